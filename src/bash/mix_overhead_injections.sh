@@ -0,0 +1,29 @@
+#!/bin/bash
+
+# Render a combined injection plan into a venue-wide overhead .wav in one pass.
+# Usage: mix_overhead_injections.sh --wav PATH --plan PATH [--output PATH] [--verify]
+
+set -e
+
+script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+repo_root="$(cd "$script_dir/../.." && pwd)"
+python_script="$repo_root/src/scripts/overhead_mix.py"
+
+if [ ! -f "$python_script" ]; then
+  echo "Error: overhead_mix.py not found at $python_script"
+  exit 1
+fi
+
+if ! command -v python3 >/dev/null 2>&1; then
+  echo "Error: python3 not installed."
+  exit 1
+fi
+
+PYTHON=""
+if [ -x "$repo_root/.venv/bin/python" ]; then
+  PYTHON="$repo_root/.venv/bin/python"
+else
+  PYTHON="python3"
+fi
+
+exec "$PYTHON" "$python_script" "$@"
@@ -0,0 +1,40 @@
+#!/bin/bash
+
+# Transcribe and verify every overhead .wav of a weekend manifest across all cores.
+# Usage: overhead_batch.sh --manifest weekend.jsonl --schedule-dir DIR [--workers N] [options...]
+# Tip: start overhead_model_daemon.sh first so verification workers share one loaded refinement model.
+
+set -e
+
+script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+repo_root="$(cd "$script_dir/../.." && pwd)"
+python_script="$repo_root/src/scripts/overhead_batch.py"
+
+if [ ! -f "$python_script" ]; then
+  echo "Error: overhead_batch.py not found at $python_script"
+  exit 1
+fi
+
+for cmd in ffprobe python3; do
+  if ! command -v "$cmd" >/dev/null 2>&1; then
+    echo "Error: $cmd not installed."
+    exit 1
+  fi
+done
+
+PYTHON=""
+if [ -x "$repo_root/.venv/bin/python" ]; then
+  PYTHON="$repo_root/.venv/bin/python"
+else
+  PYTHON="python3"
+fi
+
+for module in rapidfuzz faster_whisper; do
+  if ! "$PYTHON" -c "import $module" 2>/dev/null; then
+    echo "Error: ${module//_/-} not installed."
+    echo "Run: pip install -r $repo_root/requirements-transcribe.txt"
+    exit 1
+  fi
+done
+
+exec "$PYTHON" "$python_script" "$@"
@@ -0,0 +1,37 @@
+#!/bin/bash
+
+# Keep faster-whisper models loaded so repeated overhead verification runs skip the model load.
+# Usage: overhead_model_daemon.sh [--socket PATH] [--preload small base] [--model-pool-size N]
+# Default socket: $XDG_RUNTIME_DIR/overhead_models.sock, else ~/.cache/overhead_models.sock (owner-only)
+# Clients: export OVERHEAD_MODEL_DAEMON=<socket> (or pass --model-daemon PATH)
+
+set -e
+
+script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+repo_root="$(cd "$script_dir/../.." && pwd)"
+python_script="$repo_root/src/scripts/overhead_models.py"
+
+if [ ! -f "$python_script" ]; then
+  echo "Error: overhead_models.py not found at $python_script"
+  exit 1
+fi
+
+if ! command -v python3 >/dev/null 2>&1; then
+  echo "Error: python3 not installed."
+  exit 1
+fi
+
+PYTHON=""
+if [ -x "$repo_root/.venv/bin/python" ]; then
+  PYTHON="$repo_root/.venv/bin/python"
+else
+  PYTHON="python3"
+fi
+
+if ! "$PYTHON" -c "import faster_whisper" 2>/dev/null; then
+  echo "Error: faster-whisper not installed."
+  echo "Run: pip install -r $repo_root/requirements-transcribe.txt"
+  exit 1
+fi
+
+exec "$PYTHON" "$python_script" serve "$@"
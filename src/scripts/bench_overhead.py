@@ -0,0 +1,1165 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for overhead verification on a synthetic full-day transcript.
+
+Builds a Throw Down style day (one slot every 25 minutes, every court called, all
+venue-wide PA cues, plus crowd/DJ chatter between cues) so matching costs can be
+measured without a real export or a whisper model.
+
+Usage:
+  python bench_overhead.py by-round --hours 9 --courts 2,3,4
+  python bench_overhead.py score --hours 9
+  python bench_overhead.py cdist --hours 9 --courts 1,2,3,4
+  python bench_overhead.py insertions --hours 9
+  python bench_overhead.py levels --hours 9 --rate 48000 --channels 2
+  python bench_overhead.py mix --hours 9 --rate 48000 --channels 2
+  python bench_overhead.py stream --hours 9
+  python bench_overhead.py pool --runs 5 --load-seconds 3
+  python bench_overhead.py match --hours 9 --drop 0.15
+  python bench_overhead.py align --hours 9 --late 45
+  python bench_overhead.py clips --hours 2
+  python bench_overhead.py fingerprint --recordings 4 --minutes 30
+  python bench_overhead.py transcript --hours 12 --courts 1,2,3,4
+  python bench_overhead.py records --days 2 --hours 9 --courts 1,2,3,4,5,6
+  python bench_overhead.py vad --hours 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import re
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from overhead_align import align_timeline, round_anchors
+from overhead_audio import OverheadAudio
+from overhead_clips import ClipTemplate, find_clip
+from overhead_fingerprint import FP_FRAME_SECONDS, FingerprintIndex
+from overhead_inject_common import seconds_to_hms as inject_seconds_to_hms
+from overhead_mix import ClipPlacement, mix_clips, patch_clips
+from overhead_models import ModelPool, ModelPoolServer, RemoteModelPool
+from overhead_transcribe import SETTLE_SECONDS, TranscriptProgress
+from overhead_transcript_cache import write_columnar_transcript
+from overhead_vad import SpeechRegions
+from verify_overhead_schedule import (
+    COURT_WORDS,
+    EVENT_CUES,
+    THROWDOWN_25MIN_MARKERS,
+    ExpectedEvent,
+    Game,
+    MatchResult,
+    SegmentIndex,
+    SegmentScorer,
+    TranscriptSegment,
+    VerificationReport,
+    best_in_row,
+    build_expected_events,
+    court_regex,
+    group_games_by_slot,
+    infer_slot_anchor_wav,
+    match_events_to_transcript,
+    normalize_team,
+    seconds_to_hm,
+    serialize_match_results,
+    verify_by_round,
+    verify_by_round_streaming,
+    write_report,
+)
+
+TEAM_WORDS = [
+    "Alpha", "Beta", "Brawlers", "Squad", "Titans", "Crusaders", "Reapers", "Spies",
+    "Shadows", "Snacks", "Friends", "Plank", "Mama", "Syndicate", "Girls", "Door",
+]
+
+CUE_TEXT: dict[str, str] = {
+    "transition_2min": "Two minutes to get to your next court",
+    "transition_1min": "One minute to get to your court",
+    "transition_30sec": "30 seconds to get to your court",
+    "play_start": "Players line up, here we go",
+    "halfway": "Halfway through",
+    "ninety_seconds": "90 seconds remaining",
+    "thirty_seconds": "30 seconds remaining",
+    "countdown": "10, 9, 8, 7, 6, 5, 4, 3, 2, 1",
+}
+
+CHATTER = [
+    "Let's go everybody",
+    "Make some noise",
+    "Great game out there",
+    "Grab some water",
+    "Shout out to our refs",
+    "Music is back on",
+]
+
+
+def synthetic_day(
+    hours: float,
+    courts: list[int],
+    chatter_every: float = 4.0,
+    drift_per_round: float = 2.0,
+    seed: int = 7,
+) -> tuple[list[Game], list[TranscriptSegment]]:
+    """Games starting 09:00 every 25 minutes and a transcript with jittered PA cues."""
+    rng = random.Random(seed)
+    games: list[Game] = []
+    segments: list[TranscriptSegment] = []
+    rounds = int(hours * 3600 // 1500)
+
+    for round_idx in range(rounds):
+        slot_wall = 9 * 3600 + round_idx * 1500
+        slot_wav = round_idx * 1500 + drift_per_round * round_idx
+        for court_num in courts:
+            home = f"{rng.choice(TEAM_WORDS)} {rng.choice(TEAM_WORDS)}"
+            away = f"{rng.choice(TEAM_WORDS)} {rng.choice(TEAM_WORDS)}"
+            games.append(
+                Game(
+                    home_team=home,
+                    away_team=away,
+                    start_time=seconds_to_hm(slot_wall),
+                    minutes=25,
+                    court=f"Court {court_num}",
+                    court_num=court_num,
+                    round=f"Round {round_idx + 1}",
+                )
+            )
+            word = COURT_WORDS.get(court_num, (str(court_num),))[0]
+            call_at = slot_wav + 5 + 12 * courts.index(court_num) + rng.uniform(-2, 2)
+            segments.append(
+                TranscriptSegment(
+                    start=call_at,
+                    end=call_at + 9,
+                    text=f"Court {word}, {home} versus {away}, home team {home}",
+                )
+            )
+        for event_type, offset, venue_wide, _label in THROWDOWN_25MIN_MARKERS:
+            if not venue_wide:
+                continue
+            at = slot_wav + offset + rng.uniform(-8, 8)
+            segments.append(TranscriptSegment(start=at, end=at + 3, text=CUE_TEXT[event_type]))
+
+    at = 0.0
+    end = rounds * 1500.0
+    while at < end:
+        at += rng.expovariate(1.0 / chatter_every)
+        segments.append(TranscriptSegment(start=at, end=at + 1.5, text=rng.choice(CHATTER)))
+
+    segments.sort(key=lambda segment: segment.start)
+    return games, segments
+
+
+def timed(fn: Callable[[], object], repeat: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_by_round(args: argparse.Namespace) -> None:
+    courts = [int(c) for c in args.courts.split(",")]
+    games, segments = synthetic_day(args.hours, courts, chatter_every=args.chatter_every)
+    rounds = len({g.start_time for g in games})
+    print(f"Synthetic day: {rounds} rounds x {len(courts)} courts, {len(segments)} segments")
+
+    def run() -> None:
+        verify_by_round(
+            games,
+            segments,
+            Path("synthetic.wav"),
+            "09:00",
+            tolerance=90,
+            min_confidence=0.55,
+            skip_ranges=[],
+            skip_before=None,
+            refine_bundled=False,
+        )
+
+    elapsed = timed(run, args.repeat)
+    print(f"verify_by_round (no refinement): {elapsed * 1000:.1f} ms")
+
+    index = SegmentIndex(segments)
+    queries = [(q * 37.0, q * 37.0 + 180.0) for q in range(int(len(segments) / 10))]
+
+    def linear() -> None:
+        for lo, hi in queries:
+            [s for s in segments if lo <= s.start <= hi]
+
+    def indexed() -> None:
+        for lo, hi in queries:
+            index.between(lo, hi)
+
+    linear_s = timed(linear, args.repeat)
+    indexed_s = timed(indexed, args.repeat)
+    print(
+        f"{len(queries)} window queries: linear {linear_s * 1000:.1f} ms, "
+        f"SegmentIndex {indexed_s * 1000:.1f} ms ({linear_s / indexed_s:.0f}x)"
+    )
+
+
+def legacy_score_segment(event: ExpectedEvent, segment: TranscriptSegment) -> float:
+    """score_segment as it was before SegmentScorer: all work repeated per pair."""
+    from rapidfuzz import fuzz
+
+    text = segment.text.lower()
+    cue_patterns = EVENT_CUES.get(event.event_type, [])
+    cue_hits = sum(1 for pattern in cue_patterns if re.search(pattern, text, re.I))
+
+    if event.venue_wide:
+        if cue_hits == 0:
+            return 0.0
+        return min(0.5 + 0.15 * cue_hits, 1.0)
+
+    score = 0.0
+    if court_regex(event.court_num).search(text):
+        score += 0.35
+    score += 0.25 * (fuzz.partial_ratio(normalize_team(event.home_team), text) / 100.0)
+    score += 0.25 * (fuzz.partial_ratio(normalize_team(event.away_team), text) / 100.0)
+    if cue_hits:
+        score += min(0.25, 0.1 * cue_hits)
+    return min(score, 1.0)
+
+
+def event_segment_pairs(
+    hours: float,
+    courts: list[int],
+    chatter_every: float,
+    tolerance: int = 90,
+) -> list[tuple[ExpectedEvent, TranscriptSegment]]:
+    """Every (event, segment) pair a by-round pass would score on the synthetic day."""
+    games, segments = synthetic_day(hours, courts, chatter_every=chatter_every)
+    index = SegmentIndex(segments)
+    events = build_expected_events(games, "09:00", skip_ranges=[])
+    pairs: list[tuple[ExpectedEvent, TranscriptSegment]] = []
+    for event in events:
+        extra = 120 if event.event_type == "court_announcement" else 0
+        for segment in index.between(
+            event.wav_offset_seconds - tolerance, event.wav_offset_seconds + tolerance + extra
+        ):
+            pairs.append((event, segment))
+    return pairs
+
+
+def bench_score(args: argparse.Namespace) -> None:
+    courts = [int(c) for c in args.courts.split(",")]
+    pairs = event_segment_pairs(args.hours, courts, args.chatter_every)
+    court_pairs = sum(1 for event, _segment in pairs if not event.venue_wide)
+    print(f"{len(pairs)} (event, segment) pairs ({court_pairs} court, {len(pairs) - court_pairs} venue)")
+
+    def legacy() -> None:
+        for event, segment in pairs:
+            legacy_score_segment(event, segment)
+
+    def compiled() -> None:
+        scorer = SegmentScorer()
+        for event, segment in pairs:
+            scorer.score(event, segment)
+
+    mismatches = sum(
+        1
+        for event, segment in pairs
+        if abs(legacy_score_segment(event, segment) - SegmentScorer().score(event, segment)) > 1e-9
+    ) if args.check else 0
+    legacy_s = timed(legacy, args.repeat)
+    compiled_s = timed(compiled, args.repeat)
+    print(
+        f"per pair: legacy {legacy_s / len(pairs) * 1e6:.2f} us, "
+        f"SegmentScorer {compiled_s / len(pairs) * 1e6:.2f} us "
+        f"({legacy_s / compiled_s:.1f}x)"
+    )
+    if args.check:
+        print(f"score mismatches vs legacy: {mismatches}")
+
+
+def bench_cdist(args: argparse.Namespace) -> None:
+    courts = [int(c) for c in args.courts.split(",")]
+    games, segments = synthetic_day(args.hours, courts, chatter_every=args.chatter_every)
+    index = SegmentIndex(segments)
+    events = [
+        event
+        for event in build_expected_events(games, "09:00", skip_ranges=[])
+        if event.event_type == "court_announcement"
+    ]
+    slots: dict[int, list[ExpectedEvent]] = {}
+    for event in events:
+        slots.setdefault(event.wav_offset_seconds, []).append(event)
+    batches = [
+        (slot_events, index.between(offset - args.tolerance, offset + args.tolerance + 120))
+        for offset, slot_events in slots.items()
+    ]
+    pairs = sum(len(slot_events) * len(window) for slot_events, window in batches)
+    print(
+        f"{len(group_games_by_slot(games))} slots x {len(courts)} court calls, "
+        f"{pairs} (event, segment) pairs"
+    )
+
+    def pairwise() -> list[int | None]:
+        scorer = SegmentScorer()
+        picks: list[int | None] = []
+        for slot_events, window in batches:
+            for event in slot_events:
+                best_idx, best_score = None, 0.0
+                for idx, segment in enumerate(window):
+                    score = scorer.score(event, segment)
+                    if score > best_score:
+                        best_idx, best_score = idx, score
+                picks.append(best_idx)
+        return picks
+
+    def batched() -> list[int | None]:
+        scorer = SegmentScorer(workers=args.workers)
+        picks: list[int | None] = []
+        for slot_events, window in batches:
+            scores = scorer.score_matrix(slot_events, window)
+            picks.extend(best_in_row(scores, row)[0] for row in range(len(slot_events)))
+        return picks
+
+    mismatches = sum(1 for a, b in zip(pairwise(), batched()) if a != b)
+    pairwise_s = timed(pairwise, args.repeat)
+    batched_s = timed(batched, args.repeat)
+    print(
+        f"cold scorer per slot batch: pairwise partial_ratio {pairwise_s * 1000:.1f} ms, "
+        f"cdist matrix {batched_s * 1000:.1f} ms ({pairwise_s / batched_s:.1f}x)"
+    )
+    print(f"best-match mismatches: {mismatches}")
+
+
+def write_synthetic_wav(
+    path: Path,
+    hours: float,
+    sample_rate: int,
+    channels: int,
+    silence_after: list[float],
+    silence_seconds: float = 20.0,
+    seed: int = 7,
+) -> None:
+    """Noise around -20 dBFS everywhere except silence_seconds of near-silence after
+    each offset in silence_after, written in blocks so long days fit in memory."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    frames = int(hours * 3600 * sample_rate)
+    data_size = frames * channels * 2
+    quiet = sorted(silence_after)
+    with path.open("wb") as handle:
+        handle.write(b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE")
+        handle.write(
+            b"fmt "
+            + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16)
+        )
+        handle.write(b"data" + struct.pack("<I", data_size))
+        block = sample_rate * 60
+        for first in range(0, frames, block):
+            count = min(block, frames - first)
+            samples = rng.normal(0.0, 3000.0, size=(count, channels))
+            times = (first + np.arange(count)) / sample_rate
+            for at in quiet:
+                mask = (times >= at) & (times < at + silence_seconds)
+                samples[mask] *= 0.001
+            handle.write(samples.astype("<i2").tobytes())
+
+
+def bench_insertions(args: argparse.Namespace) -> None:
+    from inject_no_blocking import compute_insertions
+
+    rounds = int(args.hours * 3600 // 1500)
+    countdowns = [round_idx * 1500.0 + 1290.0 for round_idx in range(rounds)]
+    report = {
+        "rounds": [
+            {
+                "round": round_idx + 1,
+                "schedule_label": f"Round {round_idx + 1}",
+                "speech": [
+                    {
+                        "wav_seconds": at,
+                        "wav_timestamp": inject_seconds_to_hms(at),
+                        "role": "countdown_play_end",
+                        "text": "10, 9, 8, 7, 6, 5, 4, 3, 2, 1",
+                    }
+                ],
+            }
+            for round_idx, at in enumerate(countdowns)
+        ]
+    }
+
+    with tempfile.TemporaryDirectory(prefix="bench_overhead_") as tmp:
+        wav = Path(tmp) / "day.wav"
+        write_synthetic_wav(
+            wav, args.hours, args.rate, args.channels, [at + 12.0 for at in countdowns]
+        )
+        size_mb = wav.stat().st_size / 1e6
+        print(f"Synthetic wav: {args.hours:g} h, {args.rate} Hz x {args.channels} ch, {size_mb:.0f} MB, {rounds} rounds")
+
+        def run() -> list[dict]:
+            return compute_insertions(
+                wav,
+                report,
+                None,
+                offset_after_silence=3.0,
+                search_window=180.0,
+                noise_db=-35.0,
+                min_silence_detect=0.3,
+                min_after_countdown=3.0,
+                min_no_blocking_silence=15.0,
+                fallback_after_countdown_end=3.0,
+            )
+
+        first = timed(run)
+        warm = timed(run, args.repeat)
+        insertions = run()
+        high = sum(1 for item in insertions if item.get("insert_confidence") == "high")
+        print(
+            f"compute_insertions: first pass {first * 1000:.0f} ms (whole-file silence map), "
+            f"then {warm * 1000:.1f} ms per run over {rounds} rounds; "
+            f"{high}/{len(insertions)} high-confidence inserts"
+        )
+        OverheadAudio._open.clear()
+
+
+def bench_levels(args: argparse.Namespace) -> None:
+    import numpy as np
+
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory(prefix="bench_overhead_") as tmp:
+        wav = Path(tmp) / "day.wav"
+        write_synthetic_wav(wav, args.hours, args.rate, args.channels, [])
+        duration = args.hours * 3600
+
+        built = timed(lambda: OverheadAudio(wav).envelope)
+        loaded = timed(lambda: OverheadAudio(wav).envelope)
+        audio = OverheadAudio(wav)
+        audio.envelope
+        print(
+            f"Envelope for {args.hours:g} h at {args.rate} Hz x {args.channels} ch: "
+            f"build {built:.2f} s, reload {loaded * 1000:.1f} ms"
+        )
+
+        for window in (0.5, 6.0, 180.0):
+            starts = [rng.uniform(0, duration - window) for _ in range(args.queries)]
+
+            def raw() -> None:
+                for start in starts:
+                    samples = audio.native_slice(start, start + window)
+                    float(np.abs(samples.astype(np.float32)).max())
+
+            def pyramid() -> None:
+                for start in starts:
+                    audio.peak_db(start, start + window)
+
+            raw_s = timed(raw)
+            pyramid_s = timed(pyramid)
+            print(
+                f"{window:>6g} s windows: memmap scan {raw_s / len(starts) * 1e6:8.1f} us, "
+                f"envelope {pyramid_s / len(starts) * 1e6:6.1f} us per peak query"
+            )
+        OverheadAudio._open.clear()
+
+
+def bench_mix(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory(prefix="bench_overhead_") as tmp:
+        wav = Path(tmp) / "day.wav"
+        clip = Path(tmp) / "clip.wav"
+        out = Path(tmp) / "out.wav"
+        write_synthetic_wav(wav, args.hours, args.rate, args.channels, [])
+        write_synthetic_wav(clip, 8.0 / 3600, args.rate, 1, [], seed=11)
+        slots = [i * 25 * 60.0 for i in range(int(args.hours * 60 / 25))]
+        placements = [ClipPlacement(clip, at + 14 * 60.0) for at in slots]
+        placements += [ClipPlacement(clip, at + 2.0, -3.0) for at in slots]
+
+        stats = mix_clips(wav, out, placements)
+        print(
+            f"Mixed {len(placements)} clips into {args.hours:g} h at {args.rate} Hz x {args.channels} ch "
+            f"in one pass: {stats.wall_seconds:.2f} s ({stats.realtime_factor:.0f}x realtime), "
+            f"{stats.mixed_blocks} blocks mixed, {stats.copied_blocks} copied"
+        )
+
+        patched = patch_clips(wav, out, placements)
+        print(
+            f"Patch ({patched.method}): {patched.wall_seconds:.2f} s, "
+            f"{patched.bytes_written / 1e6:.1f} MB mixed, {patched.bytes_copied / 1e6:.0f} MB copied"
+        )
+        shifted = [ClipPlacement(p.clip, p.at + 0.5, p.gain_db) for p in placements]
+        rerun = patch_clips(wav, out, shifted, patched.as_dict())
+        print(
+            f"Re-run with shifted offsets ({rerun.method}): {rerun.wall_seconds * 1000:.1f} ms, "
+            f"{rerun.bytes_written / 1e6:.1f} MB mixed, {rerun.bytes_copied / 1e6:.1f} MB restored"
+        )
+        OverheadAudio._open.clear()
+
+
+def bench_stream(args: argparse.Namespace) -> None:
+    courts = [int(c) for c in args.courts.split(",")]
+    games, segments = synthetic_day(args.hours, courts, chatter_every=args.chatter_every)
+    duration = args.hours * 3600
+    chunk_ends = [min(duration, (i + 1) * args.chunk_seconds) for i in range(math.ceil(duration / args.chunk_seconds))]
+
+    def transcript():
+        for consumed, end in enumerate(chunk_ends[:-1], start=1):
+            print(f"@chunk {consumed}")
+            yield TranscriptProgress([s for s in segments if s.start < end], end - SETTLE_SECONDS)
+        print(f"@chunk {len(chunk_ends)}")
+        yield TranscriptProgress(segments, float("inf"), done=True)
+
+    def streamed() -> None:
+        verify_by_round_streaming(
+            games, transcript(), Path("synthetic.wav"), "09:00", 90, 0.55, [], None, refine_bundled=False
+        )
+
+    def batch() -> None:
+        verify_by_round(games, segments, Path("synthetic.wav"), "09:00", 90, 0.55, [], None, refine_bundled=False)
+
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        streamed()
+    chunk = 0
+    emitted: list[int] = []
+    for line in out.getvalue().splitlines():
+        if line.startswith("@chunk "):
+            chunk = int(line.split()[1])
+        elif line.startswith("Round"):
+            emitted.append(chunk)
+
+    streamed_s = timed(streamed, args.repeat)
+    batch_s = timed(batch, args.repeat)
+    print(
+        f"{len(emitted)} rounds over {len(chunk_ends)} chunks of {args.chunk_seconds:g} s: "
+        f"round 1 after chunk {emitted[0]} ({emitted[0] / len(chunk_ends):.0%} of the day), "
+        f"median round emitted {statistics.median(len(chunk_ends) - c for c in emitted):.0f} chunk(s) "
+        f"before the transcript finished"
+    )
+    print(f"Verification cost: batch {batch_s * 1000:.0f} ms, streamed {streamed_s * 1000:.0f} ms")
+
+
+def cue_truth(
+    segments: list[TranscriptSegment],
+    games: list[Game],
+    drift_per_round: float = 2.0,
+) -> dict[tuple[int, str, int], float]:
+    """Start of the segment synthetic_day generated for each (round, event_type, court)."""
+    index = SegmentIndex(segments)
+    truth: dict[tuple[int, str, int], float] = {}
+    for round_idx, (_slot_start, slot_games) in enumerate(group_games_by_slot(games), start=1):
+        slot_wav = (round_idx - 1) * (1500 + drift_per_round)
+        for game in slot_games:
+            call = f"Court {COURT_WORDS.get(game.court_num, (str(game.court_num),))[0]}, {game.home_team} versus"
+            for segment in index.between(slot_wav, slot_wav + 60):
+                if segment.text.startswith(call):
+                    truth[(round_idx, "court_announcement", game.court_num)] = segment.start
+        for event_type, offset, venue_wide, _label in THROWDOWN_25MIN_MARKERS:
+            if not venue_wide:
+                continue
+            for segment in index.between(slot_wav + offset - 8.5, slot_wav + offset + 8.5):
+                if segment.text == CUE_TEXT[event_type]:
+                    truth[(round_idx, event_type, 0)] = segment.start
+    return truth
+
+
+def bench_match(args: argparse.Namespace) -> None:
+    courts = [int(c) for c in args.courts.split(",")]
+    games, segments = synthetic_day(args.hours, courts, chatter_every=args.chatter_every)
+    # Calls the announcer skipped or whisper lost: every cue segment dropped with probability --drop.
+    rng = random.Random(args.seed)
+    chatter = set(CHATTER)
+    segments = [s for s in segments if s.text in chatter or rng.random() >= args.drop]
+    truth = cue_truth(segments, games)
+
+    print(
+        f"Synthetic day: {len({g.start_time for g in games})} rounds x {len(courts)} courts, "
+        f"{len(segments)} segments, {args.drop:.0%} of cue segments dropped"
+    )
+    for matcher in ("greedy", "assignment"):
+        def run() -> list[dict]:
+            return verify_by_round(
+                games, segments, Path("synthetic.wav"), "09:00", args.tolerance, 0.55, [], None,
+                refine_bundled=False, matcher=matcher,
+            )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            reports = run()
+        counts = {"correct": 0, "wrong": 0, "missed": 0, "spurious": 0, "absent": 0}
+        for report in reports:
+            for result in report["results"]:
+                if result.status == "skipped":
+                    continue
+                event = result.expected
+                expected = truth.get((report["round"], event.event_type, 0 if event.venue_wide else event.court_num))
+                if expected is None:
+                    counts["spurious" if result.matched else "absent"] += 1
+                elif not result.matched:
+                    counts["missed"] += 1
+                else:
+                    counts["correct" if abs(result.actual_start - expected) < 1e-6 else "wrong"] += 1
+        elapsed = timed(run, args.repeat)
+        scored = counts["correct"] + counts["wrong"] + counts["missed"]
+        print(
+            f"  {matcher:<10} {elapsed * 1000:6.0f} ms  correct {counts['correct']}/{scored} "
+            f"({counts['correct'] / scored:.1%}), wrong segment {counts['wrong']}, missed {counts['missed']}, "
+            f"matched with no true segment {counts['spurious']} (correctly unmatched {counts['absent']})"
+        )
+
+
+def run_late(
+    segments: list[TranscriptSegment],
+    games: list[Game],
+    late: float,
+    seed: int,
+    drift_per_round: float = 2.0,
+) -> tuple[list[TranscriptSegment], dict[tuple[int, str, int], float]]:
+    """The PA running up to ``late`` seconds behind from a random venue cue of each round on."""
+    rng = random.Random(seed)
+    truth = cue_truth(segments, games, drift_per_round)
+    chatter = set(CHATTER)
+    venue = [offset for _type, offset, venue_wide, _label in THROWDOWN_25MIN_MARKERS if venue_wide]
+    shifted = list(segments)
+    for round_idx in range(1, len(group_games_by_slot(games)) + 1):
+        slot_wav = (round_idx - 1) * (1500 + drift_per_round)
+        start, by = slot_wav + rng.choice(venue) - 10, rng.uniform(0, late)
+        end = slot_wav + 1500 - 10
+        shifted = [
+            TranscriptSegment(s.start + by, s.end + by, s.text)
+            if s.text not in chatter and start <= s.start < end
+            else s
+            for s in shifted
+        ]
+        for key, at in truth.items():
+            if key[0] == round_idx and start <= at < end:
+                truth[key] = at + by
+    shifted.sort(key=lambda segment: segment.start)
+    return shifted, truth
+
+
+def bench_align(args: argparse.Namespace) -> None:
+    courts = [int(c) for c in args.courts.split(",")]
+    games, segments = synthetic_day(args.hours, courts, chatter_every=args.chatter_every)
+    segments, truth = run_late(segments, games, args.late, args.seed)
+    slots = group_games_by_slot(games)
+    offsets = {event_type: offset for event_type, offset, _venue, _label in THROWDOWN_25MIN_MARKERS}
+    print(
+        f"Synthetic day: {len(slots)} rounds x {len(courts)} courts, {len(segments)} segments, "
+        f"PA up to {args.late:g} s late from a random cue of each round"
+    )
+
+    index = SegmentIndex(segments)
+
+    def anchor_search() -> dict[int, float | None]:
+        return {
+            round_idx: infer_slot_anchor_wav(slot_games, index, float(slot_start - 9 * 3600), 90, 0.55)
+            for round_idx, (slot_start, slot_games) in enumerate(slots, start=1)
+        }
+
+    def aligned():
+        return align_timeline(games, segments, "09:00", band_seconds=args.band)
+
+    anchors = anchor_search()
+    points = aligned()
+    per_round = [
+        abs(anchors[key[0]] + offsets[key[1]] - at)
+        for key, at in truth.items()
+        if key[1] != "court_announcement" and anchors[key[0]] is not None
+    ]
+    curve = {(p.round, p.event_type, 0 if p.event_type != "court_announcement" else p.court_num): p for p in points}
+    per_cue = [
+        abs(curve[key].expected_wav + curve[key].drift_seconds - at)
+        for key, at in truth.items()
+        if key[1] != "court_announcement"
+    ]
+    aligned_anchors = round_anchors(points)
+    anchor_diff = max(abs(aligned_anchors[r] - a) for r, a in anchors.items() if a is not None)
+
+    search_s = timed(anchor_search, args.repeat)
+    align_s = timed(aligned, args.repeat)
+    print(f"  per-round anchor search  {search_s * 1000:6.1f} ms  venue cue error: median {statistics.median(per_round):5.1f} s, max {max(per_round):5.1f} s")
+    print(f"  whole-day alignment      {align_s * 1000:6.1f} ms  venue cue error: median {statistics.median(per_cue):5.1f} s, max {max(per_cue):5.1f} s")
+    print(f"  ({len(points)} cues x {2 * args.band + 1:.0f} drift bins; round anchors differ by at most {anchor_diff:.1f} s)")
+
+
+def bench_clips(args: argparse.Namespace) -> None:
+    import numpy as np
+
+    rate = 16000
+    rng = np.random.default_rng(args.seed)
+    t = np.arange(int(args.clip_seconds * rate)) / rate
+    clip = (0.3 * np.sin(2 * np.pi * (300 + 300 * t) * t) * (1 + rng.normal(0, 0.3, len(t)))).astype(np.float32)
+    frames = int(args.hours * 3600 * rate)
+    plays = [int((r * 1500 + 121 + rng.uniform(-8, 8)) * rate) for r in range(int(args.hours * 3600 // 1500))]
+    samples = np.empty(frames, dtype=np.int16)
+    block = rate * 60
+    for first in range(0, frames, block):
+        noise = rng.normal(0.0, 0.1, min(block, frames - first))
+        for at in plays:
+            lo, hi = max(at, first), min(at + len(clip), first + len(noise))
+            if lo < hi:
+                noise[lo - first : hi - first] += clip[lo - at : hi - at]
+        samples[first : first + len(noise)] = np.clip(noise * 32767, -32768, 32767)
+
+    started = time.perf_counter()
+    hits = find_clip(samples, ClipTemplate("transition_2min", clip), args.threshold)
+    elapsed = time.perf_counter() - started
+    found = [h.sample for h in hits]
+    exact = len(set(found) & set(plays))
+    print(
+        f"{args.hours:g} h at {rate} Hz, {len(plays)} plays of a {args.clip_seconds:g} s clip in noise ~6 dB under the clip"
+    )
+    print(
+        f"  find_clip {elapsed:.2f} s ({args.hours * 3600 / elapsed:,.0f}x realtime): "
+        f"{len(hits)} hits, {exact}/{len(plays)} at the exact sample, {len(set(found) - set(plays))} elsewhere"
+    )
+
+
+def bench_fingerprint(args: argparse.Namespace) -> None:
+    import wave
+
+    import numpy as np
+
+    rate = 16000
+    rng = np.random.default_rng(args.seed)
+    t = np.arange(3 * rate) / rate
+    clip = np.zeros(len(t))
+    for first in range(0, len(t), 1280):
+        for freq in rng.uniform(200, 3000, 3):
+            clip[first : first + 1280] += 0.1 * np.sin(2 * np.pi * freq * t[first : first + 1280])
+
+    def write(path: Path, samples) -> None:
+        with wave.open(str(path), "wb") as handle:
+            handle.setnchannels(1)
+            handle.setsampwidth(2)
+            handle.setframerate(rate)
+            handle.writeframes((np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes())
+
+    with tempfile.TemporaryDirectory(prefix="bench_overhead_") as tmp:
+        root = Path(tmp)
+        write(root / "clip.wav", clip)
+        truth: dict[str, list[float]] = {}
+        for n in range(args.recordings):
+            samples = rng.normal(0, 0.05, int(args.minutes * 60 * rate))
+            starts = sorted(float(x) for x in rng.uniform(0, args.minutes * 60 - 5, args.plays).round(2))
+            for start in starts:
+                samples[int(start * rate) : int(start * rate) + len(clip)] += 0.8 * clip
+            write(root / f"day{n}.wav", samples)
+            truth[str(root / f"day{n}.wav")] = starts
+
+        index = FingerprintIndex(root / "fp.sqlite")
+        started = time.perf_counter()
+        clip_source, _ = index.enroll(root / "clip.wav", "clip", "clip")
+        for path in truth:
+            index.enroll(Path(path), "recording")
+        enroll_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        found = index.occurrences([clip_source])
+        lookup_s = time.perf_counter() - started
+        correct = sum(
+            1
+            for o in found
+            if any(abs(o.start - at) <= FP_FRAME_SECONDS for at in truth[o.recording])
+        )
+
+        template = ClipTemplate("clip", clip.astype(np.float32))
+        started = time.perf_counter()
+        for path in truth:
+            find_clip(OverheadAudio(Path(path)).mono16k, template)
+        scan_s = time.perf_counter() - started
+        hashes = index.db.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+        index.close()
+        size = (root / "fp.sqlite").stat().st_size
+
+    total = args.recordings * args.plays
+    print(
+        f"{args.recordings} recording(s) x {args.minutes:g} min, {args.plays} plays of a 3 s clip each; "
+        f"index {hashes} hashes, {size / 1e6:.1f} MB"
+    )
+    print(f"  enroll once            {enroll_s:7.2f} s")
+    print(f"  index lookup           {lookup_s * 1000:7.1f} ms  {correct}/{total} found, {len(found) - correct} spurious")
+    print(f"  NCC rescan (no index)  {scan_s:7.2f} s")
+
+
+TRANSCRIPT_LOADS = {
+    "json": "data = json.loads(path.read_text(encoding='utf-8')); "
+    "result = [TranscriptSegment(**item) for item in data['segments']]",
+    "cols-range": "result = ColumnarTranscript(path).between(3600.0, 3600.0 + 1500.0)",
+    "cols-all": "result = ColumnarTranscript(path).segments()",
+}
+
+# Run in a fresh interpreter per format; RSS is resident pages held after the load
+# (Linux /proc), with the loaded transcript still referenced.
+TRANSCRIPT_LOAD_PROBE = """
+import json, os, sys, time
+from pathlib import Path
+from overhead_transcribe import TranscriptSegment
+from overhead_transcript_cache import ColumnarTranscript
+def rss():
+    with open("/proc/self/statm") as handle:
+        return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+path = Path(sys.argv[1])
+before = rss()
+started = time.perf_counter()
+{load}
+first = time.perf_counter() - started
+held = rss() - before
+best = first
+for _ in range(int(sys.argv[2])):
+    started = time.perf_counter()
+    {load}
+    best = min(best, time.perf_counter() - started)
+print(first, best, held, len(result))
+"""
+
+
+def bench_transcript(args: argparse.Namespace) -> None:
+    import json
+
+    _games, segments = synthetic_day(args.hours, [int(c) for c in args.courts.split(",")])
+    meta = {"wav_path": "day.wav", "model": "small", "wav_size": 1, "wav_mtime_ns": 1}
+    with tempfile.TemporaryDirectory(prefix="bench_overhead_") as tmp:
+        paths = {
+            "json": Path(tmp) / "day.wav.transcript.json",
+            "cols": Path(tmp) / "day.wav.transcript.cols",
+        }
+        started = time.perf_counter()
+        payload = {**meta, "segments": [{"start": s.start, "end": s.end, "text": s.text} for s in segments]}
+        paths["json"].write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        json_write_s = time.perf_counter() - started
+        started = time.perf_counter()
+        write_columnar_transcript(paths["cols"], meta, segments)
+        cols_write_s = time.perf_counter() - started
+
+        print(f"{args.hours:g} h synthetic transcript, {len(segments)} segments")
+        for name, path in paths.items():
+            written = json_write_s if name == "json" else cols_write_s
+            print(f"  {name:<5} {path.stat().st_size / 1e6:6.2f} MB, written in {written * 1000:6.1f} ms")
+        for name, load in TRANSCRIPT_LOADS.items():
+            path = paths["json" if name == "json" else "cols"]
+            probe = TRANSCRIPT_LOAD_PROBE.replace("{load}", load)
+            result = subprocess.run(
+                [sys.executable, "-c", probe, str(path), str(args.repeat)],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=Path(__file__).resolve().parent,
+            )
+            first, best, rss, rows = result.stdout.split()
+            print(
+                f"  load {name:<10} first {float(first) * 1000:6.2f} ms, best {float(best) * 1000:6.2f} ms, "
+                f"+{int(rss) / 1e6:4.1f} MB RSS  ({rows} segments)"
+            )
+
+
+def bench_records(args: argparse.Namespace) -> None:
+    import json
+    import tracemalloc
+
+    courts = [int(c) for c in args.courts.split(",")]
+    days = [synthetic_day(args.hours, courts, seed=7 + day) for day in range(args.days)]
+
+    def retained(build: Callable[[], object]) -> tuple[object, int, float]:
+        """(result, bytes still allocated while it is held, seconds to build)."""
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - started
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return result, held, elapsed
+
+    segments, segment_bytes, segment_s = retained(
+        lambda: [[TranscriptSegment(s.start, s.end, s.text) for s in day_segments] for _g, day_segments in days]
+    )
+    events, event_bytes, event_s = retained(lambda: [build_expected_events(games, "09:00", []) for games, _s in days])
+    started = time.perf_counter()
+    matched = [
+        match_events_to_transcript(day_events, day_segments, 90, 0.55)
+        for day_events, day_segments in zip(events, segments)
+    ]
+    match_s = time.perf_counter() - started
+    # Copies, so the matcher's caches are not counted against the results.
+    results, result_bytes, result_s = retained(
+        lambda: [
+            [
+                MatchResult(r.expected, r.matched, r.actual_start, r.drift_seconds, r.confidence, r.matched_text, r.status)
+                for r in day_results
+            ]
+            for day_results in matched
+        ]
+    )
+    n_segments = sum(map(len, segments))
+    n_events = sum(map(len, events))
+    n_results = sum(map(len, results))
+
+    def serialize() -> None:
+        for day_results in results:
+            serialize_match_results(day_results)
+
+    def report() -> None:
+        for day_results in results:
+            rows = serialize_match_results(day_results)
+            payload = VerificationReport(wav_path="day.wav", schedule_date="", wav_start_time="09:00", events=rows)
+            write_report(payload, Path(os.devnull))
+
+    with contextlib.redirect_stderr(io.StringIO()):
+        serialize_s = timed(serialize, args.repeat)
+        report_s = timed(report, args.repeat)
+    size = sum(len(json.dumps(serialize_match_results(day_results))) for day_results in results)
+
+    print(f"{args.days} day(s) x {args.hours:g} h x {len(courts)} courts")
+    print(f"  {n_segments:6d} TranscriptSegment  {segment_bytes / n_segments:6.0f} B each  {segment_s * 1000:7.1f} ms")
+    print(f"  {n_events:6d} ExpectedEvent      {event_bytes / n_events:6.0f} B each  {event_s * 1000:7.1f} ms (build)")
+    print(f"  {n_results:6d} MatchResult        {result_bytes / n_results:6.0f} B each  {result_s * 1000:7.1f} ms")
+    print(f"  match_events_to_transcript {match_s * 1000:7.1f} ms")
+    print(f"  serialize_match_results {serialize_s * 1000:7.1f} ms ({size / 1e6:.1f} MB JSON)")
+    print(f"  serialize + write_report {report_s * 1000:6.1f} ms")
+
+
+class InstantModel:
+    """Stands in for a loaded whisper model: transcribe() costs nothing, so only plumbing is timed."""
+
+    def transcribe(self, audio, **options):
+        return iter([]), None
+
+
+def bench_pool(args: argparse.Namespace) -> None:
+    def loader(name: str, cpu_threads: int, num_workers: int) -> InstantModel:
+        time.sleep(args.load_seconds)
+        return InstantModel()
+
+    import numpy as np
+
+    audio = np.zeros(int(args.chunk_seconds * 16000), dtype=np.float32)
+
+    def verification(pool) -> None:
+        # One by-round run touches the transcription model and the refinement model.
+        for _ in range(args.chunks):
+            pool.transcribe("small", audio, vad_filter=True)
+        pool.transcribe("base", audio[: 16000 * 8], batched=True, batch_size=16)
+
+    started = time.perf_counter()
+    for _ in range(args.runs):
+        verification(ModelPool(loader=loader, pipeline_factory=lambda model: model))
+    cold = time.perf_counter() - started
+
+    pool = ModelPool(loader=loader, pipeline_factory=lambda model: model)
+    started = time.perf_counter()
+    for _ in range(args.runs):
+        verification(pool)
+    warm = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory(prefix="bench_overhead_") as tmp:
+        address = Path(tmp) / "models.sock"
+        server = ModelPoolServer(address, ModelPool(loader=loader, pipeline_factory=lambda model: model))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        remote = RemoteModelPool(address)
+        verification(remote)
+        started = time.perf_counter()
+        for _ in range(args.runs):
+            verification(remote)
+        daemon = time.perf_counter() - started
+        server.shutdown()
+        server.server_close()
+
+    per_call = daemon / (args.runs * (args.chunks + 1))
+    print(
+        f"{args.runs} verification(s), {args.chunks} x {args.chunk_seconds:g} s chunks each, "
+        f"model load {args.load_seconds:g} s:"
+    )
+    print(f"  fresh models per run  {cold:7.2f} s")
+    print(f"  in-process pool       {warm:7.2f} s (loads once)")
+    print(f"  daemon (pre-warmed)   {daemon:7.2f} s ({per_call * 1000:.1f} ms socket overhead per chunk)")
+
+
+def synthetic_feed(hours: float, segments: list[TranscriptSegment], seed: int = 7) -> object:
+    """16 kHz int16 day: crowd noise, a DJ music bed every other 5 minutes, and a
+    voiced, syllable-modulated announcement over it for every transcript segment."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    rate = 16000
+    frames = int(hours * 3600 * rate)
+    samples = np.empty(frames, dtype=np.int16)
+    block = rate * 60
+    notes = 220.0 * 2 ** (np.array([0, 3, 5, 7, 10, 12]) / 12)
+    for first in range(0, frames, block):
+        t = (first + np.arange(min(block, frames - first))) / rate
+        signal = rng.normal(0.0, 0.01, len(t))
+        music = (t // 300) % 2 == 1
+        if music.any():
+            beat = (t * 2).astype(np.int64)
+            chord = sum(np.sin(2 * np.pi * notes[(beat + k) % len(notes)] * t) for k in (0, 2, 4))
+            signal += np.where(music, 0.02 * chord, 0.0)
+        for segment in segments:
+            lo, hi = max(segment.start, t[0]), min(segment.end, t[-1])
+            if lo >= hi:
+                continue
+            span = slice(int(lo * rate) - first, int(hi * rate) - first)
+            local = t[span] - segment.start
+            phase = 2 * np.pi * (120 * local + 20 / np.pi * np.sin(np.pi * local))
+            voiced = sum(np.sin(k * phase) / k for k in range(1, 20))
+            signal[span] += 0.1 * voiced * 0.5 * (1 + np.sin(2 * np.pi * 4 * local))
+        samples[first : first + len(t)] = np.clip(signal * 32767, -32768, 32767)
+    return samples
+
+
+def bench_vad(args: argparse.Namespace) -> None:
+    _games, segments = synthetic_day(args.hours, [int(c) for c in args.courts.split(",")], chatter_every=120.0)
+    samples = synthetic_feed(args.hours, segments)
+    started = time.perf_counter()
+    regions = SpeechRegions.detect(samples)
+    elapsed = time.perf_counter() - started
+
+    covered = sum(1 for s in segments if any(lo <= s.start and s.end <= hi for lo, hi in regions.window(s.start, s.end)))
+    spoken = sum(s.end - s.start for s in segments)
+    spans = regions.window(0.0, regions.duration)
+    # Whisper encodes a 30 s window per clip (or per 30 s of a longer one).
+    full_windows = math.ceil(regions.duration / 30)
+    clip_windows = sum(math.ceil((hi - lo) / 30) for lo, hi in spans)
+    print(
+        f"{args.hours:g} h synthetic feed: {len(segments)} announcements ({spoken:.0f} s of speech) "
+        f"over crowd noise, music every other 5 min"
+    )
+    print(
+        f"  detect {elapsed:.2f} s ({regions.duration / elapsed:,.0f}x realtime): {len(regions)} regions, "
+        f"{regions.speech_seconds:.0f} s kept, {regions.skipped_fraction:.1%} skipped"
+    )
+    print(f"  announcements fully inside a region: {covered}/{len(segments)}")
+    print(
+        f"  whisper 30 s windows: {full_windows} for the whole day, {clip_windows} over the regions "
+        f"({full_windows / max(1, clip_windows):.1f}x fewer)"
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    by_round = sub.add_parser("by-round", help="verify_by_round and window queries on a full day")
+    by_round.add_argument("--hours", type=float, default=9.0)
+    by_round.add_argument("--courts", default="2,3,4")
+    by_round.add_argument("--chatter-every", type=float, default=1.0, help="Mean seconds between filler segments")
+    by_round.add_argument("--repeat", type=int, default=3)
+    by_round.set_defaults(func=bench_by_round)
+
+    score = sub.add_parser("score", help="Per-pair score_segment cost, legacy vs SegmentScorer")
+    score.add_argument("--hours", type=float, default=9.0)
+    score.add_argument("--courts", default="2,3,4")
+    score.add_argument("--chatter-every", type=float, default=1.0)
+    score.add_argument("--repeat", type=int, default=3)
+    score.add_argument("--check", action="store_true", help="Also compare every score with legacy")
+    score.set_defaults(func=bench_score)
+
+    cdist = sub.add_parser("cdist", help="Court-call matching, pairwise vs one cdist matrix per slot")
+    cdist.add_argument("--hours", type=float, default=9.0)
+    cdist.add_argument("--courts", default="2,3,4")
+    cdist.add_argument("--chatter-every", type=float, default=1.0)
+    cdist.add_argument("--tolerance", type=int, default=90)
+    cdist.add_argument("--workers", type=int, default=-1, help="cdist worker threads (-1 = all cores)")
+    cdist.add_argument("--repeat", type=int, default=3)
+    cdist.set_defaults(func=bench_cdist)
+
+    insertions = sub.add_parser("insertions", help="inject_no_blocking.compute_insertions on a synthetic wav")
+    insertions.add_argument("--hours", type=float, default=9.0)
+    insertions.add_argument("--rate", type=int, default=16000)
+    insertions.add_argument("--channels", type=int, default=1)
+    insertions.add_argument("--repeat", type=int, default=3)
+    insertions.set_defaults(func=bench_insertions)
+
+    levels = sub.add_parser("levels", help="Peak queries from the loudness envelope vs scanning samples")
+    levels.add_argument("--hours", type=float, default=2.0)
+    levels.add_argument("--rate", type=int, default=48000)
+    levels.add_argument("--channels", type=int, default=2)
+    levels.add_argument("--queries", type=int, default=200)
+    levels.set_defaults(func=bench_levels)
+
+    mix = sub.add_parser("mix", help="Single-pass in-process clip mixing over a full day")
+    mix.add_argument("--hours", type=float, default=2.0)
+    mix.add_argument("--rate", type=int, default=48000)
+    mix.add_argument("--channels", type=int, default=2)
+    mix.set_defaults(func=bench_mix)
+
+    stream = sub.add_parser("stream", help="When each round is verified while the transcript streams in")
+    stream.add_argument("--hours", type=float, default=9.0)
+    stream.add_argument("--courts", default="2,3,4")
+    stream.add_argument("--chatter-every", type=float, default=1.0)
+    stream.add_argument("--chunk-seconds", type=float, default=300.0)
+    stream.add_argument("--repeat", type=int, default=3)
+    stream.set_defaults(func=bench_stream)
+
+    pool = sub.add_parser("pool", help="Model load cost across repeated verifications: fresh, pooled, daemon")
+    pool.add_argument("--runs", type=int, default=5)
+    pool.add_argument("--load-seconds", type=float, default=3.0, help="Simulated WhisperModel load time")
+    pool.add_argument("--chunks", type=int, default=20, help="Transcribe calls per verification")
+    pool.add_argument("--chunk-seconds", type=float, default=30.0)
+    pool.set_defaults(func=bench_pool)
+
+    match = sub.add_parser("match", help="Matching accuracy and cost, greedy vs optimal assignment")
+    match.add_argument("--hours", type=float, default=9.0)
+    match.add_argument("--courts", default="2,3,4")
+    match.add_argument("--chatter-every", type=float, default=1.0)
+    match.add_argument("--drop", type=float, default=0.15, help="Fraction of cue segments removed")
+    match.add_argument("--tolerance", type=int, default=90)
+    match.add_argument("--seed", type=int, default=11)
+    match.add_argument("--repeat", type=int, default=3)
+    match.set_defaults(func=bench_match)
+
+    align = sub.add_parser("align", help="Whole-day drift alignment vs per-round anchor search")
+    align.add_argument("--hours", type=float, default=9.0)
+    align.add_argument("--courts", default="2,3,4")
+    align.add_argument("--chatter-every", type=float, default=1.0)
+    align.add_argument("--late", type=float, default=45.0, help="Most seconds the PA falls behind within a round")
+    align.add_argument("--band", type=float, default=300.0)
+    align.add_argument("--seed", type=int, default=5)
+    align.add_argument("--repeat", type=int, default=3)
+    align.set_defaults(func=bench_align)
+
+    clips = sub.add_parser("clips", help="Locating a soundboard clip across a day by cross-correlation")
+    clips.add_argument("--hours", type=float, default=2.0)
+    clips.add_argument("--clip-seconds", type=float, default=3.0)
+    clips.add_argument("--threshold", type=float, default=0.5)
+    clips.add_argument("--seed", type=int, default=3)
+    clips.set_defaults(func=bench_clips)
+
+    fp = sub.add_parser("fingerprint", help="Clip lookups from the fingerprint index vs rescanning audio")
+    fp.add_argument("--recordings", type=int, default=4)
+    fp.add_argument("--minutes", type=float, default=30.0)
+    fp.add_argument("--plays", type=int, default=6)
+    fp.add_argument("--seed", type=int, default=2)
+    fp.set_defaults(func=bench_fingerprint)
+
+    transcript = sub.add_parser("transcript", help="Transcript cache load time and RSS, JSON vs columnar")
+    transcript.add_argument("--hours", type=float, default=12.0)
+    transcript.add_argument("--courts", default="1,2,3,4")
+    transcript.add_argument("--repeat", type=int, default=5)
+    transcript.set_defaults(func=bench_transcript)
+
+    records = sub.add_parser("records", help="Memory and serialization cost of events, segments and match results")
+    records.add_argument("--days", type=int, default=2)
+    records.add_argument("--hours", type=float, default=9.0)
+    records.add_argument("--courts", default="1,2,3,4,5,6")
+    records.add_argument("--repeat", type=int, default=5)
+    records.set_defaults(func=bench_records)
+
+    vad = sub.add_parser("vad", help="Speech-region prefilter: detection cost, cue recall and audio skipped")
+    vad.add_argument("--hours", type=float, default=2.0)
+    vad.add_argument("--courts", default="1,2,3,4")
+    vad.set_defaults(func=bench_vad)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,8 +3,10 @@
 Insert no-blocking PA clips into a venue-wide overhead .wav after each play-end buzzer.
 
 Uses play-end countdown times from a by-round overhead verification report, then
-ffmpeg silencedetect to find the start of the post-buzzer silent window. Overlays
-the clip a few seconds into that silence (same duration as the source wav).
+the whole-file silence map of the memory-mapped wav (10 ms frame RMS with hysteresis,
+see OverheadAudio.silence_intervals) to find the start of the post-buzzer silent
+window. Overlays the clip a few seconds into that silence (same duration as the
+source wav).
 
 Usage:
   python inject_no_blocking.py \\
@@ -18,20 +20,22 @@ from __future__ import annotations
 
 import argparse
 import re
-import subprocess
 import sys
 from pathlib import Path
 
+from overhead_audio import OverheadAudio
 from overhead_inject_common import (
-    build_ffmpeg_command,
+    add_verify_schedule_arguments,
     load_report,
     load_transcript,
     max_volume_db,
     probe_audio,
     run_verification,
+    schedule_overrides,
     seconds_to_hms,
     write_injections_sidecar,
 )
+from overhead_mix import add_mix_arguments, plan_injections, render_injections
 
 DEFAULT_CLIP = Path(
     "/Users/jessicasartin/Downloads/15 min round - foam NS 8.5 (no time limit on NB).band"
@@ -105,53 +109,14 @@ def detect_silences(
     noise_db: float,
     min_silence: float,
 ) -> list[dict]:
-    cmd = [
-        "ffmpeg",
-        "-hide_banner",
-        "-ss",
-        str(max(0.0, start)),
-        "-t",
-        str(max(0.1, duration)),
-        "-i",
-        str(wav_path),
-        "-af",
-        f"silencedetect=noise={noise_db}dB:d={min_silence}",
-        "-f",
-        "null",
-        "-",
+    start = max(0.0, start)
+    runs = OverheadAudio.open(wav_path).silences(
+        start, start + max(0.1, duration), noise_db, min_silence
+    )
+    return [
+        {"start": run_start, "end": run_end, "duration": run_end - run_start}
+        for run_start, run_end in runs
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    stderr = result.stderr
-
-    silences: list[dict] = []
-    current_start: float | None = None
-    for line in stderr.splitlines():
-        if "silence_start:" in line:
-            value = line.split("silence_start:")[-1].strip()
-            current_start = start + float(value)
-        elif "silence_end:" in line and current_start is not None:
-            tail = line.split("silence_end:")[-1].strip()
-            relative_end = float(tail.split("|")[0].strip())
-            duration_match = re.search(r"silence_duration:\s*([0-9.]+)", line)
-            silence_duration = float(duration_match.group(1)) if duration_match else None
-            silences.append(
-                {
-                    "start": current_start,
-                    "end": start + relative_end,
-                    "duration": silence_duration,
-                }
-            )
-            current_start = None
-
-    if current_start is not None:
-        silences.append(
-            {
-                "start": current_start,
-                "end": start + duration,
-                "duration": (start + duration) - current_start,
-            }
-        )
-    return silences
 
 
 def is_silent_at(
@@ -482,7 +447,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--transcript",
         type=Path,
-        help="Transcript JSON for countdown end times (default: {wav}.transcript.json)",
+        help="Transcript cache for countdown end times (default: {wav}.transcript.cols)",
     )
     parser.add_argument("--clip", type=Path, help="No-blocking clip .wav to insert")
     parser.add_argument(
@@ -552,13 +517,15 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--verify",
         action="store_true",
-        help="Run verify_overhead_schedule.py --by-round on the output wav",
+        help="Verify the output wav by round in-process, re-transcribing only around the inserted clips",
     )
+    add_verify_schedule_arguments(parser)
     parser.add_argument(
         "--require-silence-verify",
         action="store_true",
         help="Fail if any insertion point is not verified silent",
     )
+    add_mix_arguments(parser)
     return parser.parse_args()
 
 
@@ -616,38 +583,45 @@ def main() -> int:
         print(f"\nDry run: would insert {len(valid)} clip(s).")
         return 0
 
-    output_path = args.output or args.wav.with_name(f"{args.wav.stem}_with_no_blocking.wav")
-    wav_info = probe_audio(args.wav)
     insert_seconds = [item["insert_seconds"] for item in valid]
+    payload = {
+        "source_wav": str(args.wav),
+        "injection_type": "no_blocking",
+        "clip": str(clip_path),
+        "clip_gain_db": args.clip_gain_db,
+        "offset_after_silence": args.offset_after_silence,
+        "silence_noise_db": args.silence_noise_db,
+        "insertions": insertions,
+    }
+    if args.plan:
+        plan_injections(
+            args.plan,
+            args.wav,
+            "no_blocking",
+            clip_path,
+            insert_seconds,
+            payload,
+            args.clip_gain_db,
+            report.get("wav_start_time"),
+            {**(report.get("schedule") or {}), **schedule_overrides(args)} or None,
+        )
+        return 0
 
-    cmd = build_ffmpeg_command(
-        args.wav,
-        clip_path,
-        output_path,
-        insert_seconds,
-        wav_info["sample_rate"],
-        wav_info["channels"],
-    )
+    output_path = args.output or args.wav.with_name(f"{args.wav.stem}_with_no_blocking.wav")
     print(f"\nWriting: {output_path}", file=sys.stderr)
-    print(f"Inserting {len(insert_seconds)} clip(s) with ffmpeg ...", file=sys.stderr)
-    subprocess.run(cmd, check=True)
-
     sidecar = output_path.with_suffix(output_path.suffix + ".injections.json")
-    write_injections_sidecar(
-        sidecar,
-        {
-            "source_wav": str(args.wav),
-            "clip": str(clip_path),
-            "offset_after_silence": args.offset_after_silence,
-            "silence_noise_db": args.silence_noise_db,
-            "insertions": insertions,
-        },
+    stats = render_injections(
+        args.wav, clip_path, output_path, insert_seconds, args.clip_gain_db, args.mixer, sidecar
     )
+    if stats is not None:
+        payload["mix"] = stats.as_dict()
+
+    write_injections_sidecar(sidecar, payload)
     print(f"Insertion log: {sidecar}", file=sys.stderr)
     print(f"Done: {output_path}", file=sys.stderr)
 
     if args.verify:
-        return run_verification(output_path, report, Path(__file__).resolve().parents[2])
+        return run_verification(output_path, report, schedule_overrides(args))
     return 0
 
 
@@ -9,7 +9,7 @@ Usage:
   python inject_start_buzzer.py \\
     --wav "/path/to/BDL Throwdown 5 Full Timeline_with_no_blocking.wav" \\
     --report "/path/to/..._overhead_by_round_report.json" \\
-    --transcript "/path/to/BDL Throwdown 5 Full Timeline.wav.transcript.json"
+    --transcript "/path/to/BDL Throwdown 5 Full Timeline.wav.transcript.cols"
 
   python inject_start_buzzer.py --wav ... --report ... --dry-run
 """
@@ -18,20 +18,22 @@ from __future__ import annotations
 
 import argparse
 import re
-import subprocess
 import sys
 from pathlib import Path
 
 from overhead_inject_common import (
-    build_ffmpeg_command,
+    add_verify_schedule_arguments,
     load_report,
     load_transcript,
     max_volume_db,
     probe_audio,
     run_verification,
+    schedule_overrides,
     seconds_to_hms,
     write_injections_sidecar,
 )
+from overhead_mix import add_mix_arguments, plan_injections, render_injections
+from overhead_transcript_cache import existing_cache, transcript_cache_path
 
 DEFAULT_BAND_DIR = Path(
     "/Users/jessicasartin/Downloads/15 min round - foam NS 8.5 (no time limit on NB).band"
@@ -250,8 +252,7 @@ def resolve_transcript_path(args: argparse.Namespace) -> Path | None:
         return args.transcript.expanduser()
     # Original export transcript (timestamps unchanged after no-blocking overlay).
     stem = args.wav.stem.replace("_with_no_blocking", "")
-    candidate = args.wav.with_name(f"{stem}.transcript.json")
-    return candidate if candidate.exists() else None
+    return existing_cache(transcript_cache_path(args.wav.with_name(stem + args.wav.suffix)))
 
 
 def resolve_upstream_injections(args: argparse.Namespace) -> Path | None:
@@ -320,7 +321,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--transcript",
         type=Path,
-        help="Transcript JSON (default: original {stem}.transcript.json beside wav dir)",
+        help="Transcript cache (default: original {stem}.transcript.cols beside wav dir)",
     )
     parser.add_argument("--clip", type=Path, help="Start buzzer clip to insert")
     parser.add_argument(
@@ -365,13 +366,15 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--verify",
         action="store_true",
-        help="Run verify_overhead_schedule.py --by-round on the output wav",
+        help="Verify the output wav by round in-process, re-transcribing only around the inserted clips",
     )
+    add_verify_schedule_arguments(parser)
     parser.add_argument(
         "--require-phrase-clear",
         action="store_true",
         help="Fail if any insertion overlaps speech or lands before phrase end",
     )
+    add_mix_arguments(parser)
     return parser.parse_args()
 
 
@@ -439,6 +442,30 @@ def main() -> int:
         print(f"\nDry run: would insert {len(valid)} clip(s).")
         return 0
 
+    insert_seconds = [item["insert_seconds"] for item in valid]
+    payload: dict = {
+        "source_wav": str(args.wav),
+        "clip": str(clip_path),
+        "clip_gain_db": args.clip_gain_db,
+        "injection_type": "start_buzzer",
+        "offset_after_phrase_end": args.offset_after_phrase_end,
+        "fallback_offset_after_play_start": args.fallback_offset_after_play_start,
+        "insertions": insertions,
+    }
+    if args.plan:
+        plan_injections(
+            args.plan,
+            args.wav,
+            "start_buzzer",
+            clip_path,
+            insert_seconds,
+            payload,
+            args.clip_gain_db,
+            report.get("wav_start_time"),
+            {**(report.get("schedule") or {}), **schedule_overrides(args)} or None,
+        )
+        return 0
+
     output_path = args.output
     if output_path is None:
         stem = args.wav.stem
@@ -447,31 +474,15 @@ def main() -> int:
         else:
             out_stem = f"{stem}_with_no_blocking_and_start_buzzer"
         output_path = args.wav.with_name(f"{out_stem}.wav")
-    wav_info = probe_audio(args.wav)
-    insert_seconds = [item["insert_seconds"] for item in valid]
-
-    cmd = build_ffmpeg_command(
-        args.wav,
-        clip_path,
-        output_path,
-        insert_seconds,
-        wav_info["sample_rate"],
-        wav_info["channels"],
-    )
     print(f"\nWriting: {output_path}", file=sys.stderr)
-    print(f"Inserting {len(insert_seconds)} clip(s) with ffmpeg ...", file=sys.stderr)
-    subprocess.run(cmd, check=True)
+    sidecar = output_path.with_suffix(output_path.suffix + ".injections.json")
+    stats = render_injections(
+        args.wav, clip_path, output_path, insert_seconds, args.clip_gain_db, args.mixer, sidecar
+    )
+    if stats is not None:
+        payload["mix"] = stats.as_dict()
 
     upstream = resolve_upstream_injections(args)
-    sidecar = output_path.with_suffix(output_path.suffix + ".injections.json")
-    payload: dict = {
-        "source_wav": str(args.wav),
-        "clip": str(clip_path),
-        "injection_type": "start_buzzer",
-        "offset_after_phrase_end": args.offset_after_phrase_end,
-        "fallback_offset_after_play_start": args.fallback_offset_after_play_start,
-        "insertions": insertions,
-    }
     if upstream:
         payload["upstream_injections"] = str(upstream)
     write_injections_sidecar(sidecar, payload)
@@ -479,7 +490,7 @@ def main() -> int:
     print(f"Done: {output_path}", file=sys.stderr)
 
     if args.verify:
-        return run_verification(output_path, report, Path(__file__).resolve().parents[2])
+        return run_verification(output_path, report, schedule_overrides(args))
     return 0
 
 
@@ -0,0 +1,196 @@
+"""Whole-day alignment of the expected cue timeline to the transcript.
+
+Every expected cue of the day (court calls and THROWDOWN_25MIN_MARKERS venue cues,
+in schedule order) is given a drift: how far its transcript time is from the time
+the schedule and ``--wav-start-time`` predict. Drift is a hidden state on a grid
+of ``step_seconds`` bins within +/- ``band_seconds``; a cue gains the score of a
+cue-classified segment sitting in its drift bin, and changing drift between
+consecutive cues costs ``drift_change_cost`` per second. One Viterbi pass finds
+the drift sequence with the best total, so a PA operator running late part-way
+through a round moves the curve from that cue on instead of shifting the whole
+round. The min over previous drifts is an L1 distance transform (two running
+minima), which keeps the pass at O(cues x bins).
+
+``round_anchors`` turns the curve into per-round slot anchors for ``--by-round``
+and ``write_drift_curve`` writes it as CSV for plotting.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from verify_overhead_schedule import (
+    THROWDOWN_25MIN_MARKERS,
+    VENUE_MATCH_THRESHOLD,
+    Game,
+    SegmentIndex,
+    TranscriptSegment,
+    build_slot_events,
+    get_scorer,
+    group_games_by_slot,
+    time_to_seconds,
+)
+
+ALIGN_BAND_SECONDS = 300
+ALIGN_STEP_SECONDS = 1.0
+# Score given up per second of drift change between consecutive cues: small next to
+# a cue hit (0.35-1.0), so the curve follows real lateness but not lone stray hits.
+DRIFT_CHANGE_COST = 0.005
+
+MARKER_OFFSETS = {event_type: offset for event_type, offset, _venue, _label in THROWDOWN_25MIN_MARKERS}
+
+
+@dataclass
+class DriftPoint:
+    round: int
+    event_type: str
+    court_num: int
+    wall_time: str
+    expected_wav: float
+    drift_seconds: float
+    actual_start: float | None = None
+    score: float = 0.0
+
+    @property
+    def matched(self) -> bool:
+        return self.actual_start is not None
+
+
+def cue_segments(segments: list[TranscriptSegment] | SegmentIndex) -> list[TranscriptSegment]:
+    """Segments that hit at least one EVENT_CUES pattern; everything else cannot move the curve."""
+    scorer = get_scorer()
+    return [s for s in segments if any(scorer.features(s.text).cue_hits.values())]
+
+
+def l1_min_plus(cost: Any, step_cost: float) -> tuple[Any, Any]:
+    """For each bin d: min over d' of cost[d'] + step_cost * |d - d'|, and the d' reaching it.
+
+    Ties go to the nearest bin at or below d.
+    """
+    bins = np.arange(len(cost))
+    down = cost - step_cost * bins
+    down_min = np.minimum.accumulate(down)
+    down_arg = np.maximum.accumulate(np.where(down == down_min, bins, 0))
+    up = (cost + step_cost * bins)[::-1]
+    up_min = np.minimum.accumulate(up)
+    up_arg = (len(cost) - 1 - np.maximum.accumulate(np.where(up == up_min, bins, 0)))[::-1]
+    from_below = down_min + step_cost * bins
+    from_above = up_min[::-1] - step_cost * bins
+    above = from_above < from_below
+    return np.where(above, from_above, from_below), np.where(above, up_arg, down_arg)
+
+
+def align_timeline(
+    games: list[Game],
+    segments: list[TranscriptSegment] | SegmentIndex,
+    wav_start_time: str,
+    skip_ranges: list[tuple[int, int]] | None = None,
+    skip_before: str | None = None,
+    min_confidence: float = 0.55,
+    band_seconds: float = ALIGN_BAND_SECONDS,
+    step_seconds: float = ALIGN_STEP_SECONDS,
+    drift_change_cost: float = DRIFT_CHANGE_COST,
+) -> list[DriftPoint]:
+    """Drift of every non-skipped cue of the day, in schedule order."""
+    scorer = get_scorer()
+    index = SegmentIndex(cue_segments(segments))
+    global_anchor = time_to_seconds(wav_start_time)
+    offsets = np.arange(-band_seconds, band_seconds + step_seconds / 2, step_seconds)
+    last_offset = max(MARKER_OFFSETS.values())
+
+    points: list[DriftPoint] = []
+    gains: list[Any] = []
+    picks: list[Any] = []
+    for round_idx, (slot_start, slot_games) in enumerate(group_games_by_slot(games), start=1):
+        hint_wav = float(slot_start - global_anchor)
+        events = [
+            e
+            for e in build_slot_events(slot_games, slot_start, hint_wav, skip_ranges or [], skip_before)
+            if not e.skipped
+        ]
+        events.sort(key=lambda e: (e.wav_offset_seconds, e.court_num))
+        window = index.between(hint_wav - band_seconds, hint_wav + last_offset + band_seconds)
+        scores = scorer.score_matrix(events, window)
+        starts = np.array([s.start for s in window], dtype=np.float64)
+        for row, event in enumerate(events):
+            gain = np.zeros(len(offsets))
+            start_at = np.full(len(offsets), np.nan)
+            threshold = VENUE_MATCH_THRESHOLD if event.venue_wide else min_confidence
+            bins = np.rint((starts - event.wav_offset_seconds + band_seconds) / step_seconds).astype(np.intp)
+            for col in np.flatnonzero((bins >= 0) & (bins < len(offsets)) & (scores[row] >= threshold)):
+                if scores[row, col] > gain[bins[col]]:
+                    gain[bins[col]] = scores[row, col]
+                    start_at[bins[col]] = starts[col]
+            gains.append(gain)
+            picks.append(start_at)
+            points.append(
+                DriftPoint(
+                    round=round_idx,
+                    event_type=event.event_type,
+                    court_num=event.court_num,
+                    wall_time=event.wall_time,
+                    expected_wav=event.wav_offset_seconds,
+                    drift_seconds=0.0,
+                )
+            )
+    if not points:
+        return points
+
+    # The curve starts from the schedule anchor: the first cue pays for its drift from 0.
+    step_cost = drift_change_cost * step_seconds
+    cost = drift_change_cost * np.abs(offsets) - gains[0]
+    back: list[Any] = []
+    for gain in gains[1:]:
+        best, arg = l1_min_plus(cost, step_cost)
+        back.append(arg)
+        cost = best - gain
+    path = [int(np.argmin(cost))]
+    for arg in reversed(back):
+        path.append(int(arg[path[-1]]))
+    path.reverse()
+
+    for point, bin_, gain, start_at in zip(points, path, gains, picks):
+        point.drift_seconds = float(offsets[bin_])
+        if gain[bin_] > 0.0:
+            point.actual_start = float(start_at[bin_])
+            point.drift_seconds = point.actual_start - point.expected_wav
+            point.score = float(gain[bin_])
+    return points
+
+
+def round_anchors(points: list[DriftPoint]) -> dict[int, float]:
+    """Slot anchor per round: where the curve puts its play start (first cue if skipped) minus the marker offset."""
+    anchors: dict[int, float] = {}
+    for point in points:
+        if point.round in anchors and point.event_type != "play_start":
+            continue
+        offset = MARKER_OFFSETS[point.event_type]
+        anchors[point.round] = round(point.expected_wav - offset + point.drift_seconds, 1)
+    return anchors
+
+
+def write_drift_curve(path: Path, points: list[DriftPoint]) -> None:
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(
+            ["round", "event_type", "court", "wall_time", "expected_wav", "drift_seconds", "matched", "actual_start", "score"]
+        )
+        for p in points:
+            writer.writerow(
+                [
+                    p.round,
+                    p.event_type,
+                    "ALL" if p.court_num == 0 else p.court_num,
+                    p.wall_time,
+                    round(p.expected_wav, 1),
+                    round(p.drift_seconds, 1),
+                    int(p.matched),
+                    "" if p.actual_start is None else round(p.actual_start, 2),
+                    round(p.score, 3),
+                ]
+            )
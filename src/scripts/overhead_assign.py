@@ -0,0 +1,124 @@
+"""Maximum-weight matching of expected events to transcript segments.
+
+Each event lists the segments it may take (inside its time window, above its
+score threshold) with a weight. ``assign_candidates`` picks at most one segment
+per event and one event per segment so the total weight is as large as
+possible. Events only compete with events whose windows share a segment, so
+the candidate graph is split into connected components and each component is
+solved as a small dense assignment problem (Hungarian / Jonker-Volgenant
+shortest augmenting paths). A full day is hundreds of tiny problems, never one
+events x segments matrix.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+# Cost of a forbidden (event, segment) pair; finite so potentials stay well-defined.
+FORBIDDEN_COST = 1e9
+
+
+def solve_assignment(cost: Any) -> list[int]:
+    """Column assigned to each row minimizing total cost; needs rows <= columns.
+
+    Shortest augmenting path with row/column potentials, one row added at a time,
+    O(rows^2 * columns). Ties resolve to the lowest column index, so the result
+    only depends on the matrix.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    rows, cols = cost.shape
+    if rows > cols:
+        raise ValueError(f"need rows <= columns, got {rows}x{cols}")
+    u = np.zeros(rows + 1)
+    v = np.zeros(cols + 1)
+    # owner[j]: 1-based row holding column j (0 = free); column 0 is the virtual start.
+    owner = np.zeros(cols + 1, dtype=np.int64)
+    way = np.zeros(cols + 1, dtype=np.int64)
+    for row in range(1, rows + 1):
+        owner[0] = row
+        j0 = 0
+        minv = np.full(cols + 1, np.inf)
+        used = np.zeros(cols + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            free = ~used[1:]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            masked = np.where(free, minv[1:], np.inf)
+            j1 = int(masked.argmin()) + 1
+            delta = masked[j1 - 1]
+            u[owner[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    assignment = [-1] * rows
+    for col in range(1, cols + 1):
+        if owner[col]:
+            assignment[owner[col] - 1] = col - 1
+    return assignment
+
+
+def candidate_components(candidates: list[dict[int, float]]) -> list[list[int]]:
+    """Rows grouped by shared candidate columns (union-find), each group sorted."""
+    parent = list(range(len(candidates)))
+
+    def find(row: int) -> int:
+        while parent[row] != row:
+            parent[row] = parent[parent[row]]
+            row = parent[row]
+        return row
+
+    first_row: dict[int, int] = {}
+    for row, options in enumerate(candidates):
+        for col in options:
+            if col in first_row:
+                a, b = find(row), find(first_row[col])
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+            else:
+                first_row[col] = row
+
+    groups: dict[int, list[int]] = {}
+    for row, options in enumerate(candidates):
+        if options:
+            groups.setdefault(find(row), []).append(row)
+    return list(groups.values())
+
+
+def assign_candidates(candidates: list[dict[int, float]]) -> list[int | None]:
+    """Segment chosen for each row of ``{segment: weight}`` maps, maximizing total weight.
+
+    Weights must be positive; a row may stay unassigned (None) when every segment
+    it could take is worth more to other rows.
+    """
+    picks: list[int | None] = [None] * len(candidates)
+    for rows in candidate_components(candidates):
+        if len(rows) == 1:
+            options = candidates[rows[0]]
+            # Highest weight, earliest segment on ties, as the matrix solve would pick.
+            picks[rows[0]] = min(options, key=lambda col: (-options[col], col))
+            continue
+        cols = sorted({col for row in rows for col in candidates[row]})
+        position = {col: pos for pos, col in enumerate(cols)}
+        # One private "unassigned" column per row at cost 0 after the real columns.
+        cost = np.full((len(rows), len(cols) + len(rows)), FORBIDDEN_COST)
+        for r, row in enumerate(rows):
+            for col, weight in candidates[row].items():
+                cost[r, position[col]] = -weight
+            cost[r, len(cols) + r] = 0.0
+        for r, col in enumerate(solve_assignment(cost)):
+            if col < len(cols):
+                picks[rows[r]] = cols[col]
+    return picks
@@ -0,0 +1,577 @@
+"""Direct access to venue-wide overhead .wav files without re-decoding through ffmpeg."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+HASH_READ_BYTES = 1 << 20
+
+ANALYSIS_SAMPLE_RATE = 16000
+PCM_DIRNAME = ".overhead_pcm"
+# volumedetect's floor for digital silence in 16-bit audio.
+SILENCE_FLOOR_DB = -91.0
+LEVEL_FRAME_SECONDS = 0.01
+LEVEL_BLOCK_FRAMES = 6000
+# (name, 10 ms frames per entry) of each envelope resolution, finest first.
+ENVELOPE_LEVELS = (("10ms", 1), ("100ms", 10), ("1s", 100))
+FINGERPRINT_BLOCKS = 32
+FINGERPRINT_BLOCK_BYTES = 1 << 16
+SILENCE_HYSTERESIS_DB = 3.0
+
+
+@dataclass
+class WavLayout:
+    """Location and format of the RIFF ``data`` chunk of a .wav file."""
+
+    format_tag: int
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+    block_align: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def frames(self) -> int:
+        return self.data_size // self.block_align
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate
+
+    @property
+    def is_pcm(self) -> bool:
+        return self.format_tag in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT)
+
+    def byte_range(self, start: float, end: float) -> tuple[int, int]:
+        """Absolute file byte range covering [start, end) seconds, clamped to the data chunk."""
+        first = min(self.frames, max(0, int(round(start * self.sample_rate))))
+        last = min(self.frames, max(first, int(round(end * self.sample_rate))))
+        return (
+            self.data_offset + first * self.block_align,
+            self.data_offset + last * self.block_align,
+        )
+
+
+def read_wav_layout(path: Path) -> WavLayout | None:
+    """Parse the RIFF header of path; None when it is not a readable WAVE file."""
+    try:
+        file_size = path.stat().st_size
+        with path.open("rb") as handle:
+            header = handle.read(12)
+            if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+                return None
+            fmt: tuple[int, int, int, int, int] | None = None
+            while True:
+                chunk_header = handle.read(8)
+                if len(chunk_header) < 8:
+                    return None
+                chunk_id = chunk_header[:4]
+                chunk_size = struct.unpack("<I", chunk_header[4:])[0]
+                if chunk_id == b"fmt ":
+                    body = handle.read(chunk_size)
+                    format_tag, channels, sample_rate, _byte_rate, block_align, bits = (
+                        struct.unpack("<HHIIHH", body[:16])
+                    )
+                    if format_tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                        format_tag = struct.unpack("<H", body[24:26])[0]
+                    fmt = (format_tag, channels, sample_rate, block_align, bits)
+                    if chunk_size % 2:
+                        handle.seek(1, 1)
+                    continue
+                if chunk_id == b"data":
+                    if fmt is None:
+                        return None
+                    data_offset = handle.tell()
+                    available = file_size - data_offset
+                    # Recorders still writing (or >4 GB exports) leave a placeholder size.
+                    data_size = chunk_size if 0 < chunk_size <= available else available
+                    format_tag, channels, sample_rate, block_align, bits = fmt
+                    return WavLayout(
+                        format_tag=format_tag,
+                        channels=channels,
+                        sample_rate=sample_rate,
+                        bits_per_sample=bits,
+                        block_align=block_align,
+                        data_offset=data_offset,
+                        data_size=data_size - data_size % block_align,
+                    )
+                handle.seek(chunk_size + chunk_size % 2, 1)
+    except (OSError, struct.error):
+        return None
+
+
+def hash_wav_range(path: Path, layout: WavLayout | None, start: float, end: float) -> str:
+    """Content hash of the samples in [start, end) seconds.
+
+    Falls back to the file's size and mtime when the wav is not plain PCM, so the key
+    still changes whenever the file does.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if layout is None or not layout.is_pcm:
+        stat = path.stat()
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}:{start:.3f}:{end:.3f}".encode())
+        return digest.hexdigest()
+
+    first, last = layout.byte_range(start, end)
+    with path.open("rb") as handle:
+        handle.seek(first)
+        remaining = last - first
+        while remaining > 0:
+            block = handle.read(min(HASH_READ_BYTES, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def wav_fingerprint(path: Path, layout: WavLayout | None) -> str:
+    """Cheap content key for a whole wav: size, mtime and evenly spaced sample blocks.
+
+    Reading a fixed number of blocks keeps this constant-time for multi-gigabyte files
+    while still telling apart same-sized variants (e.g. injected copies).
+    """
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    start = layout.data_offset if layout is not None else 0
+    span = max(0, stat.st_size - start - FINGERPRINT_BLOCK_BYTES)
+    with path.open("rb") as handle:
+        for block in range(FINGERPRINT_BLOCKS):
+            handle.seek(start + span * block // max(1, FINGERPRINT_BLOCKS - 1))
+            digest.update(handle.read(FINGERPRINT_BLOCK_BYTES))
+    return digest.hexdigest()
+
+
+def decode_to_pcm_file(wav_path: Path, output: Path, sample_rate: int | None, channels: int | None) -> None:
+    """Decode wav_path to raw s16le at output (atomically), optionally resampled/downmixed."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(output.name + ".tmp")
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", str(wav_path)]
+    if channels:
+        cmd += ["-ac", str(channels)]
+    if sample_rate:
+        cmd += ["-ar", str(sample_rate)]
+    cmd += ["-f", "s16le", "-acodec", "pcm_s16le", str(tmp)]
+    subprocess.run(cmd, capture_output=True, check=True)
+    os.replace(tmp, output)
+
+
+def to_db(amplitude: float) -> float:
+    if amplitude <= 0.0:
+        return SILENCE_FLOOR_DB
+    return max(SILENCE_FLOOR_DB, 20.0 * math.log10(amplitude))
+
+
+class OverheadAudio:
+    """Memory-mapped PCM views of one overhead .wav, shared by every analysis tool.
+
+    ``native`` is the file's own samples (frames x channels) and ``mono16k`` the
+    16 kHz mono signal whisper and VAD expect. Plain 16-bit / float PCM data chunks
+    are mapped straight out of the .wav; anything else is decoded once with ffmpeg
+    into a raw s16le sidecar under ``.overhead_pcm/`` beside it, keyed by the wav's
+    size and mtime. Every read after that is a slice of a memmap.
+    """
+
+    _open: dict[Path, OverheadAudio] = {}
+
+    def __init__(self, wav_path: Path, sidecar_dir: Path | None = None):
+        self.wav_path = wav_path
+        self.sidecar_dir = sidecar_dir or wav_path.parent / PCM_DIRNAME
+        stat = wav_path.stat()
+        self.signature = (stat.st_size, stat.st_mtime_ns)
+        self.layout = read_wav_layout(wav_path)
+        self._native: Any = None
+        self._mono16k: Any = None
+        self._levels: Any = None
+        self._envelope: LoudnessEnvelope | None = None
+        self._silences: dict[tuple[float, float, float], SilenceIntervals] = {}
+
+    @classmethod
+    def open(cls, wav_path: Path) -> OverheadAudio:
+        """Shared instance for wav_path, reopened when the file changes on disk."""
+        key = wav_path.resolve()
+        audio = cls._open.get(key)
+        stat = wav_path.stat()
+        if audio is None or audio.signature != (stat.st_size, stat.st_mtime_ns):
+            audio = cls._open[key] = cls(wav_path)
+        return audio
+
+    @property
+    def sample_rate(self) -> int:
+        """Rate of ``native``; the 16 kHz view is used when the file is not a WAVE."""
+        return self.layout.sample_rate if self.layout is not None else ANALYSIS_SAMPLE_RATE
+
+    @property
+    def duration(self) -> float:
+        return len(self.native) / self.sample_rate
+
+    def _sidecar(self, suffix: str) -> Path:
+        size, mtime_ns = self.signature
+        return self.sidecar_dir / f"{self.wav_path.name}.{size}-{mtime_ns}.{suffix}"
+
+    def _mapped_sidecar(self, suffix: str, sample_rate: int | None, channels: int | None) -> Any:
+        import numpy as np
+
+        path = self._sidecar(suffix)
+        if not path.exists():
+            for stale in self.sidecar_dir.glob(f"{self.wav_path.name}.*.{suffix}"):
+                stale.unlink(missing_ok=True)
+            decode_to_pcm_file(self.wav_path, path, sample_rate, channels)
+        if not path.stat().st_size:
+            return np.zeros(0, dtype=np.int16)
+        return np.memmap(path, dtype=np.int16, mode="r")
+
+    @property
+    def native(self) -> Any:
+        """(frames, channels) memmap at the file's own sample rate."""
+        if self._native is None:
+            import numpy as np
+
+            layout = self.layout
+            dtype = None
+            if layout is not None and layout.is_pcm:
+                dtype = {
+                    (WAVE_FORMAT_PCM, 16): np.dtype("<i2"),
+                    (WAVE_FORMAT_IEEE_FLOAT, 32): np.dtype("<f4"),
+                }.get((layout.format_tag, layout.bits_per_sample))
+            if dtype is not None and layout.frames:
+                self._native = np.memmap(
+                    self.wav_path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=layout.data_offset,
+                    shape=(layout.frames, layout.channels),
+                )
+            elif layout is None:
+                self._native = self.mono16k.reshape(-1, 1)
+            else:
+                flat = self._mapped_sidecar(f"{layout.sample_rate}.s16", None, None)
+                channels = layout.channels
+                self._native = flat[: len(flat) - len(flat) % channels].reshape(-1, channels)
+        return self._native
+
+    @property
+    def mono16k(self) -> Any:
+        """16 kHz mono int16 memmap (the file itself when it already is 16 kHz mono s16)."""
+        if self._mono16k is None:
+            layout = self.layout
+            if (
+                layout is not None
+                and layout.format_tag == WAVE_FORMAT_PCM
+                and layout.bits_per_sample == 16
+                and layout.channels == 1
+                and layout.sample_rate == ANALYSIS_SAMPLE_RATE
+            ):
+                self._mono16k = self.native[:, 0]
+            else:
+                self._mono16k = self._mapped_sidecar("16k.s16", ANALYSIS_SAMPLE_RATE, 1)
+        return self._mono16k
+
+    def _frames(self, start: float, end: float, rate: int, total: int) -> tuple[int, int]:
+        first = min(total, max(0, int(round(start * rate))))
+        last = min(total, max(first, int(round(end * rate))))
+        return first, last
+
+    def slice(self, start: float, end: float) -> Any:
+        """[start, end) seconds of the 16 kHz mono signal as float32 in [-1, 1)."""
+        import numpy as np
+
+        samples = self.mono16k
+        first, last = self._frames(start, end, ANALYSIS_SAMPLE_RATE, len(samples))
+        return np.asarray(samples[first:last], dtype=np.float32) / 32768.0
+
+    def native_slice(self, start: float, end: float) -> Any:
+        """[start, end) seconds of the native samples, (frames, channels), zero-copy."""
+        samples = self.native
+        first, last = self._frames(start, end, self.sample_rate, len(samples))
+        return samples[first:last]
+
+    def _full_scale(self) -> float:
+        return 1.0 if self.native.dtype.kind == "f" else 32768.0
+
+    @property
+    def envelope(self) -> LoudnessEnvelope:
+        """Peak/RMS pyramid of the file, loaded from ``.overhead_pcm/`` or built once."""
+        if self._envelope is None:
+            key = wav_fingerprint(self.wav_path, self.layout)
+            paths = [
+                self.sidecar_dir / f"{self.wav_path.name}.{key}.env{name}.npy"
+                for name, _frames in ENVELOPE_LEVELS
+            ]
+            envelope = LoudnessEnvelope.load(paths, self.sample_rate, len(self.native))
+            if envelope is None:
+                envelope = LoudnessEnvelope.build(self.native, self.sample_rate, self._full_scale())
+                for stale in self.sidecar_dir.glob(f"{self.wav_path.name}.*.env*.npy"):
+                    stale.unlink(missing_ok=True)
+                envelope.save(paths)
+            self._envelope = envelope
+        return self._envelope
+
+    def _window_levels(self, start: float, end: float) -> tuple[float, float, int] | None:
+        total = len(self.native)
+        first, last = self._frames(start, end, self.sample_rate, total)
+        if last <= first:
+            return None
+        return self.envelope.window(self.native, first, last, self._full_scale())
+
+    def peak_db(self, start: float, end: float) -> float | None:
+        """Peak level over [start, end) in dBFS (ffmpeg volumedetect's max_volume)."""
+        levels = self._window_levels(start, end)
+        if levels is None:
+            return None
+        return to_db(levels[0])
+
+    def rms_db(self, start: float, end: float) -> float | None:
+        """RMS level over [start, end) in dBFS, of the loudest channel per 10 ms frame."""
+        levels = self._window_levels(start, end)
+        if levels is None:
+            return None
+        _peak, sumsq, count = levels
+        return to_db(math.sqrt(sumsq / count))
+
+    def frame_levels_db(self) -> Any:
+        """Per-10 ms-frame RMS in dBFS over the whole file (loudest channel)."""
+        import numpy as np
+
+        if self._levels is None:
+            envelope = self.envelope
+            counts = np.full(len(envelope.levels[0]), envelope.frame_len, dtype=np.float64)
+            if len(counts):
+                counts[-1] = envelope.total - envelope.frame_len * (len(counts) - 1)
+            mean_square = np.asarray(envelope.levels[0][:, 1], dtype=np.float64) / counts
+            with np.errstate(divide="ignore"):
+                self._levels = np.maximum(10.0 * np.log10(mean_square), SILENCE_FLOOR_DB).astype(
+                    np.float32
+                )
+        return self._levels
+
+    def silence_intervals(
+        self,
+        noise_db: float,
+        min_silence: float,
+        hysteresis_db: float = SILENCE_HYSTERESIS_DB,
+    ) -> SilenceIntervals:
+        """Every silence of the file for these settings, computed once per instance."""
+        key = (noise_db, min_silence, hysteresis_db)
+        cached = self._silences.get(key)
+        if cached is None:
+            cached = self._silences[key] = SilenceIntervals.from_levels(
+                self.frame_levels_db(),
+                LEVEL_FRAME_SECONDS,
+                self.duration,
+                noise_db,
+                min_silence,
+                hysteresis_db,
+            )
+        return cached
+
+    def silences(
+        self,
+        start: float,
+        end: float,
+        noise_db: float,
+        min_silence: float,
+    ) -> list[tuple[float, float]]:
+        """(start, end) silences within [start, end), answered from silence_intervals."""
+        return self.silence_intervals(noise_db, min_silence).window(start, end)
+
+
+@dataclass
+class SilenceIntervals:
+    """Sorted, non-overlapping silences of a whole file with window queries.
+
+    A frame enters silence once its RMS drops below ``noise_db`` and only leaves it
+    when the RMS rises above ``noise_db + hysteresis_db``, so level flutter around
+    the threshold does not split one pause into many. Runs shorter than
+    ``min_silence`` are dropped.
+    """
+
+    starts: Any
+    ends: Any
+    min_silence: float
+
+    @classmethod
+    def from_levels(
+        cls,
+        levels_db: Any,
+        frame_seconds: float,
+        duration: float,
+        noise_db: float,
+        min_silence: float,
+        hysteresis_db: float,
+    ) -> SilenceIntervals:
+        import numpy as np
+
+        enter = levels_db < noise_db
+        leave = levels_db > noise_db + hysteresis_db
+        # State at each frame is set by the most recent enter/leave frame (forward fill).
+        marks = np.where(enter | leave, np.arange(len(levels_db)), -1)
+        last_mark = np.maximum.accumulate(marks) if len(marks) else marks
+        quiet = (last_mark >= 0) & enter[np.maximum(last_mark, 0)]
+
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], quiet.astype(np.int8), [0]))))
+        starts = edges[::2] * frame_seconds
+        ends = np.minimum(edges[1::2] * frame_seconds, duration)
+        keep = (ends - starts) >= min_silence
+        return cls(starts=starts[keep], ends=ends[keep], min_silence=min_silence)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def window(self, start: float, end: float) -> list[tuple[float, float]]:
+        """Silences overlapping [start, end), clipped to it; clipped runs must still
+        last min_silence, as silencedetect would require within that window."""
+        import numpy as np
+
+        first = int(np.searchsorted(self.ends, start, side="right"))
+        last = int(np.searchsorted(self.starts, end, side="left"))
+        runs: list[tuple[float, float]] = []
+        for run_start, run_end in zip(self.starts[first:last], self.ends[first:last]):
+            clipped = (max(float(run_start), start), min(float(run_end), end))
+            if clipped[1] - clipped[0] >= self.min_silence:
+                runs.append(clipped)
+        return runs
+
+
+@dataclass
+class LoudnessEnvelope:
+    """Peak and sum-of-squares pyramid at 10 ms, 100 ms and 1 s.
+
+    Each level is a (n, 2) float32 array of [peak, sum of squares] per entry, both in
+    full-scale units; the sum of squares is taken on the loudest channel of each 10 ms
+    frame. A window is answered from whole coarse entries in the middle, finer
+    entries towards the edges and the raw samples of the two partial frames.
+    """
+
+    sample_rate: int
+    frame_len: int
+    total: int
+    levels: list[Any]
+
+    def __post_init__(self) -> None:
+        import numpy as np
+
+        # Contiguous per-column copies: the query path reads a handful of entries per
+        # level, where plain Python over .tolist() beats numpy call overhead.
+        self._peaks = [np.ascontiguousarray(level[:, 0]) for level in self.levels]
+        self._sums = [np.ascontiguousarray(level[:, 1], dtype=np.float64) for level in self.levels]
+
+    @staticmethod
+    def frame_length(sample_rate: int) -> int:
+        return max(1, int(round(LEVEL_FRAME_SECONDS * sample_rate)))
+
+    @classmethod
+    def build(cls, samples: Any, sample_rate: int, full_scale: float) -> LoudnessEnvelope:
+        import numpy as np
+
+        frame_len = cls.frame_length(sample_rate)
+        total = len(samples)
+        channels = samples.shape[1] if total else 1
+        frames = np.zeros(((total + frame_len - 1) // frame_len, 2), dtype=np.float32)
+        block = frame_len * LEVEL_BLOCK_FRAMES
+        for offset in range(0, total, block):
+            chunk = np.asarray(samples[offset : offset + block])
+            if len(chunk) % frame_len:
+                # Zero padding changes neither the peak nor the sum of squares.
+                pad = np.zeros((frame_len - len(chunk) % frame_len, channels), dtype=chunk.dtype)
+                chunk = np.concatenate([chunk, pad])
+            count = len(chunk) // frame_len
+            out = offset // frame_len
+            # Interleaved samples of one frame are contiguous, so the peak is a row max.
+            flat = chunk.reshape(count, frame_len * channels)
+            if chunk.dtype.kind == "i":
+                peak = np.maximum(flat.max(axis=1).astype(np.int32), -flat.min(axis=1).astype(np.int32))
+            else:
+                peak = np.abs(flat).max(axis=1)
+            frames[out : out + count, 0] = peak / full_scale
+            per_channel = chunk.astype(np.float32).reshape(count, frame_len, channels).transpose(0, 2, 1)
+            sumsq = np.matmul(per_channel[:, :, None, :], per_channel[:, :, :, None])[:, :, 0, 0]
+            frames[out : out + count, 1] = sumsq.max(axis=1) / (full_scale * full_scale)
+
+        levels = [frames]
+        for depth in range(1, len(ENVELOPE_LEVELS)):
+            step = ENVELOPE_LEVELS[depth][1] // ENVELOPE_LEVELS[depth - 1][1]
+            finer = levels[-1]
+            count = (len(finer) + step - 1) // step
+            padded = np.zeros((count * step, 2), dtype=np.float32)
+            padded[: len(finer)] = finer
+            grouped = padded.reshape(count, step, 2)
+            levels.append(
+                np.stack([grouped[:, :, 0].max(axis=1), grouped[:, :, 1].sum(axis=1)], axis=1)
+            )
+        return cls(sample_rate=sample_rate, frame_len=frame_len, total=total, levels=levels)
+
+    @classmethod
+    def load(cls, paths: list[Path], sample_rate: int, total: int) -> LoudnessEnvelope | None:
+        import numpy as np
+
+        if not all(path.exists() for path in paths):
+            return None
+        frame_len = cls.frame_length(sample_rate)
+        levels = [np.load(path, mmap_mode="r") for path in paths]
+        if len(levels[0]) != (total + frame_len - 1) // frame_len:
+            return None
+        return cls(sample_rate=sample_rate, frame_len=frame_len, total=total, levels=levels)
+
+    def save(self, paths: list[Path]) -> None:
+        import numpy as np
+
+        for path, level in zip(paths, self.levels):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp.npy")
+            np.save(tmp, level)
+            os.replace(tmp, path)
+
+    def _entries(self, depth: int, first: int, last: int) -> tuple[float, float]:
+        """Combine level ``depth`` entries [first, last), using coarser levels inside."""
+        spans = [(first, last)]
+        if depth + 1 < len(self.levels):
+            step = ENVELOPE_LEVELS[depth + 1][1] // ENVELOPE_LEVELS[depth][1]
+            inner_first = -(-first // step)
+            inner_last = last // step
+            if inner_first < inner_last:
+                peak, sumsq = self._entries(depth + 1, inner_first, inner_last)
+                spans = [(first, inner_first * step), (inner_last * step, last)]
+            else:
+                peak, sumsq = 0.0, 0.0
+        else:
+            peak, sumsq = 0.0, 0.0
+        peaks, sums = self._peaks[depth], self._sums[depth]
+        for lo, hi in spans:
+            if hi > lo:
+                peak = max(peak, max(peaks[lo:hi].tolist()))
+                sumsq += sum(sums[lo:hi].tolist())
+        return peak, sumsq
+
+    def window(self, samples: Any, first: int, last: int, full_scale: float) -> tuple[float, float, int]:
+        """(peak, sum of squares, sample count) over samples [first, last)."""
+        import numpy as np
+
+        frame_len = self.frame_len
+        inner_first = -(-first // frame_len)
+        inner_last = last // frame_len if last < self.total else len(self.levels[0])
+        peak, sumsq = 0.0, 0.0
+        if inner_first < inner_last:
+            peak, sumsq = self._entries(0, inner_first, inner_last)
+            edges = [(first, inner_first * frame_len), (inner_last * frame_len, last)]
+        else:
+            edges = [(first, last)]
+        for lo, hi in edges:
+            if hi > lo:
+                raw = np.asarray(samples[lo:hi], dtype=np.float64) / full_scale
+                peak = max(peak, float(np.abs(raw).max()))
+                sumsq += float((raw * raw).sum(axis=0).max())
+        return peak, sumsq, last - first
@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+"""Verify a whole weekend of venue-wide overhead recordings in one run.
+
+A manifest lists one job per line (JSONL): the wav, its schedule date and courts,
+and the wall-clock time the wav starts at. The batch runs in two phases that each
+keep every core busy:
+
+1. Transcription. Every wav whose transcript cache is missing or stale is planned
+   into VAD-bounded chunks (overhead_transcribe.plan_transcription), and the
+   pending chunks of all of them go through one whisper process pool, round-robin
+   across the wavs. Chunk checkpoints, transcript caches and speech regions are
+   the same files a single verify_overhead_schedule.py run reads and writes, so an
+   interrupted batch resumes and a later single-wav run starts from the cache.
+2. Verification. Refinement and matching run per job across a second process
+   pool (verify_overhead_schedule.verify_overhead), each job writing the same
+   by-round report a --by-round run does.
+
+Injected wavs (``"injections": true``) reuse the transcript of the wav they were
+made from, so they only re-transcribe around their clips; put the source wav in
+the same manifest and it is transcribed first. The combined report has every
+job's outcome and per-job timings.
+
+Manifest line:
+  {"wav": "day1.wav", "date": "2026-06-20", "courts": "2,3,4", "wav_start_time": "09:00"}
+Optional keys: name, schedule_dir, model, injections, skip (list of HH:MM-HH:MM),
+skip_before, output_report. Relative paths in the manifest are relative to the manifest;
+--schedule-dir is relative to the working directory.
+
+Usage:
+  python overhead_batch.py --manifest weekend.jsonl \\
+    --schedule-dir src/output/June2026Tournament/schedule/generated
+  python overhead_batch.py --manifest weekend.jsonl --schedule-dir DIR --workers 8 --vad-prefilter
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from overhead_models import (
+    add_model_pool_arguments,
+    configure_model_pool,
+    configure_model_pool_from_args,
+    model_daemon_address,
+)
+from overhead_transcribe import (
+    DEFAULT_CHUNK_SECONDS,
+    DEFAULT_OVERLAP_SECONDS,
+    ChunkPlan,
+    TranscriptChunkStore,
+    default_cpu_threads,
+    iter_plan_results,
+    plan_transcription,
+)
+from overhead_transcript_cache import (
+    read_transcript_file,
+    refinement_cache_path,
+    transcript_cache_path,
+)
+from overhead_vad import print_speech_regions, speech_regions
+from verify_overhead_schedule import (
+    get_wav_duration,
+    load_games,
+    load_refinement_cache,
+    parse_skip_ranges,
+    save_refinement_cache,
+    transcript_cache_is_current,
+    verify_overhead,
+    write_transcript_cache,
+)
+
+REQUIRED_KEYS = ("wav", "date", "wav_start_time")
+
+
+@dataclass
+class BatchJob:
+    name: str
+    wav: Path
+    date: str
+    courts: list[int]
+    wav_start_time: str
+    schedule_dir: Path
+    model: str = "small"
+    injections: bool = False
+    skip: list[str] = field(default_factory=list)
+    skip_before: str | None = None
+    output_report: Path | None = None
+
+    @property
+    def cache_path(self) -> Path:
+        return transcript_cache_path(self.wav)
+
+    @property
+    def report_path(self) -> Path:
+        return self.output_report or self.wav.with_name(f"{self.wav.stem}_overhead_by_round_report.json")
+
+
+@dataclass
+class JobResult:
+    """Outcome and timings of one job; ``*_at`` are seconds since the batch started."""
+
+    name: str
+    wav: str
+    status: str = "pending"
+    transcript: str = "cached"  # cached, transcribed, patched (injected wavs) or none
+    rounds_passed: int = 0
+    rounds_total: int = 0
+    transcribe_serial_seconds: float = 0.0
+    transcribed_at: float | None = None
+    verify_seconds: float = 0.0
+    finished_at: float | None = None
+    report: str | None = None
+    transcription: dict | None = None
+    refinement: dict | None = None
+    error: str | None = None
+
+    def as_dict(self) -> dict:
+        payload = asdict(self)
+        for key in ("transcribe_serial_seconds", "transcribed_at", "verify_seconds", "finished_at"):
+            if payload[key] is not None:
+                payload[key] = round(payload[key], 2)
+        return payload
+
+
+def parse_courts(value: str | list) -> list[int]:
+    if isinstance(value, list):
+        return [int(court) for court in value]
+    return [int(court.strip()) for court in str(value).split(",") if court.strip()]
+
+
+def load_manifest(path: Path, schedule_dir: Path | None = None, model: str = "small") -> list[BatchJob]:
+    """Jobs of a JSONL manifest; ``schedule_dir`` and ``model`` are the defaults for lines without them."""
+    jobs: list[BatchJob] = []
+    base = path.parent
+    with path.open(encoding="utf-8") as handle:
+        for line_num, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            data = json.loads(line)
+            missing = [key for key in REQUIRED_KEYS if not data.get(key)]
+            if missing:
+                raise ValueError(f"{path}:{line_num}: missing {', '.join(missing)}")
+            job_schedule_dir = base / data["schedule_dir"] if data.get("schedule_dir") else schedule_dir
+            if job_schedule_dir is None:
+                raise ValueError(f"{path}:{line_num}: no schedule_dir and no --schedule-dir default")
+            wav = base / data["wav"]
+            output_report = data.get("output_report")
+            jobs.append(
+                BatchJob(
+                    name=data.get("name") or wav.stem,
+                    wav=wav,
+                    date=data["date"],
+                    courts=parse_courts(data.get("courts", "2,3,4")),
+                    wav_start_time=data["wav_start_time"],
+                    schedule_dir=job_schedule_dir,
+                    model=data.get("model") or model,
+                    injections=bool(data.get("injections", False)),
+                    skip=list(data.get("skip", [])),
+                    skip_before=data.get("skip_before"),
+                    output_report=base / output_report if output_report else None,
+                )
+            )
+    names = [job.name for job in jobs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(
+            f"{path}: duplicate job name(s) {', '.join(duplicates)}; set \"name\" on those lines"
+        )
+    return jobs
+
+
+def transcript_needed(job: BatchJob, word_timestamps: bool = False) -> bool:
+    """True when the job's transcript cache is missing, stale, or lacks requested word timings."""
+    cached = read_transcript_file(job.cache_path)
+    if cached is None:
+        return True
+    meta, _segments = cached
+    if word_timestamps and not meta.get("word_timestamps"):
+        return True
+    return not transcript_cache_is_current(meta, job.wav)
+
+
+def fail_job(result: JobResult, exc: Exception) -> None:
+    """Mark a job whose wav could not be transcribed; it is not verified."""
+    if result.status == "error":
+        return
+    result.status = "error"
+    result.transcript = "none"
+    result.error = f"{type(exc).__name__}: {exc}"
+    print(f"[ERROR] {result.name}: {result.error}", file=sys.stderr)
+
+
+def transcribe_jobs(
+    jobs: list[BatchJob],
+    results: dict[str, JobResult],
+    args: argparse.Namespace,
+    batch_started: float,
+) -> None:
+    """Transcribe every job's wav through one whisper pool per model and write its cache.
+
+    A wav that cannot be planned or has a chunk fail is marked as an error (fail_job)
+    and the rest of the batch carries on.
+    """
+    if not jobs:
+        return
+    cpu_threads = args.cpu_threads or default_cpu_threads(args.workers)
+    planned: list[tuple[ChunkPlan, BatchJob]] = []
+    for job in jobs:
+        try:
+            speech = None
+            if args.vad_prefilter:
+                speech = speech_regions(job.wav)
+                print_speech_regions(speech)
+            plan = plan_transcription(
+                job.wav,
+                job.model,
+                get_wav_duration(job.wav),
+                args.chunk_seconds,
+                args.chunk_overlap,
+                TranscriptChunkStore.beside(job.wav),
+                args.force_retranscribe,
+                args.word_timestamps,
+                speech,
+            )
+        except Exception as exc:  # one unreadable wav must not cost the rest of the weekend
+            fail_job(results[job.name], exc)
+            continue
+        planned.append((plan, job))
+    job_of = {id(plan): job for plan, job in planned}
+    started = time.perf_counter()
+
+    def complete(plan: ChunkPlan) -> None:
+        job = job_of[id(plan)]
+        stats = plan.stats(args.workers, time.perf_counter() - started)
+        write_transcript_cache(job.cache_path, job.wav, job.model, plan.merged(), stats.as_dict())
+        result = results[job.name]
+        result.transcript = "transcribed"
+        result.transcription = stats.as_dict()
+        result.transcribe_serial_seconds = plan.serial_seconds
+        result.transcribed_at = time.perf_counter() - batch_started
+
+    def chunk_failed(plan: ChunkPlan, exc: Exception) -> None:
+        fail_job(results[job_of[id(plan)].name], exc)
+
+    for model_name in dict.fromkeys(job.model for _plan, job in planned):
+        group = [plan for plan, job in planned if job.model == model_name]
+        pending = sum(len(plan.pending) for plan in group)
+        print(
+            f"Transcribing {pending} chunk(s) of {len(group)} wav(s) with model={model_name} "
+            f"across {args.workers} worker(s) ...",
+            file=sys.stderr,
+        )
+        for plan in group:
+            if plan.done:
+                complete(plan)
+        for plan, index, pieces, elapsed in iter_plan_results(
+            group, model_name, args.workers, cpu_threads, args.word_timestamps, chunk_failed
+        ):
+            if results[job_of[id(plan)].name].status == "error":
+                continue
+            plan.finish(index, pieces, elapsed)
+            if plan.done:
+                complete(plan)
+
+
+def verify_options(args: argparse.Namespace) -> dict:
+    """verify_overhead keyword arguments shared by every job."""
+    return {
+        "tolerance": args.tolerance,
+        "min_confidence": args.min_confidence,
+        "refine_bundled": not args.no_refine_bundled,
+        "refine_model": args.refine_model,
+        "refine_chunk_sec": args.refine_chunk_sec,
+        "matcher": args.matcher,
+        "word_timestamps": args.word_timestamps,
+        "vad_prefilter": args.vad_prefilter,
+    }
+
+
+def _init_verify_worker(size: int, cpu_threads: int, daemon: str | None) -> None:
+    configure_model_pool(size=size, cpu_threads=cpu_threads, daemon=daemon)
+
+
+def run_job(job: BatchJob, options: dict, match_rate_threshold: float) -> dict:
+    """Refine and match one job against its schedule; the JobResult fields it settles."""
+    from overhead_inject_common import load_injection_base
+
+    started = time.perf_counter()
+    try:
+        games = load_games(job.schedule_dir, job.date, job.courts)
+        base = load_injection_base(job.wav) if job.injections else None
+        refine_cache_path = refinement_cache_path(job.cache_path)
+        refine_cache = None
+        if options["refine_bundled"]:
+            # An injected wav starts from its base's cache, as verify_injected_by_round does.
+            source = base.refine_cache_path if base is not None else refine_cache_path
+            refine_cache = load_refinement_cache(source)
+        payload = verify_overhead(
+            job.wav,
+            games,
+            job.wav_start_time,
+            transcript=base.segments if base is not None else None,
+            changed_ranges=base.changed_ranges if base is not None else (),
+            model_name=base.model_name if base is not None else job.model,
+            skip_ranges=parse_skip_ranges(job.skip),
+            skip_before=job.skip_before,
+            refine_cache=refine_cache,
+            cache_path=job.cache_path,
+            schedule={"schedule_dir": str(job.schedule_dir.resolve()), "date": job.date, "courts": job.courts},
+            output_report=job.report_path,
+            **options,
+        )
+        if refine_cache is not None:
+            save_refinement_cache(refine_cache_path, refine_cache)
+    except Exception as exc:  # one broken job must not cost the rest of the weekend
+        return {
+            "status": "error",
+            "error": f"{type(exc).__name__}: {exc}",
+            "verify_seconds": time.perf_counter() - started,
+        }
+
+    rounds = payload["rounds"]
+    passed = sum(1 for r in rounds if r["summary"]["match_rate"] >= match_rate_threshold)
+    settled = {
+        "status": "passed" if rounds and passed == len(rounds) else "failed",
+        "rounds_passed": passed,
+        "rounds_total": len(rounds),
+        "verify_seconds": time.perf_counter() - started,
+        "report": str(job.report_path),
+        "refinement": payload["refinement"],
+    }
+    if not rounds:
+        # The single-wav CLI exits 1 here too ("No rounds matched filter.").
+        settled["error"] = "No rounds matched the schedule"
+    if base is not None:
+        settled["transcript"] = "patched"
+        settled["transcription"] = payload["transcript_patch"]
+    elif payload["transcription"] and not payload["transcription"].get("from_cache"):
+        settled["transcript"] = "transcribed"
+        settled["transcription"] = payload["transcription"]
+    return settled
+
+
+def verify_jobs(
+    jobs: list[BatchJob],
+    results: dict[str, JobResult],
+    args: argparse.Namespace,
+    batch_started: float,
+) -> None:
+    """run_job for every job across ``args.workers`` processes, recording results as they finish."""
+    options = verify_options(args)
+
+    def record(job: BatchJob, settled: dict) -> None:
+        result = results[job.name]
+        for key, value in settled.items():
+            setattr(result, key, value)
+        result.finished_at = time.perf_counter() - batch_started
+        outcome = f"{result.rounds_passed}/{result.rounds_total} rounds"
+        if result.status == "error":
+            outcome = result.error
+        print(
+            f"[{result.status.upper()}] {job.name}: {outcome} in {result.verify_seconds:.1f}s",
+            file=sys.stderr,
+        )
+
+    workers = min(args.workers, len(jobs))
+    if workers <= 1:
+        for job in jobs:
+            record(job, run_job(job, options, args.match_rate_threshold))
+        return
+
+    cpu_threads = args.cpu_threads or default_cpu_threads(workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_verify_worker,
+        initargs=(args.model_pool_size, cpu_threads, model_daemon_address()),
+    ) as pool:
+        futures = {pool.submit(run_job, job, options, args.match_rate_threshold): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                settled = future.result()
+            except Exception as exc:  # the worker process itself died, e.g. BrokenProcessPool
+                settled = {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+            record(job, settled)
+
+
+def run_batch(jobs: list[BatchJob], args: argparse.Namespace) -> dict:
+    """Both phases over ``jobs``; returns the combined report payload."""
+    from overhead_inject_common import load_injection_base
+
+    batch_started = time.perf_counter()
+    results = {job.name: JobResult(name=job.name, wav=str(job.wav)) for job in jobs}
+    missing = [job for job in jobs if not job.wav.exists()]
+    for job in missing:
+        fail_job(results[job.name], FileNotFoundError(f"WAV file not found: {job.wav}"))
+    runnable = [job for job in jobs if job not in missing]
+
+    needed = [
+        job
+        for job in runnable
+        if not job.injections and (args.force_retranscribe or transcript_needed(job, args.word_timestamps))
+    ]
+    transcribe_jobs(needed, results, args, batch_started)
+    # Injected wavs whose source is not transcribed anywhere are transcribed in full.
+    orphans = [
+        job
+        for job in runnable
+        if job.injections
+        and load_injection_base(job.wav) is None
+        and transcript_needed(job, args.word_timestamps)
+    ]
+    if orphans:
+        print(
+            f"No transcribed source wav for {len(orphans)} injected wav(s); transcribing them in full",
+            file=sys.stderr,
+        )
+        transcribe_jobs(orphans, results, args, batch_started)
+    transcribe_seconds = time.perf_counter() - batch_started
+    runnable = [job for job in runnable if results[job.name].status != "error"]
+
+    verify_jobs(runnable, results, args, batch_started)
+    wall_seconds = time.perf_counter() - batch_started
+    passed = sum(1 for result in results.values() if result.status == "passed")
+    return {
+        "manifest": str(args.manifest),
+        "workers": args.workers,
+        "wall_seconds": round(wall_seconds, 2),
+        "phases": {
+            "transcribe_seconds": round(transcribe_seconds, 2),
+            "verify_seconds": round(wall_seconds - transcribe_seconds, 2),
+        },
+        "jobs_passed": passed,
+        "jobs_total": len(jobs),
+        "jobs": [results[job.name].as_dict() for job in jobs],
+    }
+
+
+def print_batch_report(report: dict) -> None:
+    print(
+        f"{'Job':<32} {'Status':<7} {'Rounds':>7} {'Transcript':<11} "
+        f"{'Whisper':>8} {'Verify':>8} {'Done at':>8}"
+    )
+    print("-" * 88)
+    for job in report["jobs"]:
+        rounds = f"{job['rounds_passed']}/{job['rounds_total']}"
+        finished = f"{job['finished_at']:.0f}s" if job["finished_at"] is not None else "-"
+        print(
+            f"{job['name'][:32]:<32} {job['status']:<7} {rounds:>7} {job['transcript']:<11} "
+            f"{job['transcribe_serial_seconds']:>7.0f}s {job['verify_seconds']:>7.1f}s {finished:>8}"
+        )
+    print("-" * 88)
+    phases = report["phases"]
+    print(
+        f"Jobs passed: {report['jobs_passed']}/{report['jobs_total']} in {report['wall_seconds']:.0f}s "
+        f"(transcription {phases['transcribe_seconds']:.0f}s, "
+        f"verification {phases['verify_seconds']:.0f}s, {report['workers']} worker(s))"
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Transcribe and verify a manifest of overhead .wav files across all cores"
+    )
+    parser.add_argument("--manifest", type=Path, required=True, help="JSONL manifest, one job per line")
+    parser.add_argument(
+        "--schedule-dir",
+        type=Path,
+        help="Directory containing {date}_courtN.jsonl files, for jobs without schedule_dir",
+    )
+    parser.add_argument(
+        "--model",
+        default="small",
+        help="faster-whisper model for jobs without one (default: small)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes per phase: whisper chunk workers, then verification jobs (default: all cores)",
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=DEFAULT_CHUNK_SECONDS,
+        help=f"Transcription chunk length in seconds (default: {DEFAULT_CHUNK_SECONDS:.0f})",
+    )
+    parser.add_argument(
+        "--chunk-overlap",
+        type=float,
+        default=DEFAULT_OVERLAP_SECONDS,
+        help=f"Seconds decoded past each chunk edge (default: {DEFAULT_OVERLAP_SECONDS:.0f})",
+    )
+    parser.add_argument(
+        "--force-retranscribe",
+        action="store_true",
+        help="Ignore cached transcripts and chunk checkpoints",
+    )
+    parser.add_argument(
+        "--word-timestamps",
+        action="store_true",
+        help="Have whisper time every word, so bundled cues are split without re-transcribing",
+    )
+    parser.add_argument(
+        "--vad-prefilter",
+        action="store_true",
+        help="Only transcribe and refine the speech regions of each wav (overhead_vad.py)",
+    )
+    parser.add_argument("--tolerance", type=int, default=90, help="Search window +/- seconds (default: 90)")
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        default=0.55,
+        help="Minimum match score for court announcements (default: 0.55)",
+    )
+    parser.add_argument(
+        "--matcher",
+        choices=("assignment", "greedy"),
+        default="assignment",
+        help="How segments are paired with expected events (default: assignment)",
+    )
+    parser.add_argument(
+        "--match-rate-threshold",
+        type=float,
+        default=0.80,
+        help="Match rate a round needs to pass (default: 0.80)",
+    )
+    parser.add_argument(
+        "--no-refine-bundled",
+        action="store_true",
+        help="Skip 8s-chunk re-transcription of bundled Whisper segments",
+    )
+    parser.add_argument(
+        "--refine-model",
+        default="base",
+        help="faster-whisper model for bundled-cue refinement (default: base)",
+    )
+    parser.add_argument(
+        "--refine-chunk-sec",
+        type=int,
+        default=8,
+        help="Sub-chunk size in seconds for bundled-cue refinement (default: 8)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Combined JSON report (default: {manifest_stem}_batch_report.json beside the manifest)",
+    )
+    add_model_pool_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main() -> int:
+    args = parse_args()
+    configure_model_pool_from_args(args)
+    args.workers = max(1, args.workers)
+    try:
+        jobs = load_manifest(args.manifest, args.schedule_dir, args.model)
+    except (FileNotFoundError, ValueError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    if not jobs:
+        print(f"Error: no jobs in {args.manifest}", file=sys.stderr)
+        return 1
+
+    report = run_batch(jobs, args)
+    output = args.output or args.manifest.with_name(f"{args.manifest.stem}_batch_report.json")
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print_batch_report(report)
+    print(f"\nBatch report: {output}", file=sys.stderr)
+    return 0 if report["jobs_passed"] == report["jobs_total"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,264 @@
+"""Find every playback of a prerecorded PA clip in an overhead recording.
+
+Venue-wide cues that come from the soundboard (the "two minutes to get to your
+next court" vocal, countdowns, the start buzzer, the ``CLIP_PRESETS`` drops) are
+the same samples every round, so they can be located by normalized
+cross-correlation against the reference clip instead of by transcription.
+
+The day is scanned at ``ANALYSIS_SAMPLE_RATE / decimate`` with FFT overlap-save
+blocks, reading the 16 kHz memmap from ``OverheadAudio`` one block at a time.
+Peaks above the threshold are then re-correlated at the full 16 kHz rate in a
+few-sample window, so hit times are sample-accurate at the analysis rate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+from overhead_audio import ANALYSIS_SAMPLE_RATE, OverheadAudio
+
+CLIP_THRESHOLD = 0.5
+CLIP_DECIMATE = 4
+# Decimated samples per correlation block; the FFT size is the next power of two
+# above this plus the template.
+CLIP_BLOCK_SAMPLES = 1 << 18
+
+
+@dataclass
+class ClipTemplate:
+    name: str
+    samples: Any  # float32, 16 kHz mono
+
+    @classmethod
+    def from_wav(cls, name: str, path: Path, sidecar_dir: Path | None = None) -> ClipTemplate:
+        audio = OverheadAudio(path, sidecar_dir=sidecar_dir)
+        samples = audio.slice(0.0, audio.duration)
+        # Leading/trailing digital silence only widens the match window.
+        loud = np.flatnonzero(np.abs(samples) > 1e-3)
+        if len(loud):
+            samples = samples[loud[0] : loud[-1] + 1]
+        return cls(name=name, samples=np.ascontiguousarray(samples, dtype=np.float32))
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / ANALYSIS_SAMPLE_RATE
+
+
+@dataclass
+class ClipHit:
+    name: str
+    sample: int  # first sample of the clip at ANALYSIS_SAMPLE_RATE
+    score: float
+    duration: float
+
+    @property
+    def start(self) -> float:
+        return self.sample / ANALYSIS_SAMPLE_RATE
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+def decimate(samples: Any, factor: int) -> Any:
+    """Block-average by ``factor`` (a crude low-pass that is plenty for detection)."""
+    samples = np.asarray(samples, dtype=np.float32)
+    if factor <= 1:
+        return samples
+    usable = len(samples) - len(samples) % factor
+    return samples[:usable].reshape(-1, factor).mean(axis=1)
+
+
+def normalized_cross_correlation(signal: Any, template: Any) -> Any:
+    """NCC of ``template`` at every offset where it fits entirely inside ``signal``.
+
+    Zero-mean template; the signal's local mean and energy come from cumulative sums.
+    Silent stretches score 0.
+    """
+    signal = np.asarray(signal, dtype=np.float64)
+    template = np.asarray(template, dtype=np.float64)
+    m = len(template)
+    if len(signal) < m or m == 0:
+        return np.zeros(0)
+    template = template - template.mean()
+    norm = np.sqrt(np.dot(template, template))
+    if norm == 0.0:
+        return np.zeros(len(signal) - m + 1)
+    nfft = 1 << int(np.ceil(np.log2(len(signal) + m - 1)))
+    spectrum = np.fft.rfft(signal, nfft) * np.conj(np.fft.rfft(template, nfft))
+    dots = np.fft.irfft(spectrum, nfft)[: len(signal) - m + 1]
+    return dots / (norm * local_norms(signal, m))
+
+
+def local_norms(signal: Any, m: int) -> Any:
+    """sqrt(sum((x - mean(x))^2)) over every length-m window, with a floor for silence."""
+    sums = np.concatenate(([0.0], np.cumsum(signal)))
+    squares = np.concatenate(([0.0], np.cumsum(signal * signal)))
+    window_sum = sums[m:] - sums[:-m]
+    energy = squares[m:] - squares[:-m] - window_sum * window_sum / m
+    return np.sqrt(np.maximum(energy, 1e-12 * m))
+
+
+def pick_peaks(scores: Any, threshold: float, spacing: int) -> list[tuple[int, float]]:
+    """Local maxima >= threshold as (offset, score), thinned by strongest_apart."""
+    above = np.flatnonzero(scores >= threshold)
+    if not len(above):
+        return []
+    left = np.concatenate(([-np.inf], scores[:-1]))[above]
+    right = np.concatenate((scores[1:], [-np.inf]))[above]
+    maxima = above[(scores[above] >= left) & (scores[above] >= right)]
+    return strongest_apart([(int(o), float(scores[o])) for o in maxima], spacing)
+
+
+def strongest_apart(peaks: list[tuple[int, float]], spacing: int) -> list[tuple[int, float]]:
+    """Peaks kept strongest first, dropping any within ``spacing`` of a kept one; time order."""
+    kept: list[tuple[int, float]] = []
+    for offset, score in sorted(peaks, key=lambda p: (-p[1], p[0])):
+        if all(abs(offset - other) >= spacing for other, _ in kept):
+            kept.append((offset, score))
+    return sorted(kept)
+
+
+def correlation_blocks(
+    samples: Any, template_len: int, factor: int, block: int
+) -> Iterator[tuple[int, Any]]:
+    """(first decimated offset, decimated samples) blocks overlapping by template_len - 1."""
+    step = block * factor
+    overlap = (template_len - 1) * factor
+    for first in range(0, len(samples), step):
+        chunk = decimate(samples[first : first + step + overlap], factor)
+        if len(chunk) >= template_len:
+            yield first // factor, chunk
+        if first + step + overlap >= len(samples):
+            break
+
+
+def find_clip(
+    samples: Any,
+    template: ClipTemplate,
+    threshold: float = CLIP_THRESHOLD,
+    factor: int = CLIP_DECIMATE,
+    block: int = CLIP_BLOCK_SAMPLES,
+) -> list[ClipHit]:
+    """Every occurrence of ``template`` in 16 kHz mono ``samples`` (int16 memmap or float)."""
+    scale = 1.0 / 32768.0 if np.issubdtype(np.asarray(samples[:0]).dtype, np.integer) else 1.0
+    coarse_template = decimate(template.samples, factor)
+    m = len(coarse_template)
+    peaks: list[tuple[int, float]] = []
+    for offset, chunk in correlation_blocks(samples, m, factor, block):
+        scores = normalized_cross_correlation(chunk * scale, coarse_template)
+        peaks.extend((offset + p, score) for p, score in pick_peaks(scores, threshold, m))
+    # A clip straddling a block boundary can peak in both blocks.
+    coarse = [offset for offset, _score in strongest_apart(peaks, m)]
+
+    hits: list[ClipHit] = []
+    full = len(template.samples)
+    for offset in coarse:
+        lo = max(0, offset * factor - 2 * factor)
+        hi = min(len(samples), offset * factor + 2 * factor + full)
+        window = np.asarray(samples[lo:hi], dtype=np.float64) * scale
+        scores = normalized_cross_correlation(window, template.samples)
+        if not len(scores):
+            continue
+        best = int(np.argmax(scores))
+        if scores[best] >= threshold:
+            hits.append(
+                ClipHit(
+                    name=template.name,
+                    sample=lo + best,
+                    score=round(float(scores[best]), 4),
+                    duration=template.duration,
+                )
+            )
+    return hits
+
+
+def find_clips(
+    audio: OverheadAudio,
+    templates: list[ClipTemplate],
+    threshold: float = CLIP_THRESHOLD,
+    factor: int = CLIP_DECIMATE,
+) -> list[ClipHit]:
+    """find_clip for each template over the whole recording, hits in time order."""
+    hits = [hit for template in templates for hit in find_clip(audio.mono16k, template, threshold, factor)]
+    return sorted(hits, key=lambda hit: (hit.sample, hit.name))
+
+
+def parse_clip_specs(specs: list[str]) -> list[tuple[str, Path]]:
+    """``NAME=PATH`` pairs from --clip."""
+    pairs: list[tuple[str, Path]] = []
+    for spec in specs:
+        name, sep, path = spec.partition("=")
+        if not sep or not name or not path:
+            raise ValueError(f"--clip expects NAME=PATH, got {spec!r}")
+        pairs.append((name, Path(path).expanduser()))
+    return pairs
+
+
+def resolve_clip_paths(specs: list[str], presets: list[str], band_dir: Path | None = None) -> list[tuple[str, Path]]:
+    """(name, path) for --clip NAME=PATH and --clip-preset KEY (CLIP_PRESETS under band_dir)."""
+    from inject_no_blocking import CLIP_PRESETS, DEFAULT_CLIP
+
+    band_dir = band_dir or DEFAULT_CLIP.parent.parent.parent
+    pairs = parse_clip_specs(specs)
+    for key in presets:
+        if key not in CLIP_PRESETS:
+            raise ValueError(f"unknown clip preset {key!r} (choose from {', '.join(CLIP_PRESETS)})")
+        pairs.append((key, band_dir.expanduser() / "Media/Audio Files" / CLIP_PRESETS[key]))
+    for _name, path in pairs:
+        if not path.exists():
+            raise FileNotFoundError(f"Clip not found: {path}")
+    return pairs
+
+
+def load_clip_templates(specs: list[str], presets: list[str], band_dir: Path | None = None) -> list[ClipTemplate]:
+    return [ClipTemplate.from_wav(name, path) for name, path in resolve_clip_paths(specs, presets, band_dir)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="List every playback of reference PA clips in a .wav")
+    parser.add_argument("--wav", type=Path, required=True)
+    parser.add_argument("--clip", action="append", default=[], metavar="NAME=PATH", help="Reference clip (repeatable)")
+    parser.add_argument("--clip-preset", action="append", default=[], help="Reference clip from CLIP_PRESETS")
+    parser.add_argument("--band-dir", type=Path, help="GarageBand project holding the presets")
+    parser.add_argument("--threshold", type=float, default=CLIP_THRESHOLD, help="Minimum NCC (default: 0.5)")
+    parser.add_argument("--output", type=Path, help="Write hits as JSON")
+    args = parser.parse_args()
+
+    try:
+        templates = load_clip_templates(args.clip, args.clip_preset, args.band_dir)
+    except (ValueError, FileNotFoundError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    if not templates:
+        print("Error: give at least one --clip or --clip-preset", file=sys.stderr)
+        return 1
+    audio = OverheadAudio.open(args.wav)
+    started = time.perf_counter()
+    hits = find_clips(audio, templates, args.threshold)
+    elapsed = time.perf_counter() - started
+    for hit in hits:
+        print(f"{hit.start:10.4f}s  {hit.name:<28} ncc {hit.score:.3f}")
+    print(
+        f"{len(hits)} hit(s) for {len(templates)} clip(s) in {audio.duration / 3600:.2f} h of audio, "
+        f"{elapsed:.1f} s",
+        file=sys.stderr,
+    )
+    if args.output:
+        args.output.write_text(
+            json.dumps([{**asdict(hit), "start": round(hit.start, 5)} for hit in hits], indent=2) + "\n",
+            encoding="utf-8",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
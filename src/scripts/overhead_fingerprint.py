@@ -0,0 +1,453 @@
+"""Persistent constellation-hash index of PA clips and overhead recordings.
+
+Each source (a reference clip or a whole overhead .wav) is reduced once to
+spectrogram peaks at 8 kHz, and nearby peak pairs become 24-bit hashes
+``(anchor bin, target bin, frame gap)`` stored with the anchor frame in SQLite.
+A clip occurs in a recording wherever many of its hashes line up at the same
+frame offset. The lookup is an indexed join on ``hash``, so finding every clip
+across every enrolled recording never touches the audio again and costs
+O(clip hashes x log index) rather than a scan of the recordings.
+
+Frames are 32 ms apart; for sample-accurate times re-run overhead_clips.py on
+the hits. Recordings are keyed by overhead_audio.wav_fingerprint, so an
+edited or re-exported .wav is fingerprinted again and stale hashes are dropped.
+
+Usage:
+  python overhead_fingerprint.py enroll --clip-preset no_blocking --clip "buzzer=/path/Start buzzer.wav"
+  python overhead_fingerprint.py enroll --wav day1.wav --wav day1_with_no_blocking.wav
+  python overhead_fingerprint.py find --wav day1_with_no_blocking.wav
+  python overhead_fingerprint.py audit --wav day1_with_no_blocking.wav
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+from overhead_audio import ANALYSIS_SAMPLE_RATE, OverheadAudio, read_wav_layout, wav_fingerprint
+
+FINGERPRINT_DB_ENV = "OVERHEAD_FINGERPRINT_DB"
+DEFAULT_DB_PATH = Path.home() / ".overhead_fingerprints.sqlite"
+
+FP_DECIMATE = 2  # 16 kHz -> 8 kHz
+FP_SAMPLE_RATE = ANALYSIS_SAMPLE_RATE // FP_DECIMATE
+FP_NFFT = 1024
+FP_HOP = 256
+FP_FRAME_SECONDS = FP_HOP / FP_SAMPLE_RATE
+# Peaks are local maxima over +/- these many bins and frames, and this many dB
+# above the block's median level.
+PEAK_FREQ_RADIUS = 12
+PEAK_TIME_RADIUS = 8
+PEAK_MIN_DB = 12.0
+# Each anchor peak is paired with the next FAN_OUT peaks up to MAX_FRAME_GAP frames later.
+FAN_OUT = 6
+MAX_FRAME_GAP = 63
+BLOCK_FRAMES = 4096
+# Matching hashes needed at one offset to report an occurrence.
+MIN_VOTES = 12
+# Bumped whenever the hash recipe changes; older indexes are rejected.
+FINGERPRINT_VERSION = "1"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    duration REAL NOT NULL,
+    hashes INTEGER NOT NULL,
+    enrolled_at TEXT NOT NULL,
+    UNIQUE (kind, name)
+);
+CREATE TABLE IF NOT EXISTS hashes (hash INTEGER NOT NULL, source_id INTEGER NOT NULL, frame INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS hashes_by_hash ON hashes (hash, source_id);
+CREATE INDEX IF NOT EXISTS hashes_by_source ON hashes (source_id);
+"""
+
+
+@dataclass
+class Source:
+    id: int
+    kind: str  # "clip" or "recording"
+    name: str
+    path: str
+    signature: str
+    duration: float
+    hashes: int
+
+
+@dataclass
+class Occurrence:
+    clip: str
+    recording: str
+    start: float
+    votes: int
+    coverage: float  # votes / hashes of the clip
+
+
+def default_db_path() -> Path:
+    return Path(os.environ.get(FINGERPRINT_DB_ENV) or DEFAULT_DB_PATH)
+
+
+def window_max(values: Any, radius: int, axis: int) -> Any:
+    """Max over +/- radius along axis (edges padded with -inf), in O(log radius) passes."""
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (radius, radius)
+    running = np.pad(values, pad, constant_values=-np.inf)
+
+    def span(first: int, count: int) -> tuple[slice, ...]:
+        return tuple(slice(first, first + count) if a == axis else slice(None) for a in range(values.ndim))
+
+    size = 2 * radius + 1
+    width = 1
+    # running[i] holds the max of the `width` values starting at i.
+    while width * 2 <= size:
+        count = running.shape[axis] - width
+        running = np.maximum(running[span(0, count)], running[span(width, count)])
+        width *= 2
+    count = values.shape[axis]
+    return np.maximum(running[span(0, count)], running[span(size - width, count)])
+
+
+def spectrogram_peaks(samples: Any, first_frame: int, core: tuple[int, int]) -> tuple[Any, Any]:
+    """(frames, bins) of constellation peaks whose frame lies in ``core``.
+
+    ``samples`` are 8 kHz floats starting at ``first_frame * FP_HOP``; the frames
+    outside ``core`` only serve as neighbourhood for the local-maximum test.
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    if len(samples) < FP_NFFT:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    windows = sliding_window_view(samples, FP_NFFT)[::FP_HOP]
+    spectrum = np.abs(np.fft.rfft(windows * np.hanning(FP_NFFT), axis=1))[:, 1:FP_NFFT // 2]
+    level = (20.0 * np.log10(spectrum + 1e-9)).astype(np.float32)
+    local = window_max(window_max(level, PEAK_FREQ_RADIUS, axis=1), PEAK_TIME_RADIUS, axis=0)
+    # The median of every 7th cell is as good a noise floor and far cheaper.
+    is_peak = (level == local) & (level >= np.median(level.ravel()[::7]) + PEAK_MIN_DB)
+    frames, bins = np.nonzero(is_peak)
+    frames = frames + first_frame
+    keep = (frames >= core[0]) & (frames < core[1])
+    # bins are 1-based spectrum indices, 1..511, so they fit 9 bits.
+    return frames[keep], bins[keep] + 1
+
+
+def constellation(samples16k: Any) -> tuple[Any, Any]:
+    """Sorted (frames, bins) of peaks over a 16 kHz mono signal, read in blocks."""
+    scale = 1.0 / 32768.0 if np.issubdtype(np.asarray(samples16k[:0]).dtype, np.integer) else 1.0
+    total_frames = max(0, (len(samples16k) // FP_DECIMATE - FP_NFFT) // FP_HOP + 1)
+    all_frames: list[Any] = []
+    all_bins: list[Any] = []
+    for core_start in range(0, total_frames, BLOCK_FRAMES):
+        core_end = min(total_frames, core_start + BLOCK_FRAMES)
+        first = max(0, core_start - PEAK_TIME_RADIUS)
+        last = min(total_frames, core_end + PEAK_TIME_RADIUS)
+        lo = first * FP_HOP * FP_DECIMATE
+        hi = ((last - 1) * FP_HOP + FP_NFFT) * FP_DECIMATE
+        chunk = np.asarray(samples16k[lo:hi], dtype=np.float64) * scale
+        chunk = chunk[: len(chunk) - len(chunk) % FP_DECIMATE].reshape(-1, FP_DECIMATE).mean(axis=1)
+        frames, bins = spectrogram_peaks(chunk, first, (core_start, core_end))
+        all_frames.append(frames)
+        all_bins.append(bins)
+    if not all_frames:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    frames, bins = np.concatenate(all_frames), np.concatenate(all_bins)
+    order = np.lexsort((bins, frames))
+    return frames[order], bins[order]
+
+
+def peak_hashes(frames: Any, bins: Any) -> tuple[Any, Any]:
+    """(hashes, anchor frames) pairing each peak with the next FAN_OUT peaks in time."""
+    hashes: list[Any] = []
+    anchors: list[Any] = []
+    for step in range(1, FAN_OUT + 1):
+        gap = frames[step:] - frames[:-step]
+        ok = (gap >= 1) & (gap <= MAX_FRAME_GAP)
+        hashes.append((bins[:-step][ok] << 15) | (bins[step:][ok] << 6) | gap[ok])
+        anchors.append(frames[:-step][ok])
+    if not hashes:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(hashes), np.concatenate(anchors)
+
+
+def fingerprint(samples16k: Any) -> tuple[Any, Any]:
+    return peak_hashes(*constellation(samples16k))
+
+
+class FingerprintIndex:
+    """SQLite store of source fingerprints with occurrence lookup by hash join."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.executescript(SCHEMA)
+        version = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if version is None:
+            self.db.execute("INSERT INTO meta VALUES ('version', ?)", (FINGERPRINT_VERSION,))
+            self.db.commit()
+        elif version[0] != FINGERPRINT_VERSION:
+            raise ValueError(
+                f"{path} was built with fingerprint version {version[0]}, this is {FINGERPRINT_VERSION}; "
+                "delete it and enroll again"
+            )
+
+    def close(self) -> None:
+        self.db.close()
+
+    def sources(self, kind: str | None = None) -> list[Source]:
+        query = "SELECT id, kind, name, path, signature, duration, hashes FROM sources"
+        rows = self.db.execute(query + (" WHERE kind = ?" if kind else "") + " ORDER BY id", (kind,) if kind else ())
+        return [Source(*row) for row in rows]
+
+    def source(self, kind: str, name: str) -> Source | None:
+        row = self.db.execute(
+            "SELECT id, kind, name, path, signature, duration, hashes FROM sources WHERE kind = ? AND name = ?",
+            (kind, name),
+        ).fetchone()
+        return Source(*row) if row else None
+
+    def enroll(self, path: Path, kind: str, name: str | None = None) -> tuple[Source, bool]:
+        """Fingerprint ``path`` unless it is already enrolled with the same content.
+
+        Recordings are named by their resolved path. Returns (source, newly_fingerprinted).
+        """
+        name = name or str(path.resolve())
+        signature = wav_fingerprint(path, read_wav_layout(path))
+        existing = self.source(kind, name)
+        if existing is not None and existing.signature == signature:
+            return existing, False
+        audio = OverheadAudio.open(path)
+        hashes, frames = fingerprint(audio.mono16k)
+        with self.db:
+            if existing is not None:
+                self.db.execute("DELETE FROM hashes WHERE source_id = ?", (existing.id,))
+                self.db.execute("DELETE FROM sources WHERE id = ?", (existing.id,))
+            cursor = self.db.execute(
+                "INSERT INTO sources (kind, name, path, signature, duration, hashes, enrolled_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, name, str(path), signature, len(audio.mono16k) / ANALYSIS_SAMPLE_RATE, len(hashes),
+                 datetime.now().isoformat(timespec="seconds")),
+            )
+            source_id = cursor.lastrowid
+            self.db.executemany(
+                "INSERT INTO hashes (hash, source_id, frame) VALUES (?, ?, ?)",
+                zip(hashes.tolist(), [source_id] * len(hashes), frames.tolist()),
+            )
+        return self.source(kind, name), True
+
+    def remove(self, kind: str, name: str) -> bool:
+        existing = self.source(kind, name)
+        if existing is None:
+            return False
+        with self.db:
+            self.db.execute("DELETE FROM hashes WHERE source_id = ?", (existing.id,))
+            self.db.execute("DELETE FROM sources WHERE id = ?", (existing.id,))
+        return True
+
+    def occurrences(
+        self,
+        clips: Iterable[Source] | None = None,
+        recordings: Iterable[Source] | None = None,
+        min_votes: int = MIN_VOTES,
+    ) -> list[Occurrence]:
+        """Every placement of each clip in each recording, in recording then time order."""
+        clips = list(clips) if clips is not None else self.sources("clip")
+        recordings = list(recordings) if recordings is not None else self.sources("recording")
+        by_id = {r.id: r for r in recordings}
+        if not by_id:
+            return []
+        marks = ",".join("?" * len(by_id))
+        found: list[Occurrence] = []
+        for clip in clips:
+            votes: Counter[tuple[int, int]] = Counter(
+                self.db.execute(
+                    "SELECT r.source_id, r.frame - c.frame FROM hashes c "
+                    "JOIN hashes r ON r.hash = c.hash "
+                    f"WHERE c.source_id = ? AND r.source_id IN ({marks})",
+                    (clip.id, *by_id),
+                )
+            )
+            for (recording_id, delta), count in strongest_offsets(votes, min_votes):
+                found.append(
+                    Occurrence(
+                        clip=clip.name,
+                        recording=by_id[recording_id].path,
+                        start=round(delta * FP_FRAME_SECONDS, 3),
+                        votes=count,
+                        coverage=round(count / max(1, clip.hashes), 3),
+                    )
+                )
+        return sorted(found, key=lambda o: (o.recording, o.start, o.clip))
+
+
+def strongest_offsets(
+    votes: Counter[tuple[int, int]], min_votes: int
+) -> list[tuple[tuple[int, int], int]]:
+    """Offsets with enough votes, counting the +/-1 frame neighbours (peaks jitter by a frame).
+
+    Strongest first; any other offset within the clip's own +/-1 frames is absorbed.
+    """
+    pooled = {
+        key: sum(votes.get((key[0], key[1] + d), 0) for d in (-1, 0, 1))
+        for key in votes
+    }
+    kept: list[tuple[tuple[int, int], int]] = []
+    taken: set[tuple[int, int]] = set()
+    for key, count in sorted(pooled.items(), key=lambda item: (-item[1], item[0])):
+        if count < min_votes:
+            break
+        if key in taken:
+            continue
+        kept.append((key, count))
+        taken.update((key[0], key[1] + d) for d in range(-2, 3))
+    return kept
+
+
+def print_occurrences(occurrences: list[Occurrence]) -> None:
+    from verify_overhead_schedule import seconds_to_hms
+
+    recording = None
+    for item in occurrences:
+        if item.recording != recording:
+            recording = item.recording
+            print(recording)
+        print(f"  {seconds_to_hms(item.start):>8} ({item.start:9.3f}s)  {item.clip:<28} {item.votes:4d} hashes ({item.coverage:.0%})")
+
+
+def audit_injections(index: FingerprintIndex, wav: Path, tolerance: float = 0.25) -> list[dict]:
+    """Each clip placement recorded in wav's injections sidecar, with whether the index hears it there."""
+    from overhead_inject_common import injections_sidecar_path, sidecar_placements
+
+    sidecar = json.loads(injections_sidecar_path(wav).read_text(encoding="utf-8"))
+    recording, _ = index.enroll(wav, "recording")
+    rows: list[dict] = []
+    for clip_path, insert_seconds in sidecar_placements(sidecar):
+        clip, _ = index.enroll(clip_path, "clip", clip_path.stem)
+        heard = [o.start for o in index.occurrences([clip], [recording])]
+        nearest = min(heard, key=lambda at: abs(at - insert_seconds), default=None)
+        rows.append(
+            {
+                "clip": clip.name,
+                "insert_seconds": insert_seconds,
+                "found_at": nearest,
+                "ok": nearest is not None and abs(nearest - insert_seconds) <= tolerance,
+            }
+        )
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help=f"Index file (default: ${FINGERPRINT_DB_ENV} or {DEFAULT_DB_PATH})",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    enroll = sub.add_parser("enroll", help="Add clips and/or recordings to the index")
+    enroll.add_argument("--clip", action="append", default=[], metavar="NAME=PATH")
+    enroll.add_argument("--clip-preset", action="append", default=[], help="CLIP_PRESETS key from inject_no_blocking.py")
+    enroll.add_argument("--band-dir", type=Path, help="GarageBand project holding the presets")
+    enroll.add_argument("--wav", action="append", default=[], type=Path, help="Overhead recording (repeatable)")
+
+    find = sub.add_parser("find", help="Every occurrence of enrolled clips")
+    find.add_argument("--wav", action="append", default=[], type=Path, help="Recording to search (enrolled on first use); default all enrolled")
+    find.add_argument("--clip", action="append", default=[], metavar="NAME", help="Only these clips (default all)")
+    find.add_argument("--min-votes", type=int, default=MIN_VOTES)
+    find.add_argument("--json", type=Path, help="Also write occurrences as JSON")
+
+    audit = sub.add_parser("audit", help="Check the clip placements recorded in a wav's injections sidecar")
+    audit.add_argument("--wav", type=Path, required=True)
+    audit.add_argument("--tolerance", type=float, default=0.25, help="Seconds (default: 0.25)")
+
+    sub.add_parser("list", help="Enrolled clips and recordings")
+
+    remove = sub.add_parser("remove", help="Drop a clip or recording from the index")
+    remove.add_argument("kind", choices=("clip", "recording"))
+    remove.add_argument("name")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        index = FingerprintIndex(args.db or default_db_path())
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+    if args.command == "enroll":
+        from overhead_clips import resolve_clip_paths
+
+        try:
+            clips = resolve_clip_paths(args.clip, args.clip_preset, args.band_dir)
+        except (ValueError, FileNotFoundError) as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        for kind, name, path in [("clip", n, p) for n, p in clips] + [("recording", None, w) for w in args.wav]:
+            started = time.perf_counter()
+            source, fresh = index.enroll(path, kind, name)
+            state = f"{source.hashes} hashes in {time.perf_counter() - started:.1f}s" if fresh else "unchanged"
+            print(f"{kind:<9} {source.name}: {state}")
+        return 0
+
+    if args.command == "find":
+        recordings = None
+        if args.wav:
+            recordings = []
+            for wav in args.wav:
+                source, fresh = index.enroll(wav, "recording")
+                if fresh:
+                    print(f"Fingerprinted {wav} ({source.hashes} hashes)", file=sys.stderr)
+                recordings.append(source)
+        clips = index.sources("clip")
+        if args.clip:
+            clips = [c for c in clips if c.name in args.clip]
+        started = time.perf_counter()
+        occurrences = index.occurrences(clips, recordings, args.min_votes)
+        print_occurrences(occurrences)
+        print(
+            f"{len(occurrences)} occurrence(s) of {len(clips)} clip(s) in "
+            f"{len(recordings) if recordings is not None else len(index.sources('recording'))} recording(s), "
+            f"lookup {time.perf_counter() - started:.2f}s",
+            file=sys.stderr,
+        )
+        if args.json:
+            args.json.write_text(json.dumps([o.__dict__ for o in occurrences], indent=2) + "\n", encoding="utf-8")
+        return 0
+
+    if args.command == "audit":
+        rows = audit_injections(index, args.wav, args.tolerance)
+        for row in rows:
+            found = "—" if row["found_at"] is None else f"{row['found_at']:.2f}s"
+            print(f"{'OK  ' if row['ok'] else 'MISS'} {row['clip']:<28} inserted {row['insert_seconds']:9.2f}s  heard {found}")
+        missing = sum(1 for row in rows if not row["ok"])
+        print(f"{len(rows) - missing}/{len(rows)} recorded placements heard", file=sys.stderr)
+        return 1 if missing else 0
+
+    if args.command == "remove":
+        return 0 if index.remove(args.kind, args.name) else 1
+
+    for source in index.sources():
+        print(f"{source.kind:<9} {source.name}  {source.duration:9.1f}s  {source.hashes} hashes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,476 @@
+"""Live monitoring of a venue-wide overhead recording while the PA board is still recording.
+
+``verify_overhead_schedule.py --follow`` tails a growing .wav (or a folder of rolling
+segment files), transcribes each new step of audio as soon as it is on disk, and
+checks every expected THROWDOWN_25MIN_MARKERS cue the moment its match window has
+settled in the transcript. Missed and drifting cues are printed (and optionally
+appended to a JSONL file) while the round is still running, e.g. a missing
+"two minutes" call is reported a couple of minutes after it was due.
+
+Until a round's anchor can be inferred from its own court calls / play start, its
+cues are expected at the schedule time shifted by the drift of the last anchored
+round, so early cues of a round do not wait for the anchor search to settle.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+from overhead_audio import ANALYSIS_SAMPLE_RATE, WAVE_FORMAT_IEEE_FLOAT, WAVE_FORMAT_PCM, WavLayout, read_wav_layout
+from overhead_models import get_model_pool
+from overhead_transcribe import (
+    SETTLE_SECONDS,
+    VAD_SETTINGS,
+    TranscriptionChunk,
+    TranscriptProgress,
+    TranscriptSegment,
+    merge_chunk_segments,
+)
+from verify_overhead_schedule import (
+    Game,
+    SegmentIndex,
+    build_slot_events,
+    group_games_by_slot,
+    infer_slot_anchor_wav,
+    match_slot_events,
+    seconds_to_hm,
+    seconds_to_hms,
+    slot_anchor_search_end,
+    time_to_seconds,
+)
+
+FOLLOW_STEP_SECONDS = 30.0
+FOLLOW_OVERLAP_SECONDS = 5.0
+FOLLOW_POLL_SECONDS = 2.0
+DRIFT_ALERT_SECONDS = 45.0
+# Court calls are matched up to two minutes past their window (see match_slot_events).
+COURT_CALL_EXTRA_SECONDS = 120
+
+TranscribeFn = Callable[[Any, float], list[TranscriptSegment]]
+
+
+@dataclass
+class _SegmentFile:
+    path: Path
+    layout: WavLayout
+    start: float
+
+
+class GrowingAudio:
+    """Readable prefix of a wav still being written, or of a folder of rolling .wav segments.
+
+    Segment files are taken in name order and assumed back to back; only the newest
+    one may still be growing. Audio is returned as float32 mono at 16 kHz for whisper.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._files: list[_SegmentFile] = []
+
+    def _paths(self) -> list[Path]:
+        if self.path.is_dir():
+            return sorted(p for p in self.path.iterdir() if p.suffix.lower() == ".wav")
+        return [self.path] if self.path.exists() else []
+
+    def refresh(self) -> float:
+        """Re-scan for new data and files; returns the seconds of audio available."""
+        files: list[_SegmentFile] = []
+        start = 0.0
+        known = {f.path: f for f in self._files[:-1]}
+        for path in self._paths():
+            layout = known[path].layout if path in known else read_wav_layout(path)
+            if layout is None:
+                # Header not flushed yet; later files cannot be placed before this one.
+                break
+            if layout.format_tag not in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT) or layout.bits_per_sample not in (16, 32):
+                raise ValueError(f"--follow needs 16-bit PCM or 32-bit float wav: {path}")
+            files.append(_SegmentFile(path, layout, start))
+            start += layout.duration
+        self._files = files
+        return start
+
+    @property
+    def available(self) -> float:
+        return self._files[-1].start + self._files[-1].layout.duration if self._files else 0.0
+
+    def read(self, start: float, end: float) -> Any:
+        import numpy as np
+
+        pieces = []
+        for segment in self._files:
+            layout = segment.layout
+            lo = max(start, segment.start) - segment.start
+            hi = min(end, segment.start + layout.duration) - segment.start
+            if hi <= lo:
+                continue
+            first, last = layout.byte_range(lo, hi)
+            with segment.path.open("rb") as handle:
+                handle.seek(first)
+                raw = handle.read(last - first)
+            dtype = "<f4" if layout.format_tag == WAVE_FORMAT_IEEE_FLOAT else "<i2"
+            frames = np.frombuffer(raw[: len(raw) - len(raw) % layout.block_align], dtype=dtype)
+            frames = frames.reshape(-1, layout.channels).astype(np.float32)
+            if dtype == "<i2":
+                frames /= 32768.0
+            pieces.append(to_analysis_rate(frames.mean(axis=1), layout.sample_rate))
+        if not pieces:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(pieces)
+
+
+def to_analysis_rate(mono: Any, sample_rate: int) -> Any:
+    """Resample mono float audio to 16 kHz (block mean for integer ratios, else linear)."""
+    import numpy as np
+
+    if sample_rate == ANALYSIS_SAMPLE_RATE:
+        return mono
+    if sample_rate % ANALYSIS_SAMPLE_RATE == 0:
+        factor = sample_rate // ANALYSIS_SAMPLE_RATE
+        usable = len(mono) - len(mono) % factor
+        return mono[:usable].reshape(-1, factor).mean(axis=1)
+    count = int(len(mono) * ANALYSIS_SAMPLE_RATE / sample_rate)
+    positions = np.arange(count) * (sample_rate / ANALYSIS_SAMPLE_RATE)
+    return np.interp(positions, np.arange(len(mono)), mono).astype(np.float32)
+
+
+def whisper_transcriber(model_name: str) -> TranscribeFn:
+    model = get_model_pool().model(model_name)
+
+    def transcribe(audio: Any, offset: float) -> list[TranscriptSegment]:
+        segments_iter, _info = model.transcribe(audio, vad_filter=VAD_SETTINGS["vad_filter"])
+        return [
+            TranscriptSegment(start=offset + piece.start, end=offset + piece.end, text=piece.text.strip())
+            for piece in segments_iter
+            if piece.text.strip()
+        ]
+
+    return transcribe
+
+
+class LiveTranscript:
+    """Transcribes a GrowingAudio in fixed steps as soon as each step (plus overlap) is on disk."""
+
+    def __init__(
+        self,
+        audio: GrowingAudio,
+        transcribe: TranscribeFn,
+        step_seconds: float = FOLLOW_STEP_SECONDS,
+        overlap_seconds: float = FOLLOW_OVERLAP_SECONDS,
+    ):
+        self.audio = audio
+        self.transcribe = transcribe
+        self.step = step_seconds
+        self.overlap = overlap_seconds
+        self.chunks: list[TranscriptionChunk] = []
+        self.chunk_segments: dict[int, list[TranscriptSegment]] = {}
+        self.transcribed_until = 0.0
+
+    def _transcribe_step(self, end: float, decode_end: float) -> None:
+        chunk = TranscriptionChunk(
+            index=len(self.chunks),
+            start=self.transcribed_until,
+            end=end,
+            decode_start=max(0.0, self.transcribed_until - self.overlap),
+            decode_end=decode_end,
+        )
+        audio = self.audio.read(chunk.decode_start, chunk.decode_end)
+        self.chunks.append(chunk)
+        self.chunk_segments[chunk.index] = self.transcribe(audio, chunk.decode_start)
+        self.transcribed_until = end
+
+    def poll(self) -> TranscriptProgress | None:
+        """Transcribe every complete new step; None when nothing new was available."""
+        available = self.audio.refresh()
+        before = len(self.chunks)
+        while self.transcribed_until + self.step + self.overlap <= available:
+            end = self.transcribed_until + self.step
+            self._transcribe_step(end, end + self.overlap)
+        if len(self.chunks) == before:
+            return None
+        return TranscriptProgress(
+            segments=merge_chunk_segments(self.chunks, self.chunk_segments, complete=False),
+            settled_until=self.transcribed_until - SETTLE_SECONDS,
+        )
+
+    def finish(self) -> TranscriptProgress:
+        """Transcribe the tail once the recording has stopped growing."""
+        available = self.audio.refresh()
+        if available > self.transcribed_until:
+            self._transcribe_step(available, available)
+        return TranscriptProgress(
+            segments=merge_chunk_segments(self.chunks, self.chunk_segments),
+            settled_until=available,
+            done=True,
+        )
+
+
+@dataclass
+class CueAlert:
+    status: str
+    round: int
+    event_type: str
+    court: str
+    label: str
+    expected_wav: float
+    expected_wall: str
+    anchor_source: str
+    actual_wav: float | None = None
+    drift_seconds: float | None = None
+    confidence: float = 0.0
+    text: str = ""
+    latency_seconds: float = 0.0
+
+    @property
+    def is_alert(self) -> bool:
+        return self.status != "ok"
+
+    def as_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "round": self.round,
+            "event_type": self.event_type,
+            "court": self.court,
+            "label": self.label,
+            "expected_wav": round(self.expected_wav, 1),
+            "expected_wav_timestamp": seconds_to_hms(self.expected_wav),
+            "expected_wall": self.expected_wall,
+            "anchor_source": self.anchor_source,
+            "actual_wav": None if self.actual_wav is None else round(self.actual_wav, 1),
+            "drift_seconds": None if self.drift_seconds is None else round(self.drift_seconds, 1),
+            "confidence": round(self.confidence, 3),
+            "text": self.text,
+            "latency_seconds": round(self.latency_seconds, 1),
+        }
+
+    def format_line(self) -> str:
+        tag = {"ok": "OK   ", "drift": "DRIFT", "missed": "MISS "}[self.status]
+        where = f"R{self.round} {self.event_type:<18} {self.court:<4} due {seconds_to_hms(self.expected_wav)} ({self.expected_wall})"
+        if self.actual_wav is None:
+            return f"{tag} {where}  not heard"
+        return f"{tag} {where}  heard {seconds_to_hms(self.actual_wav)} ({self.drift_seconds:+.0f}s)  {self.text}"
+
+
+@dataclass
+class _RoundState:
+    round_idx: int
+    slot_start: int
+    games: list[Game]
+    anchor: float | None = None
+    anchored: bool = False
+    reported: set[tuple[str, int]] = field(default_factory=set)
+
+
+class CueMonitor:
+    """Checks each expected cue once the transcript has settled past its match window."""
+
+    def __init__(
+        self,
+        games: list[Game],
+        wav_start_time: str,
+        tolerance: int,
+        min_confidence: float,
+        skip_ranges: list[tuple[int, int]],
+        skip_before: str | None,
+        drift_alert: float = DRIFT_ALERT_SECONDS,
+    ):
+        self.global_anchor = time_to_seconds(wav_start_time)
+        self.tolerance = tolerance
+        self.min_confidence = min_confidence
+        self.skip_ranges = skip_ranges
+        self.skip_before = skip_before
+        self.drift_alert = drift_alert
+        self.rounds = [
+            _RoundState(round_idx, slot_start, sorted(slot_games, key=lambda g: g.court_num))
+            for round_idx, (slot_start, slot_games) in enumerate(group_games_by_slot(games), start=1)
+        ]
+        self.drift = 0.0
+
+    def window_end(self, event_type: str, expected: float) -> float:
+        extra = COURT_CALL_EXTRA_SECONDS if event_type == "court_announcement" else 0
+        return expected + self.tolerance + extra
+
+    def update(self, progress: TranscriptProgress) -> list[CueAlert]:
+        index = SegmentIndex.of(progress.segments)
+        settled = progress.settled_until
+        alerts: list[CueAlert] = []
+        for state in self.rounds:
+            hint = float(state.slot_start - self.global_anchor)
+            if hint - self.tolerance > settled:
+                break
+            if not state.anchored and settled >= slot_anchor_search_end(hint, self.tolerance):
+                state.anchor = infer_slot_anchor_wav(state.games, index, hint, self.tolerance, self.min_confidence)
+                state.anchored = True
+                if state.anchor is not None:
+                    self.drift = state.anchor - hint
+            if state.anchored and state.anchor is not None:
+                anchor, source = state.anchor, "inferred"
+            elif state.anchored:
+                anchor, source = hint, "schedule_hint"
+            else:
+                anchor, source = hint + self.drift, "provisional"
+
+            events = build_slot_events(state.games, state.slot_start, anchor, self.skip_ranges, self.skip_before)
+            due = [
+                event
+                for event in events
+                if not event.skipped
+                and event.wav_offset_seconds >= 0
+                and (event.event_type, event.court_num) not in state.reported
+                and self.window_end(event.event_type, event.wav_offset_seconds) <= settled
+            ]
+            for result in match_slot_events(due, index, self.tolerance, self.min_confidence):
+                event = result.expected
+                state.reported.add((event.event_type, event.court_num))
+                if not result.matched:
+                    status = "missed"
+                elif abs(result.drift_seconds or 0.0) > self.drift_alert:
+                    status = "drift"
+                else:
+                    status = "ok"
+                alerts.append(
+                    CueAlert(
+                        status=status,
+                        round=state.round_idx,
+                        event_type=event.event_type,
+                        court="ALL" if event.venue_wide else f"C{event.court_num}",
+                        label=event.label,
+                        expected_wav=event.wav_offset_seconds,
+                        expected_wall=event.wall_time,
+                        anchor_source=source,
+                        actual_wav=result.actual_start,
+                        drift_seconds=result.drift_seconds,
+                        confidence=result.confidence,
+                        text=result.matched_text,
+                        latency_seconds=settled - self.window_end(event.event_type, event.wav_offset_seconds),
+                    )
+                )
+        alerts.sort(key=lambda alert: alert.expected_wav)
+        return alerts
+
+
+def emit_alerts(alerts: list[CueAlert], verbose: bool, jsonl: TextIO | None) -> None:
+    for alert in alerts:
+        if alert.is_alert or verbose:
+            print(alert.format_line(), flush=True)
+        if jsonl is not None:
+            jsonl.write(json.dumps(alert.as_dict()) + "\n")
+            jsonl.flush()
+
+
+def follow_overhead(
+    live: LiveTranscript,
+    monitor: CueMonitor,
+    poll_seconds: float = FOLLOW_POLL_SECONDS,
+    idle_exit_seconds: float = 0.0,
+    verbose: bool = False,
+    jsonl: TextIO | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, int]:
+    """Poll until the recording stops growing for idle_exit_seconds (0: until interrupted)."""
+    counts = {"ok": 0, "drift": 0, "missed": 0}
+    idle = 0.0
+    try:
+        while True:
+            progress = live.poll()
+            if progress is None:
+                if idle_exit_seconds and idle >= idle_exit_seconds:
+                    break
+                sleep(poll_seconds)
+                idle += poll_seconds
+                continue
+            idle = 0.0
+            alerts = monitor.update(progress)
+            for alert in alerts:
+                counts[alert.status] += 1
+            emit_alerts(alerts, verbose, jsonl)
+    except KeyboardInterrupt:
+        print("\nStopped following.", file=sys.stderr)
+    alerts = monitor.update(live.finish())
+    for alert in alerts:
+        counts[alert.status] += 1
+    emit_alerts(alerts, verbose, jsonl)
+    return counts
+
+
+def add_follow_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Tail a growing --wav (or a folder of rolling .wav segments) and alert on missed/drifting cues",
+    )
+    parser.add_argument(
+        "--follow-step",
+        type=float,
+        default=FOLLOW_STEP_SECONDS,
+        help=f"Seconds of new audio transcribed per step in --follow (default: {FOLLOW_STEP_SECONDS:g})",
+    )
+    parser.add_argument(
+        "--follow-poll",
+        type=float,
+        default=FOLLOW_POLL_SECONDS,
+        help=f"Seconds between checks for new audio in --follow (default: {FOLLOW_POLL_SECONDS:g})",
+    )
+    parser.add_argument(
+        "--follow-idle-exit",
+        type=float,
+        default=0.0,
+        help="Stop --follow once the recording has not grown for this many seconds (default: run until Ctrl-C)",
+    )
+    parser.add_argument(
+        "--drift-alert",
+        type=float,
+        default=DRIFT_ALERT_SECONDS,
+        help=f"Alert when a cue is heard more than this many seconds off (default: {DRIFT_ALERT_SECONDS:g})",
+    )
+    parser.add_argument(
+        "--alerts-jsonl",
+        type=Path,
+        help="Append one JSON object per checked cue to this file in --follow ('-' for stdout)",
+    )
+
+
+def run_follow(
+    args: argparse.Namespace,
+    games: list[Game],
+    wav_start_time: str,
+    skip_ranges: list[tuple[int, int]],
+) -> int:
+    live = LiveTranscript(
+        GrowingAudio(args.wav),
+        whisper_transcriber(args.model),
+        step_seconds=args.follow_step,
+    )
+    monitor = CueMonitor(
+        games,
+        wav_start_time,
+        args.tolerance,
+        args.min_confidence,
+        skip_ranges,
+        args.skip_before,
+        drift_alert=args.drift_alert,
+    )
+    print(
+        f"Following {args.wav} from {wav_start_time} (step {args.follow_step:g}s, "
+        f"tolerance ±{args.tolerance}s, drift alert {args.drift_alert:g}s) ...",
+        file=sys.stderr,
+    )
+    if args.alerts_jsonl is None:
+        counts = follow_overhead(live, monitor, args.follow_poll, args.follow_idle_exit)
+    elif str(args.alerts_jsonl) == "-":
+        counts = follow_overhead(live, monitor, args.follow_poll, args.follow_idle_exit, jsonl=sys.stdout)
+    else:
+        with args.alerts_jsonl.open("a", encoding="utf-8") as jsonl:
+            counts = follow_overhead(live, monitor, args.follow_poll, args.follow_idle_exit, jsonl=jsonl)
+    print(
+        f"Cues checked: {sum(counts.values())} ({counts['ok']} ok, {counts['drift']} drifting, "
+        f"{counts['missed']} missed); audio followed to {seconds_to_hms(live.audio.available)} "
+        f"({seconds_to_hm(monitor.global_anchor + int(live.audio.available))})",
+        file=sys.stderr,
+    )
+    return 0 if counts["missed"] == 0 and counts["drift"] == 0 else 1
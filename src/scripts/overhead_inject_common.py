@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
+from overhead_audio import OverheadAudio, read_wav_layout
+from overhead_transcript_cache import (
+    read_transcript_file,
+    read_transcript_json,
+    refinement_cache_path,
+    transcript_cache_path,
+)
+
 
 def seconds_to_hms(total_seconds: float) -> str:
     total = max(0, int(round(total_seconds)))
@@ -47,34 +57,12 @@ def load_report(path: Path) -> dict:
 
 
 def load_transcript(wav_path: Path, transcript_path: Path | None) -> dict | None:
-    path = transcript_path or wav_path.with_suffix(wav_path.suffix + ".transcript.json")
-    if not path.exists():
-        return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return read_transcript_json(transcript_path or transcript_cache_path(wav_path))
 
 
 def max_volume_db(wav_path: Path, timestamp: float, window_seconds: float = 0.5) -> float | None:
-    cmd = [
-        "ffmpeg",
-        "-hide_banner",
-        "-ss",
-        str(max(0.0, timestamp)),
-        "-t",
-        str(max(0.05, window_seconds)),
-        "-i",
-        str(wav_path),
-        "-af",
-        "volumedetect",
-        "-f",
-        "null",
-        "-",
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    for line in result.stderr.splitlines():
-        if "max_volume:" in line:
-            value = line.split("max_volume:")[-1].strip().split()[0]
-            return float(value.replace("dB", ""))
-    return None
+    start = max(0.0, timestamp)
+    return OverheadAudio.open(wav_path).peak_db(start, start + max(0.05, window_seconds))
 
 
 def build_ffmpeg_command(
@@ -123,44 +111,232 @@ def build_ffmpeg_command(
     ]
 
 
-def run_verification(wav_path: Path, report: dict, repo_root: Path) -> int:
-    verify_script = repo_root / "src/scripts/verify_overhead_schedule.py"
-    if not verify_script.exists():
-        print(f"Warning: verification script not found: {verify_script}", file=sys.stderr)
-        return 0
+SCHEDULE_KEYS = ("schedule_dir", "date", "courts")
+
+
+def add_verify_schedule_arguments(parser: argparse.ArgumentParser) -> None:
+    """Schedule options for --verify, for reports that do not record one."""
+    parser.add_argument(
+        "--schedule-dir",
+        type=Path,
+        help="With --verify, directory of {date}_courtN.jsonl files (default: the report's schedule)",
+    )
+    parser.add_argument("--date", help="With --verify, schedule date YYYY-MM-DD (default: the report's)")
+    parser.add_argument(
+        "--courts",
+        help="With --verify, comma-separated court numbers, e.g. 2,3,4 (default: the report's)",
+    )
+
+
+def schedule_overrides(args: argparse.Namespace) -> dict:
+    """The schedule fields given on the injector's command line."""
+    overrides: dict = {}
+    if args.schedule_dir:
+        overrides["schedule_dir"] = str(args.schedule_dir.resolve())
+    if args.date:
+        overrides["date"] = args.date
+    if args.courts:
+        overrides["courts"] = [int(c.strip()) for c in args.courts.split(",") if c.strip()]
+    return overrides
+
 
-    schedule_dir = repo_root / "src/output/June2026Tournament/schedule/generated"
-    if not schedule_dir.exists():
+def run_verification(wav_path: Path, report: dict, overrides: dict | None = None) -> int:
+    """By-round verification of an injected wav, in this process.
+
+    The injections sidecar beside ``wav_path`` (already written by the injector)
+    says which wav it was made from and where clips went; only the audio around
+    them is re-transcribed. Report, transcript and refinement caches are written
+    beside ``wav_path`` as verify_overhead_schedule.py would. The schedule comes
+    from the report, with ``overrides`` (schedule_overrides) on top; verification
+    fails rather than guess a day when neither gives all of it. Reports record
+    an absolute schedule_dir; a relative one (older reports) is taken from the
+    working directory, like --schedule-dir.
+    """
+    from verify_overhead_schedule import load_games, load_refinement_cache, save_refinement_cache, verify_overhead
+
+    schedule = {**(report.get("schedule") or {}), **(overrides or {})}
+    missing = [key for key in SCHEDULE_KEYS if not schedule.get(key)]
+    if not report.get("wav_start_time"):
+        missing.append("wav_start_time")
+    if missing:
         print(
-            "Warning: default schedule dir not found; skipping verification",
+            f"Error: cannot verify {wav_path}: the report has no {', '.join(missing)}; "
+            "pass --schedule-dir, --date and --courts, or re-run verify_overhead_schedule.py --by-round",
             file=sys.stderr,
         )
-        return 0
+        return 1
+    schedule_dir = Path(schedule["schedule_dir"]).resolve()
+    if not schedule_dir.is_dir():
+        print(f"Error: cannot verify {wav_path}: schedule dir not found: {schedule_dir}", file=sys.stderr)
+        return 1
+    try:
+        games = load_games(schedule_dir, schedule["date"], schedule["courts"])
+    except (FileNotFoundError, ValueError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
 
-    wav_start = report.get("wav_start_time", "09:00")
-    python = repo_root / ".venv/bin/python"
-    if not python.exists():
-        python = Path(sys.executable)
+    cache_path = transcript_cache_path(wav_path)
+    refine_cache_path = refinement_cache_path(cache_path)
+    base = load_injection_base(wav_path)
+    if base is None:
+        print("No current transcript of the source wav; transcribing the output wav.", file=sys.stderr)
+        refine_cache = load_refinement_cache(refine_cache_path)
+    else:
+        refine_cache = load_refinement_cache(base.refine_cache_path)
+    print("\nVerifying output wav by round ...", file=sys.stderr)
+    result = verify_overhead(
+        wav_path,
+        games,
+        report["wav_start_time"],
+        transcript=base.segments if base else None,
+        changed_ranges=base.changed_ranges if base else (),
+        model_name=base.model_name if base else "small",
+        refine_cache=refine_cache,
+        cache_path=cache_path,
+        schedule={**schedule, "schedule_dir": str(schedule_dir)},
+        output_report=wav_path.with_name(f"{wav_path.stem}_overhead_by_round_report.json"),
+        verbose=True,
+    )
+    save_refinement_cache(refine_cache_path, refine_cache)
+    print("-" * 72)
+    print(f"Rounds passed: {result['rounds_passed']}/{result['rounds_total']} ({result['verify_seconds']:.1f}s)")
+    return 0 if result["rounds_passed"] == result["rounds_total"] else 1
 
-    cmd = [
-        str(python),
-        str(verify_script),
-        "--wav",
-        str(wav_path),
-        "--schedule-dir",
-        str(schedule_dir),
-        "--date",
-        "2026-06-20",
-        "--courts",
-        "2,3,4",
-        "--wav-start-time",
-        wav_start,
-        "--by-round",
+
+def injected_ranges(clip_path: Path, insert_seconds: list[float]) -> list[tuple[float, float]]:
+    """Wav seconds covered by a clip inserted at each of ``insert_seconds``."""
+    layout = read_wav_layout(clip_path)
+    duration = layout.duration if layout is not None else probe_audio(clip_path)["duration"]
+    return [(at, at + duration) for at in insert_seconds]
+
+
+def injections_sidecar_path(wav_path: Path) -> Path:
+    return wav_path.with_suffix(wav_path.suffix + ".injections.json")
+
+
+def sidecar_ranges(sidecar: dict) -> list[tuple[float, float]]:
+    """Wav seconds an injections sidecar changed relative to its source_wav.
+
+    Patch-mode mixes record the exact frame regions they wrote; otherwise the
+    ranges come from the clip length at each recorded insert point.
+    """
+    mix = sidecar.get("mix") or {}
+    if mix.get("regions"):
+        rate = mix["sample_rate"]
+        return [(first / rate, last / rate) for first, last in mix["regions"]]
+    if sidecar.get("injection_type") == "combined":
+        return [span for entry in sidecar.get("injections", []) for span in sidecar_ranges(entry)]
+    insert_seconds = [
+        item["insert_seconds"]
+        for item in sidecar.get("insertions", [])
+        if item.get("insert_seconds") is not None
     ]
-    print("\nRe-running overhead verification on output wav ...", file=sys.stderr)
-    result = subprocess.run(cmd)
-    return result.returncode
+    if not insert_seconds:
+        return []
+    return injected_ranges(Path(sidecar["clip"]), insert_seconds)
+
+
+def sidecar_placements(sidecar: dict) -> list[tuple[Path, float]]:
+    """(clip, insert seconds) for every clip an injections sidecar says it placed."""
+    if sidecar.get("injection_type") == "combined":
+        return [place for entry in sidecar.get("injections", []) for place in sidecar_placements(entry)]
+    return [
+        (Path(sidecar["clip"]), item["insert_seconds"])
+        for item in sidecar.get("insertions", [])
+        if item.get("insert_seconds") is not None
+    ]
+
+
+@dataclass
+class InjectionBase:
+    """Nearest ancestor of an injected wav whose transcript is still current."""
+
+    wav_path: Path
+    segments: list
+    model_name: str
+    changed_ranges: list[tuple[float, float]]
+    sidecars: list[Path]
+
+    @property
+    def refine_cache_path(self) -> Path:
+        return refinement_cache_path(transcript_cache_path(self.wav_path))
+
+
+def load_injection_base(wav_path: Path, sidecar_path: Path | None = None) -> InjectionBase | None:
+    """Follow injections sidecars from wav_path back to a wav with a current transcript cache.
+
+    Ranges from every sidecar on the way are collected, so a start-buzzer wav made
+    from an untranscribed no-blocking wav re-transcribes around both sets of clips.
+    None when the chain ends without a usable transcript.
+    """
+    from verify_overhead_schedule import transcript_cache_is_current
+
+    ranges: list[tuple[float, float]] = []
+    sidecars: list[Path] = []
+    current = wav_path
+    while True:
+        if sidecar_path is None or sidecars:
+            sidecar_path = injections_sidecar_path(current)
+        if not sidecar_path.exists() or sidecar_path in sidecars:
+            return None
+        sidecar = json.loads(sidecar_path.read_text(encoding="utf-8"))
+        sidecars.append(sidecar_path)
+        ranges.extend(sidecar_ranges(sidecar))
+        current = Path(sidecar["source_wav"])
+        cached = read_transcript_file(transcript_cache_path(current)) if current.exists() else None
+        if cached is not None:
+            meta, segments = cached
+            if transcript_cache_is_current(meta, current):
+                return InjectionBase(
+                    wav_path=current,
+                    segments=segments,
+                    model_name=meta.get("model", "small"),
+                    changed_ranges=sorted(ranges),
+                    sidecars=sidecars,
+                )
 
 
 def write_injections_sidecar(path: Path, payload: dict) -> None:
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def load_injection_plan(path: Path, source_wav: Path) -> dict:
+    """Combined plan rendered by overhead_mix.py; empty when path does not exist yet."""
+    if not path.exists():
+        return {"source_wav": str(source_wav), "entries": []}
+    plan = json.loads(path.read_text(encoding="utf-8"))
+    if Path(plan["source_wav"]).resolve() != source_wav.resolve():
+        raise ValueError(f"Plan {path} was built for {plan['source_wav']}, not {source_wav}")
+    return plan
+
+
+def add_to_injection_plan(
+    path: Path,
+    source_wav: Path,
+    injection_type: str,
+    clip_path: Path,
+    insert_seconds: list[float],
+    sidecar: dict,
+    gain_db: float = 0.0,
+    wav_start_time: str | None = None,
+    schedule: dict | None = None,
+) -> dict:
+    """Record one tool's placements in the plan, replacing an earlier run of the same type."""
+    plan = load_injection_plan(path, source_wav)
+    entries = [e for e in plan["entries"] if e["injection_type"] != injection_type]
+    entries.append(
+        {
+            "injection_type": injection_type,
+            "clip": str(clip_path),
+            "gain_db": gain_db,
+            "insert_seconds": insert_seconds,
+            "sidecar": sidecar,
+        }
+    )
+    plan["entries"] = entries
+    if wav_start_time:
+        plan["wav_start_time"] = wav_start_time
+    if schedule:
+        plan["schedule"] = schedule
+    write_injections_sidecar(path, plan)
+    return plan
@@ -0,0 +1,619 @@
+#!/usr/bin/env python3
+"""
+Mix PA clips into a venue-wide overhead .wav in one sequential, in-process pass.
+
+Streams the source through its memory-mapped PCM (see overhead_audio.OverheadAudio)
+in blocks, adds every clip at its sample-accurate offset with per-clip gain and a
+soft limiter instead of ffmpeg's amix (which rescales the whole programme), and
+copies untouched blocks straight through. Takes a combined injection plan written
+by inject_no_blocking.py / inject_start_buzzer.py --plan, so the whole day is
+rewritten once no matter how many injection types are stacked.
+
+For 16-bit PCM sources the default patch mode does not stream the day at all: the
+output is a reflink/copy_file_range clone of the source with only the mixed regions
+rewritten, and a re-run against the same output restores and rewrites just those
+regions in place (tracked in the ``mix`` block of the injections sidecar).
+
+Usage:
+  python inject_no_blocking.py --wav day.wav --report ... --plan day.injection_plan.json
+  python inject_start_buzzer.py --wav day.wav --report ... --plan day.injection_plan.json
+  python overhead_mix.py --wav day.wav --plan day.injection_plan.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import errno
+import fcntl
+import json
+import os
+import struct
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from overhead_audio import WAVE_FORMAT_PCM, OverheadAudio, read_wav_layout, wav_fingerprint
+from overhead_inject_common import (
+    add_to_injection_plan,
+    add_verify_schedule_arguments,
+    build_ffmpeg_command,
+    load_injection_plan,
+    probe_audio,
+    run_verification,
+    schedule_overrides,
+    write_injections_sidecar,
+)
+
+MIX_BLOCK_SECONDS = 10.0
+# Samples below the knee pass unchanged; above it they bend smoothly towards full scale.
+LIMITER_KNEE = 0.9
+RIFF_MAX_SIZE = 0xFFFFFFFF
+# Linux ioctl that shares a file's extents with another (btrfs, XFS, bcachefs).
+FICLONE = 0x40049409
+COPY_CHUNK_BYTES = 1 << 24
+
+
+@dataclass
+class ClipPlacement:
+    clip: Path
+    at: float
+    gain_db: float = 0.0
+
+
+@dataclass
+class MixStats:
+    frames: int
+    sample_rate: int
+    channels: int
+    placements: int
+    mixed_blocks: int
+    copied_blocks: int
+    limited_samples: int
+    wall_seconds: float
+    mode: str = "stream"
+    method: str = "write"
+    regions: list[tuple[int, int]] = field(default_factory=list)
+    source_fingerprint: str = ""
+    bytes_written: int = 0
+    bytes_copied: int = 0
+
+    @property
+    def realtime_factor(self) -> float:
+        audio_seconds = self.frames / self.sample_rate if self.sample_rate else 0.0
+        return audio_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "sample_rate": self.sample_rate,
+            "channels": self.channels,
+            "placements": self.placements,
+            "mixed_blocks": self.mixed_blocks,
+            "copied_blocks": self.copied_blocks,
+            "limited_samples": self.limited_samples,
+            "wall_seconds": round(self.wall_seconds, 2),
+            "realtime_factor": round(self.realtime_factor, 1),
+            "mode": self.mode,
+            "method": self.method,
+            "regions": [list(region) for region in self.regions],
+            "source_fingerprint": self.source_fingerprint,
+            "bytes_written": self.bytes_written,
+            "bytes_copied": self.bytes_copied,
+        }
+
+
+def load_clip_samples(clip_path: Path, sample_rate: int, channels: int) -> Any:
+    """Clip as float32 (frames, channels) at the source's rate and channel count.
+
+    PCM wavs already at the right rate are read from their memmap; anything else
+    (other rates, GarageBand .aif exports) is decoded once through ffmpeg.
+    """
+    import numpy as np
+
+    layout = read_wav_layout(clip_path)
+    if layout is not None and layout.is_pcm and layout.sample_rate == sample_rate:
+        audio = OverheadAudio(clip_path)
+        samples = np.asarray(audio.native, dtype=np.float32) / audio._full_scale()
+        if samples.shape[1] == channels:
+            return samples
+        mono = samples.mean(axis=1, keepdims=True)
+        return np.repeat(mono, channels, axis=1)
+
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        str(clip_path),
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-f",
+        "f32le",
+        "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, dtype="<f4").reshape(-1, channels)
+
+
+def soft_limit(block: Any) -> int:
+    """Limit block (float, full scale 1.0) in place; returns samples that were above the knee."""
+    import numpy as np
+
+    magnitude = np.abs(block)
+    over = magnitude > LIMITER_KNEE
+    count = int(over.sum())
+    if count:
+        headroom = 1.0 - LIMITER_KNEE
+        bent = LIMITER_KNEE + headroom * np.tanh((magnitude[over] - LIMITER_KNEE) / headroom)
+        block[over] = np.sign(block[over]) * bent
+    return count
+
+
+def wav_header(frames: int, sample_rate: int, channels: int) -> bytes:
+    """16-bit PCM header; sizes past 4 GB are written as the RIFF placeholder."""
+    block_align = channels * 2
+    data_size = frames * block_align
+    return (
+        b"RIFF"
+        + struct.pack("<I", min(RIFF_MAX_SIZE, 36 + data_size))
+        + b"WAVE"
+        + b"fmt "
+        + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16)
+        + b"data"
+        + struct.pack("<I", min(RIFF_MAX_SIZE, data_size))
+    )
+
+
+def clip_spans(placements: list[ClipPlacement], sample_rate: int, channels: int) -> list[tuple[int, int, Any, float]]:
+    """(first_frame, end_frame, samples, linear_gain) per placement, sorted by first frame."""
+    if not placements:
+        raise ValueError("No clip placements provided")
+    clips: dict[Path, Any] = {}
+    spans: list[tuple[int, int, Any, float]] = []
+    for placement in placements:
+        if placement.clip not in clips:
+            clips[placement.clip] = load_clip_samples(placement.clip, sample_rate, channels)
+        clip = clips[placement.clip]
+        first = int(round(placement.at * sample_rate))
+        spans.append((first, first + len(clip), clip, 10 ** (placement.gain_db / 20.0)))
+    spans.sort(key=lambda span: span[0])
+    return spans
+
+
+def merge_regions(spans: list[tuple[int, int, Any, float]], frames: int) -> list[tuple[int, int]]:
+    """Disjoint frame ranges touched by any span, clamped to [0, frames)."""
+    regions: list[tuple[int, int]] = []
+    for first, last, _, _ in spans:
+        first, last = max(0, first), min(frames, last)
+        if first >= last:
+            continue
+        if regions and first <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], max(regions[-1][1], last))
+        else:
+            regions.append((first, last))
+    return regions
+
+
+def mix_region(
+    samples: Any,
+    first: int,
+    last: int,
+    spans: list[tuple[int, int, Any, float]],
+    full_scale: float,
+) -> tuple[Any, int]:
+    """16-bit PCM for frames [first, last) of samples with overlapping spans added and limited."""
+    import numpy as np
+
+    mixed = np.asarray(samples[first:last], dtype=np.float32) / full_scale
+    for start, end, clip, gain in spans:
+        lo, hi = max(start, first), min(end, last)
+        if lo < hi:
+            mixed[lo - first : hi - first] += gain * clip[lo - start : hi - start]
+    limited = soft_limit(mixed)
+    return np.clip(np.rint(mixed * 32768.0), -32768, 32767).astype("<i2"), limited
+
+
+def mix_clips(
+    source_wav: Path,
+    output_path: Path,
+    placements: list[ClipPlacement],
+    block_seconds: float = MIX_BLOCK_SECONDS,
+) -> MixStats:
+    """Write source_wav with every placement mixed in to output_path (16-bit PCM)."""
+    import numpy as np
+
+    started = time.perf_counter()
+    source = OverheadAudio.open(source_wav)
+    samples = source.native
+    rate = source.sample_rate
+    frames, channels = samples.shape
+    full_scale = source._full_scale()
+    spans = clip_spans(placements, rate, channels)
+    regions = merge_regions(spans, frames)
+
+    block = max(1, int(block_seconds * rate))
+    passthrough = samples.dtype == np.dtype("<i2")
+    mixed_blocks = copied_blocks = limited = 0
+    tmp = output_path.with_name(output_path.name + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(wav_header(frames, rate, channels))
+        for offset in range(0, frames, block):
+            end = min(frames, offset + block)
+            active = [span for span in spans if span[0] < end and span[1] > offset]
+            if not passthrough:
+                pcm, count = mix_region(samples, offset, end, active, full_scale)
+                limited += count
+            elif not active:
+                handle.write(np.asarray(samples[offset:end]).tobytes())
+                copied_blocks += 1
+                continue
+            else:
+                pcm = np.array(samples[offset:end])
+                for first, last in regions:
+                    lo, hi = max(first, offset), min(last, end)
+                    if lo < hi:
+                        pcm[lo - offset : hi - offset], count = mix_region(samples, lo, hi, active, full_scale)
+                        limited += count
+            handle.write(pcm.tobytes())
+            mixed_blocks += bool(active)
+            copied_blocks += not active
+    tmp.replace(output_path)
+
+    return MixStats(
+        frames=frames,
+        sample_rate=rate,
+        channels=channels,
+        placements=len(placements),
+        mixed_blocks=mixed_blocks,
+        copied_blocks=copied_blocks,
+        limited_samples=limited,
+        wall_seconds=time.perf_counter() - started,
+        regions=regions,
+        bytes_written=frames * channels * 2,
+    )
+
+
+def copy_range(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """Copy count bytes at offset between two files inside the kernel where possible."""
+    end = offset + count
+    if hasattr(os, "copy_file_range"):
+        try:
+            while offset < end:
+                copied = os.copy_file_range(src_fd, dst_fd, end - offset, offset, offset)
+                if copied == 0:
+                    break
+                offset += copied
+            return
+        except OSError as exc:
+            if exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    if hasattr(os, "sendfile"):
+        try:
+            os.lseek(dst_fd, offset, os.SEEK_SET)
+            while offset < end:
+                sent = os.sendfile(dst_fd, src_fd, offset, min(end - offset, COPY_CHUNK_BYTES))
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError as exc:
+            if exc.errno not in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    while offset < end:
+        chunk = os.pread(src_fd, min(end - offset, COPY_CHUNK_BYTES), offset)
+        if not chunk:
+            break
+        os.pwrite(dst_fd, chunk, offset)
+        offset += len(chunk)
+
+
+def clone_file(source: Path, target: Path) -> str:
+    """Copy source to target, sharing extents (reflink) when the filesystem allows it."""
+    with source.open("rb") as src, target.open("wb") as dst:
+        if sys.platform.startswith("linux"):
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return "reflink"
+            except OSError:
+                pass
+        copy_range(src.fileno(), dst.fileno(), 0, os.fstat(src.fileno()).st_size)
+    return "copy"
+
+
+def can_patch(source_wav: Path) -> bool:
+    layout = read_wav_layout(source_wav)
+    return layout is not None and layout.format_tag == WAVE_FORMAT_PCM and layout.bits_per_sample == 16
+
+
+def patch_clips(
+    source_wav: Path,
+    output_path: Path,
+    placements: list[ClipPlacement],
+    previous: dict | None = None,
+    sidecar_path: Path | None = None,
+) -> MixStats:
+    """Write output_path as a copy of a 16-bit source_wav with only the mixed regions rewritten.
+
+    previous is the ``mix`` block of the sidecar from an earlier patch of the same
+    output. When it was cut from this exact source, the output is fixed up in place:
+    its old regions are restored from the source and the new ones written, so a
+    re-run with tweaked offsets touches a few seconds per round. Otherwise the source
+    is cloned (reflink, copy_file_range, sendfile) and patched before an atomic rename.
+    sidecar_path is removed before any in-place write so an interrupted patch is never
+    mistaken for a good one.
+    """
+    started = time.perf_counter()
+    layout = read_wav_layout(source_wav)
+    if layout is None or layout.format_tag != WAVE_FORMAT_PCM or layout.bits_per_sample != 16:
+        raise ValueError(f"Patch mode needs a 16-bit PCM wav: {source_wav}")
+    source = OverheadAudio.open(source_wav)
+    samples = source.native
+    frames, channels = samples.shape
+    spans = clip_spans(placements, layout.sample_rate, channels)
+    regions = merge_regions(spans, frames)
+    fingerprint = wav_fingerprint(source_wav, layout)
+
+    in_place = (
+        previous is not None
+        and previous.get("mode") == "patch"
+        and previous.get("source_fingerprint") == fingerprint
+        and output_path.exists()
+        and output_path.stat().st_size == source_wav.stat().st_size
+    )
+    if in_place:
+        if sidecar_path is not None:
+            sidecar_path.unlink(missing_ok=True)
+        target, method = output_path, "in_place"
+    else:
+        target = output_path.with_name(output_path.name + ".tmp")
+        method = clone_file(source_wav, target)
+
+    limited = written = copied = 0
+    with source_wav.open("rb") as src, target.open("r+b") as dst:
+        if in_place:
+            for first, last in previous.get("regions", []):
+                first, last = max(0, first), min(frames, last)
+                if first < last:
+                    count = (last - first) * layout.block_align
+                    copy_range(src.fileno(), dst.fileno(), layout.data_offset + first * layout.block_align, count)
+                    copied += count
+        else:
+            copied = layout.data_offset + layout.data_size
+        for first, last in regions:
+            pcm, count = mix_region(samples, first, last, spans, 32768.0)
+            limited += count
+            data = pcm.tobytes()
+            os.pwrite(dst.fileno(), data, layout.data_offset + first * layout.block_align)
+            written += len(data)
+    if not in_place:
+        target.replace(output_path)
+
+    return MixStats(
+        frames=frames,
+        sample_rate=layout.sample_rate,
+        channels=channels,
+        placements=len(placements),
+        mixed_blocks=len(regions),
+        copied_blocks=0,
+        limited_samples=limited,
+        wall_seconds=time.perf_counter() - started,
+        mode="patch",
+        method=method,
+        regions=regions,
+        source_fingerprint=fingerprint,
+        bytes_written=written,
+        bytes_copied=copied,
+    )
+
+
+def print_mix_stats(stats: MixStats) -> None:
+    if stats.mode == "patch":
+        print(
+            f"Patched {stats.placements} clip(s) into {len(stats.regions)} region(s) ({stats.method}): "
+            f"{stats.bytes_written / 1e6:.1f} MB written, {stats.bytes_copied / 1e6:.1f} MB copied, "
+            f"{stats.limited_samples} sample(s) limited; {stats.wall_seconds:.1f}s",
+            file=sys.stderr,
+        )
+        return
+    print(
+        f"Mixed {stats.placements} clip(s) in one pass: {stats.mixed_blocks} block(s) mixed, "
+        f"{stats.copied_blocks} copied, {stats.limited_samples} sample(s) limited; "
+        f"{stats.wall_seconds:.1f}s ({stats.realtime_factor:.0f}x realtime)",
+        file=sys.stderr,
+    )
+
+
+def add_mix_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options shared by the injectors for rendering or deferring their clips."""
+    parser.add_argument(
+        "--clip-gain-db",
+        type=float,
+        default=0.0,
+        help="Gain applied to each inserted clip in dB (default: 0)",
+    )
+    parser.add_argument(
+        "--mixer",
+        choices=("patch", "native", "ffmpeg"),
+        default="patch",
+        help=(
+            "patch: copy the source and rewrite only the mixed regions (default; 16-bit PCM, "
+            "otherwise native); native: single-pass in-process mix; ffmpeg: legacy amix filter graph"
+        ),
+    )
+    parser.add_argument(
+        "--plan",
+        type=Path,
+        help="Add the insertions to this combined plan for overhead_mix.py instead of writing a wav",
+    )
+
+
+def previous_mix(sidecar_path: Path) -> dict | None:
+    """``mix`` block of an existing injections sidecar, if it has one."""
+    try:
+        return json.loads(sidecar_path.read_text(encoding="utf-8")).get("mix")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def render(
+    wav_path: Path,
+    output_path: Path,
+    placements: list[ClipPlacement],
+    mixer: str = "patch",
+    sidecar_path: Path | None = None,
+) -> MixStats:
+    """Write output_path with the patch mixer when the source allows it, else stream it."""
+    if mixer == "patch" and can_patch(wav_path):
+        previous = previous_mix(sidecar_path) if sidecar_path else None
+        stats = patch_clips(wav_path, output_path, placements, previous, sidecar_path)
+    else:
+        stats = mix_clips(wav_path, output_path, placements)
+    print_mix_stats(stats)
+    return stats
+
+
+def render_injections(
+    wav_path: Path,
+    clip_path: Path,
+    output_path: Path,
+    insert_seconds: list[float],
+    gain_db: float = 0.0,
+    mixer: str = "patch",
+    sidecar_path: Path | None = None,
+) -> MixStats | None:
+    if mixer == "ffmpeg":
+        wav_info = probe_audio(wav_path)
+        cmd = build_ffmpeg_command(
+            wav_path,
+            clip_path,
+            output_path,
+            insert_seconds,
+            wav_info["sample_rate"],
+            wav_info["channels"],
+        )
+        print(f"Inserting {len(insert_seconds)} clip(s) with ffmpeg ...", file=sys.stderr)
+        subprocess.run(cmd, check=True)
+        return None
+    placements = [ClipPlacement(clip_path, at, gain_db) for at in insert_seconds]
+    return render(wav_path, output_path, placements, mixer, sidecar_path)
+
+
+def plan_injections(
+    plan_path: Path,
+    wav_path: Path,
+    injection_type: str,
+    clip_path: Path,
+    insert_seconds: list[float],
+    sidecar: dict,
+    gain_db: float = 0.0,
+    wav_start_time: str | None = None,
+    schedule: dict | None = None,
+) -> None:
+    plan = add_to_injection_plan(
+        plan_path,
+        wav_path,
+        injection_type,
+        clip_path,
+        insert_seconds,
+        sidecar,
+        gain_db,
+        wav_start_time,
+        schedule,
+    )
+    types = ", ".join(entry["injection_type"] for entry in plan["entries"])
+    print(f"\nAdded {len(insert_seconds)} {injection_type} clip(s) to {plan_path} ({types})", file=sys.stderr)
+    print(f"Render with: overhead_mix.py --wav {wav_path} --plan {plan_path}", file=sys.stderr)
+
+
+def plan_placements(plan: dict) -> list[ClipPlacement]:
+    return [
+        ClipPlacement(clip=Path(entry["clip"]), at=float(at), gain_db=float(entry.get("gain_db", 0.0)))
+        for entry in plan["entries"]
+        for at in entry["insert_seconds"]
+    ]
+
+
+def default_output_path(source_wav: Path, plan: dict) -> Path:
+    types = [entry["injection_type"] for entry in plan["entries"]]
+    return source_wav.with_name(f"{source_wav.stem}_with_{'_and_'.join(types)}.wav")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Render a combined injection plan into the overhead .wav in one pass."
+    )
+    parser.add_argument("--wav", type=Path, required=True, help="Source overhead .wav")
+    parser.add_argument(
+        "--plan",
+        type=Path,
+        help="Injection plan JSON (default: {wav_stem}.injection_plan.json beside wav)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Output .wav path (default: {wav_stem}_with_{type}_and_{type}.wav)",
+    )
+    parser.add_argument(
+        "--mixer",
+        choices=("patch", "native"),
+        default="patch",
+        help="patch: rewrite only the mixed regions of a copy (default); native: stream the whole day",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Verify the output wav by round in-process, re-transcribing only around the inserted clips",
+    )
+    add_verify_schedule_arguments(parser)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    if not args.wav.exists():
+        print(f"Error: WAV not found: {args.wav}", file=sys.stderr)
+        return 1
+    plan_path = args.plan or args.wav.with_name(f"{args.wav.stem}.injection_plan.json")
+    plan = load_injection_plan(plan_path, args.wav)
+    placements = plan_placements(plan)
+    if not placements:
+        print(f"Error: no placements in plan: {plan_path}", file=sys.stderr)
+        return 1
+    missing = sorted({str(p.clip) for p in placements if not p.clip.exists()})
+    if missing:
+        print(f"Error: clip not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    output_path = args.output or default_output_path(args.wav, plan)
+    print(f"Writing: {output_path}", file=sys.stderr)
+    sidecar = output_path.with_suffix(output_path.suffix + ".injections.json")
+    stats = render(args.wav, output_path, placements, args.mixer, sidecar)
+
+    write_injections_sidecar(
+        sidecar,
+        {
+            "source_wav": str(args.wav),
+            "injection_type": "combined",
+            "plan": str(plan_path),
+            "mix": stats.as_dict(),
+            "injections": [entry["sidecar"] for entry in plan["entries"]],
+        },
+    )
+    print(f"Insertion log: {sidecar}", file=sys.stderr)
+    print(f"Done: {output_path}", file=sys.stderr)
+
+    if args.verify:
+        report = {"wav_start_time": plan.get("wav_start_time"), "schedule": plan.get("schedule")}
+        return run_verification(output_path, report, schedule_overrides(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
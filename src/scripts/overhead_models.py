@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""Warm faster-whisper models shared by transcription, bundled-cue refinement and --follow.
+
+Loading a WhisperModel takes several seconds, which used to be paid by every
+transcribe_wav run and again for the refinement model. ModelPool keeps up to
+``size`` models loaded, keyed by model name and evicted least-recently-used,
+all built with the same ``cpu_threads``/``num_workers``.
+
+A pool can also be served from a long-running process on a local Unix socket:
+
+    python overhead_models.py serve --preload small base
+    python verify_overhead_schedule.py ... --model-daemon "$XDG_RUNTIME_DIR/overhead_models.sock"
+
+Clients select the daemon with --model-daemon or OVERHEAD_MODEL_DAEMON and get
+stand-in models whose transcribe() forwards the audio (or a wav path) to it, so
+a re-run started by an injector — a separate interpreter — skips the model load.
+The daemon reads any wav path a client names, so its socket lives in a per-user
+directory and is only connectable by its owner (mode 0600).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+DEFAULT_POOL_SIZE = 2
+MODEL_DAEMON_ENV = "OVERHEAD_MODEL_DAEMON"
+DEFAULT_SOCKET_PATH = (
+    Path(os.environ.get("XDG_RUNTIME_DIR") or Path.home() / ".cache") / "overhead_models.sock"
+)
+
+ModelLoader = Callable[[str, int, int], Any]
+
+
+def resolve_cpu_threads(cpu_threads: int) -> int:
+    """0 means every core, as a single in-process transcription has always used."""
+    return cpu_threads or (os.cpu_count() or 1)
+
+
+@dataclass
+class PooledSegment:
+    """The part of a faster-whisper segment callers read; what the daemon sends back."""
+
+    start: float
+    end: float
+    text: str
+    words: list | None = None  # [start, end, word] with word_timestamps
+
+
+@dataclass
+class PoolStats:
+    loads: int = 0
+    hits: int = 0
+    evictions: int = 0
+    load_seconds: float = 0.0
+    loaded: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["load_seconds"] = round(self.load_seconds, 2)
+        return data
+
+
+def load_whisper_model(model_name: str, cpu_threads: int, num_workers: int) -> Any:
+    from overhead_transcribe import import_whisper_model
+
+    WhisperModel = import_whisper_model()
+    return WhisperModel(
+        model_name,
+        device="cpu",
+        compute_type="int8",
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
+
+
+def batched_pipeline(model: Any) -> Any:
+    from faster_whisper import BatchedInferencePipeline
+
+    return BatchedInferencePipeline(model=model)
+
+
+class ModelPool:
+    """Up to ``size`` loaded models by name; the least recently used one is dropped first."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        loader: ModelLoader = load_whisper_model,
+        pipeline_factory: Callable[[Any], Any] = batched_pipeline,
+    ):
+        self.size = max(1, size)
+        self.cpu_threads = resolve_cpu_threads(cpu_threads)
+        self.num_workers = max(1, num_workers)
+        self.loader = loader
+        self.pipeline_factory = pipeline_factory
+        self.stats = PoolStats()
+        self._models: OrderedDict[str, Any] = OrderedDict()
+        self._pipelines: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def settings(self) -> tuple[int, int, int, str | None]:
+        return self.size, self.cpu_threads, self.num_workers, None
+
+    def model(self, model_name: str) -> Any:
+        with self._lock:
+            if model_name in self._models:
+                self._models.move_to_end(model_name)
+                self.stats.hits += 1
+                return self._models[model_name]
+            print(f"Loading whisper model={model_name} ...", file=sys.stderr)
+            started = time.perf_counter()
+            model = self.loader(model_name, self.cpu_threads, self.num_workers)
+            self.stats.load_seconds += time.perf_counter() - started
+            self.stats.loads += 1
+            self._models[model_name] = model
+            while len(self._models) > self.size:
+                evicted, _ = self._models.popitem(last=False)
+                self._pipelines.pop(evicted, None)
+                self.stats.evictions += 1
+            self.stats.loaded = list(self._models)
+            return model
+
+    def pipeline(self, model_name: str) -> Any:
+        """BatchedInferencePipeline around the pooled model; dropped along with it."""
+        model = self.model(model_name)
+        with self._lock:
+            if model_name not in self._pipelines:
+                self._pipelines[model_name] = self.pipeline_factory(model)
+            return self._pipelines[model_name]
+
+    def transcribe(
+        self,
+        model_name: str,
+        audio: Any,
+        batched: bool = False,
+        **options: Any,
+    ) -> list[PooledSegment]:
+        runner = self.pipeline(model_name) if batched else self.model(model_name)
+        segments_iter, _info = runner.transcribe(audio, **options)
+        return [
+            PooledSegment(
+                piece.start,
+                piece.end,
+                piece.text,
+                [[w.start, w.end, w.word] for w in piece.words] if getattr(piece, "words", None) else None,
+            )
+            for piece in segments_iter
+        ]
+
+
+class RemoteModel:
+    """Stand-in for a WhisperModel (or its batched pipeline) living in the daemon."""
+
+    def __init__(self, address: Path, model_name: str, batched: bool = False):
+        self.address = address
+        self.model_name = model_name
+        self.batched = batched
+
+    def transcribe(self, audio: Any, **options: Any) -> tuple[list[PooledSegment], None]:
+        header: dict = {
+            "op": "transcribe",
+            "model": self.model_name,
+            "batched": self.batched,
+            "options": options,
+        }
+        payload = b""
+        if isinstance(audio, (str, Path)):
+            header["audio_path"] = str(audio)
+        else:
+            payload = np.ascontiguousarray(audio, dtype=np.float32).tobytes()
+            header["samples"] = len(payload) // 4
+        reply = daemon_request(self.address, header, payload)
+        return [PooledSegment(*item) for item in reply["segments"]], None
+
+
+class RemoteModelPool:
+    """ModelPool interface backed by a daemon; loading and eviction happen over there."""
+
+    def __init__(self, address: Path):
+        self.address = address
+
+    @property
+    def settings(self) -> tuple[int, int, int, str | None]:
+        return 0, 0, 0, str(self.address)
+
+    def model(self, model_name: str) -> RemoteModel:
+        return RemoteModel(self.address, model_name)
+
+    def pipeline(self, model_name: str) -> RemoteModel:
+        return RemoteModel(self.address, model_name, batched=True)
+
+    def transcribe(
+        self,
+        model_name: str,
+        audio: Any,
+        batched: bool = False,
+        **options: Any,
+    ) -> list[PooledSegment]:
+        segments, _info = RemoteModel(self.address, model_name, batched).transcribe(audio, **options)
+        return segments
+
+    @property
+    def stats(self) -> PoolStats:
+        reply = daemon_request(self.address, {"op": "stats"})
+        return PoolStats(**reply["stats"])
+
+
+_pool: ModelPool | RemoteModelPool | None = None
+
+
+def configure_model_pool(
+    size: int = DEFAULT_POOL_SIZE,
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+    daemon: Path | str | None = None,
+) -> ModelPool | RemoteModelPool:
+    """Set the process-wide pool; loaded models survive when the settings are unchanged."""
+    global _pool
+    daemon = daemon or os.environ.get(MODEL_DAEMON_ENV) or None
+    if daemon:
+        wanted: tuple = (0, 0, 0, str(daemon))
+    else:
+        wanted = (max(1, size), resolve_cpu_threads(cpu_threads), max(1, num_workers), None)
+    if _pool is None or _pool.settings != wanted:
+        _pool = RemoteModelPool(Path(daemon)) if daemon else ModelPool(size, cpu_threads, num_workers)
+    return _pool
+
+
+def get_model_pool() -> ModelPool | RemoteModelPool:
+    if _pool is None:
+        return configure_model_pool()
+    return _pool
+
+
+def model_daemon_address() -> str | None:
+    """Daemon socket the current pool talks to, for handing on to worker processes."""
+    pool = get_model_pool()
+    return str(pool.address) if isinstance(pool, RemoteModelPool) else None
+
+
+def add_model_pool_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=0,
+        help="Threads per whisper model (default: 0 = all cores, split across --workers when chunked)",
+    )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=1,
+        help="Concurrent transcribe() calls one loaded model can serve (default: 1)",
+    )
+    parser.add_argument(
+        "--model-pool-size",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help=f"Whisper models kept loaded at once, least recently used evicted (default: {DEFAULT_POOL_SIZE})",
+    )
+    parser.add_argument(
+        "--model-daemon",
+        type=Path,
+        help=f"Use the model daemon listening on this socket (default: ${MODEL_DAEMON_ENV} if set)",
+    )
+
+
+def configure_model_pool_from_args(args: argparse.Namespace) -> ModelPool | RemoteModelPool:
+    return configure_model_pool(
+        size=args.model_pool_size,
+        cpu_threads=args.cpu_threads,
+        num_workers=args.num_workers,
+        daemon=args.model_daemon,
+    )
+
+
+def send_message(sock: socket.socket, header: dict, payload: bytes = b"") -> None:
+    sock.sendall(json.dumps(header).encode("utf-8") + b"\n" + payload)
+
+
+def read_message(stream: Any) -> tuple[dict | None, bytes]:
+    """One JSON header line plus the float32 payload it announces; (None, b"") at EOF."""
+    line = stream.readline()
+    if not line:
+        return None, b""
+    header = json.loads(line)
+    payload = stream.read(header.get("samples", 0) * 4) if header.get("samples") else b""
+    return header, payload
+
+
+def daemon_request(address: Path, header: dict, payload: bytes = b"") -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(address))
+        except OSError as exc:
+            raise RuntimeError(f"Model daemon not reachable at {address}: {exc}") from exc
+        send_message(sock, header, payload)
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as stream:
+            reply, _ = read_message(stream)
+    if reply is None:
+        raise RuntimeError(f"Model daemon at {address} closed the connection")
+    if "error" in reply:
+        raise RuntimeError(f"Model daemon: {reply['error']}")
+    return reply
+
+
+class _PoolRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        pool: ModelPool = self.server.pool  # type: ignore[attr-defined]
+        header, payload = read_message(self.rfile)
+        if header is None:
+            return
+        try:
+            reply = handle_daemon_request(pool, header, payload)
+        except Exception as exc:  # reported to the client, daemon keeps serving
+            reply = {"error": f"{type(exc).__name__}: {exc}"}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+def handle_daemon_request(pool: ModelPool, header: dict, payload: bytes) -> dict:
+    op = header.get("op")
+    if op == "stats":
+        return {"stats": pool.stats.as_dict()}
+    if op == "preload":
+        for name in header.get("models", []):
+            pool.model(name)
+        return {"stats": pool.stats.as_dict()}
+    if op == "transcribe":
+        audio: Any = header.get("audio_path") or np.frombuffer(payload, dtype=np.float32)
+        segments = pool.transcribe(
+            header["model"], audio, batched=header.get("batched", False), **header.get("options", {})
+        )
+        return {"segments": [[s.start, s.end, s.text, s.words] for s in segments]}
+    raise ValueError(f"unknown op {op!r}")
+
+
+class ModelPoolServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Owner-only (0600) socket; refuses to replace a daemon that is still answering."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Path, pool: ModelPool):
+        self.pool = pool
+        if address.exists() or address.is_symlink():
+            if not address.is_socket():
+                raise RuntimeError(f"{address} exists and is not a socket")
+            try:
+                daemon_request(address, {"op": "stats"})
+            except RuntimeError:
+                address.unlink()  # left behind by a daemon that did not shut down cleanly
+            else:
+                raise RuntimeError(f"A model daemon is already serving on {address}")
+        super().__init__(str(address), _PoolRequestHandler)
+
+    def server_bind(self) -> None:
+        # Create the socket 0600 rather than chmod it after another user could connect.
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+        os.chmod(self.server_address, 0o600)
+
+
+def serve(args: argparse.Namespace) -> int:
+    pool = ModelPool(args.model_pool_size, args.cpu_threads, args.num_workers)
+    args.socket.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    try:
+        server = ModelPoolServer(args.socket, pool)
+    except RuntimeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    try:
+        # Preloaded after binding, so a second daemon on the same socket fails fast.
+        for name in args.preload:
+            pool.model(name)
+        print(
+            f"Serving whisper model pool on {args.socket} (size {pool.size}, "
+            f"cpu_threads {pool.cpu_threads}, num_workers {pool.num_workers})",
+            file=sys.stderr,
+        )
+        print(f"Clients: export {MODEL_DAEMON_ENV}={args.socket}", file=sys.stderr)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        args.socket.unlink(missing_ok=True)
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Keep faster-whisper models loaded for overhead verification.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_parser = sub.add_parser("serve", help="Run the model pool on a local Unix socket")
+    serve_parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    serve_parser.add_argument("--model-pool-size", type=int, default=DEFAULT_POOL_SIZE)
+    serve_parser.add_argument("--cpu-threads", type=int, default=0)
+    serve_parser.add_argument("--num-workers", type=int, default=1)
+    serve_parser.add_argument("--preload", nargs="*", default=[], metavar="MODEL")
+    status_parser = sub.add_parser("status", help="Show what a running daemon has loaded")
+    status_parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.command == "serve":
+        return serve(args)
+    try:
+        reply = daemon_request(args.socket, {"op": "stats"})
+    except RuntimeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    print(json.dumps(reply["stats"], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
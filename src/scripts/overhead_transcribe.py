@@ -0,0 +1,890 @@
+"""Chunked, parallel faster-whisper transcription for long venue-wide overhead .wav files.
+
+A full tournament day is split into chunks whose boundaries are snapped into VAD
+silence gaps, each chunk is decoded with a few seconds of overlap on either side,
+and the chunks are transcribed by a process pool of whisper workers. Segments are
+merged back by ownership (a segment belongs to the chunk containing its midpoint),
+so the result is one ordered segment list comparable to a single-pass run.
+
+Finished chunks are checkpointed in a content-addressed store keyed by the hash of
+the chunk's samples, its time range, the model and the VAD settings, so an
+interrupted run resumes where it stopped and an edited wav only re-transcribes the
+chunks whose audio actually changed.
+
+``stream_chunked`` yields the merged transcript every time the run of finished chunks
+from the start of the file grows, so callers can act on early audio while later
+chunks are still being transcribed.
+
+Given ``speech`` (the region index from overhead_vad.py) it replaces the Silero
+boundary search, and whisper is only given the regions inside each chunk
+(as clip_timestamps, so segment times stay absolute); chunks without speech are
+never decoded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+from overhead_audio import (
+    ANALYSIS_SAMPLE_RATE,
+    OverheadAudio,
+    WavLayout,
+    hash_wav_range,
+    read_wav_layout,
+)
+from overhead_models import configure_model_pool, get_model_pool, model_daemon_address
+from overhead_vad import SpeechRegions
+
+SAMPLE_RATE = ANALYSIS_SAMPLE_RATE
+
+DEFAULT_CHUNK_SECONDS = 300.0
+DEFAULT_OVERLAP_SECONDS = 5.0
+BOUNDARY_SEARCH_SECONDS = 20.0
+MIN_BOUNDARY_GAP_SECONDS = 2.0
+# Whisper never emits a segment longer than its 30 s window, so a segment owned by a
+# later chunk cannot start more than this far before that chunk's start.
+SETTLE_SECONDS = 30.0
+# Audio re-transcribed either side of an edited range, so whole phrases around it are redone.
+PATCH_PAD_SECONDS = 10.0
+
+CHUNK_STORE_VERSION = 1
+CHUNK_STORE_DIRNAME = ".overhead_transcript_chunks"
+
+# Everything besides audio and model that changes what whisper returns for a chunk.
+VAD_SETTINGS: dict[str, Any] = {
+    "vad_filter": True,
+    "boundary_min_silence_ms": 300,
+    "boundary_speech_pad_ms": 100,
+    "boundary_min_gap_seconds": MIN_BOUNDARY_GAP_SECONDS,
+}
+
+_worker_model: Any = None
+
+# (start, end, text) of one word in wav seconds; text keeps whisper's leading space.
+Word = tuple[float, float, str]
+
+
+@dataclass(slots=True)
+class TranscriptSegment:
+    start: float
+    end: float
+    text: str
+    words: list[Word] | None = None
+
+    def as_dict(self) -> dict:
+        data: dict = {"start": self.start, "end": self.end, "text": self.text}
+        if self.words is not None:
+            data["words"] = [list(word) for word in self.words]
+        return data
+
+    @classmethod
+    def from_dict(cls, item: dict) -> TranscriptSegment:
+        words = item.get("words")
+        return cls(
+            start=item["start"],
+            end=item["end"],
+            text=item["text"],
+            words=[tuple(word) for word in words] if words is not None else None,
+        )
+
+
+@dataclass
+class TranscriptionChunk:
+    index: int
+    start: float
+    end: float
+    decode_start: float
+    decode_end: float
+    # Speech regions (wav seconds) inside the decode range whisper is limited to; None for all of it.
+    speech: tuple[tuple[float, float], ...] | None = None
+
+
+@dataclass
+class TranscriptProgress:
+    """Transcript so far; segments starting before settled_until will not change.
+
+    ``segments`` may be a SegmentIndex the producer already built; consumers take it
+    through SegmentIndex.of rather than indexing it again.
+    """
+
+    segments: Sequence[TranscriptSegment]
+    settled_until: float
+    done: bool = False
+    stats: TranscriptionStats | None = None
+
+
+@dataclass
+class TranscriptionStats:
+    chunks: int
+    workers: int
+    audio_seconds: float
+    wall_seconds: float
+    serial_seconds: float
+    cached_chunks: int = 0
+    # Set with a VAD prefilter: speech in the whole file, the part of the transcribed
+    # chunks' audio whisper skipped, and the wall time that skipping is estimated to
+    # have saved net of building the region index.
+    speech_seconds: float | None = None
+    skipped_seconds: float = 0.0
+    saved_seconds: float = 0.0
+    vad_seconds: float = 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def estimated_speedup(self) -> float:
+        """Summed per-chunk whisper time over end-to-end wall time.
+
+        An estimate of the gain over a single pass, which is not run to measure it:
+        chunk overlap and per-chunk model warm-up make the sum differ from a real
+        single pass somewhat.
+        """
+        return self.serial_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def realtime_factor(self) -> float:
+        return self.audio_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def skipped_fraction(self) -> float:
+        if self.speech_seconds is None or self.audio_seconds <= 0:
+            return 0.0
+        return 1.0 - self.speech_seconds / self.audio_seconds
+
+    def as_dict(self) -> dict:
+        data = {
+            "chunks": self.chunks,
+            "cached_chunks": self.cached_chunks,
+            "workers": self.workers,
+            "audio_seconds": round(self.audio_seconds, 1),
+            "wall_seconds": round(self.wall_seconds, 1),
+            "serial_seconds": round(self.serial_seconds, 1),
+            "chunks_per_second": round(self.chunks_per_second, 3),
+            "estimated_speedup": round(self.estimated_speedup, 2),
+            "realtime_factor": round(self.realtime_factor, 1),
+        }
+        if self.speech_seconds is not None:
+            data["vad_prefilter"] = {
+                "speech_seconds": round(self.speech_seconds, 1),
+                "skipped_fraction": round(self.skipped_fraction, 3),
+                "skipped_seconds": round(self.skipped_seconds, 1),
+                "saved_seconds": round(self.saved_seconds, 1),
+                "vad_seconds": round(self.vad_seconds, 2),
+            }
+        return data
+
+
+def import_whisper_model() -> Any:
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        print(
+            "Error: faster-whisper is required. Install with: pip install -r requirements-transcribe.txt",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return WhisperModel
+
+
+def decode_pcm_range(wav_path: Path, start: float, duration: float) -> Any:
+    """[start, start + duration) of wav_path as 16 kHz mono float32, read from its memmap."""
+    start = max(0.0, start)
+    return OverheadAudio.open(wav_path).slice(start, start + max(0.05, duration))
+
+
+def silence_gaps(
+    speech: list[tuple[float, float]],
+    window_start: float,
+    window_end: float,
+) -> list[tuple[float, float]]:
+    """Return the non-speech intervals of [window_start, window_end] given sorted speech spans."""
+    gaps: list[tuple[float, float]] = []
+    cursor = window_start
+    for start, end in speech:
+        if start > cursor:
+            gaps.append((cursor, min(start, window_end)))
+        cursor = max(cursor, end)
+        if cursor >= window_end:
+            break
+    if cursor < window_end:
+        gaps.append((cursor, window_end))
+    return [(a, b) for a, b in gaps if b > a]
+
+
+def snap_boundary(
+    nominal: float,
+    speech: list[tuple[float, float]],
+    window_start: float,
+    window_end: float,
+    min_gap: float = MIN_BOUNDARY_GAP_SECONDS,
+) -> float:
+    """Move a nominal chunk boundary to the middle of the nearest usable silence gap.
+
+    Gaps at least ``min_gap`` long are all considered good; among those the one closest
+    to the nominal boundary wins. Without any long gap the longest one is used, and with
+    no gap at all the nominal boundary is kept.
+    """
+    gaps = silence_gaps(speech, window_start, window_end)
+    if not gaps:
+        return nominal
+
+    def rank(gap: tuple[float, float]) -> tuple[float, float]:
+        length = gap[1] - gap[0]
+        midpoint = (gap[0] + gap[1]) / 2
+        return (-min(length, min_gap), abs(midpoint - nominal))
+
+    best = min(gaps, key=rank)
+    return (best[0] + best[1]) / 2
+
+
+def vad_speech_spans(audio: Any, offset: float) -> list[tuple[float, float]]:
+    """Silero VAD (bundled with faster-whisper) speech spans in absolute seconds."""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    stamps = get_speech_timestamps(
+        audio,
+        VadOptions(
+            min_silence_duration_ms=VAD_SETTINGS["boundary_min_silence_ms"],
+            speech_pad_ms=VAD_SETTINGS["boundary_speech_pad_ms"],
+        ),
+    )
+    return [
+        (offset + item["start"] / SAMPLE_RATE, offset + item["end"] / SAMPLE_RATE)
+        for item in stamps
+    ]
+
+
+def plan_chunks(
+    duration: float,
+    chunk_seconds: float,
+    overlap_seconds: float,
+    boundary_speech: Callable[[float, float], list[tuple[float, float]]] | None = None,
+    search_seconds: float = BOUNDARY_SEARCH_SECONDS,
+) -> list[TranscriptionChunk]:
+    """Split [0, duration] into chunks with VAD-snapped boundaries and decode overlap.
+
+    ``boundary_speech(start, end)`` returns speech spans around a nominal boundary;
+    without it the nominal boundaries are used as-is.
+    """
+    if duration <= 0:
+        return []
+    if chunk_seconds <= 0 or duration <= chunk_seconds + search_seconds:
+        return [TranscriptionChunk(0, 0.0, duration, 0.0, duration)]
+
+    # Nominal boundaries sit on a fixed grid and are snapped independently, so an edit
+    # near one boundary cannot shift every later chunk (and its cache key).
+    boundaries = [0.0]
+    nominal = chunk_seconds
+    while nominal < duration - search_seconds:
+        window_start = max(boundaries[-1] + 1.0, nominal - search_seconds)
+        window_end = min(duration, nominal + search_seconds)
+        boundary = nominal
+        if boundary_speech is not None:
+            boundary = snap_boundary(
+                nominal,
+                boundary_speech(window_start, window_end),
+                window_start,
+                window_end,
+            )
+        boundaries.append(boundary)
+        nominal += chunk_seconds
+    boundaries.append(duration)
+
+    chunks: list[TranscriptionChunk] = []
+    for idx, (start, end) in enumerate(zip(boundaries, boundaries[1:])):
+        chunks.append(
+            TranscriptionChunk(
+                index=idx,
+                start=start,
+                end=end,
+                decode_start=max(0.0, start - overlap_seconds),
+                decode_end=min(duration, end + overlap_seconds),
+            )
+        )
+    return chunks
+
+
+def plan_patch_windows(
+    changed: list[tuple[float, float]],
+    duration: float,
+    boundary_speech: Callable[[float, float], list[tuple[float, float]]] | None = None,
+    pad_seconds: float = PATCH_PAD_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+) -> list[TranscriptionChunk]:
+    """Chunks covering each changed range plus ``pad_seconds`` either side.
+
+    Window edges are snapped into silence the same way chunk boundaries are, and
+    windows that touch are merged, so each re-transcribed stretch starts and ends
+    between phrases.
+    """
+    spans: list[list[float]] = []
+    for start, end in sorted(changed):
+        lo = max(0.0, start - pad_seconds)
+        hi = min(duration, end + pad_seconds)
+        if boundary_speech is not None:
+            if lo > 0.0:
+                search = (max(0.0, lo - pad_seconds), lo + pad_seconds / 2)
+                lo = snap_boundary(lo, boundary_speech(*search), *search)
+            if hi < duration:
+                search = (hi - pad_seconds / 2, min(duration, hi + pad_seconds))
+                hi = snap_boundary(hi, boundary_speech(*search), *search)
+        if spans and lo <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], hi)
+        else:
+            spans.append([lo, hi])
+    return [
+        TranscriptionChunk(
+            index=idx,
+            start=lo,
+            end=hi,
+            decode_start=max(0.0, lo - overlap_seconds),
+            decode_end=min(duration, hi + overlap_seconds),
+        )
+        for idx, (lo, hi) in enumerate(spans)
+    ]
+
+
+def transcribe_windows(
+    wav_path: Path,
+    model_name: str,
+    windows: list[TranscriptionChunk],
+    word_timestamps: bool = False,
+) -> list[TranscriptSegment]:
+    """Segments whose midpoint falls inside one of ``windows``, transcribed with the pooled model."""
+    if not windows:
+        return []
+    _use_pooled_model(model_name)
+    segments: list[TranscriptSegment] = []
+    for window in windows:
+        _index, pieces, _elapsed = _transcribe_chunk(str(wav_path), window, word_timestamps)
+        for start, end, text, words in pieces:
+            if window.start <= (start + end) / 2 < window.end:
+                segments.append(TranscriptSegment(start=start, end=end, text=text, words=words))
+    return segments
+
+
+def owns_segment(chunk: TranscriptionChunk, segment: TranscriptSegment, is_last: bool) -> bool:
+    midpoint = (segment.start + segment.end) / 2
+    if midpoint < chunk.start:
+        return chunk.index == 0
+    if is_last:
+        return True
+    return midpoint < chunk.end
+
+
+def merge_chunk_segments(
+    chunks: list[TranscriptionChunk],
+    chunk_segments: dict[int, list[TranscriptSegment]],
+    complete: bool = True,
+) -> list[TranscriptSegment]:
+    """Keep each overlapping segment only in the chunk that owns its midpoint.
+
+    With ``complete=False`` chunks is a leading run of the plan, so segments past the
+    end of its last chunk are left for the chunk that follows.
+    """
+    merged: list[TranscriptSegment] = []
+    last_index = chunks[-1].index if chunks and complete else -1
+    for chunk in chunks:
+        for segment in chunk_segments.get(chunk.index, []):
+            if owns_segment(chunk, segment, chunk.index == last_index):
+                merged.append(segment)
+    merged.sort(key=lambda segment: (segment.start, segment.end))
+
+    deduped: list[TranscriptSegment] = []
+    for segment in merged:
+        if (
+            deduped
+            and abs(segment.start - deduped[-1].start) < 1.0
+            and segment.text.strip().lower() == deduped[-1].text.strip().lower()
+        ):
+            continue
+        deduped.append(segment)
+    return deduped
+
+
+def _init_worker(model_name: str, cpu_threads: int, daemon: str | None = None) -> None:
+    global _worker_model
+    configure_model_pool(size=1, cpu_threads=cpu_threads, daemon=daemon)
+    _worker_model = get_model_pool().model(model_name)
+
+
+def _use_pooled_model(model_name: str) -> None:
+    global _worker_model
+    _worker_model = get_model_pool().model(model_name)
+
+
+def piece_words(piece: Any, offset: float) -> list[Word] | None:
+    """Word timings of a whisper (or pooled) segment shifted by offset; None without them."""
+    words = getattr(piece, "words", None)
+    if words is None:
+        return None
+    shifted: list[Word] = []
+    for word in words:
+        start, end, text = (word.start, word.end, word.word) if hasattr(word, "word") else word[:3]
+        shifted.append((offset + start, offset + end, text))
+    return shifted
+
+
+def transcribe_options(
+    word_timestamps: bool,
+    speech: list[tuple[float, float]] | tuple[tuple[float, float], ...] | None = None,
+    offset: float = 0.0,
+) -> dict[str, Any]:
+    """Whisper options; ``speech`` (wav seconds) limits decoding to those clips of audio starting at offset."""
+    options: dict[str, Any] = {"vad_filter": VAD_SETTINGS["vad_filter"]}
+    if word_timestamps:
+        options["word_timestamps"] = True
+    if speech is not None:
+        # Whisper's own VAD would only re-trim regions the prefilter already chose.
+        options["vad_filter"] = False
+        options["clip_timestamps"] = [round(t - offset, 3) for span in speech for t in span]
+    return options
+
+
+def _transcribe_chunk(
+    wav_path: str,
+    chunk: TranscriptionChunk,
+    word_timestamps: bool = False,
+) -> tuple[int, list[tuple[float, float, str, list[Word] | None]], float]:
+    started = time.perf_counter()
+    pieces: list[tuple[float, float, str, list[Word] | None]] = []
+    if chunk.speech is not None and not chunk.speech:
+        return chunk.index, pieces, time.perf_counter() - started
+    audio = decode_pcm_range(Path(wav_path), chunk.decode_start, chunk.decode_end - chunk.decode_start)
+    segments_iter, _info = _worker_model.transcribe(
+        audio, **transcribe_options(word_timestamps, chunk.speech, chunk.decode_start)
+    )
+    for piece in segments_iter:
+        text = piece.text.strip()
+        if text:
+            pieces.append(
+                (
+                    chunk.decode_start + piece.start,
+                    chunk.decode_start + piece.end,
+                    text,
+                    piece_words(piece, chunk.decode_start),
+                )
+            )
+    return chunk.index, pieces, time.perf_counter() - started
+
+
+def default_cpu_threads(workers: int) -> int:
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+class TranscriptChunkStore:
+    """One JSON checkpoint per transcribed chunk, addressed by its cache key."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    @classmethod
+    def beside(cls, wav_path: Path) -> TranscriptChunkStore:
+        """Store shared by every wav in the same folder (source and injected variants)."""
+        return cls(wav_path.parent / CHUNK_STORE_DIRNAME)
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> list[TranscriptSegment] | None:
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return [TranscriptSegment.from_dict(item) for item in data["segments"]]
+
+    def put(self, key: str, chunk: TranscriptionChunk, segments: list[TranscriptSegment]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "version": CHUNK_STORE_VERSION,
+                    "chunk": asdict(chunk),
+                    "segments": [segment.as_dict() for segment in segments],
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+
+
+def chunk_cache_key(
+    wav_path: Path,
+    layout: WavLayout | None,
+    chunk: TranscriptionChunk,
+    model_name: str,
+    word_timestamps: bool = False,
+) -> str:
+    payload = {
+        "version": CHUNK_STORE_VERSION,
+        "content": hash_wav_range(wav_path, layout, chunk.decode_start, chunk.decode_end),
+        "range": [round(chunk.start, 3), round(chunk.end, 3)],
+        "decode": [round(chunk.decode_start, 3), round(chunk.decode_end, 3)],
+        "model": model_name,
+        "vad": VAD_SETTINGS,
+    }
+    if word_timestamps:
+        # Only added when set, so checkpoints from before the option stay valid.
+        payload["word_timestamps"] = True
+    if chunk.speech is not None:
+        payload["speech"] = [[round(lo, 3), round(hi, 3)] for lo, hi in chunk.speech]
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ChunkPlan:
+    """The chunks of one wav, their checkpoint keys and the segments known so far.
+
+    Cached and speechless chunks are resolved when the plan is made; ``pending``
+    lists the rest, and each is recorded (and checkpointed) by ``finish`` as its
+    whisper result comes back, from whichever pool ran it.
+    """
+
+    wav_path: Path
+    duration: float
+    chunks: list[TranscriptionChunk]
+    keys: dict[int, str]
+    segments: dict[int, list[TranscriptSegment]]
+    pending: list[TranscriptionChunk]
+    store: TranscriptChunkStore | None = None
+    speech: SpeechRegions | None = None
+    serial_seconds: float = 0.0
+
+    def finish(self, index: int, pieces: list[tuple[float, float, str, list[Word] | None]], elapsed: float) -> None:
+        segments = [TranscriptSegment(start=s, end=e, text=t, words=w) for s, e, t, w in pieces]
+        self.segments[index] = segments
+        self.serial_seconds += elapsed
+        if self.store is not None:
+            chunk = next(chunk for chunk in self.pending if chunk.index == index)
+            self.store.put(self.keys[index], chunk, segments)
+
+    @property
+    def done(self) -> bool:
+        return len(self.segments) == len(self.chunks)
+
+    def merged(self) -> list[TranscriptSegment]:
+        return merge_chunk_segments(self.chunks, self.segments)
+
+    def stats(self, workers: int, wall_seconds: float) -> TranscriptionStats:
+        silent = [chunk for chunk in self.chunks if chunk.speech == ()]
+        stats = TranscriptionStats(
+            chunks=len(self.chunks),
+            workers=workers,
+            audio_seconds=self.duration,
+            wall_seconds=wall_seconds,
+            serial_seconds=self.serial_seconds,
+            cached_chunks=len(self.chunks) - len(self.pending) - len(silent),
+        )
+        if self.speech is not None:
+            spoken = sum(hi - lo for chunk in self.pending for lo, hi in chunk.speech or ())
+            stats.speech_seconds = self.speech.speech_seconds
+            stats.skipped_seconds = (
+                sum(c.decode_end - c.decode_start for c in self.pending + silent) - spoken
+            )
+            stats.vad_seconds = self.speech.build_seconds
+            stats.saved_seconds = prefilter_savings(
+                wall_seconds, spoken, stats.skipped_seconds, stats.vad_seconds
+            )
+        return stats
+
+
+def plan_transcription(
+    wav_path: Path,
+    model_name: str,
+    duration: float,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    store: TranscriptChunkStore | None = None,
+    force: bool = False,
+    word_timestamps: bool = False,
+    speech: SpeechRegions | None = None,
+) -> ChunkPlan:
+    """Plan VAD-bounded chunks for wav_path and pick up every chunk the store already has."""
+
+    def boundary_speech(start: float, end: float) -> list[tuple[float, float]]:
+        return vad_speech_spans(decode_pcm_range(wav_path, start, end - start), start)
+
+    chunks = plan_chunks(
+        duration, chunk_seconds, overlap_seconds, speech.window if speech is not None else boundary_speech
+    )
+    if speech is not None:
+        chunks = [
+            replace(chunk, speech=tuple(speech.window(chunk.decode_start, chunk.decode_end)))
+            for chunk in chunks
+        ]
+    layout = read_wav_layout(wav_path) if store is not None else None
+    keys = {
+        chunk.index: chunk_cache_key(wav_path, layout, chunk, model_name, word_timestamps)
+        for chunk in chunks
+    } if store is not None else {}
+
+    chunk_segments: dict[int, list[TranscriptSegment]] = {}
+    pending: list[TranscriptionChunk] = []
+    for chunk in chunks:
+        if chunk.speech == ():
+            chunk_segments[chunk.index] = []
+            continue
+        cached = None if store is None or force else store.get(keys[chunk.index])
+        if cached is None:
+            pending.append(chunk)
+        else:
+            chunk_segments[chunk.index] = cached
+    return ChunkPlan(
+        wav_path=wav_path,
+        duration=duration,
+        chunks=chunks,
+        keys=keys,
+        segments=chunk_segments,
+        pending=pending,
+        store=store,
+        speech=speech,
+    )
+
+
+def transcribe_chunked(
+    wav_path: Path,
+    model_name: str,
+    duration: float,
+    workers: int,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    cpu_threads: int | None = None,
+    store: TranscriptChunkStore | None = None,
+    force: bool = False,
+    word_timestamps: bool = False,
+    speech: SpeechRegions | None = None,
+) -> tuple[list[TranscriptSegment], TranscriptionStats]:
+    """Transcribe wav_path in VAD-bounded chunks across ``workers`` whisper processes.
+
+    With a store, chunks already checkpointed under the same key are reused (unless
+    ``force``) and every newly finished chunk is checkpointed as soon as it returns.
+    """
+    progress = None
+    for progress in stream_chunked(
+        wav_path,
+        model_name,
+        duration,
+        workers,
+        chunk_seconds,
+        overlap_seconds,
+        cpu_threads,
+        store,
+        force,
+        word_timestamps,
+        speech,
+    ):
+        pass
+    assert progress is not None and progress.stats is not None
+    return progress.segments, progress.stats
+
+
+def stream_chunked(
+    wav_path: Path,
+    model_name: str,
+    duration: float,
+    workers: int,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    cpu_threads: int | None = None,
+    store: TranscriptChunkStore | None = None,
+    force: bool = False,
+    word_timestamps: bool = False,
+    speech: SpeechRegions | None = None,
+) -> Iterator[TranscriptProgress]:
+    """transcribe_chunked as a stream of progressively longer merged transcripts.
+
+    A progress is yielded whenever the run of finished chunks from the start of the
+    file grows (cached chunks count as finished up front); the last one has
+    ``done`` set and carries the stats.
+    """
+    started = time.perf_counter()
+    workers = max(1, workers)
+    threads = cpu_threads or default_cpu_threads(workers)
+    if workers > 1:
+        # Build the shared 16 kHz sidecar once here so workers only ever map it.
+        OverheadAudio.open(wav_path).mono16k
+
+    plan = plan_transcription(
+        wav_path,
+        model_name,
+        duration,
+        chunk_seconds,
+        overlap_seconds,
+        store,
+        force,
+        word_timestamps,
+        speech,
+    )
+    chunks, chunk_segments = plan.chunks, plan.segments
+
+    print(
+        f"Transcribing {wav_path} with model={model_name}: {len(plan.pending)}/{len(chunks)} "
+        f"chunk(s) to transcribe across {workers} worker(s) x {threads} thread(s) ...",
+        file=sys.stderr,
+    )
+
+    settled = 0
+
+    def advance() -> TranscriptProgress | None:
+        nonlocal settled
+        prefix = settled
+        while prefix < len(chunks) - 1 and chunks[prefix].index in chunk_segments:
+            prefix += 1
+        if prefix == settled:
+            return None
+        settled = prefix
+        return TranscriptProgress(
+            segments=merge_chunk_segments(chunks[:prefix], chunk_segments, complete=False),
+            settled_until=chunks[prefix - 1].end - SETTLE_SECONDS,
+        )
+
+    progress = advance()
+    if progress is not None:
+        yield progress
+
+    for index, pieces, elapsed in iter_chunk_results(
+        wav_path, model_name, plan.pending, workers, threads, word_timestamps
+    ):
+        plan.finish(index, pieces, elapsed)
+        progress = advance()
+        if progress is not None:
+            yield progress
+
+    yield TranscriptProgress(
+        segments=plan.merged(),
+        settled_until=float("inf"),
+        done=True,
+        stats=plan.stats(workers, time.perf_counter() - started),
+    )
+
+
+def iter_chunk_results(
+    wav_path: Path,
+    model_name: str,
+    chunks: list[TranscriptionChunk],
+    workers: int,
+    cpu_threads: int,
+    word_timestamps: bool = False,
+) -> Iterator[tuple[int, list[tuple[float, float, str, list[Word] | None]], float]]:
+    """Yield chunk results as they finish, in-process for one worker or via a process pool."""
+    if not chunks:
+        return
+    if workers <= 1 or len(chunks) <= 1:
+        _use_pooled_model(model_name)
+        for chunk in chunks:
+            yield _transcribe_chunk(str(wav_path), chunk, word_timestamps)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=_init_worker,
+        initargs=(model_name, cpu_threads, model_daemon_address()),
+    ) as pool:
+        futures = [pool.submit(_transcribe_chunk, str(wav_path), chunk, word_timestamps) for chunk in chunks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def iter_plan_results(
+    plans: list[ChunkPlan],
+    model_name: str,
+    workers: int,
+    cpu_threads: int,
+    word_timestamps: bool = False,
+    on_error: Callable[[ChunkPlan, Exception], None] | None = None,
+) -> Iterator[tuple[ChunkPlan, int, list[tuple[float, float, str, list[Word] | None]], float]]:
+    """Pending chunks of several wavs through one process pool, as they finish.
+
+    Chunks are submitted round-robin across the plans, so every wav's early audio
+    is transcribed first and no single long day holds up the others. With
+    ``on_error``, a chunk that raises is reported there with its plan (once per
+    failing chunk) and the other chunks carry on; without it the error propagates.
+    """
+
+    def report(plan: ChunkPlan, exc: Exception) -> None:
+        if on_error is None:
+            raise exc
+        on_error(plan, exc)
+
+    queues = [list(plan.pending) for plan in plans]
+    order: list[tuple[ChunkPlan, TranscriptionChunk]] = []
+    while any(queues):
+        for plan, queue in zip(plans, queues):
+            if queue:
+                order.append((plan, queue.pop(0)))
+    if not order:
+        return
+    if workers <= 1 or len(order) <= 1:
+        _use_pooled_model(model_name)
+        for plan, chunk in order:
+            try:
+                result = _transcribe_chunk(str(plan.wav_path), chunk, word_timestamps)
+            except Exception as exc:
+                report(plan, exc)
+                continue
+            yield (plan, *result)
+        return
+
+    for plan in plans:
+        if plan.pending:
+            try:
+                OverheadAudio.open(plan.wav_path).mono16k
+            except Exception as exc:
+                report(plan, exc)
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(order)),
+        initializer=_init_worker,
+        initargs=(model_name, cpu_threads, model_daemon_address()),
+    ) as pool:
+        futures = {
+            pool.submit(_transcribe_chunk, str(plan.wav_path), chunk, word_timestamps): plan
+            for plan, chunk in order
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as exc:
+                report(futures[future], exc)
+                continue
+            yield (futures[future], *result)
+
+
+def prefilter_savings(whisper_seconds: float, spoken: float, skipped: float, vad_seconds: float) -> float:
+    """Wall time the skipped audio would have cost at the rate whisper managed on the
+    speech it was given, less the time spent building the region index."""
+    if spoken <= 0:
+        return 0.0
+    return whisper_seconds / spoken * skipped - vad_seconds
+
+
+def print_transcription_stats(stats: TranscriptionStats) -> None:
+    print(
+        f"Transcribed {stats.chunks - stats.cached_chunks}/{stats.chunks} chunk(s) "
+        f"({stats.cached_chunks} from cache) in {stats.wall_seconds:.1f}s "
+        f"({stats.chunks_per_second:.2f} chunks/s, {stats.realtime_factor:.1f}x realtime); "
+        f"serial whisper time {stats.serial_seconds:.1f}s → "
+        f"est. {stats.estimated_speedup:.2f}x speedup vs single pass",
+        file=sys.stderr,
+    )
+    if stats.speech_seconds is not None:
+        print(
+            f"VAD prefilter skipped {stats.skipped_fraction:.1%} of the audio "
+            f"({stats.skipped_seconds:.0f}s of the transcribed chunks); "
+            f"est. {stats.saved_seconds:.1f}s wall time saved after {stats.vad_seconds:.1f}s building the index",
+            file=sys.stderr,
+        )
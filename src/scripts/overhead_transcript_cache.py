@@ -0,0 +1,366 @@
+"""Columnar on-disk format for overhead transcripts and refinement caches.
+
+A full-day transcript cache used to be pretty-printed JSON that every run parsed
+back into ``TranscriptSegment`` objects. The ``.cols`` format is one file:
+
+    b"OHTC" | u32 version | u64 directory length | JSON directory | columns
+
+The directory holds the cache metadata (wav path, model, size/mtime signature,
+transcription stats) and the dtype, byte offset and length of each column. Columns
+are 8-byte aligned little-endian arrays: ``start``/``end`` as float64 (float32 is
+~2 ms coarse past 4.5 h of audio), and text as a uint64 offset array into one
+UTF-8 blob. Word timings, when given, are the same columns again under ``word.``
+with ``words.first`` marking each segment's first word.
+
+Files are opened through mmap, so opening a day's transcript costs the directory
+parse and a time-range read only touches the rows it returns. Paths ending in
+``.json`` keep the old JSON layout, which is also what ``export`` writes for humans.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+from overhead_transcribe import TranscriptSegment, Word
+
+MAGIC = b"OHTC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIQ")
+ALIGN = 8
+COLUMNAR_SUFFIX = ".cols"
+
+
+def transcript_cache_path(wav_path: Path) -> Path:
+    """Default transcript cache beside a wav: ``{wav}.transcript.cols``."""
+    return wav_path.with_suffix(wav_path.suffix + ".transcript" + COLUMNAR_SUFFIX)
+
+
+def refinement_cache_path(cache_path: Path) -> Path:
+    """Refinement cache beside a transcript cache, in the same format."""
+    return cache_path.with_name(f"{cache_path.stem}.refined{cache_path.suffix}")
+
+
+def existing_cache(path: Path) -> Path | None:
+    """path, or the ``.json`` cache an older run left in its place; None when neither exists."""
+    if path.exists():
+        return path
+    legacy = path.with_suffix(".json")
+    if path.suffix == COLUMNAR_SUFFIX and legacy.exists():
+        return legacy
+    return None
+
+
+def is_columnar(path: Path) -> bool:
+    with path.open("rb") as handle:
+        return handle.read(len(MAGIC)) == MAGIC
+
+
+def pack_strings(strings: Iterable[str]) -> tuple[Any, Any]:
+    """(uint64 byte offsets, n + 1 of them; uint8 UTF-8 blob)."""
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def write_columns(path: Path, meta: dict, columns: dict[str, Any]) -> None:
+    """Write meta and named 1-D arrays as one ``.cols`` file, atomically."""
+    arrays = {name: np.ascontiguousarray(values) for name, values in columns.items()}
+    directory: dict[str, Any] = {"meta": meta, "columns": {}}
+    # Offsets depend on the directory's own length, so lay out until it stops changing.
+    body_start = 0
+    while True:
+        position = body_start
+        for name, values in arrays.items():
+            directory["columns"][name] = {
+                "dtype": values.dtype.str,
+                "offset": position,
+                "count": len(values),
+            }
+            position += -(-values.nbytes // ALIGN) * ALIGN
+        encoded = json.dumps(directory, separators=(",", ":")).encode("utf-8")
+        needed = -(-(HEADER.size + len(encoded)) // ALIGN) * ALIGN
+        if needed == body_start:
+            break
+        body_start = needed
+
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+        handle.write(encoded)
+        for name, values in arrays.items():
+            handle.seek(directory["columns"][name]["offset"])
+            handle.write(values.tobytes())
+        handle.truncate(position)
+    os.replace(tmp, path)
+
+
+class ColumnFile:
+    """Read-only mmap view of a ``.cols`` file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as handle:
+            magic, version, length = HEADER.unpack(handle.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a columnar transcript")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}")
+            directory = json.loads(handle.read(length))
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.meta: dict = directory["meta"]
+        self._columns: dict[str, dict] = directory["columns"]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def column(self, name: str) -> Any:
+        spec = self._columns[name]
+        if not spec["count"]:
+            return np.zeros(0, dtype=spec["dtype"])
+        return np.frombuffer(self._map, dtype=spec["dtype"], count=spec["count"], offset=spec["offset"])
+
+    def strings(self, name: str, first: int = 0, last: int | None = None) -> list[str]:
+        """Decoded entries first..last of the string column ``name``."""
+        offsets = self.column(f"{name}.offsets")
+        last = len(offsets) - 1 if last is None else last
+        if last <= first:
+            return []
+        bounds = offsets[first : last + 1].tolist()
+        base = self._columns[f"{name}.bytes"]["offset"]
+        raw = self._map[base + bounds[0] : base + bounds[-1]]
+        origin = bounds[0]
+        return [raw[a - origin : b - origin].decode("utf-8") for a, b in zip(bounds, bounds[1:])]
+
+
+def segment_columns(segments: list[TranscriptSegment]) -> dict[str, Any]:
+    offsets, blob = pack_strings(segment.text for segment in segments)
+    return {
+        "start": np.array([segment.start for segment in segments], dtype="<f8"),
+        "end": np.array([segment.end for segment in segments], dtype="<f8"),
+        "text.offsets": offsets,
+        "text.bytes": blob,
+    }
+
+
+class ColumnarTranscript:
+    """Transcript segments in start order, read straight from the mmap.
+
+    ``window``/``between`` bisect the start column, so a time-range read decodes
+    only the rows it returns.
+    """
+
+    def __init__(self, path: Path):
+        self.file = ColumnFile(path)
+        self.meta = self.file.meta
+        self.starts = self.file.column("start")
+        self.ends = self.file.column("end")
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def has_words(self) -> bool:
+        return "words.first" in self.file
+
+    def segments(self, first: int = 0, last: int | None = None) -> list[TranscriptSegment]:
+        last = len(self) if last is None else last
+        texts = self.file.strings("text", first, last)
+        segments = [
+            TranscriptSegment(start=start, end=end, text=text)
+            for start, end, text in zip(self.starts[first:last].tolist(), self.ends[first:last].tolist(), texts)
+        ]
+        if self.has_words and segments:
+            bounds = self.file.column("words.first")[first : last + 1].tolist()
+            words = self.word_rows(bounds[0], bounds[-1])
+            for segment, a, b in zip(segments, bounds, bounds[1:]):
+                segment.words = words[a - bounds[0] : b - bounds[0]]
+        return segments
+
+    def window(self, start: float, end: float) -> range:
+        """Positions of segments with start <= segment.start <= end."""
+        return range(
+            int(np.searchsorted(self.starts, start, side="left")),
+            int(np.searchsorted(self.starts, end, side="right")),
+        )
+
+    def between(self, start: float, end: float) -> list[TranscriptSegment]:
+        span = self.window(start, end)
+        return self.segments(span.start, span.stop)
+
+    def words(self, position: int) -> list[Word]:
+        """Word timings of one segment; empty when the file has none."""
+        if not self.has_words:
+            return []
+        first, last = self.file.column("words.first")[position : position + 2].tolist()
+        return self.word_rows(first, last)
+
+    def word_rows(self, first: int, last: int) -> list[Word]:
+        texts = self.file.strings("word.text", first, last)
+        starts = self.file.column("word.start")[first:last].tolist()
+        ends = self.file.column("word.end")[first:last].tolist()
+        return list(zip(starts, ends, texts))
+
+    def to_json(self) -> dict:
+        """The JSON cache layout (metadata plus a segments list)."""
+        return {**self.meta, "segments": [segment.as_dict() for segment in self.segments()]}
+
+
+def write_columnar_transcript(path: Path, meta: dict, segments: list[TranscriptSegment]) -> None:
+    """Write segments sorted by start; word columns when any segment has word timings."""
+    ordered = sorted(segments, key=lambda segment: segment.start)
+    columns = segment_columns(ordered)
+    if any(segment.words is not None for segment in ordered):
+        groups = [segment.words or [] for segment in ordered]
+        flat = [word for group in groups for word in group]
+        first = np.zeros(len(groups) + 1, dtype="<u8")
+        np.cumsum([len(group) for group in groups], out=first[1:])
+        offsets, blob = pack_strings(word[2] for word in flat)
+        columns.update(
+            {
+                "words.first": first,
+                "word.start": np.array([word[0] for word in flat], dtype="<f8"),
+                "word.end": np.array([word[1] for word in flat], dtype="<f8"),
+                "word.text.offsets": offsets,
+                "word.text.bytes": blob,
+            }
+        )
+    write_columns(path, meta, columns)
+
+
+def write_transcript_file(path: Path, meta: dict, segments: list[TranscriptSegment]) -> None:
+    """Columnar unless path ends in .json."""
+    if path.suffix == ".json":
+        path.write_text(json.dumps({**meta, "segments": [s.as_dict() for s in segments]}, indent=2), encoding="utf-8")
+    else:
+        write_columnar_transcript(path, meta, segments)
+
+
+def read_transcript_file(path: Path) -> tuple[dict, list[TranscriptSegment]] | None:
+    """(metadata, segments) from a cache in either format, or its legacy .json; None if absent."""
+    found = existing_cache(path)
+    if found is None:
+        return None
+    if is_columnar(found):
+        transcript = ColumnarTranscript(found)
+        return transcript.meta, transcript.segments()
+    data = json.loads(found.read_text(encoding="utf-8"))
+    return data, [TranscriptSegment.from_dict(item) for item in data.pop("segments")]
+
+
+def read_transcript_json(path: Path) -> dict | None:
+    """A cache in either format as the JSON layout (what the injectors read)."""
+    found = existing_cache(path)
+    if found is None:
+        return None
+    if is_columnar(found):
+        return ColumnarTranscript(found).to_json()
+    return json.loads(found.read_text(encoding="utf-8"))
+
+
+def write_refinement_file(path: Path, data: dict) -> None:
+    """Refinement cache: refined segments of every entry, grouped by entry key."""
+    if path.suffix == ".json":
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return
+    entries = data.get("entries", {})
+    keys = list(entries)
+    groups = [[TranscriptSegment.from_dict(item) for item in entries[key]["segments"]] for key in keys]
+    first = np.zeros(len(keys) + 1, dtype="<u8")
+    np.cumsum([len(group) for group in groups], out=first[1:])
+    key_offsets, key_blob = pack_strings(keys)
+    text_offsets, text_blob = pack_strings(entries[key].get("original_text", "") for key in keys)
+    columns = segment_columns([segment for group in groups for segment in group])
+    columns.update(
+        {
+            "entry.first": first,
+            "entry.key.offsets": key_offsets,
+            "entry.key.bytes": key_blob,
+            "entry.original_text.offsets": text_offsets,
+            "entry.original_text.bytes": text_blob,
+        }
+    )
+    write_columns(path, {key: value for key, value in data.items() if key != "entries"}, columns)
+
+
+def read_refinement_file(path: Path) -> dict | None:
+    found = existing_cache(path)
+    if found is None:
+        return None
+    if not is_columnar(found):
+        return json.loads(found.read_text(encoding="utf-8"))
+    columns = ColumnFile(found)
+    starts = columns.column("start").tolist()
+    ends = columns.column("end").tolist()
+    texts = columns.strings("text")
+    first = columns.column("entry.first").tolist()
+    entries = {
+        key: {
+            "original_text": original,
+            "segments": [
+                {"start": starts[i], "end": ends[i], "text": texts[i]} for i in range(first[n], first[n + 1])
+            ],
+        }
+        for n, (key, original) in enumerate(zip(columns.strings("entry.key"), columns.strings("entry.original_text")))
+    }
+    return {**columns.meta, "entries": entries}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Inspect and convert columnar transcript caches")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="Write a cache as indented JSON")
+    export.add_argument("cache", type=Path)
+    export.add_argument("--output", type=Path, help="Default: the cache path with a .json suffix")
+    convert = sub.add_parser("convert", help="Write a JSON cache (transcript or refinement) as .cols")
+    convert.add_argument("cache", type=Path)
+    convert.add_argument("--output", type=Path, help="Default: the cache path with a .cols suffix")
+    show = sub.add_parser("range", help="Print the segments starting between two wav times")
+    show.add_argument("cache", type=Path)
+    show.add_argument("--start", type=float, required=True, help="Seconds")
+    show.add_argument("--end", type=float, required=True, help="Seconds")
+    args = parser.parse_args()
+
+    if not args.cache.exists():
+        print(f"Error: {args.cache} not found", file=sys.stderr)
+        return 1
+    columnar = is_columnar(args.cache)
+    refinement = ".refined" in args.cache.name
+    if args.command == "export":
+        output = args.output or args.cache.with_suffix(".json")
+        data = read_refinement_file(args.cache) if refinement else read_transcript_json(args.cache)
+        output.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        print(f"Wrote {output}", file=sys.stderr)
+    elif args.command == "convert":
+        if columnar:
+            print(f"Error: {args.cache} is already columnar", file=sys.stderr)
+            return 1
+        output = args.output or args.cache.with_suffix(COLUMNAR_SUFFIX)
+        if refinement:
+            write_refinement_file(output, read_refinement_file(args.cache) or {})
+        else:
+            meta, segments = read_transcript_file(args.cache) or ({}, [])
+            write_columnar_transcript(output, meta, segments)
+        print(f"Wrote {output} ({output.stat().st_size / 1e3:.0f} kB, JSON {args.cache.stat().st_size / 1e3:.0f} kB)")
+    else:
+        if columnar:
+            segments = ColumnarTranscript(args.cache).between(args.start, args.end)
+        else:
+            _meta, segments = read_transcript_file(args.cache) or ({}, [])
+            segments = [s for s in segments if args.start <= s.start <= args.end]
+        for segment in segments:
+            print(f"{segment.start:10.2f} {segment.end:10.2f}  {segment.text}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Whole-day speech-region index of a venue-wide overhead .wav, for whisper to skip the rest.
+
+The overhead feed is mostly music and crowd noise with sparse PA announcements.
+This is a cheap first-pass VAD over the 16 kHz memmap: each 32 ms frame gets its
+speech-band (300-3400 Hz) level and spectral flatness from one vectorised FFT, and
+counts as speech when it is well above the local noise floor and tonal rather than
+noise-like. Speech frames are smoothed, and the runs are padded and merged into
+regions long enough to hold a whole cue ("Court four, ...") with context either
+side.
+
+It errs towards keeping audio: loud music passes (tonal and above the floor) and
+only costs whisper time, whereas a dropped announcement is a missed cue. The
+regions of a file are persisted under ``.overhead_pcm/`` keyed by its content
+fingerprint and the settings, so every later run (and the refinement pass) reads
+them back instead of scanning the day again.
+
+Usage:
+  python overhead_vad.py --wav day1.wav
+  python overhead_vad.py --wav day1.wav --json day1_speech_regions.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from overhead_audio import ANALYSIS_SAMPLE_RATE, OverheadAudio, wav_fingerprint
+
+VAD_FRAME = 512
+VAD_FRAME_SECONDS = VAD_FRAME / ANALYSIS_SAMPLE_RATE
+VAD_BLOCK_FRAMES = 4096
+SPEECH_BAND_HZ = (300.0, 3400.0)
+# Noise floor: a low percentile of every floor block, then the minimum over the
+# neighbouring blocks, so a minute-long announcement cannot raise its own floor.
+FLOOR_BLOCK_FRAMES = 256
+FLOOR_PERCENTILE = 20.0
+FLOOR_SPREAD_BLOCKS = 3
+# Bumped whenever detection changes; older region files are rebuilt.
+VAD_VERSION = 1
+
+
+@dataclass(frozen=True)
+class VadSettings:
+    margin_db: float = 6.0
+    max_flatness: float = 0.5
+    min_level_db: float = -60.0
+    smooth_seconds: float = 0.3
+    min_speech_seconds: float = 0.2
+    pad_seconds: float = 1.0
+    merge_gap_seconds: float = 2.0
+
+    def key(self) -> str:
+        payload = json.dumps({"version": VAD_VERSION, **asdict(self)}, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=6).hexdigest()
+
+
+DEFAULT_VAD_SETTINGS = VadSettings()
+
+
+def frame_features(samples: Any) -> tuple[Any, Any, Any]:
+    """(band level dB, band spectral flatness, frame RMS dBFS) per 32 ms frame of int16 samples."""
+    import numpy as np
+
+    total = len(samples) // VAD_FRAME
+    level = np.empty(total, dtype=np.float32)
+    flatness = np.empty(total, dtype=np.float32)
+    rms_db = np.empty(total, dtype=np.float32)
+    window = np.hanning(VAD_FRAME).astype(np.float32)
+    lo, hi = (int(round(hz * VAD_FRAME / ANALYSIS_SAMPLE_RATE)) for hz in SPEECH_BAND_HZ)
+    tiny = np.float32(1e-12)
+    for first in range(0, total, VAD_BLOCK_FRAMES):
+        last = min(total, first + VAD_BLOCK_FRAMES)
+        frames = np.asarray(samples[first * VAD_FRAME : last * VAD_FRAME], dtype=np.float32)
+        frames = frames.reshape(last - first, VAD_FRAME) / np.float32(32768.0)
+        rms_db[first:last] = 10.0 * np.log10((frames * frames).mean(axis=1) + tiny)
+        spectrum = np.fft.rfft(frames * window, axis=1)[:, lo : hi + 1]
+        power = (spectrum.real * spectrum.real + spectrum.imag * spectrum.imag).astype(np.float32) + tiny
+        mean_power = power.mean(axis=1)
+        level[first:last] = 10.0 * np.log10(mean_power)
+        flatness[first:last] = np.exp(np.log(power).mean(axis=1)) / mean_power
+    return level, flatness, rms_db
+
+
+def noise_floor(level: Any) -> Any:
+    """Per-frame noise floor of ``level``, tracking slow changes in background loudness."""
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    if not len(level):
+        return level
+    blocks = -(-len(level) // FLOOR_BLOCK_FRAMES)
+    padded = np.full(blocks * FLOOR_BLOCK_FRAMES, np.nan, dtype=np.float32)
+    padded[: len(level)] = level
+    floors = np.nanpercentile(padded.reshape(blocks, FLOOR_BLOCK_FRAMES), FLOOR_PERCENTILE, axis=1)
+    spread = np.pad(floors, FLOOR_SPREAD_BLOCKS, mode="edge")
+    floors = sliding_window_view(spread, 2 * FLOOR_SPREAD_BLOCKS + 1).min(axis=1)
+    return np.repeat(floors.astype(np.float32), FLOOR_BLOCK_FRAMES)[: len(level)]
+
+
+def speech_frames(samples: Any, settings: VadSettings = DEFAULT_VAD_SETTINGS) -> Any:
+    """Boolean speech decision per 32 ms frame, after smoothing."""
+    import numpy as np
+
+    level, flatness, rms_db = frame_features(samples)
+    candidate = (
+        (level > noise_floor(level) + settings.margin_db)
+        & (flatness < settings.max_flatness)
+        & (rms_db > settings.min_level_db)
+    )
+    # A frame is speech when enough of its neighbourhood is, which fills the short
+    # dips between syllables and drops isolated clicks and beats.
+    width = max(1, int(round(settings.smooth_seconds / VAD_FRAME_SECONDS)))
+    counts = np.concatenate(([0], np.cumsum(candidate, dtype=np.int32)))
+    lo = np.clip(np.arange(len(candidate)) - width // 2, 0, len(candidate))
+    hi = np.clip(lo + width, 0, len(candidate))
+    return (counts[hi] - counts[lo]) * 3 >= width
+
+
+@dataclass
+class SpeechRegions:
+    """Sorted, non-overlapping (start, end) speech regions of a whole file, in seconds."""
+
+    starts: Any
+    ends: Any
+    duration: float
+    # Time spent detecting them in this process; 0.0 when read back from disk.
+    build_seconds: float = 0.0
+
+    @classmethod
+    def detect(
+        cls,
+        samples: Any,
+        settings: VadSettings = DEFAULT_VAD_SETTINGS,
+    ) -> SpeechRegions:
+        import numpy as np
+
+        duration = len(samples) / ANALYSIS_SAMPLE_RATE
+        speech = speech_frames(samples, settings)
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+        starts = edges[::2] * VAD_FRAME_SECONDS
+        ends = edges[1::2] * VAD_FRAME_SECONDS
+        keep = (ends - starts) >= settings.min_speech_seconds
+        starts = np.maximum(starts[keep] - settings.pad_seconds, 0.0)
+        ends = np.minimum(ends[keep] + settings.pad_seconds, duration)
+        if len(starts):
+            # A region starts wherever the gap since the previous one is long enough.
+            opens = np.concatenate(([True], starts[1:] - ends[:-1] > settings.merge_gap_seconds))
+            closes = np.concatenate((opens[1:], [True]))
+            starts, ends = starts[opens], ends[closes]
+        return cls(starts=starts, ends=ends, duration=duration)
+
+    @classmethod
+    def load(cls, path: Path, duration: float) -> SpeechRegions | None:
+        import numpy as np
+
+        if not path.exists():
+            return None
+        spans = np.load(path)
+        return cls(starts=spans[:, 0], ends=spans[:, 1], duration=duration)
+
+    def save(self, path: Path) -> None:
+        import numpy as np
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp.npy")
+        np.save(tmp, np.stack([self.starts, self.ends], axis=1).astype(np.float64).reshape(-1, 2))
+        os.replace(tmp, path)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def speech_seconds(self) -> float:
+        return float((self.ends - self.starts).sum())
+
+    @property
+    def skipped_fraction(self) -> float:
+        return 1.0 - self.speech_seconds / self.duration if self.duration > 0 else 0.0
+
+    def window(self, start: float, end: float) -> list[tuple[float, float]]:
+        """Regions overlapping [start, end), clipped to it."""
+        import numpy as np
+
+        first = int(np.searchsorted(self.ends, start, side="right"))
+        last = int(np.searchsorted(self.starts, end, side="left"))
+        return [
+            (max(float(lo), start), min(float(hi), end))
+            for lo, hi in zip(self.starts[first:last], self.ends[first:last])
+        ]
+
+    def as_dict(self) -> dict:
+        return {
+            "regions": len(self),
+            "speech_seconds": round(self.speech_seconds, 1),
+            "skipped_fraction": round(self.skipped_fraction, 3),
+        }
+
+
+def speech_regions_path(audio: OverheadAudio, settings: VadSettings = DEFAULT_VAD_SETTINGS) -> Path:
+    key = wav_fingerprint(audio.wav_path, audio.layout)
+    return audio.sidecar_dir / f"{audio.wav_path.name}.{key}.vad-{settings.key()}.npy"
+
+
+def speech_regions(wav_path: Path, settings: VadSettings = DEFAULT_VAD_SETTINGS) -> SpeechRegions:
+    """Speech regions of wav_path, loaded from ``.overhead_pcm/`` or detected and saved once."""
+    audio = OverheadAudio.open(wav_path)
+    samples = audio.mono16k
+    duration = len(samples) / ANALYSIS_SAMPLE_RATE
+    path = speech_regions_path(audio, settings)
+    regions = SpeechRegions.load(path, duration)
+    if regions is None:
+        started = time.perf_counter()
+        regions = SpeechRegions.detect(samples, settings)
+        regions.build_seconds = time.perf_counter() - started
+        for stale in audio.sidecar_dir.glob(f"{wav_path.name}.*.vad-*.npy"):
+            stale.unlink(missing_ok=True)
+        regions.save(path)
+    return regions
+
+
+def print_speech_regions(regions: SpeechRegions) -> None:
+    source = f"built in {regions.build_seconds:.1f}s" if regions.build_seconds else "from cache"
+    print(
+        f"VAD prefilter: {len(regions)} speech region(s), {regions.speech_seconds:.0f}s of "
+        f"{regions.duration:.0f}s ({regions.skipped_fraction:.1%} skipped), {source}",
+        file=sys.stderr,
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build and show the speech-region index of an overhead .wav")
+    parser.add_argument("--wav", type=Path, required=True, help="Venue-wide overhead .wav")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the regions here as JSON")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.wav.exists():
+        print(f"Error: WAV file not found: {args.wav}", file=sys.stderr)
+        return 1
+    regions = speech_regions(args.wav)
+    print_speech_regions(regions)
+    if args.json:
+        payload = {
+            "wav_path": str(args.wav),
+            "duration": round(regions.duration, 2),
+            **regions.as_dict(),
+            "settings": asdict(DEFAULT_VAD_SETTINGS),
+            "spans": [[round(lo, 2), round(hi, 2)] for lo, hi in regions.window(0.0, regions.duration)],
+        }
+        args.json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"Speech regions: {args.json}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
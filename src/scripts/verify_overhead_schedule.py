@@ -20,15 +20,50 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import re
 import statistics
 import subprocess
 import sys
-import tempfile
-from dataclasses import asdict, dataclass, field
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, fields, replace
+from itertools import accumulate
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
+
+from overhead_transcribe import (
+    DEFAULT_CHUNK_SECONDS,
+    DEFAULT_OVERLAP_SECONDS,
+    SAMPLE_RATE,
+    TranscriptChunkStore,
+    TranscriptProgress,
+    TranscriptSegment,
+    TranscriptionChunk,
+    TranscriptionStats,
+    decode_pcm_range,
+    plan_patch_windows,
+    prefilter_savings,
+    print_transcription_stats,
+    piece_words,
+    stream_chunked,
+    transcribe_options,
+    transcribe_windows,
+    vad_speech_spans,
+)
+from overhead_assign import assign_candidates
+from overhead_vad import SpeechRegions, print_speech_regions, speech_regions
+from overhead_transcript_cache import (
+    existing_cache,
+    read_refinement_file,
+    read_transcript_file,
+    refinement_cache_path,
+    transcript_cache_path,
+    write_refinement_file,
+    write_transcript_file,
+)
+from overhead_models import add_model_pool_arguments, configure_model_pool_from_args, get_model_pool
 
 COURT_WORDS = {
     1: ("one", "1"),
@@ -145,7 +180,37 @@ COUNTDOWN_TEXT_RE = re.compile(
     re.I,
 )
 
-_refine_model_cache: dict[str, Any] = {}
+# Where a new PA phrase begins inside a bundled segment: a court call or the first
+# words of a venue-wide cue. Only phrase openings, so "next court" or "here we go"
+# never cut a cue in half.
+CUE_PHRASE_START_RE = re.compile(
+    r"\bcourt\s+(?:one|two|three|four|five|six|[1-6])\b|"
+    r"\btwo minutes\b|\bone minute\b|"
+    r"\b(?:30|thirty|90|ninety) seconds\b|"
+    r"\bhalfway\b|"
+    r"\bplayers line up\b|"
+    r"\b(?:10|ten)\b[,.]?\s+(?:9|nine)\b",
+    re.I,
+)
+
+# (offset from slot start, pattern) tried in order when anchoring a round in the audio.
+SLOT_ANCHOR_PATTERNS: list[tuple[int, re.Pattern[str]]] = [
+    (240, re.compile(r"here we go|players line up")),
+    (0, re.compile(r"versus|vs\.?|home team")),
+]
+
+# A round's speech runs from its anchor to the next slot's first calls.
+SLOT_POST_SECONDS = 26 * 60
+
+# Lowest score a venue-wide cue is matched at (court calls use --min-confidence).
+VENUE_MATCH_THRESHOLD = 0.35
+# Score given up per tolerance-width of drift when assigning, so near-equal candidates
+# go to the one closest to its expected time.
+ASSIGN_DRIFT_PENALTY = 0.02
+
+REFINE_BATCH_SIZE = 16
+# Silence inserted between packed sub-chunks so each output segment maps back unambiguously.
+REFINE_PACK_GAP_SECONDS = 1.0
 
 
 @dataclass
@@ -160,7 +225,9 @@ class Game:
     type: str = ""
 
 
-@dataclass
+# Slotted and frozen: a two-day schedule holds thousands of these, and nothing
+# changes an event or a result once matching has produced it.
+@dataclass(frozen=True, slots=True)
 class ExpectedEvent:
     wall_time: str
     wall_seconds: int
@@ -176,15 +243,14 @@ class ExpectedEvent:
     skipped: bool = False
     skip_reason: str = ""
 
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in EXPECTED_EVENT_FIELDS}
 
-@dataclass
-class TranscriptSegment:
-    start: float
-    end: float
-    text: str
 
+EXPECTED_EVENT_FIELDS = tuple(item.name for item in fields(ExpectedEvent))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     expected: ExpectedEvent
     matched: bool
@@ -195,6 +261,34 @@ class MatchResult:
     status: str = "missed"
 
 
+@dataclass
+class RefinementStats:
+    segments: int = 0
+    cached_segments: int = 0
+    split_segments: int = 0  # split in memory from word timings, no model pass
+    sub_chunks: int = 0
+    batches: int = 0
+    audio_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def segments_per_second(self) -> float:
+        refined = self.segments - self.cached_segments - self.split_segments
+        return refined / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "segments": self.segments,
+            "cached_segments": self.cached_segments,
+            "split_segments": self.split_segments,
+            "sub_chunks": self.sub_chunks,
+            "batches": self.batches,
+            "audio_seconds": round(self.audio_seconds, 1),
+            "wall_seconds": round(self.wall_seconds, 2),
+            "segments_per_second": round(self.segments_per_second, 2),
+        }
+
+
 @dataclass
 class VerificationReport:
     wav_path: str
@@ -208,6 +302,67 @@ class VerificationReport:
     events: list[dict] = field(default_factory=list)
     summary: dict = field(default_factory=dict)
     orphan_segments: list[dict] = field(default_factory=list)
+    transcription: dict | None = None
+
+
+class SegmentIndex:
+    """Transcript segments sorted by start time with bisect-backed window queries.
+
+    ``window`` returns the positions whose start lies in [start, end] in O(log n + k);
+    ``overlapping`` finds segments whose [start, end] span intersects a range using a
+    running maximum of segment ends. Positions are stable for the life of the index,
+    so callers can track used segments by position.
+    """
+
+    def __init__(self, segments: Iterable[TranscriptSegment], presorted: bool = False):
+        self.segments: list[TranscriptSegment] = (
+            list(segments) if presorted else sorted(segments, key=lambda segment: segment.start)
+        )
+        self.starts: list[float] = [segment.start for segment in self.segments]
+        self._max_end: list[float] = list(accumulate((segment.end for segment in self.segments), max))
+
+    @classmethod
+    def of(cls, segments: Iterable[TranscriptSegment] | SegmentIndex) -> SegmentIndex:
+        if isinstance(segments, SegmentIndex):
+            return segments
+        return cls(segments)
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        return iter(self.segments)
+
+    def __getitem__(self, idx: int) -> TranscriptSegment:
+        return self.segments[idx]
+
+    def window(self, start: float, end: float) -> range:
+        """Positions of segments with start <= segment.start <= end."""
+        return range(bisect_left(self.starts, start), bisect_right(self.starts, end))
+
+    def between(self, start: float, end: float) -> list[TranscriptSegment]:
+        span = self.window(start, end)
+        return self.segments[span.start : span.stop]
+
+    def overlapping(self, start: float, end: float) -> list[int]:
+        """Positions of segments whose [start, end] intersects [start, end]."""
+        hi = bisect_right(self.starts, end)
+        lo = bisect_left(self._max_end, start)
+        return [idx for idx in range(lo, hi) if self.segments[idx].end >= start]
+
+    def replaced(
+        self,
+        removed: Iterable[int],
+        added: Iterable[TranscriptSegment],
+    ) -> SegmentIndex:
+        """New index without the ``removed`` positions and with ``added`` merged in."""
+        removed_set = set(removed)
+        kept = (segment for idx, segment in enumerate(self.segments) if idx not in removed_set)
+        extra = sorted(added, key=lambda segment: segment.start)
+        return SegmentIndex(
+            heapq.merge(kept, extra, key=lambda segment: segment.start),
+            presorted=True,
+        )
 
 
 def time_to_seconds(time_str: str) -> int:
@@ -440,44 +595,45 @@ def build_slot_events(
 
 def infer_slot_anchor_wav(
     slot_games: list[Game],
-    segments: list[TranscriptSegment],
+    segments: list[TranscriptSegment] | SegmentIndex,
     hint_wav: float,
     tolerance: int,
     min_confidence: float,
 ) -> float | None:
+    index = SegmentIndex.of(segments)
     search_start = max(0, hint_wav - tolerance * 2)
-    search_end = hint_wav + tolerance * 2 + 300
+    search_end = slot_anchor_search_end(hint_wav, tolerance)
+
+    scorer = get_scorer()
+    probes = [
+        ExpectedEvent(
+            wall_time="",
+            wall_seconds=0,
+            wav_offset_seconds=0,
+            event_type="court_announcement",
+            court_num=game.court_num,
+            court=game.court,
+            home_team=game.home_team,
+            away_team=game.away_team,
+            round=game.round,
+        )
+        for game in slot_games
+    ]
 
-    for offset, pattern in [
-        (240, r"here we go|players line up"),
-        (0, r"versus|vs\.?|home team"),
-    ]:
+    for offset, pattern in SLOT_ANCHOR_PATTERNS:
         target = hint_wav + offset
+        radius = tolerance * 2 + (120 if offset == 0 else 60)
         best_start: float | None = None
         best_score = 0.0
-        for segment in segments:
-            if segment.start < search_start or segment.start > search_end:
-                continue
-            if abs(segment.start - target) > tolerance * 2 + (120 if offset == 0 else 60):
-                continue
-            text = segment.text.lower()
-            if not re.search(pattern, text):
+        for segment in index.between(
+            max(search_start, target - radius), min(search_end, target + radius)
+        ):
+            if not pattern.search(scorer.features(segment.text).text_lower):
                 continue
             if offset == 240:
                 return segment.start - 240
-            for game in slot_games:
-                probe = ExpectedEvent(
-                    wall_time="",
-                    wall_seconds=0,
-                    wav_offset_seconds=0,
-                    event_type="court_announcement",
-                    court_num=game.court_num,
-                    court=game.court,
-                    home_team=game.home_team,
-                    away_team=game.away_team,
-                    round=game.round,
-                )
-                score = score_segment(probe, segment)
+            for probe in probes:
+                score = scorer.score(probe, segment)
                 if score >= min_confidence and score > best_score:
                     best_score = score
                     best_start = segment.start
@@ -489,32 +645,78 @@ def infer_slot_anchor_wav(
 
 def match_slot_events(
     events: list[ExpectedEvent],
-    segments: list[TranscriptSegment],
+    segments: list[TranscriptSegment] | SegmentIndex,
     tolerance: int,
     min_confidence: float,
+    matcher: str = "assignment",
 ) -> list[MatchResult]:
-    results: list[MatchResult] = []
-    used_venue_segments: set[int] = set()
-
+    """Match one slot's events; a segment is used by at most one venue-wide cue.
+
+    Court calls are not exclusive: whisper often bundles several of them into one
+    segment, so each takes its best-scoring segment. ``assignment`` (default) picks
+    the globally best set of venue cue pairs; ``greedy`` is the older first-come
+    matcher, kept for comparison.
+    """
+    if matcher == "greedy":
+        return match_slot_events_greedy(events, segments, tolerance, min_confidence)
+    index = SegmentIndex.of(segments)
     court_events = [e for e in events if e.event_type == "court_announcement" and not e.skipped]
     venue_events = [e for e in events if e.event_type != "court_announcement"]
+    active_venue = [e for e in venue_events if not e.skipped]
 
-    for event in court_events:
-        if event.skipped:
-            results.append(MatchResult(expected=event, matched=False, status="skipped"))
-            continue
-        window_start = max(0, event.wav_offset_seconds - tolerance)
-        window_end = event.wav_offset_seconds + tolerance + 120
+    rows: list[dict[int, float]] = []
+    for event in active_venue:
+        window = index.window(
+            event.wav_offset_seconds - tolerance, event.wav_offset_seconds + tolerance
+        )
+        rows.append({idx: score for idx in window if (score := score_segment(event, index[idx])) > 0.0})
 
-        best_idx: int | None = None
-        best_score = 0.0
-        for idx, segment in enumerate(segments):
-            if segment.start < window_start or segment.start > window_end:
-                continue
-            score = score_segment(event, segment)
-            if score > best_score:
-                best_score = score
-                best_idx = idx
+    results = match_court_calls(court_events, index, tolerance, min_confidence)
+    results += assignment_results(
+        active_venue, rows, [VENUE_MATCH_THRESHOLD] * len(active_venue), index, tolerance
+    )
+    results += [
+        MatchResult(expected=event, matched=False, status="skipped")
+        for event in venue_events
+        if event.skipped
+    ]
+    results.sort(
+        key=lambda r: (
+            r.expected.venue_wide,
+            r.expected.court_num,
+            r.expected.event_type,
+        )
+    )
+    return results
+
+
+def match_court_calls(
+    court_events: list[ExpectedEvent],
+    index: SegmentIndex,
+    tolerance: int,
+    min_confidence: float,
+) -> list[MatchResult]:
+    """Each court call matched to its best-scoring segment; calls may share a segment."""
+    results: list[MatchResult] = []
+    windows = [
+        index.window(
+            max(0, event.wav_offset_seconds - tolerance),
+            event.wav_offset_seconds + tolerance + 120,
+        )
+        for event in court_events
+    ]
+    # Every court call of the slot shares one window, so score them as one matrix.
+    span_start = min((w.start for w in windows), default=0)
+    span_stop = max((w.stop for w in windows), default=0)
+    scores = get_scorer().score_matrix(
+        court_events, [index[idx] for idx in range(span_start, span_stop)]
+    )
+
+    for row, (event, window) in enumerate(zip(court_events, windows)):
+        col, best_score = best_in_row(
+            scores, row, window.start - span_start, window.stop - span_start
+        )
+        best_idx = None if col is None else span_start + col
 
         if best_idx is None or best_score < min_confidence:
             results.append(
@@ -522,7 +724,7 @@ def match_slot_events(
             )
             continue
 
-        segment = segments[best_idx]
+        segment = index[best_idx]
         results.append(
             MatchResult(
                 expected=event,
@@ -534,24 +736,84 @@ def match_slot_events(
                 status="matched",
             )
         )
+    return results
+
+
+def assignment_results(
+    events: list[ExpectedEvent],
+    scores: list[dict[int, float]],
+    thresholds: list[float],
+    index: SegmentIndex,
+    tolerance: int,
+) -> list[MatchResult]:
+    """MatchResults from one optimal assignment over every event's scored window."""
+    candidates = [
+        {
+            idx: score - ASSIGN_DRIFT_PENALTY * abs(index[idx].start - event.wav_offset_seconds) / max(1, tolerance)
+            for idx, score in row.items()
+            if score >= threshold
+        }
+        for event, row, threshold in zip(events, scores, thresholds)
+    ]
+    picks = assign_candidates(candidates)
+    taken = {pick for pick in picks if pick is not None}
+    results: list[MatchResult] = []
+    for event, row, pick in zip(events, scores, picks):
+        if pick is None:
+            # Segments given to another event were never available to this one.
+            results.append(
+                MatchResult(
+                    expected=event,
+                    matched=False,
+                    confidence=max((score for idx, score in row.items() if idx not in taken), default=0.0),
+                    status="missed",
+                )
+            )
+            continue
+        segment = index[pick]
+        results.append(
+            MatchResult(
+                expected=event,
+                matched=True,
+                actual_start=segment.start,
+                drift_seconds=segment.start - event.wav_offset_seconds,
+                confidence=row[pick],
+                matched_text=segment.text.strip(),
+                status="matched",
+            )
+        )
+    return results
+
+
+def match_slot_events_greedy(
+    events: list[ExpectedEvent],
+    segments: list[TranscriptSegment] | SegmentIndex,
+    tolerance: int,
+    min_confidence: float,
+) -> list[MatchResult]:
+    index = SegmentIndex.of(segments)
+    results: list[MatchResult] = []
+    used_venue_segments: set[int] = set()
+
+    court_events = [e for e in events if e.event_type == "court_announcement" and not e.skipped]
+    venue_events = [e for e in events if e.event_type != "court_announcement"]
+    results += match_court_calls(court_events, index, tolerance, min_confidence)
 
     for event in venue_events:
         if event.skipped:
             results.append(MatchResult(expected=event, matched=False, status="skipped"))
             continue
 
-        threshold = 0.35
+        threshold = VENUE_MATCH_THRESHOLD
         window_start = event.wav_offset_seconds - tolerance
         window_end = event.wav_offset_seconds + tolerance
 
         best_idx: int | None = None
         best_score = 0.0
-        for idx, segment in enumerate(segments):
+        for idx in index.window(window_start, window_end):
             if idx in used_venue_segments:
                 continue
-            if segment.start < window_start or segment.start > window_end:
-                continue
-            score = score_segment(event, segment)
+            score = score_segment(event, index[idx])
             if score > best_score:
                 best_score = score
                 best_idx = idx
@@ -567,7 +829,7 @@ def match_slot_events(
             )
             continue
 
-        segment = segments[best_idx]
+        segment = index[best_idx]
         used_venue_segments.add(best_idx)
         results.append(
             MatchResult(
@@ -598,19 +860,17 @@ def format_anchor_offset(offset_seconds: float) -> str:
 
 
 def collect_slot_speech(
-    segments: list[TranscriptSegment],
+    segments: list[TranscriptSegment] | SegmentIndex,
     slot_anchor: float,
     wav_start_seconds: int,
     pre_seconds: int = 30,
-    post_seconds: int = 26 * 60,
+    post_seconds: int = SLOT_POST_SECONDS,
 ) -> list[dict]:
     window_start = slot_anchor - pre_seconds
     window_end = slot_anchor + post_seconds
     items: list[dict] = []
 
-    for segment in segments:
-        if segment.start < window_start or segment.start > window_end:
-            continue
+    for segment in SegmentIndex.of(segments).between(window_start, window_end):
         text = segment.text.strip()
         if not text:
             continue
@@ -818,7 +1078,7 @@ def serialize_refinements(
                 slot_anchor=slot_anchor,
                 wav_start_seconds=wav_start_seconds,
                 pre_seconds=0,
-                post_seconds=26 * 60,
+                post_seconds=SLOT_POST_SECONDS,
             ),
             round_idx,
         )
@@ -839,7 +1099,7 @@ def serialize_match_results(results: list[MatchResult]) -> list[dict]:
     for result in results:
         serialized.append(
             {
-                "expected": asdict(result.expected),
+                "expected": result.expected.as_dict(),
                 "matched": result.matched,
                 "actual_start": result.actual_start,
                 "actual_wav_timestamp": (
@@ -896,21 +1156,26 @@ def write_by_round_phrases_file(reports: list[dict], output_path: Path) -> None:
     output_path.write_text("\n".join(lines), encoding="utf-8")
 
 
-def write_by_round_report(
+def build_by_round_report(
     reports: list[dict],
-    output_path: Path,
     wav_path: Path,
     wav_start_time: str,
     tolerance: int,
     refine_bundled: bool,
-) -> None:
+    refinement: RefinementStats | None = None,
+    schedule: dict | None = None,
+    transcription: dict | None = None,
+) -> dict:
     passed = sum(1 for report in reports if report["summary"]["match_rate"] >= 0.8)
-    payload = {
+    return {
         "wav_path": str(wav_path),
         "wav_start_time": wav_start_time,
+        "schedule": schedule,
         "mode": "by_round",
         "tolerance_seconds": tolerance,
         "refine_bundled": refine_bundled,
+        "refinement": refinement.as_dict() if refinement else None,
+        "transcription": transcription,
         "rounds_passed": passed,
         "rounds_total": len(reports),
         "audio_structure": build_audio_structure_notes(reports),
@@ -935,13 +1200,167 @@ def write_by_round_report(
             for report in reports
         ],
     }
+
+
+def write_by_round_report(
+    reports: list[dict],
+    output_path: Path,
+    wav_path: Path,
+    wav_start_time: str,
+    tolerance: int,
+    refine_bundled: bool,
+    refinement: RefinementStats | None = None,
+    schedule: dict | None = None,
+    transcription: dict | None = None,
+) -> None:
+    payload = build_by_round_report(
+        reports, wav_path, wav_start_time, tolerance, refine_bundled, refinement, schedule, transcription
+    )
     output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     print(f"By-round report: {output_path}", file=sys.stderr)
 
 
+def print_by_round_header(tolerance: int, refine_bundled: bool) -> None:
+    print(
+        f"Per-round verification (tolerance ±{tolerance}s, full phrases"
+        f"{', bundled-cue refinement' if refine_bundled else ''})"
+        f"\n{'RND':<4} {'SCHEDULE':<12} {'WALL':<6} {'ANCHOR':<10} {'DRIFT':<8} {'MATCHED':<12} {'STATUS'}"
+    )
+    print("-" * 72, flush=True)
+
+
+def slot_anchor_search_end(hint_wav: float, tolerance: int) -> float:
+    """Latest wav time infer_slot_anchor_wav looks at for a slot hinted at hint_wav."""
+    return hint_wav + tolerance * 2 + 300
+
+
+def round_settled_at(slot_anchor: float, tolerance: int) -> float:
+    """Transcript time after which nothing can change a round anchored at slot_anchor."""
+    return slot_anchor + SLOT_POST_SECONDS + tolerance + 120
+
+
+def verify_round(
+    round_idx: int,
+    slot_start: int,
+    slot_games: list[Game],
+    index: SegmentIndex,
+    wav_path: Path,
+    global_anchor: int,
+    tolerance: int,
+    min_confidence: float,
+    skip_ranges: list[tuple[int, int]],
+    skip_before: str | None,
+    refine_bundled: bool = True,
+    refine_model: str = "base",
+    refine_chunk_sec: int = 8,
+    refine_cache: dict | None = None,
+    verbose: bool = False,
+    refinement_stats: RefinementStats | None = None,
+    slot_anchor: float | None = None,
+    matcher: str = "assignment",
+    anchor_source: str = "inferred",
+    speech: SpeechRegions | None = None,
+) -> dict:
+    """Anchor, match and annotate one round, print its status line and return its report."""
+    slot_games.sort(key=lambda g: g.court_num)
+    ref = slot_games[0]
+    hint_wav = float(slot_start - global_anchor)
+    if slot_anchor is None:
+        slot_anchor = infer_slot_anchor_wav(
+            slot_games, index, hint_wav, tolerance, min_confidence
+        )
+    if slot_anchor is None:
+        slot_anchor = hint_wav
+        anchor_source = "schedule_hint"
+
+    events = build_slot_events(
+        slot_games, slot_start, slot_anchor, skip_ranges, skip_before
+    )
+    slot_segments = index
+    refinements: list[dict] = []
+    if refine_bundled:
+        slot_segments, refinements = augment_slot_segments(
+            index,
+            slot_anchor,
+            wav_path,
+            refine_model,
+            refine_chunk_sec,
+            refine_cache,
+            stats=refinement_stats,
+            speech=speech,
+        )
+
+    results = match_slot_events(events, slot_segments, tolerance, min_confidence, matcher)
+    summary = build_summary(results, sorted({g.court_num for g in slot_games}))
+    speech_items = annotate_speech_items(
+        collect_slot_speech(
+            slot_segments,
+            slot_anchor,
+            global_anchor,
+        ),
+        round_idx,
+    )
+    structure = summarize_round_structure(speech_items)
+    refined_bundles = serialize_refinements(
+        refinements, global_anchor, slot_anchor, round_idx
+    )
+
+    report = {
+        "round": round_idx,
+        "schedule_label": ref.round,
+        "wall_start": seconds_to_hm(slot_start),
+        "slot_anchor_wav": round(slot_anchor, 1),
+        "anchor_source": anchor_source,
+        "schedule_hint_wav": hint_wav,
+        "anchor_drift": round(slot_anchor - hint_wav, 1),
+        "bundled_segments_refined": len(refinements),
+        "structure": structure,
+        "matchups": {
+            g.court_num: f"{g.home_team} vs {g.away_team}" for g in slot_games
+        },
+        "summary": summary,
+        "speech": speech_items,
+        "refined_bundles": refined_bundles,
+        "matches": serialize_match_results(results),
+        "results": results,
+    }
+
+    status = "PASS" if summary["match_rate"] >= 0.8 else "FAIL"
+    print(
+        f"Round {round_idx:2d} ({ref.round}, {seconds_to_hm(slot_start)})  "
+        f"anchor {seconds_to_hms(slot_anchor)} ({anchor_source}, drift {slot_anchor - hint_wav:+.0f}s)  "
+        f"{summary['matched']}/{summary['total_events']} matched ({summary['match_rate']:.0%})  {status}",
+        flush=True,
+    )
+
+    if verbose:
+        print(f"  Matchups: " + ", ".join(
+            f"C{n} {m}" for n, m in sorted(report["matchups"].items())
+        ))
+        print_slot_transcript(speech_items)
+        if refinements:
+            print_refined_bundles(refinements, refine_chunk_sec)
+        for result in results:
+            event = result.expected
+            if result.status in ("skipped",):
+                continue
+            court = "ALL" if event.venue_wide else f"C{event.court_num}"
+            if result.matched:
+                drift = f"{result.drift_seconds:+.0f}s"
+                print(
+                    f"  {event.event_type:<20} {court:<4} "
+                    f"{seconds_to_hms(result.actual_start)} ({drift})  {result.matched_text.strip()}"
+                )
+            else:
+                print(f"  {event.event_type:<20} {court:<4}  MISSED")
+        print(flush=True)
+
+    return report
+
+
 def verify_by_round(
     games: list[Game],
-    segments: list[TranscriptSegment],
+    segments: list[TranscriptSegment] | SegmentIndex,
     wav_path: Path,
     wav_start_time: str,
     tolerance: int,
@@ -954,106 +1373,272 @@ def verify_by_round(
     refine_cache: dict | None = None,
     round_filter: int | None = None,
     verbose: bool = False,
+    refinement_stats: RefinementStats | None = None,
+    matcher: str = "assignment",
+    slot_anchors: dict[int, float] | None = None,
+    speech: SpeechRegions | None = None,
 ) -> list[dict]:
+    done = TranscriptProgress(segments=segments, settled_until=float("inf"), done=True)
+    return verify_by_round_streaming(
+        games,
+        iter([done]),
+        wav_path,
+        wav_start_time,
+        tolerance,
+        min_confidence,
+        skip_ranges,
+        skip_before,
+        refine_bundled=refine_bundled,
+        refine_model=refine_model,
+        refine_chunk_sec=refine_chunk_sec,
+        refine_cache=refine_cache,
+        round_filter=round_filter,
+        verbose=verbose,
+        refinement_stats=refinement_stats,
+        matcher=matcher,
+        slot_anchors=slot_anchors,
+        speech=speech,
+    )
+
+
+def verify_by_round_streaming(
+    games: list[Game],
+    transcript: Iterable[TranscriptProgress],
+    wav_path: Path,
+    wav_start_time: str,
+    tolerance: int,
+    min_confidence: float,
+    skip_ranges: list[tuple[int, int]],
+    skip_before: str | None,
+    refine_bundled: bool = True,
+    refine_model: str = "base",
+    refine_chunk_sec: int = 8,
+    refine_cache: dict | None = None,
+    round_filter: int | None = None,
+    verbose: bool = False,
+    refinement_stats: RefinementStats | None = None,
+    matcher: str = "assignment",
+    slot_anchors: dict[int, float] | None = None,
+    speech: SpeechRegions | None = None,
+) -> list[dict]:
+    """verify_by_round over a transcript that is still being produced.
+
+    Each round is verified, in order, as soon as the settled part of the transcript
+    covers its anchor search and everything after the anchor that matching, speech
+    collection and refinement read. Reports are identical to a run over the finished
+    transcript; they just start arriving while later audio is still transcribing.
+    ``slot_anchors`` (round -> wav seconds, e.g. from overhead_align.round_anchors)
+    replaces the per-round anchor search for the rounds it covers. ``speech`` (the
+    VAD prefilter's regions) limits refinement to speech the same way.
+    """
     global_anchor = time_to_seconds(wav_start_time)
+    rounds = [
+        (round_idx, slot_start, slot_games)
+        for round_idx, (slot_start, slot_games) in enumerate(group_games_by_slot(games), start=1)
+        if round_filter is None or round_idx == round_filter
+    ]
     round_reports: list[dict] = []
+    # Anchor of the next round, inferred once its search window has settled.
+    anchored = False
+    slot_anchor = 0.0
+    anchor_source = "inferred"
+    for progress in transcript:
+        index: SegmentIndex | None = None
+        while len(round_reports) < len(rounds):
+            round_idx, slot_start, slot_games = rounds[len(round_reports)]
+            hint_wav = float(slot_start - global_anchor)
+            if not anchored and slot_anchors and round_idx in slot_anchors:
+                slot_anchor, anchor_source = slot_anchors[round_idx], "aligned"
+                anchored = True
+            if not anchored:
+                if not progress.done and progress.settled_until < slot_anchor_search_end(hint_wav, tolerance):
+                    break
+                if index is None:
+                    index = SegmentIndex.of(progress.segments)
+                inferred = infer_slot_anchor_wav(slot_games, index, hint_wav, tolerance, min_confidence)
+                # verify_round is handed the outcome, so it never repeats the search.
+                if inferred is None:
+                    slot_anchor, anchor_source = hint_wav, "schedule_hint"
+                else:
+                    slot_anchor, anchor_source = inferred, "inferred"
+                anchored = True
+            if not progress.done and progress.settled_until < round_settled_at(slot_anchor, tolerance):
+                break
+            if index is None:
+                index = SegmentIndex.of(progress.segments)
+            anchored = False
+            round_reports.append(
+                verify_round(
+                    round_idx,
+                    slot_start,
+                    slot_games,
+                    index,
+                    wav_path,
+                    global_anchor,
+                    tolerance,
+                    min_confidence,
+                    skip_ranges,
+                    skip_before,
+                    refine_bundled=refine_bundled,
+                    refine_model=refine_model,
+                    refine_chunk_sec=refine_chunk_sec,
+                    refine_cache=refine_cache,
+                    verbose=verbose or round_filter is not None,
+                    refinement_stats=refinement_stats,
+                    slot_anchor=slot_anchor,
+                    matcher=matcher,
+                    anchor_source=anchor_source,
+                    speech=speech,
+                )
+            )
+    return round_reports
 
-    for round_idx, (slot_start, slot_games) in enumerate(group_games_by_slot(games), start=1):
-        if round_filter is not None and round_idx != round_filter:
-            continue
 
-        slot_games.sort(key=lambda g: g.court_num)
-        ref = slot_games[0]
-        hint_wav = float(slot_start - global_anchor)
-        slot_anchor = infer_slot_anchor_wav(
-            slot_games, segments, hint_wav, tolerance, min_confidence
-        )
-        anchor_source = "inferred"
-        if slot_anchor is None:
-            slot_anchor = hint_wav
-            anchor_source = "schedule_hint"
+def splice_transcript(
+    index: SegmentIndex,
+    windows: list[TranscriptionChunk],
+    segments: list[TranscriptSegment],
+) -> tuple[SegmentIndex, int]:
+    """Swap the segments whose midpoint lies in a window for freshly transcribed ones."""
+    removed = [
+        idx
+        for window in windows
+        for idx in index.overlapping(window.start, window.end)
+        if window.start <= (index[idx].start + index[idx].end) / 2 < window.end
+    ]
+    return index.replaced(removed, segments), len(removed)
 
-        events = build_slot_events(
-            slot_games, slot_start, slot_anchor, skip_ranges, skip_before
-        )
-        slot_segments = segments
-        refinements: list[dict] = []
-        if refine_bundled:
-            slot_segments, refinements = augment_slot_segments(
-                segments,
-                slot_anchor,
+
+def verify_overhead(
+    wav_path: Path,
+    games: list[Game],
+    wav_start_time: str,
+    transcript: Iterable[TranscriptSegment] | SegmentIndex | None = None,
+    changed_ranges: Iterable[tuple[float, float]] = (),
+    model_name: str = "small",
+    tolerance: int = 90,
+    min_confidence: float = 0.55,
+    skip_ranges: list[tuple[int, int]] | None = None,
+    skip_before: str | None = None,
+    refine_bundled: bool = True,
+    refine_model: str = "base",
+    refine_chunk_sec: int = 8,
+    refine_cache: dict | None = None,
+    cache_path: Path | None = None,
+    schedule: dict | None = None,
+    output_report: Path | None = None,
+    verbose: bool = False,
+    matcher: str = "assignment",
+    word_timestamps: bool = False,
+    vad_prefilter: bool = False,
+) -> dict:
+    """By-round verification of ``wav_path`` in this process; returns the report payload.
+
+    ``transcript`` is the transcript of the wav before it was edited and
+    ``changed_ranges`` the wav seconds the edit touched (e.g. injected clips): only
+    windows around those ranges are re-transcribed and spliced in. Refinement cache
+    entries inside the windows are dropped. Without a transcript the wav is
+    transcribed in full (unchanged chunk checkpoints still apply). The resulting
+    transcript is written to ``cache_path`` when given, and the report (plus its
+    phrases file) to ``output_report``. ``vad_prefilter`` limits transcription,
+    patches and refinement to the speech regions of the wav (overhead_vad.py).
+    """
+    started = time.perf_counter()
+    patch: dict | None = None
+    transcription: dict = {}
+    speech = None
+    if vad_prefilter:
+        speech = speech_regions(wav_path)
+        print_speech_regions(speech)
+    if transcript is None:
+        index = SegmentIndex(
+            transcribe_wav(
                 wav_path,
-                refine_model,
-                refine_chunk_sec,
-                refine_cache,
+                model_name,
+                cache_path,
+                False,
+                word_timestamps=word_timestamps,
+                speech=speech,
+                transcription=transcription,
             )
-
-        results = match_slot_events(events, slot_segments, tolerance, min_confidence)
-        summary = build_summary(results, sorted({g.court_num for g in slot_games}))
-        speech = annotate_speech_items(
-            collect_slot_speech(
-                slot_segments,
-                slot_anchor,
-                global_anchor,
-            ),
-            round_idx,
         )
-        structure = summarize_round_structure(speech)
-        refined_bundles = serialize_refinements(
-            refinements, global_anchor, slot_anchor, round_idx
+    else:
+        windows = plan_patch_windows(
+            list(changed_ranges),
+            get_wav_duration(wav_path),
+            speech.window
+            if speech is not None
+            else lambda start, end: vad_speech_spans(decode_pcm_range(wav_path, start, end - start), start),
         )
-
-        report = {
-            "round": round_idx,
-            "schedule_label": ref.round,
-            "wall_start": seconds_to_hm(slot_start),
-            "slot_anchor_wav": round(slot_anchor, 1),
-            "anchor_source": anchor_source,
-            "schedule_hint_wav": hint_wav,
-            "anchor_drift": round(slot_anchor - hint_wav, 1),
-            "bundled_segments_refined": len(refinements),
-            "structure": structure,
-            "matchups": {
-                g.court_num: f"{g.home_team} vs {g.away_team}" for g in slot_games
-            },
-            "summary": summary,
-            "speech": speech,
-            "refined_bundles": refined_bundles,
-            "matches": serialize_match_results(results),
-            "results": results,
-        }
-        round_reports.append(report)
-
-        status = "PASS" if summary["match_rate"] >= 0.8 else "FAIL"
+        if speech is not None:
+            windows = [
+                replace(window, speech=tuple(speech.window(window.decode_start, window.decode_end)))
+                for window in windows
+            ]
         print(
-            f"Round {round_idx:2d} ({ref.round}, {seconds_to_hm(slot_start)})  "
-            f"anchor {seconds_to_hms(slot_anchor)} ({anchor_source}, drift {slot_anchor - hint_wav:+.0f}s)  "
-            f"{summary['matched']}/{summary['total_events']} matched ({summary['match_rate']:.0%})  {status}"
+            f"Re-transcribing {len(windows)} window(s), "
+            f"{sum(w.end - w.start for w in windows):.0f}s around the edits ...",
+            file=sys.stderr,
         )
-
-        if verbose or round_filter is not None:
-            print(f"  Matchups: " + ", ".join(
-                f"C{n} {m}" for n, m in sorted(report["matchups"].items())
-            ))
-            print_slot_transcript(speech)
-            if refinements:
-                print_refined_bundles(refinements, refine_chunk_sec)
-            for result in results:
-                event = result.expected
-                if result.status in ("skipped",):
-                    continue
-                court = "ALL" if event.venue_wide else f"C{event.court_num}"
-                if result.matched:
-                    drift = f"{result.drift_seconds:+.0f}s"
-                    print(
-                        f"  {event.event_type:<20} {court:<4} "
-                        f"{seconds_to_hms(result.actual_start)} ({drift})  {result.matched_text.strip()}"
-                    )
-                else:
-                    print(f"  {event.event_type:<20} {court:<4}  MISSED")
-            print()
-
-    return round_reports
+        # Patches carry word timings whenever the transcript they are spliced into does.
+        has_words = any(segment.words is not None for segment in SegmentIndex.of(transcript))
+        fresh = transcribe_windows(wav_path, model_name, windows, word_timestamps or has_words)
+        index, replaced = splice_transcript(SegmentIndex.of(transcript), windows, fresh)
+        if refine_cache is not None:
+            entries = refine_cache.get("entries", {})
+            for key in [k for k in entries if any(w.start <= float(k) < w.end for w in windows)]:
+                del entries[key]
+        write_transcript_cache(cache_path, wav_path, model_name, index.segments)
+        patch = {
+            "windows": [[round(w.start, 2), round(w.end, 2)] for w in windows],
+            "seconds_transcribed": round(sum(w.decode_end - w.decode_start for w in windows), 1),
+            "segments_replaced": replaced,
+            "segments_added": len(fresh),
+        }
+        if speech is not None:
+            spoken = sum(hi - lo for window in windows for lo, hi in window.speech or ())
+            patch["seconds_skipped"] = round(patch["seconds_transcribed"] - spoken, 1)
+            patch["seconds_transcribed"] = round(spoken, 1)
+
+    refinement_stats = RefinementStats()
+    if verbose:
+        print_by_round_header(tolerance, refine_bundled)
+    reports = verify_by_round(
+        games,
+        index,
+        wav_path,
+        wav_start_time,
+        tolerance,
+        min_confidence,
+        skip_ranges or [],
+        skip_before,
+        refine_bundled=refine_bundled,
+        refine_model=refine_model,
+        refine_chunk_sec=refine_chunk_sec,
+        refine_cache=refine_cache if refine_bundled else None,
+        refinement_stats=refinement_stats,
+        matcher=matcher,
+        speech=speech,
+    )
+    payload = build_by_round_report(
+        reports,
+        wav_path,
+        wav_start_time,
+        tolerance,
+        refine_bundled,
+        refinement_stats if refine_bundled else None,
+        schedule,
+        transcription or None,
+    )
+    payload["transcript_patch"] = patch
+    payload["verify_seconds"] = round(time.perf_counter() - started, 2)
+    if output_report is not None:
+        output_report.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"By-round report: {output_report}", file=sys.stderr)
+        write_by_round_phrases_file(
+            reports, output_report.with_name(f"{wav_path.stem}_overhead_by_round_phrases.txt")
+        )
+    return payload
 
 
 def court_regex(court_num: int) -> re.Pattern[str]:
@@ -1061,7 +1646,7 @@ def court_regex(court_num: int) -> re.Pattern[str]:
     return re.compile(rf"\bcourt\s*(?:{word}|{digit})\b", re.I)
 
 
-def score_segment(event: ExpectedEvent, segment: TranscriptSegment) -> float:
+def import_fuzz() -> Any:
     try:
         from rapidfuzz import fuzz
     except ImportError:
@@ -1070,37 +1655,293 @@ def score_segment(event: ExpectedEvent, segment: TranscriptSegment) -> float:
             file=sys.stderr,
         )
         sys.exit(1)
+    return fuzz
 
-    text = segment.text.lower()
-    cue_patterns = EVENT_CUES.get(event.event_type, [])
-    cue_hits = sum(1 for pattern in cue_patterns if re.search(pattern, text, re.I))
 
-    if event.venue_wide:
-        if cue_hits == 0:
-            return 0.0
-        return min(0.5 + 0.15 * cue_hits, 1.0)
+def import_cdist() -> Any:
+    try:
+        import numpy  # noqa: F401  (cdist returns numpy arrays)
+        from rapidfuzz.process import cdist
+    except ImportError:
+        print(
+            "Error: rapidfuzz and numpy are required. "
+            "Install with: pip install -r requirements-transcribe.txt",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return cdist
+
+
+@dataclass
+class SegmentFeatures:
+    text_lower: str
+    cue_hits: dict[str, int]
+    courts: dict[int, bool] = field(default_factory=dict)
+
 
-    score = 0.0
-    if court_regex(event.court_num).search(text):
-        score += 0.35
+class SegmentScorer:
+    """Scores (event, segment) pairs with the per-run work hoisted out of the pair loop.
 
-    home_norm = normalize_team(event.home_team)
-    away_norm = normalize_team(event.away_team)
-    score += 0.25 * (fuzz.partial_ratio(home_norm, text) / 100.0)
-    score += 0.25 * (fuzz.partial_ratio(away_norm, text) / 100.0)
+    Cue regexes and court patterns are compiled once, team names are normalized once,
+    and segment-side features (lowercased text and the cue-hit vector over every event
+    type) are computed once per distinct segment text. Features depend only on the
+    text, so the caches stay valid across rounds and runs.
+    """
 
-    if cue_hits:
-        score += min(0.25, 0.1 * cue_hits)
+    MAX_CACHED_TEXTS = 200_000
 
-    return min(score, 1.0)
+    def __init__(self, workers: int = -1) -> None:
+        self.workers = workers
+        self.cue_patterns: dict[str, list[re.Pattern[str]]] = {
+            event_type: [re.compile(pattern, re.I) for pattern in patterns]
+            for event_type, patterns in EVENT_CUES.items()
+        }
+        self._court_patterns: dict[int, re.Pattern[str]] = {}
+        self._teams: dict[str, str] = {}
+        self._features: dict[str, SegmentFeatures] = {}
+        self._partial: dict[tuple[str, str], float] = {}
+        self._fuzz: Any = None
+
+    @property
+    def fuzz(self) -> Any:
+        if self._fuzz is None:
+            self._fuzz = import_fuzz()
+        return self._fuzz
+
+    def features(self, text: str) -> SegmentFeatures:
+        cached = self._features.get(text)
+        if cached is not None:
+            return cached
+        if len(self._features) >= self.MAX_CACHED_TEXTS:
+            self._features.clear()
+            self._partial.clear()
+        text_lower = text.lower()
+        cached = SegmentFeatures(
+            text_lower=text_lower,
+            cue_hits={
+                event_type: sum(1 for pattern in patterns if pattern.search(text_lower))
+                for event_type, patterns in self.cue_patterns.items()
+            },
+        )
+        self._features[text] = cached
+        return cached
+
+    def court_mentioned(self, features: SegmentFeatures, court_num: int) -> bool:
+        hit = features.courts.get(court_num)
+        if hit is None:
+            pattern = self._court_patterns.get(court_num)
+            if pattern is None:
+                pattern = self._court_patterns[court_num] = court_regex(court_num)
+            hit = features.courts[court_num] = bool(pattern.search(features.text_lower))
+        return hit
+
+    def team(self, name: str) -> str:
+        normalized = self._teams.get(name)
+        if normalized is None:
+            normalized = self._teams[name] = normalize_team(name)
+        return normalized
+
+    def team_similarity(self, team_norm: str, features: SegmentFeatures) -> float:
+        key = (team_norm, features.text_lower)
+        ratio = self._partial.get(key)
+        if ratio is None:
+            ratio = self._partial[key] = self.fuzz.partial_ratio(team_norm, features.text_lower)
+        return ratio
+
+    def team_matrix(self, teams: list[str], texts: list[str]) -> Any:
+        """partial_ratio of every normalized team against every lowercased text.
+
+        One rapidfuzz cdist call across ``workers`` threads; returns a float64 array of
+        shape (len(teams), len(texts)) with the same values as the pairwise path.
+        """
+        import numpy as np
+
+        if not teams or not texts:
+            return np.zeros((len(teams), len(texts)), dtype=np.float64)
+        return import_cdist()(
+            teams,
+            texts,
+            scorer=self.fuzz.partial_ratio,
+            dtype=np.float64,
+            workers=self.workers,
+        )
+
+    def score_matrix(
+        self,
+        events: list[ExpectedEvent],
+        segments: list[TranscriptSegment] | SegmentIndex,
+    ) -> Any:
+        """score() for every (event, segment) pair as a (len(events), len(segments)) array.
+
+        Team similarity for all court events comes from a single team_matrix over the
+        distinct team names and distinct segment texts.
+        """
+        import numpy as np
+
+        features = [self.features(segment.text) for segment in segments]
+        matrix = np.zeros((len(events), len(features)), dtype=np.float64)
+        if not events or not features:
+            return matrix
+
+        text_rows: dict[str, int] = {}
+        text_of = np.array(
+            [text_rows.setdefault(f.text_lower, len(text_rows)) for f in features], dtype=np.intp
+        )
+        team_rows: dict[str, int] = {}
+        for event in events:
+            if not event.venue_wide:
+                team_rows.setdefault(self.team(event.home_team), len(team_rows))
+                team_rows.setdefault(self.team(event.away_team), len(team_rows))
+        ratios = self.team_matrix(list(team_rows), list(text_rows))
+
+        for row, event in enumerate(events):
+            cue_hits = np.array(
+                [f.cue_hits.get(event.event_type, 0) for f in features], dtype=np.float64
+            )
+            if event.venue_wide:
+                matrix[row] = np.where(cue_hits > 0, np.minimum(0.5 + 0.15 * cue_hits, 1.0), 0.0)
+                continue
+            courts = np.array(
+                [self.court_mentioned(f, event.court_num) for f in features], dtype=bool
+            )
+            score = np.where(courts, 0.35, 0.0)
+            score += 0.25 * (ratios[team_rows[self.team(event.home_team)]][text_of] / 100.0)
+            score += 0.25 * (ratios[team_rows[self.team(event.away_team)]][text_of] / 100.0)
+            score += np.where(cue_hits > 0, np.minimum(0.25, 0.1 * cue_hits), 0.0)
+            matrix[row] = np.minimum(score, 1.0)
+        return matrix
+
+    def venue_cues(self, text: str) -> list[str]:
+        cue_hits = self.features(text).cue_hits
+        return [event_type for event_type in VENUE_BUNDLE_CUE_TYPES if cue_hits.get(event_type)]
+
+    def score(self, event: ExpectedEvent, segment: TranscriptSegment) -> float:
+        features = self.features(segment.text)
+        cue_hits = features.cue_hits.get(event.event_type, 0)
+
+        if event.venue_wide:
+            if cue_hits == 0:
+                return 0.0
+            return min(0.5 + 0.15 * cue_hits, 1.0)
+
+        score = 0.0
+        if self.court_mentioned(features, event.court_num):
+            score += 0.35
+
+        score += 0.25 * (self.team_similarity(self.team(event.home_team), features) / 100.0)
+        score += 0.25 * (self.team_similarity(self.team(event.away_team), features) / 100.0)
+
+        if cue_hits:
+            score += min(0.25, 0.1 * cue_hits)
+
+        return min(score, 1.0)
+
+
+_default_scorer: SegmentScorer | None = None
+
+
+def get_scorer() -> SegmentScorer:
+    global _default_scorer
+    if _default_scorer is None:
+        _default_scorer = SegmentScorer()
+    return _default_scorer
+
+
+def score_segment(event: ExpectedEvent, segment: TranscriptSegment) -> float:
+    return get_scorer().score(event, segment)
+
+
+def best_in_row(scores: Any, row: int, lo: int = 0, hi: int | None = None) -> tuple[int | None, float]:
+    """Column of the first strictly positive maximum in scores[row, lo:hi]; (None, 0.0) if none."""
+    window = scores[row, lo:hi]
+    if not window.size:
+        return None, 0.0
+    col = int(window.argmax())
+    best = float(window[col])
+    if best <= 0.0:
+        return None, 0.0
+    return lo + col, best
 
 
 def match_events_to_transcript(
     events: list[ExpectedEvent],
-    segments: list[TranscriptSegment],
+    segments: list[TranscriptSegment] | SegmentIndex,
     tolerance: int,
     min_confidence: float,
+    matcher: str = "assignment",
+) -> list[MatchResult]:
+    """Match a whole day's events in event order; see match_slot_events for ``matcher``."""
+    if matcher == "greedy":
+        return match_events_greedy(events, segments, tolerance, min_confidence)
+    index = SegmentIndex.of(segments)
+    results: list[MatchResult | None] = [None] * len(events)
+    active: list[int] = []
+    rows: list[dict[int, float]] = []
+    for pos, event in enumerate(events):
+        if event.skipped:
+            results[pos] = MatchResult(expected=event, matched=False, status="skipped")
+            continue
+        if event.wav_offset_seconds < 0:
+            results[pos] = MatchResult(expected=event, matched=False, status="before_wav_start")
+            continue
+        window = index.window(
+            event.wav_offset_seconds - tolerance, event.wav_offset_seconds + tolerance
+        )
+        active.append(pos)
+        rows.append({idx: score for idx in window if (score := score_segment(event, index[idx])) > 0.0})
+
+    thresholds = [VENUE_MATCH_THRESHOLD if events[pos].venue_wide else min_confidence for pos in active]
+    matched = assignment_results([events[pos] for pos in active], rows, thresholds, index, tolerance)
+    for pos, result in zip(active, matched):
+        results[pos] = result
+    return [result for result in results if result is not None]
+
+
+def match_clip_hits(
+    events: list[ExpectedEvent],
+    hits: list[Any],
+    tolerance: int,
 ) -> list[MatchResult]:
+    """Match venue-wide events to overhead_clips hits of the clip named after their event type.
+
+    Hits stand in for transcript segments (text ``[clip NAME]``, score = NCC), so the
+    statuses and the one-hit-per-event assignment are the same as for a transcript.
+    """
+    hits = sorted(hits, key=lambda hit: hit.start)
+    index = SegmentIndex(
+        (TranscriptSegment(hit.start, hit.end, f"[clip {hit.name}]") for hit in hits), presorted=True
+    )
+    results: list[MatchResult | None] = [None] * len(events)
+    active: list[int] = []
+    rows: list[dict[int, float]] = []
+    for pos, event in enumerate(events):
+        if event.skipped:
+            results[pos] = MatchResult(expected=event, matched=False, status="skipped")
+            continue
+        if event.wav_offset_seconds < 0:
+            results[pos] = MatchResult(expected=event, matched=False, status="before_wav_start")
+            continue
+        window = index.window(
+            event.wav_offset_seconds - tolerance, event.wav_offset_seconds + tolerance
+        )
+        active.append(pos)
+        rows.append({idx: hits[idx].score for idx in window if hits[idx].name == event.event_type})
+
+    matched = assignment_results(
+        [events[pos] for pos in active], rows, [0.0] * len(active), index, tolerance
+    )
+    for pos, result in zip(active, matched):
+        results[pos] = result
+    return [result for result in results if result is not None]
+
+
+def match_events_greedy(
+    events: list[ExpectedEvent],
+    segments: list[TranscriptSegment] | SegmentIndex,
+    tolerance: int,
+    min_confidence: float,
+) -> list[MatchResult]:
+    index = SegmentIndex.of(segments)
     results: list[MatchResult] = []
     used_segment_indices: set[int] = set()
 
@@ -1113,18 +1954,16 @@ def match_events_to_transcript(
             results.append(MatchResult(expected=event, matched=False, status="before_wav_start"))
             continue
 
-        threshold = 0.35 if event.venue_wide else min_confidence
+        threshold = VENUE_MATCH_THRESHOLD if event.venue_wide else min_confidence
         window_start = event.wav_offset_seconds - tolerance
         window_end = event.wav_offset_seconds + tolerance
 
         best_idx: int | None = None
         best_score = 0.0
-        for idx, segment in enumerate(segments):
+        for idx in index.window(window_start, window_end):
             if idx in used_segment_indices:
                 continue
-            if segment.start < window_start or segment.start > window_end:
-                continue
-            score = score_segment(event, segment)
+            score = score_segment(event, index[idx])
             if score > best_score:
                 best_score = score
                 best_idx = idx
@@ -1140,7 +1979,7 @@ def match_events_to_transcript(
             )
             continue
 
-        segment = segments[best_idx]
+        segment = index[best_idx]
         used_segment_indices.add(best_idx)
         drift = segment.start - event.wav_offset_seconds
         results.append(
@@ -1160,32 +1999,29 @@ def match_events_to_transcript(
 
 def infer_wav_start_time(
     events: list[ExpectedEvent],
-    segments: list[TranscriptSegment],
+    segments: list[TranscriptSegment] | SegmentIndex,
     tolerance: int,
     min_confidence: float,
 ) -> str | None:
     start_events = [
         e for e in events if e.event_type == "court_announcement" and not e.skipped
     ]
-    if not start_events or not segments:
+    index = SegmentIndex.of(segments)
+    if not start_events or not len(index):
         return None
 
-    best_anchor: int | None = None
-    best_score = 0.0
-
-    for event in start_events[:12]:
-        for segment in segments:
-            if segment.start > 3600:
-                break
-            score = score_segment(event, segment)
-            if score >= min_confidence and score > best_score:
-                inferred_anchor = event.wall_seconds - int(round(segment.start))
-                best_score = score
-                best_anchor = inferred_anchor
+    probes = start_events[:12]
+    first_hour = index.between(float("-inf"), 3600)
+    if not first_hour:
+        return None
 
-    if best_anchor is None:
+    # argmax over the flattened matrix keeps the first (event, segment) in scan order.
+    scores = get_scorer().score_matrix(probes, first_hour)
+    row, col = divmod(int(scores.argmax()), scores.shape[1])
+    best_score = float(scores[row, col])
+    if best_score <= 0.0 or best_score < min_confidence:
         return None
-    return seconds_to_hm(best_anchor)
+    return seconds_to_hm(probes[row].wall_seconds - int(round(first_hour[col].start)))
 
 
 def get_wav_duration(wav_path: Path) -> float:
@@ -1208,57 +2044,174 @@ def transcribe_wav(
     model_name: str,
     cache_path: Path | None,
     force_retranscribe: bool,
+    workers: int = 1,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    chunk_store: TranscriptChunkStore | None = None,
+    cpu_threads: int | None = None,
+    word_timestamps: bool = False,
+    speech: SpeechRegions | None = None,
+    transcription: dict | None = None,
 ) -> list[TranscriptSegment]:
-    if cache_path and cache_path.exists() and not force_retranscribe:
-        data = json.loads(cache_path.read_text(encoding="utf-8"))
-        return [TranscriptSegment(**item) for item in data["segments"]]
+    progress = None
+    for progress in stream_transcript(
+        wav_path,
+        model_name,
+        cache_path,
+        force_retranscribe,
+        workers,
+        chunk_seconds,
+        overlap_seconds,
+        chunk_store,
+        cpu_threads,
+        word_timestamps,
+        speech,
+        transcription,
+    ):
+        pass
+    assert progress is not None
+    return progress.segments
 
-    try:
-        from faster_whisper import WhisperModel
-    except ImportError:
-        print(
-            "Error: faster-whisper is required. Install with: pip install -r requirements-transcribe.txt",
-            file=sys.stderr,
-        )
-        sys.exit(1)
 
+def stream_transcript(
+    wav_path: Path,
+    model_name: str,
+    cache_path: Path | None,
+    force_retranscribe: bool,
+    workers: int = 1,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    chunk_store: TranscriptChunkStore | None = None,
+    cpu_threads: int | None = None,
+    word_timestamps: bool = False,
+    speech: SpeechRegions | None = None,
+    transcription: dict | None = None,
+) -> Iterator[TranscriptProgress]:
+    """transcribe_wav as a stream of partial transcripts; the cache is written once done.
+
+    ``word_timestamps`` has whisper time every word, so bundled segments can later be
+    split in memory (split_on_cue_phrases) instead of re-transcribed. A cache written
+    without word timings does not satisfy a run that asks for them. With ``speech``
+    (overhead_vad.py regions) whisper only transcribes those regions. The run's
+    TranscriptionStats (or those cached with the transcript) go into ``transcription``.
+    """
+    cached = read_transcript_file(cache_path) if cache_path and not force_retranscribe else None
+    if cached is not None:
+        meta, segments = cached
+        if word_timestamps and not meta.get("word_timestamps"):
+            print(f"Transcript cache {cache_path} has no word timings; re-transcribing", file=sys.stderr)
+        elif transcript_cache_is_current(meta, wav_path):
+            if transcription is not None:
+                transcription.update(meta.get("transcription") or {}, from_cache=True)
+            yield TranscriptProgress(segments=segments, settled_until=float("inf"), done=True)
+            return
+        else:
+            print(
+                f"Transcript cache {cache_path} is older than {wav_path}; "
+                "re-transcribing changed chunks only",
+                file=sys.stderr,
+            )
+
+    if chunk_seconds > 0:
+        for progress in stream_chunked(
+            wav_path,
+            model_name,
+            get_wav_duration(wav_path),
+            workers,
+            chunk_seconds=chunk_seconds,
+            overlap_seconds=overlap_seconds,
+            cpu_threads=cpu_threads,
+            store=chunk_store or TranscriptChunkStore.beside(wav_path),
+            force=force_retranscribe,
+            word_timestamps=word_timestamps,
+            speech=speech,
+        ):
+            if progress.done and progress.stats is not None:
+                print_transcription_stats(progress.stats)
+                if transcription is not None:
+                    transcription.update(progress.stats.as_dict())
+                write_transcript_cache(
+                    cache_path, wav_path, model_name, progress.segments, progress.stats.as_dict()
+                )
+            yield progress
+        return
+
+    started = time.perf_counter()
+    clips = speech.window(0.0, speech.duration) if speech is not None else None
+
+    model = get_model_pool().model(model_name)
     print(f"Transcribing {wav_path} with model={model_name} ...", file=sys.stderr)
-    model = WhisperModel(model_name, device="cpu", compute_type="int8")
-    segments_iter, _info = model.transcribe(str(wav_path), vad_filter=True)
+    segments_iter: Iterable[Any] = []
+    if clips is None or clips:
+        segments_iter, _info = model.transcribe(str(wav_path), **transcribe_options(word_timestamps, clips))
 
+    # A single pass emits segments in order, so everything before the latest start is final.
     segments: list[TranscriptSegment] = []
     for segment in segments_iter:
         text = segment.text.strip()
         if text:
             segments.append(
-                TranscriptSegment(start=segment.start, end=segment.end, text=text)
+                TranscriptSegment(
+                    start=segment.start, end=segment.end, text=text, words=piece_words(segment, 0.0)
+                )
             )
-
-    if cache_path:
-        cache_path.write_text(
-            json.dumps(
-                {
-                    "wav_path": str(wav_path),
-                    "model": model_name,
-                    "segments": [asdict(s) for s in segments],
-                },
-                indent=2,
-            ),
-            encoding="utf-8",
+            yield TranscriptProgress(segments=segments, settled_until=segment.start)
+
+    stats = None
+    if speech is not None:
+        wall = time.perf_counter() - started
+        stats = TranscriptionStats(
+            chunks=1,
+            workers=1,
+            audio_seconds=speech.duration,
+            wall_seconds=wall,
+            serial_seconds=wall,
+            speech_seconds=speech.speech_seconds,
+            skipped_seconds=speech.duration - speech.speech_seconds,
+            vad_seconds=speech.build_seconds,
+        )
+        stats.saved_seconds = prefilter_savings(
+            wall, speech.speech_seconds, stats.skipped_seconds, speech.build_seconds
         )
-        print(f"Cached transcript: {cache_path}", file=sys.stderr)
+        print_transcription_stats(stats)
+        if transcription is not None:
+            transcription.update(stats.as_dict())
+    write_transcript_cache(cache_path, wav_path, model_name, segments, stats.as_dict() if stats else None)
+    yield TranscriptProgress(segments=segments, settled_until=float("inf"), done=True, stats=stats)
+
+
+def transcript_cache_is_current(data: dict, wav_path: Path) -> bool:
+    """False only when the cache records a wav size/mtime that no longer matches."""
+    if "wav_size" not in data or not wav_path.exists():
+        return True
+    stat = wav_path.stat()
+    return data["wav_size"] == stat.st_size and data.get("wav_mtime_ns") == stat.st_mtime_ns
+
 
-    return segments
+def write_transcript_cache(
+    cache_path: Path | None,
+    wav_path: Path,
+    model_name: str,
+    segments: list[TranscriptSegment],
+    transcription: dict | None = None,
+) -> None:
+    if not cache_path:
+        return
+    meta: dict = {"wav_path": str(wav_path), "model": model_name}
+    if wav_path.exists():
+        stat = wav_path.stat()
+        meta["wav_size"] = stat.st_size
+        meta["wav_mtime_ns"] = stat.st_mtime_ns
+    if transcription:
+        meta["transcription"] = transcription
+    if any(segment.words is not None for segment in segments):
+        meta["word_timestamps"] = True
+    write_transcript_file(cache_path, meta, segments)
+    print(f"Cached transcript: {cache_path}", file=sys.stderr)
 
 
 def venue_cues_in_text(text: str) -> list[str]:
-    text_lower = text.lower()
-    hits: list[str] = []
-    for event_type in VENUE_BUNDLE_CUE_TYPES:
-        patterns = EVENT_CUES.get(event_type, [])
-        if any(re.search(pattern, text_lower, re.I) for pattern in patterns):
-            hits.append(event_type)
-    return hits
+    return get_scorer().venue_cues(text)
 
 
 def is_bundled_segment(segment: TranscriptSegment) -> bool:
@@ -1268,168 +2221,248 @@ def is_bundled_segment(segment: TranscriptSegment) -> bool:
     return bool(hits and len(segment.text) > 120)
 
 
+def split_on_cue_phrases(segment: TranscriptSegment) -> list[TranscriptSegment]:
+    """Cut a segment with word timings before every CUE_PHRASE_START_RE match.
+
+    Each piece spans its own words, so a bundle of several PA cues becomes one
+    segment per cue without touching the audio. Segments without words come back
+    unchanged.
+    """
+    if not segment.words:
+        return [segment]
+    offsets: list[int] = []
+    text = ""
+    for _start, _end, word in segment.words:
+        offsets.append(len(text))
+        text += word
+    cuts = {bisect_right(offsets, match.start()) - 1 for match in CUE_PHRASE_START_RE.finditer(text)}
+    bounds = sorted(cuts | {0, len(segment.words)})
+    pieces: list[TranscriptSegment] = []
+    for first, last in zip(bounds, bounds[1:]):
+        words = segment.words[first:last]
+        piece_text = "".join(word for _start, _end, word in words).strip()
+        if piece_text:
+            pieces.append(TranscriptSegment(start=words[0][0], end=words[-1][1], text=piece_text, words=words))
+    return pieces or [segment]
+
+
 def get_refinement_model(model_name: str) -> Any:
-    if model_name not in _refine_model_cache:
-        try:
-            from faster_whisper import WhisperModel
-        except ImportError:
-            print(
-                "Error: faster-whisper is required. Install with: pip install -r requirements-transcribe.txt",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-        print(f"Loading bundled-cue refinement model={model_name} ...", file=sys.stderr)
-        _refine_model_cache[model_name] = WhisperModel(
-            model_name, device="cpu", compute_type="int8"
-        )
-    return _refine_model_cache[model_name]
+    return get_model_pool().model(model_name)
 
 
 def load_refinement_cache(path: Path | None) -> dict:
-    if path and path.exists():
-        return json.loads(path.read_text(encoding="utf-8"))
-    return {"chunk_sec": None, "refine_model": None, "entries": {}}
+    data = read_refinement_file(path) if path else None
+    return data or {"chunk_sec": None, "refine_model": None, "entries": {}}
 
 
 def save_refinement_cache(path: Path | None, data: dict) -> None:
     if path:
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        write_refinement_file(path, data)
 
 
-def refine_bundled_segment(
-    wav_path: Path,
-    segment: TranscriptSegment,
-    model: Any,
-    chunk_sec: int,
-    workdir: Path,
-) -> list[TranscriptSegment]:
+def get_refinement_pipeline(model_name: str) -> Any:
+    return get_model_pool().pipeline(model_name)
+
+
+def refinement_sub_chunks(segment: TranscriptSegment, chunk_sec: int) -> list[tuple[float, float]]:
+    """Absolute (start, end) wav seconds of the sub-chunks a bundled segment is re-read in."""
     start = max(0.0, segment.start - 1.0)
     end = max(segment.end, segment.start + 2.0)
     duration = max(end - start, 3.0)
 
-    clip = workdir / f"clip_{int(segment.start * 10)}.wav"
-    subprocess.run(
-        [
-            "ffmpeg",
-            "-y",
-            "-ss",
-            str(start),
-            "-t",
-            str(duration),
-            "-i",
-            str(wav_path),
-            "-ac",
-            "1",
-            "-ar",
-            "16000",
-            str(clip),
-        ],
-        capture_output=True,
-        check=True,
-    )
-
-    refined: list[TranscriptSegment] = []
+    sub_chunks: list[tuple[float, float]] = []
     sub_starts = list(range(0, int(duration), chunk_sec)) if duration > chunk_sec else [0]
-
     for sub_off in sub_starts:
         sub_dur = min(float(chunk_sec), duration - sub_off)
         if sub_dur < 1.5:
             continue
-        sub_clip = workdir / f"sub_{int(segment.start * 10)}_{sub_off}.wav"
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-y",
-                "-ss",
-                str(sub_off),
-                "-t",
-                str(sub_dur),
-                "-i",
-                str(clip),
-                "-ac",
-                "1",
-                "-ar",
-                "16000",
-                str(sub_clip),
-            ],
-            capture_output=True,
-            check=True,
-        )
-        segments_iter, _info = model.transcribe(str(sub_clip), vad_filter=True)
-        for piece in segments_iter:
-            text = piece.text.strip()
-            if not text:
-                continue
-            abs_start = start + sub_off + piece.start
-            abs_end = start + sub_off + piece.end
-            refined.append(TranscriptSegment(start=abs_start, end=abs_end, text=text))
+        sub_chunks.append((start + sub_off, start + sub_off + sub_dur))
+    return sub_chunks
+
 
+def refine_bundled_segments(
+    audio: Any,
+    audio_start: float,
+    segments: list[TranscriptSegment],
+    pipeline: Any,
+    chunk_sec: int,
+    batch_size: int = REFINE_BATCH_SIZE,
+    stats: RefinementStats | None = None,
+    speech: SpeechRegions | None = None,
+) -> list[list[TranscriptSegment]]:
+    """Re-transcribe bundled segments from an in-memory 16 kHz buffer in one batched pass.
+
+    audio holds the wav from audio_start onwards. Every sub-chunk of every segment is
+    trimmed to its VAD speech extent (taken from ``speech`` when the wav has a
+    prefilter index, else from Silero), packed into one buffer and sent through the
+    batched pipeline as clip_timestamps; results come back per input segment.
+    """
+    import numpy as np
+
+    gap = np.zeros(int(REFINE_PACK_GAP_SECONDS * SAMPLE_RATE), dtype=np.float32)
+    pieces: list[Any] = []
+    clips: list[dict[str, float]] = []
+    # (packed start, wav start, owning segment) per clip, in packed order
+    placements: list[tuple[float, float, int]] = []
+    packed = 0
+
+    for owner, segment in enumerate(segments):
+        for sub_start, sub_end in refinement_sub_chunks(segment, chunk_sec):
+            first = max(0, int(round((sub_start - audio_start) * SAMPLE_RATE)))
+            last = min(len(audio), int(round((sub_end - audio_start) * SAMPLE_RATE)))
+            sub_audio = audio[first:last]
+            if not len(sub_audio):
+                continue
+            if speech is None:
+                spans = vad_speech_spans(sub_audio, 0.0)
+            else:
+                sub_offset = audio_start + first / SAMPLE_RATE
+                spans = speech.window(sub_offset, sub_offset + len(sub_audio) / SAMPLE_RATE)
+                spans = [(lo - sub_offset, hi - sub_offset) for lo, hi in spans]
+            if not spans:
+                continue
+            lo = max(0, int(spans[0][0] * SAMPLE_RATE))
+            hi = min(len(sub_audio), int(spans[-1][1] * SAMPLE_RATE))
+            if hi <= lo:
+                continue
+            clip = sub_audio[lo:hi]
+            clips.append({"start": packed / SAMPLE_RATE, "end": (packed + len(clip)) / SAMPLE_RATE})
+            placements.append((packed / SAMPLE_RATE, (first + lo) / SAMPLE_RATE + audio_start, owner))
+            pieces.extend((clip, gap))
+            packed += len(clip) + len(gap)
+
+    refined: list[list[TranscriptSegment]] = [[] for _ in segments]
+    if stats is not None:
+        stats.sub_chunks += len(clips)
+        stats.audio_seconds += sum(c["end"] - c["start"] for c in clips)
+    if not clips:
+        return refined
+
+    if stats is not None:
+        stats.batches += 1
+    packed_starts = [placement[0] for placement in placements]
+    pieces_iter, _info = pipeline.transcribe(
+        np.concatenate(pieces), clip_timestamps=clips, batch_size=batch_size
+    )
+    for piece in pieces_iter:
+        text = piece.text.strip()
+        if not text:
+            continue
+        clip_idx = max(0, bisect_right(packed_starts, piece.start) - 1)
+        packed_start, wav_start, owner = placements[clip_idx]
+        refined[owner].append(
+            TranscriptSegment(
+                start=wav_start + piece.start - packed_start,
+                end=wav_start + piece.end - packed_start,
+                text=text,
+            )
+        )
+    for items in refined:
+        items.sort(key=lambda item: item.start)
     return refined
 
 
 def augment_slot_segments(
-    segments: list[TranscriptSegment],
+    segments: list[TranscriptSegment] | SegmentIndex,
     slot_anchor: float,
     wav_path: Path,
     refine_model: str,
     chunk_sec: int,
     refine_cache: dict | None,
     pre_seconds: int = 30,
-    post_seconds: int = 26 * 60,
-) -> tuple[list[TranscriptSegment], list[dict]]:
+    post_seconds: int = SLOT_POST_SECONDS,
+    stats: RefinementStats | None = None,
+    speech: SpeechRegions | None = None,
+) -> tuple[SegmentIndex, list[dict]]:
+    index = SegmentIndex.of(segments)
     window_start = slot_anchor - pre_seconds
     window_end = slot_anchor + post_seconds
 
     bundled_indices = [
         idx
-        for idx, segment in enumerate(segments)
-        if window_start <= segment.start <= window_end and is_bundled_segment(segment)
+        for idx in index.window(window_start, window_end)
+        if is_bundled_segment(index[idx])
     ]
     if not bundled_indices:
-        return segments, []
+        return index, []
 
-    model = get_refinement_model(refine_model)
     cache_entries = refine_cache.setdefault("entries", {}) if refine_cache is not None else {}
-    refinements: list[dict] = []
+    refined_by_idx: dict[int, list[TranscriptSegment]] = {}
+    pending: list[int] = []
+    split = 0
+    for idx in bundled_indices:
+        cache_key = f"{index[idx].start:.1f}"
+        if index[idx].words:
+            refined_by_idx[idx] = split_on_cue_phrases(index[idx])
+            split += 1
+        elif refine_cache is not None and cache_key in cache_entries:
+            refined_by_idx[idx] = [
+                TranscriptSegment.from_dict(item) for item in cache_entries[cache_key]["segments"]
+            ]
+        else:
+            pending.append(idx)
 
-    with tempfile.TemporaryDirectory(prefix="overhead_refine_") as tmp:
-        workdir = Path(tmp)
-        for idx in bundled_indices:
-            segment = segments[idx]
-            cache_key = f"{segment.start:.1f}"
-            if refine_cache is not None and cache_key in cache_entries:
-                refined = [
-                    TranscriptSegment(**item) for item in cache_entries[cache_key]["segments"]
-                ]
-            else:
-                refined = refine_bundled_segment(
-                    wav_path, segment, model, chunk_sec, workdir
-                )
-                if refine_cache is not None:
-                    cache_entries[cache_key] = {
-                        "original_text": segment.text,
-                        "segments": [asdict(item) for item in refined],
-                    }
-
-            refinements.append(
-                {
-                    "original_start": segment.start,
-                    "original_text": segment.text.strip(),
-                    "cues": venue_cues_in_text(segment.text),
-                    "refined": refined,
+    started = time.perf_counter()
+    if pending:
+        # One decode for the span of every pending bundle, sliced in memory from here on.
+        sub_chunks = [
+            sub for idx in pending for sub in refinement_sub_chunks(index[idx], chunk_sec)
+        ]
+        audio_start = min((sub[0] for sub in sub_chunks), default=0.0)
+        audio_end = max((sub[1] for sub in sub_chunks), default=0.0)
+        audio = decode_pcm_range(wav_path, audio_start, audio_end - audio_start)
+        batch = refine_bundled_segments(
+            audio,
+            audio_start,
+            [index[idx] for idx in pending],
+            get_refinement_pipeline(refine_model),
+            chunk_sec,
+            stats=stats,
+            speech=speech,
+        )
+        for idx, refined in zip(pending, batch):
+            refined_by_idx[idx] = refined
+            if refine_cache is not None:
+                cache_entries[f"{index[idx].start:.1f}"] = {
+                    "original_text": index[idx].text,
+                    "segments": [item.as_dict() for item in refined],
                 }
-            )
+    if stats is not None:
+        stats.segments += len(bundled_indices)
+        stats.cached_segments += len(bundled_indices) - len(pending) - split
+        stats.split_segments += split
+        stats.wall_seconds += time.perf_counter() - started
+
+    refinements: list[dict] = []
+    for idx in bundled_indices:
+        segment = index[idx]
+        refinements.append(
+            {
+                "original_start": segment.start,
+                "original_text": segment.text.strip(),
+                "cues": venue_cues_in_text(segment.text),
+                "refined": refined_by_idx[idx],
+            }
+        )
 
     if refine_cache is not None:
         refine_cache["chunk_sec"] = chunk_sec
         refine_cache["refine_model"] = refine_model
 
-    bundled_set = set(bundled_indices)
-    merged = [segment for idx, segment in enumerate(segments) if idx not in bundled_set]
-    for item in refinements:
-        merged.extend(item["refined"])
-    merged.sort(key=lambda segment: segment.start)
-    return merged, refinements
+    refined = [segment for item in refinements for segment in item["refined"]]
+    return index.replaced(bundled_indices, refined), refinements
+
+
+def print_refinement_stats(stats: RefinementStats) -> None:
+    refined = stats.segments - stats.cached_segments - stats.split_segments
+    print(
+        f"Refined {refined}/{stats.segments} bundled segment(s) "
+        f"({stats.cached_segments} from cache, {stats.split_segments} split on word timings) "
+        f"as {stats.sub_chunks} sub-chunk(s) in "
+        f"{stats.batches} batch(es), {stats.wall_seconds:.1f}s "
+        f"({stats.segments_per_second:.2f} refined segments/s)",
+        file=sys.stderr,
+    )
 
 
 def print_refined_bundles(refinements: list[dict], chunk_sec: int) -> None:
@@ -1569,7 +2602,9 @@ def print_results_table(results: list[MatchResult]) -> None:
 
 
 def write_report(report: VerificationReport, output_path: Path) -> None:
-    output_path.write_text(json.dumps(asdict(report), indent=2), encoding="utf-8")
+    # Events are already plain dicts; a shallow dump skips asdict's deep copy of them.
+    payload = {item.name: getattr(report, item.name) for item in fields(report)}
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     print(f"\nReport written: {output_path}", file=sys.stderr)
 
 
@@ -1606,6 +2641,13 @@ def parse_args() -> argparse.Namespace:
         default=0.55,
         help="Minimum match score for court announcements (default: 0.55)",
     )
+    parser.add_argument(
+        "--matcher",
+        choices=("assignment", "greedy"),
+        default="assignment",
+        help="How segments are paired with expected events: 'assignment' maximizes the total "
+        "score over each window (default); 'greedy' takes events one at a time in order",
+    )
     parser.add_argument(
         "--match-rate-threshold",
         type=float,
@@ -1636,13 +2678,55 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--transcript-cache",
         type=Path,
-        help="Path to transcript JSON cache (default: {wav}.transcript.json)",
+        help="Transcript cache; a .json path is written as JSON (default: {wav}.transcript.cols)",
     )
     parser.add_argument(
         "--retranscribe",
         action="store_true",
         help="Ignore cached transcript and re-run whisper",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Whisper worker processes transcribing VAD-bounded chunks in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=DEFAULT_CHUNK_SECONDS,
+        help=(
+            f"Target chunk length; each finished chunk is checkpointed so interrupted runs "
+            f"resume (default: {DEFAULT_CHUNK_SECONDS:.0f}; 0 = single pass, no checkpoints)"
+        ),
+    )
+    parser.add_argument(
+        "--chunk-overlap",
+        type=float,
+        default=DEFAULT_OVERLAP_SECONDS,
+        help=f"Seconds decoded past each chunk edge (default: {DEFAULT_OVERLAP_SECONDS:.0f})",
+    )
+    parser.add_argument(
+        "--word-timestamps",
+        action="store_true",
+        help=(
+            "Have whisper time every word so bundled cues are split in memory instead of "
+            "re-transcribed with --refine-model"
+        ),
+    )
+    parser.add_argument(
+        "--vad-prefilter",
+        action="store_true",
+        help=(
+            "Transcribe and refine only the speech regions found by overhead_vad.py "
+            "(index persisted under .overhead_pcm/) instead of feeding whisper the whole wav"
+        ),
+    )
+    parser.add_argument(
+        "--transcript-chunk-dir",
+        type=Path,
+        help="Chunk checkpoint store shared by wavs in one folder (default: {wav_dir}/.overhead_transcript_chunks)",
+    )
     parser.add_argument(
         "--output-report",
         type=Path,
@@ -1664,6 +2748,50 @@ def parse_args() -> argparse.Namespace:
         metavar="N",
         help="With --by-round, show full detail for round N only (1-based)",
     )
+    parser.add_argument(
+        "--clip",
+        action="append",
+        default=[],
+        metavar="EVENT_TYPE=PATH",
+        help="Reference recording of a soundboard cue, e.g. transition_2min=two_minutes.wav "
+        "(repeatable). Venue-wide cues with a clip are verified by locating the clip in the "
+        "audio instead of transcribing; other names are only counted",
+    )
+    parser.add_argument(
+        "--clip-preset",
+        action="append",
+        default=[],
+        help="Count playbacks of a CLIP_PRESETS clip from inject_no_blocking.py (under --band-dir)",
+    )
+    parser.add_argument(
+        "--band-dir",
+        type=Path,
+        help="GarageBand project holding the --clip-preset clips (default: inject_no_blocking.py's)",
+    )
+    parser.add_argument(
+        "--clip-threshold",
+        type=float,
+        default=0.5,
+        help="Minimum normalized cross-correlation for a clip playback (default: 0.5)",
+    )
+    parser.add_argument(
+        "--align",
+        action="store_true",
+        help="With --by-round, anchor rounds from one whole-day alignment of the cue timeline "
+        "(per-cue drift curve) instead of each round's own anchor search; needs the full transcript first",
+    )
+    parser.add_argument(
+        "--align-band",
+        type=float,
+        default=300.0,
+        help="With --align, largest drift in seconds the alignment considers (default: 300)",
+    )
+    parser.add_argument(
+        "--drift-curve",
+        type=Path,
+        help="With --align, write the per-cue drift curve CSV here "
+        "(default: {wav_stem}_overhead_drift.csv beside the report)",
+    )
     parser.add_argument(
         "--no-refine-bundled",
         action="store_true",
@@ -1683,13 +2811,205 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--refine-cache",
         type=Path,
-        help="Cache refined bundled segments (default: {transcript}.refined.json)",
+        help="Cache refined bundled segments (default: {transcript}.refined.cols)",
+    )
+    parser.add_argument(
+        "--injections",
+        type=Path,
+        nargs="?",
+        const=True,
+        help=(
+            "With --by-round on an injected wav: reuse the transcript of the wav it was made from and "
+            "re-transcribe only around the clips listed in this sidecar (default: {wav}.injections.json)"
+        ),
     )
+    add_model_pool_arguments(parser)
+    from overhead_follow import add_follow_arguments
+
+    add_follow_arguments(parser)
     return parser.parse_args()
 
 
+def verify_injected_by_round(
+    args: argparse.Namespace,
+    games: list[Game],
+    wav_start_time: str,
+    skip_ranges: list[tuple[int, int]],
+    courts: list[int],
+    cache_path: Path,
+) -> int:
+    from overhead_inject_common import load_injection_base
+
+    sidecar = None if args.injections is True else args.injections
+    base = load_injection_base(args.wav, sidecar)
+    if base is None:
+        print(
+            f"Error: no current transcript found by following the injections sidecar of {args.wav}; "
+            "run without --injections to transcribe it",
+            file=sys.stderr,
+        )
+        return 1
+    print(
+        f"Reusing transcript of {base.wav_path} outside {len(base.changed_ranges)} injected clip(s) "
+        f"({len(base.sidecars)} sidecar(s))",
+        file=sys.stderr,
+    )
+    refine_cache_path = args.refine_cache or refinement_cache_path(cache_path)
+    refine_cache = None
+    if not args.no_refine_bundled:
+        # Seeded from the base: a cache already beside the output wav may come from an
+        # earlier injection at other insert points, and its entries there are stale.
+        refine_cache = load_refinement_cache(base.refine_cache_path)
+    payload = verify_overhead(
+        args.wav,
+        games,
+        wav_start_time,
+        transcript=base.segments,
+        changed_ranges=base.changed_ranges,
+        model_name=base.model_name,
+        tolerance=args.tolerance,
+        min_confidence=args.min_confidence,
+        skip_ranges=skip_ranges,
+        skip_before=args.skip_before,
+        refine_bundled=not args.no_refine_bundled,
+        refine_model=args.refine_model,
+        refine_chunk_sec=args.refine_chunk_sec,
+        refine_cache=refine_cache,
+        cache_path=cache_path,
+        schedule={"schedule_dir": str(args.schedule_dir.resolve()), "date": args.date, "courts": courts},
+        output_report=args.output_report
+        or args.wav.with_name(f"{args.wav.stem}_overhead_by_round_report.json"),
+        verbose=True,
+        matcher=args.matcher,
+        vad_prefilter=args.vad_prefilter,
+    )
+    if refine_cache is not None:
+        save_refinement_cache(refine_cache_path, refine_cache)
+    rounds = payload["rounds"]
+    passed = sum(1 for r in rounds if r["summary"]["match_rate"] >= args.match_rate_threshold)
+    print("-" * 72)
+    print(f"Rounds passed: {passed}/{len(rounds)}")
+    return 0 if passed == len(rounds) else 1
+
+
+def verify_clips(
+    args: argparse.Namespace,
+    events: list[ExpectedEvent],
+    wav_start_time: str,
+) -> int:
+    """Venue-wide cues checked by locating their reference clips in the audio; no transcription."""
+    from overhead_audio import OverheadAudio
+    from overhead_clips import find_clips, load_clip_templates
+
+    try:
+        templates = load_clip_templates(args.clip, args.clip_preset, args.band_dir)
+    except (ValueError, FileNotFoundError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    names = {template.name for template in templates}
+    clip_events = [e for e in events if e.venue_wide and e.event_type in names]
+    started = time.perf_counter()
+    hits = find_clips(OverheadAudio.open(args.wav), templates, args.clip_threshold)
+    detect_seconds = time.perf_counter() - started
+    print(
+        f"Found {len(hits)} clip playback(s) for {len(templates)} clip(s) in {detect_seconds:.1f}s",
+        file=sys.stderr,
+    )
+
+    results = match_clip_hits(clip_events, hits, args.tolerance)
+    summary = build_summary(results, [])
+    print_results_table(results)
+    print()
+    print("Summary")
+    print(f"  Match rate: {summary['match_rate']:.1%} ({summary['matched']}/{summary['total_events']})")
+    if summary["max_drift_seconds"] is not None:
+        print(f"  Max drift: {summary['max_drift_seconds']}s")
+    for template in templates:
+        if template.name not in VENUE_WIDE_EVENTS:
+            count = sum(1 for hit in hits if hit.name == template.name)
+            print(f"  {template.name}: played {count} time(s) (not a scheduled cue)")
+
+    output_report = args.output_report or args.wav.with_name(
+        f"{args.wav.stem}_overhead_clip_report.json"
+    )
+    output_report.write_text(
+        json.dumps(
+            {
+                "wav_path": str(args.wav),
+                "wav_start_time": wav_start_time,
+                "tolerance_seconds": args.tolerance,
+                "clip_threshold": args.clip_threshold,
+                "detect_seconds": round(detect_seconds, 2),
+                "clips": [{"name": t.name, "duration": round(t.duration, 3)} for t in templates],
+                "hits": [
+                    {"name": h.name, "start": round(h.start, 5), "sample": h.sample, "score": h.score}
+                    for h in hits
+                ],
+                "summary": summary,
+                "matches": serialize_match_results(results),
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"\nReport written: {output_report}", file=sys.stderr)
+    if not clip_events:
+        print("Verification failed: no --clip is named after a venue-wide cue.", file=sys.stderr)
+        return 1
+    return 0 if summary["match_rate"] >= args.match_rate_threshold else 1
+
+
+def align_by_round(
+    args: argparse.Namespace,
+    games: list[Game],
+    wav_start_time: str,
+    skip_ranges: list[tuple[int, int]],
+    segments: list[TranscriptSegment],
+) -> dict[int, float]:
+    """Run the whole-day cue alignment, write its drift curve and return per-round anchors."""
+    from overhead_align import align_timeline, round_anchors, write_drift_curve
+
+    points = align_timeline(
+        games,
+        segments,
+        wav_start_time,
+        skip_ranges,
+        args.skip_before,
+        min_confidence=args.min_confidence,
+        band_seconds=args.align_band,
+    )
+    curve_path = args.drift_curve or (args.output_report or args.wav).with_name(
+        f"{args.wav.stem}_overhead_drift.csv"
+    )
+    write_drift_curve(curve_path, points)
+    matched = [p for p in points if p.matched]
+    if matched:
+        drifts = [p.drift_seconds for p in matched]
+        print(
+            f"Aligned {len(points)} cues ({len(matched)} heard), drift {min(drifts):+.0f}s to {max(drifts):+.0f}s",
+            file=sys.stderr,
+        )
+    print(f"Drift curve: {curve_path}", file=sys.stderr)
+    return round_anchors(points)
+
+
+def speech_regions_from_args(args: argparse.Namespace) -> SpeechRegions | None:
+    if not args.vad_prefilter:
+        return None
+    speech = speech_regions(args.wav)
+    print_speech_regions(speech)
+    return speech
+
+
+def chunk_store_from_args(args: argparse.Namespace) -> TranscriptChunkStore | None:
+    if args.transcript_chunk_dir:
+        return TranscriptChunkStore(args.transcript_chunk_dir)
+    return None
+
+
 def main() -> int:
     args = parse_args()
+    configure_model_pool_from_args(args)
 
     if not args.timeline_only and not args.wav.exists():
         print(f"Error: WAV file not found: {args.wav}", file=sys.stderr)
@@ -1728,29 +3048,60 @@ def main() -> int:
         print_timeline(events, wav_start_time)
         return 0
 
-    cache_path = args.transcript_cache or args.wav.with_suffix(args.wav.suffix + ".transcript.json")
+    if args.follow:
+        from overhead_follow import run_follow
+
+        return run_follow(args, games, wav_start_time, skip_ranges)
+
+    if args.clip or args.clip_preset:
+        return verify_clips(args, events, wav_start_time)
+
+    cache_path = args.transcript_cache or transcript_cache_path(args.wav)
+
+    if args.injections:
+        if not args.by_round:
+            print("Error: --injections requires --by-round", file=sys.stderr)
+            return 1
+        return verify_injected_by_round(args, games, wav_start_time, skip_ranges, courts, cache_path)
 
     if args.by_round:
-        if not cache_path.exists() and not args.wav.exists():
+        if existing_cache(cache_path) is None and not args.wav.exists():
             print(f"Error: WAV file not found: {args.wav}", file=sys.stderr)
             return 1
-        segments = transcribe_wav(args.wav, args.model, cache_path, args.retranscribe)
         if not wav_start_time:
             print("Error: --by-round requires --wav-start-time", file=sys.stderr)
             return 1
-        print(
-            f"Per-round verification (tolerance ±{args.tolerance}s, full phrases"
-            f"{'' if args.no_refine_bundled else ', bundled-cue refinement'})"
-            f"\n{'RND':<4} {'SCHEDULE':<12} {'WALL':<6} {'ANCHOR':<10} {'DRIFT':<8} {'MATCHED':<12} {'STATUS'}"
-        )
-        print("-" * 72)
-        refine_cache_path = args.refine_cache or cache_path.with_name(
-            f"{cache_path.stem}.refined.json"
-        )
+        print_by_round_header(args.tolerance, not args.no_refine_bundled)
+        refine_cache_path = args.refine_cache or refinement_cache_path(cache_path)
         refine_cache = load_refinement_cache(refine_cache_path)
-        reports = verify_by_round(
+        refinement_stats = RefinementStats()
+        transcription: dict = {}
+        # Shared by transcription and refinement; a cached transcript still refines within it.
+        speech = speech_regions_from_args(args) if args.wav.exists() else None
+        transcribe_kwargs = dict(
+            workers=args.workers,
+            chunk_seconds=args.chunk_seconds,
+            overlap_seconds=args.chunk_overlap,
+            chunk_store=chunk_store_from_args(args),
+            cpu_threads=args.cpu_threads or None,
+            word_timestamps=args.word_timestamps,
+            speech=speech,
+            transcription=transcription,
+        )
+        slot_anchors = None
+        if args.align:
+            # The alignment spans the whole day, so it waits for the full transcript.
+            segments = transcribe_wav(args.wav, args.model, cache_path, args.retranscribe, **transcribe_kwargs)
+            slot_anchors = align_by_round(args, games, wav_start_time, skip_ranges, segments)
+            transcript = iter([TranscriptProgress(segments=segments, settled_until=float("inf"), done=True)])
+        else:
+            # Rounds are verified as soon as the transcript has moved past them.
+            transcript = stream_transcript(
+                args.wav, args.model, cache_path, args.retranscribe, **transcribe_kwargs
+            )
+        reports = verify_by_round_streaming(
             games,
-            segments,
+            transcript,
             args.wav,
             wav_start_time,
             args.tolerance,
@@ -1763,9 +3114,15 @@ def main() -> int:
             refine_cache=refine_cache if not args.no_refine_bundled else None,
             round_filter=args.round,
             verbose=True,
+            refinement_stats=refinement_stats,
+            matcher=args.matcher,
+            slot_anchors=slot_anchors,
+            speech=speech,
         )
         if not args.no_refine_bundled:
             save_refinement_cache(refine_cache_path, refine_cache)
+            if refinement_stats.segments:
+                print_refinement_stats(refinement_stats)
             print(f"Refinement cache: {refine_cache_path}", file=sys.stderr)
         if not reports:
             print("No rounds matched filter.", file=sys.stderr)
@@ -1781,6 +3138,9 @@ def main() -> int:
             wav_start_time,
             args.tolerance,
             refine_bundled=not args.no_refine_bundled,
+            refinement=refinement_stats if not args.no_refine_bundled else None,
+            schedule={"schedule_dir": str(args.schedule_dir.resolve()), "date": args.date, "courts": courts},
+            transcription=transcription or None,
         )
         write_by_round_phrases_file(reports, phrases_path)
         print(f"Phrases file: {phrases_path}", file=sys.stderr)
@@ -1808,8 +3168,23 @@ def main() -> int:
             file=sys.stderr,
         )
 
-    cache_path = args.transcript_cache or args.wav.with_suffix(args.wav.suffix + ".transcript.json")
-    segments = transcribe_wav(args.wav, args.model, cache_path, args.retranscribe)
+    cache_path = args.transcript_cache or transcript_cache_path(args.wav)
+    transcription = {}
+    speech = speech_regions_from_args(args)
+    segments = transcribe_wav(
+        args.wav,
+        args.model,
+        cache_path,
+        args.retranscribe,
+        workers=args.workers,
+        chunk_seconds=args.chunk_seconds,
+        overlap_seconds=args.chunk_overlap,
+        chunk_store=chunk_store_from_args(args),
+        cpu_threads=args.cpu_threads or None,
+        word_timestamps=args.word_timestamps,
+        speech=speech,
+        transcription=transcription,
+    )
 
     inferred_start: str | None = None
     if not args.wav_start_time:
@@ -1832,7 +3207,7 @@ def main() -> int:
             )
 
     results = match_events_to_transcript(
-        events, segments, args.tolerance, args.min_confidence
+        events, segments, args.tolerance, args.min_confidence, args.matcher
     )
     summary = build_summary(results, courts)
     orphans = find_orphan_segments(segments, results)
@@ -1896,6 +3271,7 @@ def main() -> int:
         ],
         summary=summary,
         orphan_segments=orphans,
+        transcription=transcription or None,
     )
 
     output_report = args.output_report or args.wav.with_name(
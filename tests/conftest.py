@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import struct
 import sys
+import wave
 from pathlib import Path
+from types import SimpleNamespace
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SCRIPTS_DIR = REPO_ROOT / "src" / "scripts"
@@ -11,3 +14,38 @@ FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def write_pcm_wav(path: Path, samples: list[int], sample_rate: int = 8000, channels: int = 1) -> None:
+    """16-bit PCM .wav of interleaved ``samples``, for tests that need a real file on disk."""
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(channels)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        handle.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+
+
+def write_float_wav(path: Path, samples, rate: int = 16000) -> None:
+    """Mono 16-bit .wav of float ``samples`` in [-1, 1]."""
+    import numpy as np
+
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(rate)
+        handle.writeframes((np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes())
+
+
+class FakeRefinementPipeline:
+    """Stand-in batched whisper pipeline: one piece per clip, 0.5 s into it, tagged with the clip number."""
+
+    def __init__(self):
+        self.calls: list[list[dict]] = []
+
+    def transcribe(self, audio, clip_timestamps, batch_size):
+        self.calls.append(clip_timestamps)
+        pieces = [
+            SimpleNamespace(start=clip["start"] + 0.5, end=clip["start"] + 1.5, text=f"clip {n}")
+            for n, clip in enumerate(clip_timestamps)
+        ]
+        return iter(pieces), None
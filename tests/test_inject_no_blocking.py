@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from conftest import write_pcm_wav
 from inject_no_blocking import (
+    detect_silences,
     find_play_end_countdown,
     in_silence_search_window,
     list_no_blocking_silence_candidates,
@@ -95,3 +97,12 @@ class TestSpeechBeforeInsert:
             ]
         }
         assert speech_before_insert(round_data, countdown_start=1996.0, insert_at=2010.0) is None
+
+
+class TestDetectSilences:
+    def test_reads_silence_windows_from_wav(self, tmp_path: Path):
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [9000] * 2000 + [0] * 3000 + [9000] * 1000, sample_rate=1000)
+        assert detect_silences(wav, 1.0, 5.0, noise_db=-35.0, min_silence=0.3) == [
+            {"start": 2.0, "end": 5.0, "duration": 3.0}
+        ]
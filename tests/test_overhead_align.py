@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from overhead_align import align_timeline, l1_min_plus, round_anchors, write_drift_curve
+from verify_overhead_schedule import TranscriptSegment, verify_by_round
+
+
+def late_day(late: float = 40.0):
+    """Two-hour synthetic day where round 2's halfway through 30-seconds calls run ``late`` seconds behind."""
+    from bench_overhead import CHATTER, synthetic_day
+
+    games, segments = synthetic_day(2.0, [2, 3], chatter_every=20.0)
+    lo, hi = 1502 + 700, 1502 + 1400
+    segments = [
+        TranscriptSegment(s.start + late, s.end + late, s.text)
+        if s.text not in CHATTER and lo <= s.start < hi
+        else s
+        for s in segments
+    ]
+    segments.sort(key=lambda s: s.start)
+    return games, segments
+
+
+class TestL1MinPlus:
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(4)
+        cost = rng.uniform(-1, 1, size=41)
+        best, arg = l1_min_plus(cost, 0.03)
+        full = cost[None, :] + 0.03 * np.abs(np.arange(41)[:, None] - np.arange(41)[None, :])
+        assert np.allclose(best, full.min(axis=1))
+        assert np.allclose(cost[arg] + 0.03 * np.abs(np.arange(41) - arg), best)
+
+
+class TestAlignTimeline:
+    def test_curve_follows_lateness_inside_a_round(self):
+        games, segments = late_day(40.0)
+        points = align_timeline(games, segments, "09:00")
+        round_2 = {p.event_type: p for p in points if p.round == 2 and p.court_num == 0}
+
+        assert all(p.matched for p in points)
+        assert abs(round_2["play_start"].drift_seconds - 2.0) < 9
+        for event_type in ("halfway", "ninety_seconds", "thirty_seconds"):
+            assert abs(round_2[event_type].drift_seconds - 42.0) < 9
+        # Round 3 starts back on time.
+        assert round_anchors(points)[3] == pytest.approx(2 * 1502, abs=9)
+
+    def test_unheard_cues_keep_the_drift_of_their_neighbours(self):
+        games, segments = late_day(0.0)
+        segments = [s for s in segments if not (1502 + 700 <= s.start < 1502 + 1400)]
+        points = align_timeline(games, segments, "09:00")
+        missing = [p for p in points if p.round == 2 and p.event_type in ("halfway", "ninety_seconds", "thirty_seconds")]
+
+        assert missing and not any(p.matched for p in missing)
+        assert len({p.drift_seconds for p in missing}) == 1
+        assert abs(missing[0].drift_seconds) < 12
+
+    def test_drift_curve_csv_and_aligned_anchors(self, tmp_path: Path, capsys):
+        games, segments = late_day(40.0)
+        points = align_timeline(games, segments, "09:00")
+        path = tmp_path / "drift.csv"
+        write_drift_curve(path, points)
+        rows = list(csv.DictReader(path.open(encoding="utf-8")))
+        assert len(rows) == len(points)
+        assert rows[0]["court"] == "2" and rows[3]["court"] == "ALL"
+
+        anchors = round_anchors(points)
+        reports = verify_by_round(
+            games, segments, Path("x.wav"), "09:00", 90, 0.55, [], None, refine_bundled=False, slot_anchors=anchors
+        )
+        assert [r["anchor_source"] for r in reports] == ["aligned"] * len(reports)
+        assert [r["slot_anchor_wav"] for r in reports] == [anchors[r["round"]] for r in reports]
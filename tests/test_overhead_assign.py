@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from overhead_assign import assign_candidates, candidate_components, solve_assignment
+
+
+def brute_force_total(candidates: list[dict[int, float]]) -> float:
+    """Best total weight over every way of giving each row one of its columns or nothing."""
+    best = 0.0
+    for choice in itertools.product(*[[None, *row] for row in candidates]):
+        taken = [col for col in choice if col is not None]
+        if len(taken) == len(set(taken)):
+            best = max(best, sum(row[col] for row, col in zip(candidates, choice) if col is not None))
+    return best
+
+
+class TestSolveAssignment:
+    def test_minimizes_total_cost(self):
+        cost = [[4, 1, 3], [2, 0, 5], [3, 2, 2]]
+        assignment = solve_assignment(cost)
+        assert sorted(assignment) == [0, 1, 2]
+        assert sum(cost[r][c] for r, c in enumerate(assignment)) == 5
+
+    def test_rejects_more_rows_than_columns(self):
+        with pytest.raises(ValueError):
+            solve_assignment([[1], [2]])
+
+
+class TestAssignCandidates:
+    def test_components_split_on_shared_columns(self):
+        assert candidate_components([{1: 0.5}, {}, {2: 0.4, 1: 0.3}, {7: 0.9}]) == [[0, 2], [3]]
+
+    def test_optimal_where_greedy_is_not(self):
+        # Greedy in row order gives row 0 column 5 and leaves row 1 with nothing.
+        assert assign_candidates([{5: 0.65, 6: 0.4}, {5: 0.8}]) == [6, 5]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            candidates = [
+                {col: round(rng.uniform(0.35, 1.0), 2) for col in rng.sample(range(6), rng.randint(0, 3))}
+                for _ in range(rng.randint(1, 5))
+            ]
+            picks = assign_candidates(candidates)
+            taken = [col for col in picks if col is not None]
+            assert len(taken) == len(set(taken))
+            total = sum(row[col] for row, col in zip(candidates, picks) if col is not None)
+            assert total == pytest.approx(brute_force_total(candidates))
+
+    def test_deterministic_on_ties(self):
+        candidates = [{3: 0.5, 4: 0.5}, {3: 0.5, 4: 0.5}]
+        assert assign_candidates(candidates) == assign_candidates(candidates) == [3, 4]
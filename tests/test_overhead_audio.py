@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from conftest import write_pcm_wav
+from overhead_audio import (
+    OverheadAudio,
+    SilenceIntervals,
+    hash_wav_range,
+    read_wav_layout,
+)
+
+
+class TestReadWavLayout:
+    def test_parses_pcm_header(self, tmp_path: Path):
+        wav = tmp_path / "a.wav"
+        write_pcm_wav(wav, [0] * 16000, sample_rate=8000, channels=2)
+        layout = read_wav_layout(wav)
+        assert layout is not None
+        assert layout.is_pcm
+        assert layout.channels == 2
+        assert layout.sample_rate == 8000
+        assert layout.block_align == 4
+        assert layout.frames == 8000
+        assert layout.duration == 1.0
+        assert layout.data_offset == 44
+
+    def test_rejects_non_wav(self, tmp_path: Path):
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"not a wav file at all")
+        assert read_wav_layout(path) is None
+
+    def test_byte_range_clamps_to_data(self, tmp_path: Path):
+        wav = tmp_path / "a.wav"
+        write_pcm_wav(wav, [0] * 8000)
+        layout = read_wav_layout(wav)
+        assert layout.byte_range(-1.0, 0.5) == (44, 44 + 8000)
+        assert layout.byte_range(0.5, 5.0) == (44 + 8000, 44 + 16000)
+
+
+class TestHashWavRange:
+    def test_edit_only_changes_overlapping_ranges(self, tmp_path: Path):
+        original = tmp_path / "original.wav"
+        edited = tmp_path / "edited.wav"
+        samples = [i % 200 for i in range(8000 * 4)]
+        write_pcm_wav(original, samples)
+        changed = list(samples)
+        changed[8000 * 3 + 10] = 5000
+        write_pcm_wav(edited, changed)
+
+        layout_a = read_wav_layout(original)
+        layout_b = read_wav_layout(edited)
+        assert hash_wav_range(original, layout_a, 0.0, 2.0) == hash_wav_range(
+            edited, layout_b, 0.0, 2.0
+        )
+        assert hash_wav_range(original, layout_a, 2.5, 4.0) != hash_wav_range(
+            edited, layout_b, 2.5, 4.0
+        )
+
+
+class TestOverheadAudio:
+    def test_16k_mono_maps_the_wav_itself(self, tmp_path: Path):
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [0] * 16000 + [16384] * 16000, sample_rate=16000)
+        audio = OverheadAudio(wav)
+        assert audio.duration == 2.0
+        assert len(audio.mono16k) == 32000
+        assert audio.slice(0.5, 1.5).tolist() == [0.0] * 8000 + [0.5] * 8000
+        assert not (tmp_path / ".overhead_pcm").exists()
+
+    def test_peak_and_rms_levels(self, tmp_path: Path):
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [0] * 8000 + [16384, -16384] * 4000, sample_rate=8000)
+        audio = OverheadAudio(wav)
+        assert audio.peak_db(0.0, 1.0) == -91.0
+        assert round(audio.peak_db(1.0, 2.0), 2) == -6.02
+        assert round(audio.rms_db(1.0, 2.0), 2) == -6.02
+        assert audio.peak_db(5.0, 6.0) is None
+
+    def test_silences_require_every_channel_quiet(self, tmp_path: Path):
+        wav = tmp_path / "stereo.wav"
+        loud, quiet = 8000, 10
+        frames = [(loud, loud)] * 1000 + [(quiet, quiet)] * 2000 + [(quiet, loud)] * 1000 + [(0, 0)] * 4000
+        write_pcm_wav(wav, [sample for frame in frames for sample in frame], sample_rate=1000, channels=2)
+        audio = OverheadAudio(wav)
+        assert audio.silences(0.0, 8.0, noise_db=-35.0, min_silence=0.5) == [(1.0, 3.0), (4.0, 8.0)]
+        assert audio.silences(0.0, 8.0, noise_db=-35.0, min_silence=2.5) == [(4.0, 8.0)]
+        assert audio.silences(2.0, 5.0, noise_db=-35.0, min_silence=0.5) == [(2.0, 3.0), (4.0, 5.0)]
+
+    def test_open_reuses_instance_until_file_changes(self, tmp_path: Path):
+        import os
+
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [0] * 8000)
+        first = OverheadAudio.open(wav)
+        assert OverheadAudio.open(wav) is first
+        write_pcm_wav(wav, [0] * 16000)
+        stat = wav.stat()
+        os.utime(wav, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        reopened = OverheadAudio.open(wav)
+        assert reopened is not first
+        assert reopened.duration == 2.0
+
+
+class TestSilenceIntervals:
+    def test_hysteresis_bridges_flutter_near_threshold(self):
+        import numpy as np
+
+        levels = np.array([-20, -50, -50, -34, -50, -30, -20, -50], dtype=np.float32)
+        intervals = SilenceIntervals.from_levels(levels, 1.0, 8.0, -35.0, 1.0, 3.0)
+        assert intervals.window(0.0, 8.0) == [(1.0, 5.0), (7.0, 8.0)]
+        strict = SilenceIntervals.from_levels(levels, 1.0, 8.0, -35.0, 1.0, 0.0)
+        assert strict.window(0.0, 8.0) == [(1.0, 3.0), (4.0, 5.0), (7.0, 8.0)]
+
+    def test_window_clips_and_drops_short_remainders(self):
+        import numpy as np
+
+        intervals = SilenceIntervals(np.array([2.0, 10.0]), np.array([6.0, 20.0]), min_silence=1.0)
+        assert intervals.window(5.5, 12.0) == [(10.0, 12.0)]
+        assert intervals.window(4.0, 30.0) == [(4.0, 6.0), (10.0, 20.0)]
+        assert intervals.window(21.0, 30.0) == []
+
+    def test_whole_file_levels_computed_once(self, tmp_path: Path):
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [9000] * 1000 + [0] * 2000, sample_rate=1000)
+        audio = OverheadAudio(wav)
+        levels = audio.frame_levels_db()
+        assert len(levels) == 300
+        assert audio.frame_levels_db() is levels
+        assert audio.silence_intervals(-35.0, 0.5) is audio.silence_intervals(-35.0, 0.5)
+        assert audio.silences(0.0, 3.0, -35.0, 0.5) == [(1.0, 3.0)]
+
+
+class TestLoudnessEnvelope:
+    def test_pyramid_window_matches_samples(self, tmp_path: Path):
+        import numpy as np
+
+        rng = np.random.default_rng(3)
+        samples = rng.integers(-20000, 20000, size=1000 * 25 + 7).tolist()
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, samples, sample_rate=1000)
+        audio = OverheadAudio(wav)
+        raw = np.array(samples, dtype=np.float64) / 32768.0
+        for start, end in [(0.0, 25.007), (0.0033, 0.0071), (1.234, 13.5), (2.0, 22.0), (24.99, 30.0)]:
+            first, last = round(start * 1000), min(len(raw), round(end * 1000))
+            window = raw[first:last]
+            peak, sumsq, count = audio.envelope.window(audio.native, first, last, 32768.0)
+            assert count == len(window)
+            assert abs(peak - np.abs(window).max()) < 1e-6
+            assert abs(sumsq - (window**2).sum()) < 1e-3
+        assert [len(level) for level in audio.envelope.levels] == [2501, 251, 26]
+
+    def test_envelope_persisted_beside_wav(self, tmp_path: Path):
+        import numpy as np
+
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [100] * 4000 + [16384] * 4000, sample_rate=8000)
+        assert round(OverheadAudio(wav).peak_db(0.0, 0.5), 1) == -50.3
+        saved = list((tmp_path / ".overhead_pcm").glob("day.wav.*.env*.npy"))
+        assert len(saved) == 3
+
+        reloaded = OverheadAudio(wav)
+        assert all(isinstance(level, np.memmap) for level in reloaded.envelope.levels)
+        assert round(reloaded.peak_db(0.25, 1.0), 2) == -6.02
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import overhead_batch
+from bench_overhead import synthetic_day
+from conftest import write_pcm_wav
+from overhead_batch import load_manifest, parse_args, run_batch
+
+
+def write_manifest(path: Path, lines: list[dict]) -> Path:
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n", encoding="utf-8")
+    return path
+
+
+def test_manifest_resolves_paths_and_defaults(tmp_path: Path):
+    manifest = write_manifest(
+        tmp_path / "weekend.jsonl",
+        [
+            {"wav": "sat/day1.wav", "date": "2026-06-20", "courts": "2, 3", "wav_start_time": "09:00"},
+            {
+                "name": "sun",
+                "wav": "/audio/day2.wav",
+                "date": "2026-06-21",
+                "courts": [4],
+                "wav_start_time": "08:30",
+                "schedule_dir": "other",
+                "model": "medium",
+                "injections": True,
+                "output_report": "reports/sun.json",
+            },
+        ],
+    )
+    sat, sun = load_manifest(manifest, Path("schedule"), "small")
+
+    assert (sat.name, sat.wav, sat.courts, sat.model) == ("day1", tmp_path / "sat/day1.wav", [2, 3], "small")
+    assert sat.schedule_dir == Path("schedule")
+    assert sun.schedule_dir == tmp_path / "other"
+    assert sat.report_path == tmp_path / "sat/day1_overhead_by_round_report.json"
+    assert sat.cache_path.name == "day1.wav.transcript.cols"
+    assert (sun.wav, sun.courts, sun.model, sun.injections) == (Path("/audio/day2.wav"), [4], "medium", True)
+    assert sun.report_path == tmp_path / "reports/sun.json"
+
+
+def test_manifest_rejects_incomplete_and_duplicate_jobs(tmp_path: Path):
+    line = {"wav": "a/day.wav", "date": "2026-06-20", "wav_start_time": "09:00"}
+    with pytest.raises(ValueError, match=r":1: missing date"):
+        load_manifest(write_manifest(tmp_path / "m.jsonl", [{**line, "date": ""}]), Path("s"))
+    with pytest.raises(ValueError, match="no schedule_dir"):
+        load_manifest(write_manifest(tmp_path / "m.jsonl", [line]))
+    with pytest.raises(ValueError, match="duplicate job name"):
+        load_manifest(write_manifest(tmp_path / "m.jsonl", [line, {**line, "wav": "b/day.wav"}]), Path("s"))
+
+
+def test_batch_transcribes_all_wavs_in_one_pass_then_verifies(tmp_path: Path, monkeypatch):
+    import overhead_transcribe
+
+    games, segments = synthetic_day(2.0, [2, 3], chatter_every=20.0)
+    calls: list[tuple[str, int]] = []
+
+    def fake_chunk(wav_path, chunk, word_timestamps=False):
+        calls.append((Path(wav_path).name, chunk.index))
+        pieces = [(s.start, s.end, s.text, None) for s in segments if chunk.start <= s.start < chunk.end]
+        return chunk.index, pieces, 1.0
+
+    monkeypatch.setattr(overhead_transcribe, "_transcribe_chunk", fake_chunk)
+    monkeypatch.setattr(overhead_transcribe, "_use_pooled_model", lambda model_name: None)
+    monkeypatch.setattr(overhead_transcribe, "decode_pcm_range", lambda *args: None)
+    monkeypatch.setattr(overhead_transcribe, "vad_speech_spans", lambda audio, offset: [])
+    monkeypatch.setattr(overhead_batch, "get_wav_duration", lambda wav: 7200.0)
+    monkeypatch.setattr(overhead_batch, "load_games", lambda schedule_dir, date, courts: games)
+    for name in ("sat", "sun"):
+        write_pcm_wav(tmp_path / f"{name}.wav", [0] * 800)
+    manifest = write_manifest(
+        tmp_path / "weekend.jsonl",
+        [{"wav": f"{name}.wav", "date": "2026-06-20", "wav_start_time": "09:00"} for name in ("sat", "sun")],
+    )
+    args = parse_args(
+        ["--manifest", str(manifest), "--schedule-dir", "schedule", "--workers", "1", "--no-refine-bundled"]
+    )
+    jobs = load_manifest(manifest, args.schedule_dir, args.model)
+
+    report = run_batch(jobs, args)
+
+    # Chunks of both days are interleaved through the one pool.
+    assert calls[:4] == [("sat.wav", 0), ("sun.wav", 0), ("sat.wav", 1), ("sun.wav", 1)]
+    assert len(calls) == 2 * 24
+    assert report["jobs_passed"] == report["jobs_total"] == 2
+    for job in report["jobs"]:
+        assert job["status"] == "passed" and job["transcript"] == "transcribed"
+        assert job["rounds_passed"] == job["rounds_total"] == 4
+        assert job["transcribe_serial_seconds"] == 24.0
+        assert job["transcribed_at"] <= job["finished_at"]
+        assert json.loads(Path(job["report"]).read_text(encoding="utf-8"))["rounds_passed"] == 4
+    assert (tmp_path / "sat.wav.transcript.cols").exists()
+
+    calls.clear()
+    again = run_batch(jobs, args)
+    assert calls == []
+    assert [job["transcript"] for job in again["jobs"]] == ["cached", "cached"]
+    assert again["jobs_passed"] == 2
+
+
+def test_unreadable_wav_is_an_error_and_the_rest_are_verified(tmp_path: Path, monkeypatch):
+    import subprocess
+
+    import overhead_transcribe
+
+    games, segments = synthetic_day(1.0, [2])
+
+    def fake_chunk(wav_path, chunk, word_timestamps=False):
+        if Path(wav_path).stem == "sun" and chunk.index == 1:
+            raise RuntimeError("whisper worker died")
+        pieces = [(s.start, s.end, s.text, None) for s in segments if chunk.start <= s.start < chunk.end]
+        return chunk.index, pieces, 1.0
+
+    def duration(wav):
+        if wav.stem == "bad":
+            raise subprocess.CalledProcessError(1, ["ffprobe", str(wav)])
+        return 3600.0
+
+    monkeypatch.setattr(overhead_transcribe, "_transcribe_chunk", fake_chunk)
+    monkeypatch.setattr(overhead_transcribe, "_use_pooled_model", lambda model_name: None)
+    monkeypatch.setattr(overhead_transcribe, "decode_pcm_range", lambda *args: None)
+    monkeypatch.setattr(overhead_transcribe, "vad_speech_spans", lambda audio, offset: [])
+    monkeypatch.setattr(overhead_batch, "get_wav_duration", duration)
+    monkeypatch.setattr(overhead_batch, "load_games", lambda schedule_dir, date, courts: games)
+    for name in ("sat", "sun"):
+        write_pcm_wav(tmp_path / f"{name}.wav", [0] * 800)
+    (tmp_path / "bad.wav").write_bytes(b"not a wav at all")
+    manifest = write_manifest(
+        tmp_path / "weekend.jsonl",
+        [
+            {"wav": f"{name}.wav", "date": "2026-06-20", "wav_start_time": "09:00"}
+            for name in ("sat", "bad", "sun")
+        ],
+    )
+    args = parse_args(
+        ["--manifest", str(manifest), "--schedule-dir", "schedule", "--workers", "1", "--no-refine-bundled"]
+    )
+
+    report = run_batch(load_manifest(manifest, args.schedule_dir, args.model), args)
+
+    sat, bad, sun = report["jobs"]
+    assert (sat["status"], sat["transcript"]) == ("passed", "transcribed")
+    assert (bad["status"], bad["transcript"]) == ("error", "none")
+    assert bad["error"].startswith("CalledProcessError")
+    assert (sun["status"], sun["transcript"], sun["error"]) == ("error", "none", "RuntimeError: whisper worker died")
+    assert report["jobs_passed"] == 1 and report["jobs_total"] == 3
+    assert not (tmp_path / "sun.wav.transcript.cols").exists()
+    assert not (tmp_path / "sun_overhead_by_round_report.json").exists()
+
+
+def test_failing_job_is_reported_and_the_batch_carries_on(tmp_path: Path, monkeypatch):
+    games, _segments = synthetic_day(1.0, [2])
+
+    def broken_verify(wav_path, *args, **kwargs):
+        if wav_path.stem == "sat":
+            raise RuntimeError("whisper fell over")
+        rounds = [{"round": 1, "summary": {"match_rate": 1.0}}] if wav_path.stem == "sun" else []
+        return {"rounds": rounds, "refinement": None, "transcription": None, "transcript_patch": None}
+
+    monkeypatch.setattr(overhead_batch, "load_games", lambda schedule_dir, date, courts: games)
+    monkeypatch.setattr(overhead_batch, "verify_overhead", broken_verify)
+    monkeypatch.setattr(overhead_batch, "transcript_needed", lambda job, word_timestamps=False: False)
+    names = ("sat", "sun", "mon")
+    for name in names:
+        write_pcm_wav(tmp_path / f"{name}.wav", [0] * 800)
+    manifest = write_manifest(
+        tmp_path / "weekend.jsonl",
+        [{"wav": f"{name}.wav", "date": "2026-06-20", "wav_start_time": "09:00"} for name in names],
+    )
+    args = parse_args(["--manifest", str(manifest), "--schedule-dir", "schedule", "--workers", "1"])
+
+    report = run_batch(load_manifest(manifest, args.schedule_dir, args.model), args)
+
+    sat, sun, mon = report["jobs"]
+    assert (sat["status"], sat["error"]) == ("error", "RuntimeError: whisper fell over")
+    assert sun["status"] == "passed" and sun["finished_at"] is not None
+    # A wav whose schedule matched no rounds has verified nothing.
+    assert (mon["status"], mon["rounds_total"], mon["error"]) == ("failed", 0, "No rounds matched the schedule")
+    assert report["jobs_passed"] == 1
+
+
+def test_injected_job_seeds_refinement_from_its_source(tmp_path: Path, monkeypatch):
+    import overhead_inject_common
+    from overhead_inject_common import InjectionBase
+    from overhead_transcript_cache import refinement_cache_path, transcript_cache_path
+    from verify_overhead_schedule import save_refinement_cache
+
+    source, injected = tmp_path / "day.wav", tmp_path / "day_with_no_blocking.wav"
+    base = InjectionBase(source, [], "small", [(300.0, 304.0)], [])
+    save_refinement_cache(base.refine_cache_path, {"entries": {"12.0": {"original_text": "source", "segments": []}}})
+    # Left by an earlier injection at other insert points.
+    save_refinement_cache(
+        refinement_cache_path(transcript_cache_path(injected)),
+        {"entries": {"900.0": {"original_text": "stale", "segments": []}}},
+    )
+    seen: list[dict] = []
+
+    def fake_verify(wav_path, *args, refine_cache=None, **kwargs):
+        seen.append(json.loads(json.dumps(refine_cache)))
+        return {"rounds": [], "refinement": None, "transcription": None, "transcript_patch": {}}
+
+    monkeypatch.setattr(overhead_inject_common, "load_injection_base", lambda wav: base)
+    monkeypatch.setattr(overhead_batch, "load_games", lambda schedule_dir, date, courts: [])
+    monkeypatch.setattr(overhead_batch, "verify_overhead", fake_verify)
+    job = overhead_batch.BatchJob("day", injected, "2026-06-20", [2], "09:00", tmp_path, injections=True)
+
+    settled = overhead_batch.run_job(job, overhead_batch.verify_options(parse_args(["--manifest", "m"])), 0.8)
+
+    assert settled["transcript"] == "patched"
+    assert list(seen[0]["entries"]) == ["12.0"]
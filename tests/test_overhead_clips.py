@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from conftest import write_float_wav
+from overhead_audio import OverheadAudio
+from overhead_clips import ClipTemplate, find_clip, find_clips, normalized_cross_correlation, parse_clip_specs
+from verify_overhead_schedule import build_expected_events, match_clip_hits
+
+
+def chirp(seconds: float, rate: int = 16000) -> np.ndarray:
+    t = np.arange(int(seconds * rate)) / rate
+    return (0.4 * np.sin(2 * np.pi * (300 + 400 * t) * t)).astype(np.float32)
+
+
+def noisy_day(seconds: float, clip: np.ndarray, at: list[int], seed: int = 1) -> np.ndarray:
+    samples = np.random.default_rng(seed).normal(0, 0.05, int(seconds * 16000)).astype(np.float32)
+    for first in at:
+        samples[first : first + len(clip)] += 0.7 * clip
+    return samples
+
+
+class TestCrossCorrelation:
+    def test_matches_direct_computation(self):
+        rng = np.random.default_rng(2)
+        signal, template = rng.normal(size=300), rng.normal(size=25)
+        direct = []
+        for k in range(len(signal) - len(template) + 1):
+            window = signal[k : k + len(template)]
+            a, b = window - window.mean(), template - template.mean()
+            direct.append(np.dot(a, b) / np.sqrt(np.dot(a, a) * np.dot(b, b)))
+        assert np.allclose(normalized_cross_correlation(signal, template), direct)
+
+    def test_silence_scores_zero(self):
+        assert not normalized_cross_correlation(np.zeros(100), np.arange(10.0)).any()
+
+
+class TestFindClip:
+    def test_hits_are_sample_accurate_across_block_boundaries(self):
+        clip = chirp(0.5)
+        at = [1234, 40_000, 65_531, 150_001]
+        samples = noisy_day(12.0, clip, at)
+        int16 = (samples * 32767).astype(np.int16)
+        hits = find_clip(int16, ClipTemplate("buzzer", clip), block=16_384)
+
+        assert [hit.sample for hit in hits] == at
+        assert all(hit.score > 0.8 for hit in hits)
+        assert hits[0].start == pytest.approx(1234 / 16000)
+
+    def test_other_sounds_do_not_match(self):
+        samples = noisy_day(5.0, chirp(0.5), [8000])
+        hits = find_clip(samples, ClipTemplate("other", chirp(0.5)[::-1].copy()))
+        assert hits == []
+
+    def test_parse_clip_specs(self):
+        assert parse_clip_specs(["countdown=/tmp/c.wav"]) == [("countdown", Path("/tmp/c.wav"))]
+        with pytest.raises(ValueError):
+            parse_clip_specs(["countdown"])
+
+
+class TestClipVerification:
+    def test_venue_cues_verified_from_clip_hits(self, tmp_path: Path):
+        from bench_overhead import synthetic_day
+
+        clip = chirp(1.0)
+        write_float_wav(tmp_path / "two_minutes.wav", np.concatenate([np.zeros(800, np.float32), clip, np.zeros(800, np.float32)]))
+        write_float_wav(tmp_path / "day.wav", noisy_day(200.0, clip, [int(125.5 * 16000)]))
+
+        template = ClipTemplate.from_wav("transition_2min", tmp_path / "two_minutes.wav")
+        assert len(template.samples) == pytest.approx(16000, abs=2)
+        hits = find_clips(OverheadAudio(tmp_path / "day.wav"), [template])
+        assert [round(hit.start, 3) for hit in hits] == [125.5]
+
+        games, _ = synthetic_day(0.5, [2])
+        events = [e for e in build_expected_events(games, "09:00", []) if e.event_type == "transition_2min"]
+        results = match_clip_hits(events, hits, tolerance=90)
+        assert [(r.status, r.drift_seconds) for r in results] == [("matched", pytest.approx(4.5, abs=0.01))]
+        assert results[0].matched_text == "[clip transition_2min]"
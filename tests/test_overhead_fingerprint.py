@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from conftest import write_float_wav
+from overhead_fingerprint import FP_FRAME_SECONDS, FingerprintIndex, audit_injections, fingerprint
+from overhead_inject_common import sidecar_placements
+
+
+def tone_clip(seconds: float = 3.0, seed: int = 0) -> np.ndarray:
+    """Speech-like stand-in: three random tones, changing every 80 ms."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * 16000)) / 16000
+    clip = np.zeros(len(t))
+    for first in range(0, len(t), 1280):
+        for freq in rng.uniform(200, 3000, 3):
+            clip[first : first + 1280] += 0.1 * np.sin(2 * np.pi * freq * t[first : first + 1280])
+    return clip
+
+
+def recording(seconds: float, clip: np.ndarray, at: list[float], seed: int = 5) -> np.ndarray:
+    samples = np.random.default_rng(seed).normal(0, 0.05, int(seconds * 16000))
+    for start in at:
+        first = int(start * 16000)
+        samples[first : first + len(clip)] += 0.8 * clip
+    return samples
+
+
+@pytest.fixture
+def index(tmp_path: Path):
+    index = FingerprintIndex(tmp_path / "fp.sqlite")
+    yield index
+    index.close()
+
+
+class TestFingerprintIndex:
+    def test_occurrences_across_recordings(self, tmp_path: Path, index: FingerprintIndex):
+        clip = tone_clip()
+        write_float_wav(tmp_path / "buzzer.wav", clip)
+        write_float_wav(tmp_path / "day1.wav", recording(60.0, clip, [4.0, 41.5]))
+        write_float_wav(tmp_path / "day2.wav", recording(60.0, clip, [20.25], seed=6))
+        write_float_wav(tmp_path / "other.wav", recording(30.0, tone_clip(seed=9), [3.0]))
+
+        index.enroll(tmp_path / "buzzer.wav", "clip", "buzzer")
+        for name in ("day1", "day2", "other"):
+            index.enroll(tmp_path / f"{name}.wav", "recording")
+        found = index.occurrences()
+
+        assert [(Path(o.recording).name, o.clip) for o in found] == [
+            ("day1.wav", "buzzer"),
+            ("day1.wav", "buzzer"),
+            ("day2.wav", "buzzer"),
+        ]
+        for item, expected in zip(found, [4.0, 41.5, 20.25]):
+            assert abs(item.start - expected) <= FP_FRAME_SECONDS
+
+    def test_enroll_skips_unchanged_and_replaces_changed(self, tmp_path: Path, index: FingerprintIndex):
+        clip = tone_clip()
+        wav = tmp_path / "day.wav"
+        write_float_wav(wav, recording(20.0, clip, [2.0]))
+        first, fresh = index.enroll(wav, "recording")
+        assert fresh
+        assert index.enroll(wav, "recording") == (first, False)
+
+        write_float_wav(wav, recording(20.0, clip, [9.0]))
+        os.utime(wav, ns=(1, 1))
+        second, fresh = index.enroll(wav, "recording")
+        assert fresh and second.signature != first.signature
+        assert index.db.execute("SELECT COUNT(*) FROM hashes").fetchone() == (second.hashes,)
+
+    def test_hashes_are_deterministic(self):
+        samples = recording(10.0, tone_clip(), [1.0])
+        a, b = fingerprint(samples), fingerprint(samples.copy())
+        assert np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1])
+        assert len(a[0]) and a[0].max() < 1 << 24
+
+
+class TestInjectionAudit:
+    def test_placements_from_combined_sidecar(self):
+        sidecar = {
+            "injection_type": "combined",
+            "injections": [
+                {"clip": "/c/nb.wav", "insertions": [{"insert_seconds": 10.0}, {"insert_seconds": None}]},
+                {"clip": "/c/buzzer.wav", "insertions": [{"insert_seconds": 30.5}]},
+            ],
+        }
+        assert sidecar_placements(sidecar) == [(Path("/c/nb.wav"), 10.0), (Path("/c/buzzer.wav"), 30.5)]
+
+    def test_audit_reports_missing_placement(self, tmp_path: Path, index: FingerprintIndex):
+        clip = tone_clip()
+        write_float_wav(tmp_path / "nb.wav", clip)
+        wav = tmp_path / "day_with_nb.wav"
+        write_float_wav(wav, recording(40.0, clip, [5.0]))
+        (tmp_path / "day_with_nb.wav.injections.json").write_text(
+            json.dumps(
+                {
+                    "source_wav": str(tmp_path / "day.wav"),
+                    "clip": str(tmp_path / "nb.wav"),
+                    "insertions": [{"insert_seconds": 5.0}, {"insert_seconds": 25.0}],
+                }
+            ),
+            encoding="utf-8",
+        )
+        rows = audit_injections(index, wav)
+        assert [(row["insert_seconds"], row["ok"]) for row in rows] == [(5.0, True), (25.0, False)]
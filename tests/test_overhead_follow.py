@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import io
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from conftest import write_pcm_wav
+from overhead_follow import (
+    CueMonitor,
+    GrowingAudio,
+    LiveTranscript,
+    follow_overhead,
+    to_analysis_rate,
+)
+from overhead_transcribe import TranscriptProgress
+
+
+def start_recording(path: Path, sample_rate: int = 16000, channels: int = 1) -> None:
+    """Header the way a recorder leaves it while still writing: placeholder sizes."""
+    block_align = channels * 2
+    path.write_bytes(
+        b"RIFF"
+        + struct.pack("<I", 0xFFFFFFFF)
+        + b"WAVE"
+        + b"fmt "
+        + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16)
+        + b"data"
+        + struct.pack("<I", 0xFFFFFFFF)
+    )
+
+
+class TestGrowingAudio:
+    def test_growing_wav_exposes_new_frames(self, tmp_path: Path):
+        wav = tmp_path / "live.wav"
+        start_recording(wav)
+        audio = GrowingAudio(wav)
+        assert audio.refresh() == 0.0
+
+        with wav.open("ab") as handle:
+            handle.write(struct.pack("<16000h", *([1000] * 16000)))
+        assert audio.refresh() == 1.0
+        with wav.open("ab") as handle:
+            handle.write(struct.pack("<8000h", *([-2000] * 8000)))
+        assert audio.refresh() == 1.5
+
+        samples = audio.read(0.75, 1.25)
+        assert len(samples) == 8000
+        assert np.allclose(samples[:4000], 1000 / 32768)
+        assert np.allclose(samples[4000:], -2000 / 32768)
+
+    def test_rolling_segments_are_read_back_to_back(self, tmp_path: Path):
+        write_pcm_wav(tmp_path / "seg_000.wav", [100] * 16000, sample_rate=16000)
+        write_pcm_wav(tmp_path / "seg_001.wav", [200, 200] * 16000, sample_rate=16000, channels=2)
+        (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+        audio = GrowingAudio(tmp_path)
+
+        assert audio.refresh() == 2.0
+        samples = audio.read(0.5, 1.5)
+        assert len(samples) == 16000
+        assert np.allclose(samples[:8000], 100 / 32768)
+        assert np.allclose(samples[8000:], 200 / 32768)
+
+    def test_integer_ratio_resample_averages_blocks(self):
+        mono = np.array([0.0, 0.3, 0.6, 1.0, 1.0, 1.0], dtype=np.float32)
+        assert np.allclose(to_analysis_rate(mono, 48000), [0.3, 1.0])
+
+
+def synthetic_monitor(drop: tuple[int, str] | None = None):
+    from bench_overhead import synthetic_day
+
+    games, segments = synthetic_day(2.0, [2, 3], chatter_every=20.0)
+    if drop is not None:
+        round_idx, text = drop
+        lo, hi = (round_idx - 1) * 1500, round_idx * 1500
+        segments = [s for s in segments if not (lo <= s.start < hi and s.text.startswith(text))]
+    monitor = CueMonitor(games, "09:00", tolerance=90, min_confidence=0.55, skip_ranges=[], skip_before=None)
+    return monitor, segments
+
+
+class TestCueMonitor:
+    def test_missed_call_is_reported_while_round_is_running(self):
+        monitor, segments = synthetic_monitor(drop=(2, "Two minutes"))
+        reported_at: dict[tuple[int, str, str], float] = {}
+        alerts = []
+        for settled in range(30, 7200, 30):
+            progress = TranscriptProgress([s for s in segments if s.start < settled + 30], float(settled))
+            for alert in monitor.update(progress):
+                reported_at[(alert.round, alert.event_type, alert.court)] = settled
+                alerts.append(alert)
+
+        missed = [a for a in alerts if a.is_alert]
+        assert [(a.round, a.event_type, a.status) for a in missed] == [(2, "transition_2min", "missed")]
+        # Due at 1500 + 121; reported before round 2's halfway call.
+        assert reported_at[(2, "transition_2min", "ALL")] < 1500 + 780
+        assert missed[0].anchor_source == "provisional"
+        # Every cue of the three complete rounds is checked exactly once.
+        assert len(reported_at) == len(alerts)
+        assert sum(1 for a in alerts if a.round == 1) == 2 + 8
+
+    def test_drifting_cue_is_flagged(self):
+        monitor, segments = synthetic_monitor()
+        monitor.drift_alert = 5.0
+        alerts = monitor.update(TranscriptProgress(segments, 1500.0 * 4, done=True))
+        drifting = [a for a in alerts if a.status == "drift"]
+        assert drifting
+        assert all(abs(a.drift_seconds) > 5.0 for a in drifting)
+
+
+class FakeGrowingAudio:
+    def __init__(self, growth: list[float]):
+        self.growth = growth
+        self.available = 0.0
+        self.reads: list[tuple[float, float]] = []
+
+    def refresh(self) -> float:
+        if self.growth:
+            self.available = self.growth.pop(0)
+        return self.available
+
+    def read(self, start: float, end: float):
+        self.reads.append((start, end))
+        return (start, end)
+
+
+class TestFollow:
+    def test_steps_overlap_and_tail_is_flushed(self):
+        from verify_overhead_schedule import TranscriptSegment
+
+        audio = FakeGrowingAudio([10.0, 40.0, 40.0, 80.0, 95.0])
+        heard = {12.0: "first", 50.0: "second", 90.0: "tail"}
+
+        def transcribe(span, offset):
+            start, end = span
+            return [TranscriptSegment(at, at + 1.0, text) for at, text in heard.items() if start <= at < end]
+
+        live = LiveTranscript(audio, transcribe, step_seconds=30.0, overlap_seconds=5.0)
+        monitor, _ = synthetic_monitor()
+        sink = io.StringIO()
+        counts = follow_overhead(live, monitor, idle_exit_seconds=4.0, jsonl=sink, sleep=lambda s: None)
+
+        assert audio.reads == [(0.0, 35.0), (25.0, 65.0), (55.0, 95.0), (85.0, 95.0)]
+        final = live.finish()
+        assert [s.text for s in final.segments] == ["first", "second", "tail"]
+        assert sum(counts.values()) == len(sink.getvalue().splitlines())
+        for line in sink.getvalue().splitlines():
+            assert json.loads(line)["status"] in ("ok", "drift", "missed")
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
 import pytest
 
-from overhead_inject_common import build_ffmpeg_command, seconds_to_hms
+from conftest import write_pcm_wav
+from overhead_inject_common import (
+    build_ffmpeg_command,
+    load_injection_base,
+    seconds_to_hms,
+    sidecar_ranges,
+    write_injections_sidecar,
+)
 
 
 class TestSecondsToHms:
@@ -53,3 +61,87 @@ class TestBuildFfmpegCommand:
                 sample_rate=48000,
                 channels=2,
             )
+
+
+class TestInjectionSidecars:
+    def test_ranges_from_insertions_regions_and_combined(self, tmp_path: Path):
+        clip = tmp_path / "clip.wav"
+        write_pcm_wav(clip, [0] * 4000)
+        nb = {
+            "clip": str(clip),
+            "insertions": [{"insert_seconds": 10.0}, {"insert_seconds": None}, {"insert_seconds": 30.0}],
+        }
+        assert sidecar_ranges(nb) == [(10.0, 10.5), (30.0, 30.5)]
+        patched = {**nb, "mix": {"sample_rate": 8000, "regions": [[80000, 84000]]}}
+        assert sidecar_ranges(patched) == [(10.0, 10.5)]
+        combined = {"injection_type": "combined", "mix": {"regions": []}, "injections": [nb, nb]}
+        assert len(sidecar_ranges(combined)) == 4
+
+    def test_base_follows_chain_to_transcribed_wav(self, tmp_path: Path):
+        from verify_overhead_schedule import TranscriptSegment, write_transcript_cache
+
+        clip = tmp_path / "clip.wav"
+        write_pcm_wav(clip, [0] * 8000)
+        original = tmp_path / "day.wav"
+        no_blocking = tmp_path / "day_with_no_blocking.wav"
+        buzzer = tmp_path / "day_with_no_blocking_and_start_buzzer.wav"
+        for wav in (original, no_blocking, buzzer):
+            write_pcm_wav(wav, [0] * 800)
+        write_transcript_cache(
+            original.with_suffix(".wav.transcript.json"), original, "small", [TranscriptSegment(1.0, 2.0, "hi")]
+        )
+        write_injections_sidecar(
+            no_blocking.with_suffix(".wav.injections.json"),
+            {"source_wav": str(original), "clip": str(clip), "insertions": [{"insert_seconds": 50.0}]},
+        )
+        write_injections_sidecar(
+            buzzer.with_suffix(".wav.injections.json"),
+            {"source_wav": str(no_blocking), "clip": str(clip), "insertions": [{"insert_seconds": 20.0}]},
+        )
+
+        base = load_injection_base(buzzer)
+        assert base is not None
+        assert base.wav_path == original
+        assert base.changed_ranges == [(20.0, 21.0), (50.0, 51.0)]
+        assert [s.text for s in base.segments] == ["hi"]
+
+        write_pcm_wav(original, [1] * 800)  # transcript no longer current
+        assert load_injection_base(buzzer) is None
+
+
+class TestRunVerification:
+    def test_refuses_to_guess_a_schedule(self, tmp_path: Path, capsys):
+        from overhead_inject_common import run_verification
+
+        report = {"wav_start_time": "09:00"}
+        assert run_verification(tmp_path / "out.wav", report) == 1
+        assert "no schedule_dir, date, courts" in capsys.readouterr().err
+
+    def test_missing_schedule_dir_fails(self, tmp_path: Path, capsys):
+        from overhead_inject_common import run_verification
+
+        report = {
+            "wav_start_time": "09:00",
+            "schedule": {"schedule_dir": str(tmp_path / "gone"), "date": "2026-06-20", "courts": [2]},
+        }
+        assert run_verification(tmp_path / "out.wav", report) == 1
+        assert "schedule dir not found" in capsys.readouterr().err
+
+    def test_cli_fills_in_what_the_report_lacks(self, tmp_path: Path, monkeypatch):
+        import verify_overhead_schedule
+        from overhead_inject_common import run_verification, schedule_overrides
+
+        seen = []
+
+        def fake_load_games(schedule_dir, date, courts):
+            seen.append((schedule_dir, date, courts))
+            raise FileNotFoundError("stop here")
+
+        monkeypatch.setattr(verify_overhead_schedule, "load_games", fake_load_games)
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "schedule").mkdir()
+        report = {"wav_start_time": "09:00", "schedule": {"schedule_dir": "/elsewhere", "date": "2026-06-20"}}
+        args = argparse.Namespace(schedule_dir=Path("schedule"), date=None, courts="4")
+        assert run_verification(tmp_path / "out.wav", report, schedule_overrides(args)) == 1
+        # A relative --schedule-dir is the injector's working directory, not the repo's.
+        assert seen == [((tmp_path / "schedule").resolve(), "2026-06-20", [4])]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import struct
+import wave
+from pathlib import Path
+
+import pytest
+
+from conftest import write_pcm_wav
+from overhead_inject_common import add_to_injection_plan, load_injection_plan
+from overhead_mix import (
+    ClipPlacement,
+    copy_range,
+    default_output_path,
+    mix_clips,
+    patch_clips,
+    plan_placements,
+)
+
+
+def read_pcm_wav(path: Path) -> tuple[list[int], int, int]:
+    with wave.open(str(path), "rb") as handle:
+        frames = handle.readframes(handle.getnframes())
+        channels = handle.getnchannels()
+        rate = handle.getframerate()
+    return list(struct.unpack(f"<{len(frames) // 2}h", frames)), rate, channels
+
+
+class TestMixClips:
+    def test_places_clip_at_sample_offset_and_copies_the_rest(self, tmp_path: Path):
+        source = tmp_path / "day.wav"
+        clip = tmp_path / "clip.wav"
+        out = tmp_path / "out.wav"
+        write_pcm_wav(source, [100] * 8000)
+        write_pcm_wav(clip, [1000] * 4)
+
+        stats = mix_clips(source, out, [ClipPlacement(clip, at=0.5)], block_seconds=0.1)
+
+        samples, rate, channels = read_pcm_wav(out)
+        assert (rate, channels, len(samples)) == (8000, 1, 8000)
+        assert samples[3999] == 100
+        assert samples[4000:4004] == [1100] * 4
+        assert samples[4004] == 100
+        assert stats.mixed_blocks == 1
+        assert stats.copied_blocks == 9
+        assert stats.limited_samples == 0
+
+    def test_gain_and_mono_clip_on_stereo_source(self, tmp_path: Path):
+        source = tmp_path / "day.wav"
+        clip = tmp_path / "clip.wav"
+        out = tmp_path / "out.wav"
+        write_pcm_wav(source, [0] * 1600, channels=2)
+        write_pcm_wav(clip, [2000] * 10)
+
+        mix_clips(source, out, [ClipPlacement(clip, at=0.0, gain_db=-6.0206)])
+
+        samples, _, channels = read_pcm_wav(out)
+        assert channels == 2
+        assert samples[:20] == [1000] * 20
+        assert samples[20] == 0
+
+    def test_overlapping_clips_across_block_boundary_are_limited(self, tmp_path: Path):
+        source = tmp_path / "day.wav"
+        clip = tmp_path / "clip.wav"
+        out = tmp_path / "out.wav"
+        write_pcm_wav(source, [20000] * 800)
+        write_pcm_wav(clip, [20000] * 100)
+
+        stats = mix_clips(
+            source,
+            out,
+            [ClipPlacement(clip, at=0.0125), ClipPlacement(clip, at=0.0125)],
+            block_seconds=0.02,
+        )
+
+        samples, _, _ = read_pcm_wav(out)
+        assert samples[99] == 20000
+        assert all(30000 < value <= 32767 for value in samples[100:200])
+        assert samples[200] == 20000
+        assert stats.limited_samples == 100
+        assert stats.mixed_blocks == 2
+
+
+class TestPatchClips:
+    def test_matches_streaming_mix(self, tmp_path: Path):
+        source = tmp_path / "day.wav"
+        clip = tmp_path / "clip.wav"
+        write_pcm_wav(source, [(i * 37) % 20000 - 10000 for i in range(16000)], channels=2)
+        write_pcm_wav(clip, [15000, -15000] * 50)
+        placements = [ClipPlacement(clip, 0.25), ClipPlacement(clip, 0.26, -6.0), ClipPlacement(clip, 0.9)]
+
+        mix_clips(source, tmp_path / "stream.wav", placements, block_seconds=0.1)
+        stats = patch_clips(source, tmp_path / "patch.wav", placements)
+
+        assert (tmp_path / "patch.wav").read_bytes() == (tmp_path / "stream.wav").read_bytes()
+        assert stats.regions == [(2000, 2180), (7200, 7300)]
+        assert stats.bytes_written == 280 * 4
+
+    def test_rerun_restores_old_regions_in_place(self, tmp_path: Path):
+        source = tmp_path / "day.wav"
+        clip = tmp_path / "clip.wav"
+        out = tmp_path / "out.wav"
+        write_pcm_wav(source, [100] * 8000)
+        write_pcm_wav(clip, [1000] * 40)
+
+        first = patch_clips(source, out, [ClipPlacement(clip, 0.5)])
+        sidecar = tmp_path / "out.wav.injections.json"
+        sidecar.write_text("{}", encoding="utf-8")
+        second = patch_clips(source, out, [ClipPlacement(clip, 0.6)], first.as_dict(), sidecar)
+
+        samples, _, _ = read_pcm_wav(out)
+        assert second.method == "in_place"
+        assert second.bytes_copied == 80
+        assert not sidecar.exists()
+        assert samples[4000:4040] == [100] * 40
+        assert samples[4800:4840] == [1100] * 40
+        patch_clips(source, tmp_path / "fresh.wav", [ClipPlacement(clip, 0.6)])
+        assert out.read_bytes() == (tmp_path / "fresh.wav").read_bytes()
+
+    def test_changed_source_is_cloned_again(self, tmp_path: Path):
+        source = tmp_path / "day.wav"
+        clip = tmp_path / "clip.wav"
+        out = tmp_path / "out.wav"
+        write_pcm_wav(source, [100] * 8000)
+        write_pcm_wav(clip, [1000] * 40)
+        first = patch_clips(source, out, [ClipPlacement(clip, 0.5)])
+
+        write_pcm_wav(source, [200] * 8000)
+        second = patch_clips(source, out, [ClipPlacement(clip, 0.5)], first.as_dict())
+
+        samples, _, _ = read_pcm_wav(out)
+        assert second.method != "in_place"
+        assert samples[0] == 200
+        assert samples[4000] == 1200
+
+    def test_copy_range_copies_at_same_offset(self, tmp_path: Path):
+        src = tmp_path / "src.bin"
+        dst = tmp_path / "dst.bin"
+        src.write_bytes(bytes(range(256)) * 4)
+        dst.write_bytes(b"\x00" * 1024)
+        with src.open("rb") as a, dst.open("r+b") as b:
+            copy_range(a.fileno(), b.fileno(), 300, 100)
+        data = dst.read_bytes()
+        assert data[300:400] == (bytes(range(256)) * 4)[300:400]
+        assert data[:300] == b"\x00" * 300
+        assert data[400:] == b"\x00" * 624
+
+
+class TestInjectionPlan:
+    def test_replaces_entry_of_same_type_and_keeps_order(self, tmp_path: Path):
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [0] * 80)
+        plan_path = tmp_path / "day.injection_plan.json"
+
+        add_to_injection_plan(plan_path, wav, "no_blocking", Path("nb.wav"), [1.0], {"a": 1})
+        add_to_injection_plan(plan_path, wav, "start_buzzer", Path("sb.wav"), [2.0, 3.0], {"b": 2}, -3.0)
+        plan = add_to_injection_plan(plan_path, wav, "no_blocking", Path("nb.wav"), [1.5], {"a": 3})
+
+        assert [e["injection_type"] for e in plan["entries"]] == ["start_buzzer", "no_blocking"]
+        assert load_injection_plan(plan_path, wav) == plan
+        placements = plan_placements(plan)
+        assert [(p.clip.name, p.at, p.gain_db) for p in placements] == [
+            ("sb.wav", 2.0, -3.0),
+            ("sb.wav", 3.0, -3.0),
+            ("nb.wav", 1.5, 0.0),
+        ]
+        assert default_output_path(wav, plan).name == "day_with_start_buzzer_and_no_blocking.wav"
+
+    def test_rejects_plan_for_another_wav(self, tmp_path: Path):
+        plan_path = tmp_path / "plan.json"
+        add_to_injection_plan(plan_path, tmp_path / "a.wav", "no_blocking", Path("nb.wav"), [1.0], {})
+        with pytest.raises(ValueError):
+            load_injection_plan(plan_path, tmp_path / "b.wav")
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import overhead_models
+from overhead_models import ModelPool, ModelPoolServer, RemoteModelPool, configure_model_pool
+
+
+class FakeModel:
+    def __init__(self, name: str):
+        self.name = name
+        self.calls: list[tuple[object, dict]] = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append((audio, options))
+        length = len(audio) if not isinstance(audio, str) else -1
+        return iter([SimpleNamespace(start=0.5, end=1.5, text=f"{self.name}:{length}")]), None
+
+
+def fake_pool(size: int = 2) -> tuple[ModelPool, list[str]]:
+    loads: list[str] = []
+
+    def loader(name, cpu_threads, num_workers):
+        loads.append(name)
+        return FakeModel(name)
+
+    return ModelPool(size, cpu_threads=2, loader=loader, pipeline_factory=lambda model: model), loads
+
+
+class TestModelPool:
+    def test_reuses_loaded_models_and_evicts_least_recently_used(self):
+        pool, loads = fake_pool(size=2)
+        small = pool.model("small")
+        pool.model("base")
+        assert pool.model("small") is small
+        pool.model("tiny")
+        pool.model("small")
+        pool.model("base")
+
+        assert loads == ["small", "base", "tiny", "base"]
+        assert pool.stats.evictions == 2
+        assert pool.stats.loaded == ["small", "base"]
+        assert pool.stats.hits == 2
+
+    def test_pipeline_is_dropped_with_its_model(self):
+        pool, _ = fake_pool(size=1)
+        first = pool.pipeline("base")
+        assert pool.pipeline("base") is first
+        pool.model("small")
+        assert pool.pipeline("base") is not first
+
+    def test_configure_keeps_pool_when_settings_match(self, monkeypatch):
+        monkeypatch.setattr(overhead_models, "_pool", None)
+        monkeypatch.delenv(overhead_models.MODEL_DAEMON_ENV, raising=False)
+        pool = configure_model_pool(size=2, cpu_threads=3)
+        assert configure_model_pool(size=2, cpu_threads=3) is pool
+        assert configure_model_pool(size=3, cpu_threads=3) is not pool
+        assert isinstance(configure_model_pool(daemon="/tmp/x.sock"), RemoteModelPool)
+
+
+class TestModelDaemon:
+    @pytest.fixture
+    def daemon(self, tmp_path: Path):
+        pool, loads = fake_pool()
+        address = tmp_path / "models.sock"
+        server = ModelPoolServer(address, pool)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield RemoteModelPool(address), loads
+        server.shutdown()
+        server.server_close()
+
+    def test_remote_model_sends_audio_and_returns_segments(self, daemon):
+        remote, loads = daemon
+        audio = np.zeros(16000, dtype=np.float32)
+        for _ in range(3):
+            segments, _info = remote.model("small").transcribe(audio, vad_filter=True)
+        path_segments, _ = remote.pipeline("small").transcribe("/data/day.wav", batch_size=4)
+
+        assert [(s.start, s.end, s.text) for s in segments] == [(0.5, 1.5, "small:16000")]
+        assert path_segments[0].text == "small:-1"
+        assert loads == ["small"]
+        assert remote.stats.hits == 3
+
+    def test_daemon_errors_reach_the_client(self, daemon):
+        remote, _ = daemon
+        with pytest.raises(RuntimeError, match="unknown op"):
+            overhead_models.daemon_request(remote.address, {"op": "reload"})
+
+    def test_socket_is_owner_only_and_a_live_daemon_is_not_replaced(self, daemon):
+        remote, _ = daemon
+        assert remote.address.stat().st_mode & 0o777 == 0o600
+        with pytest.raises(RuntimeError, match="already serving"):
+            ModelPoolServer(remote.address, fake_pool()[0])
+        assert remote.stats.loaded == []
+
+    def test_stale_socket_is_replaced(self, tmp_path: Path):
+        import socket
+
+        address = tmp_path / "models.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(address))  # bound but never listening, like a crashed daemon's
+        server = ModelPoolServer(address, fake_pool()[0])
+        server.server_close()
+        assert address.is_socket()
+
+    def test_refuses_to_unlink_a_file_that_is_not_a_socket(self, tmp_path: Path):
+        address = tmp_path / "models.sock"
+        address.write_text("keep me", encoding="utf-8")
+        with pytest.raises(RuntimeError, match="not a socket"):
+            ModelPoolServer(address, fake_pool()[0])
+        assert address.read_text(encoding="utf-8") == "keep me"
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from conftest import write_pcm_wav
+from overhead_transcribe import (
+    TranscriptSegment,
+    TranscriptionChunk,
+    merge_chunk_segments,
+    plan_chunks,
+    plan_patch_windows,
+    silence_gaps,
+    snap_boundary,
+)
+
+
+class TestSilenceGaps:
+    def test_gaps_between_speech(self):
+        gaps = silence_gaps([(2.0, 4.0), (6.0, 9.0)], 0.0, 10.0)
+        assert gaps == [(0.0, 2.0), (4.0, 6.0), (9.0, 10.0)]
+
+    def test_no_speech_is_one_gap(self):
+        assert silence_gaps([], 5.0, 8.0) == [(5.0, 8.0)]
+
+
+class TestSnapBoundary:
+    def test_prefers_nearest_long_gap(self):
+        speech = [(580.0, 599.5), (601.0, 610.0), (614.0, 640.0)]
+        assert snap_boundary(600.0, speech, 580.0, 620.0) == 612.0
+
+    def test_keeps_nominal_when_all_speech(self):
+        assert snap_boundary(600.0, [(570.0, 630.0)], 580.0, 620.0) == 600.0
+
+
+class TestPlanChunks:
+    def test_short_file_is_single_chunk(self):
+        chunks = plan_chunks(300.0, 600.0, 5.0)
+        assert len(chunks) == 1
+        assert (chunks[0].start, chunks[0].end) == (0.0, 300.0)
+
+    def test_chunks_cover_duration_with_overlap(self):
+        chunks = plan_chunks(2000.0, 600.0, 5.0)
+        assert chunks[0].start == 0.0
+        assert chunks[-1].end == 2000.0
+        for prev, cur in zip(chunks, chunks[1:]):
+            assert prev.end == cur.start
+            assert cur.decode_start == cur.start - 5.0
+            assert prev.decode_end == prev.end + 5.0
+
+    def test_boundaries_snap_to_silence(self):
+        def speech(start: float, end: float) -> list[tuple[float, float]]:
+            return [(start, 604.0), (608.0, end)]
+
+        chunks = plan_chunks(1000.0, 600.0, 5.0, boundary_speech=speech)
+        assert chunks[0].end == 606.0
+
+
+class TestPlanPatchWindows:
+    def test_pads_and_merges_nearby_edits(self):
+        windows = plan_patch_windows([(100.0, 104.0), (112.0, 115.0), (500.0, 503.0)], 505.0)
+        assert [(w.start, w.end) for w in windows] == [(90.0, 125.0), (490.0, 505.0)]
+        assert (windows[0].decode_start, windows[1].decode_end) == (85.0, 505.0)
+
+    def test_edges_snap_into_silence(self):
+        def speech(start: float, end: float) -> list[tuple[float, float]]:
+            return [(start, 87.0), (89.0, 120.0), (122.0, end)]
+
+        [window] = plan_patch_windows([(100.0, 104.0)], 1000.0, boundary_speech=speech)
+        assert (window.start, window.end) == (88.0, 121.0)
+
+
+class TestMergeChunkSegments:
+    def test_overlap_segments_kept_once_in_order(self):
+        chunks = [
+            TranscriptionChunk(0, 0.0, 600.0, 0.0, 605.0),
+            TranscriptionChunk(1, 600.0, 1200.0, 595.0, 1200.0),
+        ]
+        shared = TranscriptSegment(start=598.0, end=599.0, text="Halfway through")
+        late = TranscriptSegment(start=601.0, end=603.0, text="Here we go")
+        merged = merge_chunk_segments(
+            chunks,
+            {
+                0: [TranscriptSegment(start=10.0, end=12.0, text="Court two"), shared, late],
+                1: [shared, late, TranscriptSegment(start=900.0, end=901.0, text="90 seconds")],
+            },
+        )
+        assert [segment.start for segment in merged] == [10.0, 598.0, 601.0, 900.0]
+
+
+class TestChunkedResume:
+    def test_cached_chunks_are_not_retranscribed(self, tmp_path, monkeypatch):
+        import overhead_transcribe
+
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [0] * 8000 * 90)
+        store = overhead_transcribe.TranscriptChunkStore(tmp_path / "chunks")
+        calls: list[list[int]] = []
+
+        def fake_results(wav_path, model_name, chunks, workers, cpu_threads, word_timestamps=False):
+            calls.append([chunk.index for chunk in chunks])
+            for chunk in chunks:
+                yield chunk.index, [(chunk.start + 1.0, chunk.start + 2.0, f"chunk {chunk.index}", None)], 1.0
+
+        monkeypatch.setattr(overhead_transcribe, "iter_chunk_results", fake_results)
+        monkeypatch.setattr(overhead_transcribe, "decode_pcm_range", lambda *args: None)
+        monkeypatch.setattr(overhead_transcribe, "vad_speech_spans", lambda audio, offset: [])
+
+        first, stats = overhead_transcribe.transcribe_chunked(
+            wav, "tiny", 90.0, 1, chunk_seconds=30.0, store=store
+        )
+        second, resumed = overhead_transcribe.transcribe_chunked(
+            wav, "tiny", 90.0, 1, chunk_seconds=30.0, store=store
+        )
+        assert calls == [[0, 1, 2], []]
+        assert stats.cached_chunks == 0
+        assert resumed.cached_chunks == 3
+        assert first == second
+
+    def test_stream_yields_settled_prefixes(self, tmp_path, monkeypatch):
+        import overhead_transcribe
+
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [0] * 8000 * 10)
+
+        def fake_results(wav_path, model_name, chunks, workers, cpu_threads, word_timestamps=False):
+            for chunk in chunks:
+                yield chunk.index, [(chunk.start + 1.0, chunk.start + 2.0, f"chunk {chunk.index}", None)], 1.0
+
+        monkeypatch.setattr(overhead_transcribe, "iter_chunk_results", fake_results)
+        monkeypatch.setattr(overhead_transcribe, "decode_pcm_range", lambda *args: None)
+        monkeypatch.setattr(overhead_transcribe, "vad_speech_spans", lambda audio, offset: [])
+
+        progress = list(overhead_transcribe.stream_chunked(wav, "tiny", 300.0, 1, chunk_seconds=100.0))
+        assert [p.done for p in progress] == [False, False, True]
+        assert [p.settled_until for p in progress[:2]] == [70.0, 170.0]
+        assert [len(p.segments) for p in progress] == [1, 2, 3]
+        assert progress[-1].stats is not None and progress[-1].stats.chunks == 3
+
+    def test_cache_key_depends_on_model_and_range(self, tmp_path):
+        from overhead_audio import read_wav_layout
+        from overhead_transcribe import chunk_cache_key
+
+        wav = tmp_path / "day.wav"
+        write_pcm_wav(wav, [0] * 8000 * 10)
+        layout = read_wav_layout(wav)
+        chunk = TranscriptionChunk(0, 0.0, 5.0, 0.0, 6.0)
+        other = TranscriptionChunk(1, 5.0, 10.0, 4.0, 10.0)
+        key = chunk_cache_key(wav, layout, chunk, "small")
+        assert key == chunk_cache_key(wav, layout, chunk, "small")
+        assert key != chunk_cache_key(wav, layout, chunk, "base")
+        assert key != chunk_cache_key(wav, layout, other, "small")
+        assert key != chunk_cache_key(wav, layout, chunk, "small", word_timestamps=True)
+
+
+def test_piece_words_from_whisper_and_pooled_segments():
+    from types import SimpleNamespace
+
+    from overhead_transcribe import piece_words
+
+    whisper = SimpleNamespace(words=[SimpleNamespace(start=0.5, end=0.9, word=" Halfway", probability=0.9)])
+    assert piece_words(whisper, 100.0) == [(100.5, 100.9, " Halfway")]
+    assert piece_words(SimpleNamespace(words=[[0.5, 0.9, " Halfway"]]), 10.0) == [(10.5, 10.9, " Halfway")]
+    assert piece_words(SimpleNamespace(start=0.0, end=1.0, text="x"), 0.0) is None
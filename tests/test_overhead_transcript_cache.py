@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from overhead_transcribe import TranscriptSegment
+from overhead_transcript_cache import (
+    ColumnarTranscript,
+    is_columnar,
+    read_refinement_file,
+    read_transcript_file,
+    read_transcript_json,
+    refinement_cache_path,
+    transcript_cache_path,
+    write_columnar_transcript,
+    write_refinement_file,
+)
+from verify_overhead_schedule import load_refinement_cache, save_refinement_cache, write_transcript_cache
+
+SEGMENTS = [
+    TranscriptSegment(7200.02, 7203.5, "Court four, Brawlers versus Titans"),
+    TranscriptSegment(12.0, 14.25, "Two minutes to get to your next court"),
+    TranscriptSegment(30.5, 31.0, "Café olé 🎉"),
+    TranscriptSegment(31.0, 31.0, ""),
+]
+
+
+def test_round_trip_sorts_and_keeps_exact_times(tmp_path: Path):
+    path = tmp_path / "day.wav.transcript.cols"
+    write_columnar_transcript(path, {"model": "small", "wav_size": 10}, SEGMENTS)
+
+    assert is_columnar(path)
+    transcript = ColumnarTranscript(path)
+    assert transcript.meta == {"model": "small", "wav_size": 10}
+    assert transcript.segments() == sorted(SEGMENTS, key=lambda s: s.start)
+    assert len(transcript) == 4 and not transcript.has_words
+    assert transcript.between(30.0, 31.0) == [SEGMENTS[2], SEGMENTS[3]]
+    assert transcript.between(100.0, 200.0) == []
+    assert transcript.window(7200.02, 7200.02) == range(3, 4)
+
+
+def test_word_timings_export_as_json(tmp_path: Path):
+    path = tmp_path / "words.cols"
+    words = [[(12.0, 12.4, " Two"), (12.4, 13.0, " minutes")], [(30.5, 31.0, " Café")]]
+    segments = [
+        TranscriptSegment(30.5, 31.0, "Café olé 🎉", words[1]),
+        TranscriptSegment(12.0, 14.25, "Two minutes to get to your next court", words[0]),
+        TranscriptSegment(40.0, 41.0, "no words"),
+    ]
+    write_columnar_transcript(path, {}, segments)
+
+    transcript = ColumnarTranscript(path)
+    assert transcript.has_words
+    assert transcript.words(0) == words[0]
+    assert [s.words for s in transcript.segments()] == [words[0], words[1], []]
+    assert transcript.between(30.0, 50.0)[0].words == words[1]
+    exported = transcript.to_json()
+    assert exported["segments"][1] == {
+        "start": 30.5,
+        "end": 31.0,
+        "text": "Café olé 🎉",
+        "words": [[30.5, 31.0, " Café"]],
+    }
+    json.dumps(exported)
+    assert TranscriptSegment.from_dict(exported["segments"][1]) == segments[0]
+
+
+def test_transcript_cache_defaults_to_columnar_and_reads_legacy_json(tmp_path: Path):
+    wav = tmp_path / "day.wav"
+    wav.write_bytes(b"\0" * 64)
+    legacy = tmp_path / "day.wav.transcript.json"
+    write_transcript_cache(legacy, wav, "small", SEGMENTS)
+    assert json.loads(legacy.read_text(encoding="utf-8"))["segments"][0]["text"].startswith("Court four")
+
+    cache = transcript_cache_path(wav)
+    assert cache.name == "day.wav.transcript.cols"
+    meta, segments = read_transcript_file(cache)
+    assert meta["model"] == "small" and meta["wav_size"] == 64
+    assert segments == SEGMENTS
+
+    write_transcript_cache(cache, wav, "small", SEGMENTS)
+    assert is_columnar(cache)
+    by_start = sorted(read_transcript_json(legacy)["segments"], key=lambda item: item["start"])
+    assert read_transcript_json(cache)["segments"] == by_start
+    assert read_transcript_file(tmp_path / "other.wav.transcript.cols") is None
+
+
+def test_refinement_cache_round_trip(tmp_path: Path):
+    path = refinement_cache_path(tmp_path / "day.wav.transcript.cols")
+    assert path.name == "day.wav.transcript.refined.cols"
+    assert load_refinement_cache(path)["entries"] == {}
+
+    data = {
+        "chunk_sec": 8,
+        "refine_model": "base",
+        "entries": {
+            "12.0": {
+                "original_text": "Two minutes. Court four, Brawlers",
+                "segments": [
+                    {"start": 12.0, "end": 13.0, "text": "Two minutes."},
+                    {"start": 13.0, "end": 15.5, "text": "Court four, Brawlers"},
+                ],
+            },
+            "40.5": {"original_text": "nothing", "segments": []},
+        },
+    }
+    save_refinement_cache(path, data)
+    assert is_columnar(path)
+    assert load_refinement_cache(path) == data
+
+    legacy = tmp_path / "old.refined.json"
+    write_refinement_file(legacy, data)
+    assert read_refinement_file(legacy.with_suffix(".cols")) == data
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from conftest import FakeRefinementPipeline, write_pcm_wav
+from overhead_audio import OverheadAudio
+from overhead_transcribe import TranscriptSegment, TranscriptionChunk
+from overhead_vad import SpeechRegions, VadSettings, speech_regions, speech_regions_path
+from verify_overhead_schedule import refine_bundled_segments
+
+RATE = 16000
+# (start, end) seconds of the synthetic announcements in crowd_with_cues.
+CUES = [(12.0, 15.0), (40.0, 46.0)]
+
+
+def crowd_with_cues(seconds: int = 60, seed: int = 3) -> np.ndarray:
+    """Broadband crowd noise around -40 dBFS with voiced, syllable-modulated cues over it."""
+    rng = np.random.default_rng(seed)
+    signal = rng.normal(0.0, 0.01, seconds * RATE)
+    for start, end in CUES:
+        t = np.arange(int((end - start) * RATE)) / RATE
+        phase = 2 * np.pi * np.cumsum(120 + 20 * np.sin(2 * np.pi * 0.5 * t)) / RATE
+        voiced = sum(np.sin(k * phase) / k for k in range(1, 20))
+        syllables = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+        signal[int(start * RATE) : int(end * RATE)] += 0.1 * voiced * syllables
+    return np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+
+
+def test_detect_keeps_cues_and_skips_crowd_noise():
+    regions = SpeechRegions.detect(crowd_with_cues())
+    spans = regions.window(0.0, regions.duration)
+    assert len(spans) == len(CUES)
+    for (lo, hi), (start, end) in zip(spans, CUES):
+        assert lo <= start and hi >= end
+        assert start - lo < 1.5 and hi - end < 1.5
+    assert regions.skipped_fraction > 0.75
+    assert regions.window(13.0, 41.0) == [(13.0, spans[0][1]), (spans[1][0], 41.0)]
+
+
+def test_regions_persist_beside_wav_and_follow_settings(tmp_path: Path):
+    wav = tmp_path / "day.wav"
+    write_pcm_wav(wav, crowd_with_cues().tolist(), sample_rate=RATE)
+
+    built = speech_regions(wav)
+    path = speech_regions_path(OverheadAudio.open(wav))
+    assert path.exists() and path.parent.name == ".overhead_pcm"
+    assert built.build_seconds > 0
+
+    loaded = speech_regions(wav)
+    assert loaded.build_seconds == 0.0
+    assert loaded.window(0.0, 60.0) == built.window(0.0, 60.0)
+
+    wide = speech_regions(wav, VadSettings(merge_gap_seconds=60.0))
+    assert len(wide) == 1 and not path.exists()
+
+
+def test_chunks_without_speech_are_never_transcribed(tmp_path: Path, monkeypatch):
+    import overhead_transcribe
+
+    wav = tmp_path / "day.wav"
+    write_pcm_wav(wav, [0] * 8000 * 10)
+    sent: list[TranscriptionChunk] = []
+
+    def fake_results(wav_path, model_name, chunks, workers, cpu_threads, word_timestamps=False):
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk.index, [(lo, hi, f"chunk {chunk.index}", None) for lo, hi in chunk.speech], 2.0
+
+    monkeypatch.setattr(overhead_transcribe, "iter_chunk_results", fake_results)
+    speech = SpeechRegions(starts=np.array([30.0, 250.0]), ends=np.array([36.0, 254.0]), duration=300.0)
+    segments, stats = overhead_transcribe.transcribe_chunked(
+        wav, "tiny", 300.0, 1, chunk_seconds=100.0, speech=speech
+    )
+
+    assert [chunk.index for chunk in sent] == [0, 2]
+    assert sent[0].speech == ((30.0, 36.0),)
+    assert [(s.start, s.text) for s in segments] == [(30.0, "chunk 0"), (250.0, "chunk 2")]
+    assert stats.cached_chunks == 0
+    assert stats.skipped_fraction == 1 - 10.0 / 300.0
+    report = stats.as_dict()["vad_prefilter"]
+    assert report["speech_seconds"] == 10.0 and report["skipped_seconds"] > 190.0
+    assert stats.saved_seconds > 0
+
+
+def test_chunk_is_decoded_as_clips_at_absolute_times(monkeypatch):
+    from types import SimpleNamespace
+
+    import overhead_transcribe
+
+    calls: list[dict] = []
+
+    class FakeModel:
+        def transcribe(self, audio, **options):
+            calls.append(options)
+            return iter([SimpleNamespace(start=2.0, end=3.0, text=" Court four", words=None)]), None
+
+    monkeypatch.setattr(overhead_transcribe, "_worker_model", FakeModel())
+    monkeypatch.setattr(overhead_transcribe, "decode_pcm_range", lambda *args: None)
+    chunk = TranscriptionChunk(0, 100.0, 200.0, 95.0, 205.0, speech=((96.0, 99.5), (150.0, 152.0)))
+    _index, pieces, _elapsed = overhead_transcribe._transcribe_chunk("day.wav", chunk)
+
+    assert calls == [{"vad_filter": False, "clip_timestamps": [1.0, 4.5, 55.0, 57.0]}]
+    assert pieces == [(97.0, 98.0, "Court four", None)]
+    silent = TranscriptionChunk(1, 200.0, 300.0, 195.0, 300.0, speech=())
+    assert overhead_transcribe._transcribe_chunk("day.wav", silent)[1] == [] and len(calls) == 1
+
+
+def test_refinement_trims_sub_chunks_to_speech_regions(monkeypatch):
+    import verify_overhead_schedule
+
+    def no_silero(audio, offset):
+        raise AssertionError("Silero VAD should not run with a prefilter index")
+
+    monkeypatch.setattr(verify_overhead_schedule, "vad_speech_spans", no_silero)
+    speech = SpeechRegions(starts=np.array([12.0]), ends=np.array([14.0]), duration=60.0)
+    bundle = TranscriptSegment(start=11.0, end=20.0, text="Two minutes, one minute")
+    pipeline = FakeRefinementPipeline()
+    refined = refine_bundled_segments(
+        np.zeros(RATE * 40, dtype=np.float32), 10.0, [bundle], pipeline, 8, speech=speech
+    )
+
+    assert pipeline.calls == [[{"start": 0.0, "end": 2.0}]]
+    assert [(item.start, item.text) for item in refined[0]] == [(12.5, "clip 0")]
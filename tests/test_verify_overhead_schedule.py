@@ -5,21 +5,38 @@ from pathlib import Path
 
 import pytest
 
+from conftest import FakeRefinementPipeline
 from verify_overhead_schedule import (
     ExpectedEvent,
     Game,
+    RefinementStats,
+    SegmentIndex,
+    SegmentScorer,
     TranscriptSegment,
+    augment_slot_segments,
+    best_in_row,
     build_expected_events,
     classify_speech_role,
+    collect_slot_speech,
     in_skip_range,
+    infer_wav_start_time,
     load_games,
     match_events_to_transcript,
+    match_slot_events,
     normalize_team,
     parse_skip_ranges,
+    refine_bundled_segments,
+    refinement_sub_chunks,
     score_segment,
     seconds_to_hms,
+    split_on_cue_phrases,
     time_to_seconds,
+    venue_cues_in_text,
+    verify_by_round,
+    verify_by_round_streaming,
+    verify_overhead,
 )
+from overhead_transcribe import TranscriptProgress
 
 FIXTURES = Path(__file__).resolve().parent / "fixtures"
 SCHEDULE_DIR = FIXTURES / "schedule"
@@ -178,3 +195,428 @@ class TestMatching:
         assert len(results) == 1
         assert results[0].matched
         assert results[0].matched_text == segments[0].text
+
+    def test_assignment_keeps_segment_for_the_better_match(self):
+        def cue(event_type: str, offset: float) -> ExpectedEvent:
+            return ExpectedEvent(
+                wall_time="09:00",
+                wall_seconds=time_to_seconds("09:00") + int(offset),
+                wav_offset_seconds=offset,
+                event_type=event_type,
+                court_num=0,
+                court="ALL",
+                home_team="",
+                away_team="",
+                round="Round 1",
+                venue_wide=True,
+            )
+
+        # The "one minute" call was never made; its window still reaches the 30 s call.
+        events = [cue("transition_1min", 60.0), cue("transition_30sec", 90.0)]
+        segments = [TranscriptSegment(start=91.0, end=94.0, text="30 seconds to get to your court")]
+
+        greedy = match_events_to_transcript(events, segments, 90, 0.55, matcher="greedy")
+        assert [r.status for r in greedy] == ["matched", "missed"]
+
+        results = match_events_to_transcript(events, segments, 90, 0.55)
+        assert [r.status for r in results] == ["missed", "matched"]
+        assert results[1].actual_start == 91.0
+        # Its only candidate went to the 30 s call, so it had nothing left to score.
+        assert results[0].confidence == 0.0
+        assert greedy[1].confidence == 0.0
+
+    def test_assignment_lets_court_calls_share_a_bundled_segment(self):
+        games = [
+            Game("Plank", "Scooby Snacks", "09:00", 25, "Court 2", 2, "Round 1"),
+            Game("Totally Spies", "Grims Reapers", "09:00", 25, "Court 3", 3, "Round 1"),
+        ]
+        events = [
+            e
+            for e in build_expected_events(games, "09:00", [])
+            if e.event_type == "court_announcement"
+        ]
+        segments = [
+            TranscriptSegment(
+                start=2.0,
+                end=14.0,
+                text="On court two, home team Plank versus Scooby Snacks. "
+                "On court three, home team Totally Spies versus Grims Reapers.",
+            )
+        ]
+
+        for matcher in ("greedy", "assignment"):
+            results = match_slot_events(events, segments, 90, 0.55, matcher=matcher)
+            assert [(r.expected.court_num, r.status) for r in results] == [(2, "matched"), (3, "matched")]
+
+    def test_assignment_matches_greedy_on_a_clean_day(self, capsys):
+        from bench_overhead import synthetic_day
+
+        games, segments = synthetic_day(2.0, [2, 3])
+        runs = [
+            verify_by_round(games, segments, Path("x.wav"), "09:00", 90, 0.55, [], None, refine_bundled=False, matcher=m)
+            for m in ("greedy", "assignment")
+        ]
+        assert [r["matches"] for r in runs[0]] == [r["matches"] for r in runs[1]]
+
+
+class TestSegmentIndex:
+    @pytest.fixture
+    def index(self) -> SegmentIndex:
+        return SegmentIndex(
+            [
+                TranscriptSegment(start=30.0, end=31.0, text="c"),
+                TranscriptSegment(start=10.0, end=25.0, text="a"),
+                TranscriptSegment(start=20.0, end=21.0, text="b"),
+                TranscriptSegment(start=40.0, end=45.0, text="d"),
+            ]
+        )
+
+    def test_sorted_by_start(self, index: SegmentIndex):
+        assert [segment.text for segment in index] == ["a", "b", "c", "d"]
+
+    def test_window_is_inclusive(self, index: SegmentIndex):
+        assert list(index.window(20.0, 30.0)) == [1, 2]
+        assert [segment.text for segment in index.between(0.0, 15.0)] == ["a"]
+        assert index.between(46.0, 50.0) == []
+
+    def test_overlapping_finds_long_earlier_segment(self, index: SegmentIndex):
+        assert index.overlapping(22.0, 23.0) == [0]
+        assert index.overlapping(21.0, 30.0) == [0, 1, 2]
+
+    def test_replaced_keeps_order(self, index: SegmentIndex):
+        replaced = index.replaced([0], [TranscriptSegment(start=12.0, end=13.0, text="a2")])
+        assert [segment.text for segment in replaced] == ["a2", "b", "c", "d"]
+        assert len(index) == 4
+
+    def test_collect_slot_speech_uses_window(self, index: SegmentIndex):
+        speech = collect_slot_speech(index, slot_anchor=25.0, wav_start_seconds=0, pre_seconds=5, post_seconds=6)
+        assert [item["text"] for item in speech] == ["b", "c"]
+
+    def test_augment_without_bundles_returns_same_index(self, index: SegmentIndex):
+        merged, refinements = augment_slot_segments(
+            index, 25.0, Path("missing.wav"), "base", 8, None
+        )
+        assert merged is index
+        assert refinements == []
+
+
+class TestSegmentScorer:
+    def test_features_computed_once_per_text(self):
+        scorer = SegmentScorer()
+        first = scorer.features("Players line up, here we go")
+        assert scorer.features("Players line up, here we go") is first
+        assert first.cue_hits["play_start"] == 2
+        assert first.cue_hits["halfway"] == 0
+
+    def test_court_hits_cached_per_court(self):
+        scorer = SegmentScorer()
+        features = scorer.features("Court three, home team Gamma")
+        assert scorer.court_mentioned(features, 3)
+        assert not scorer.court_mentioned(features, 2)
+        assert features.courts == {3: True, 2: False}
+
+    def test_venue_cues_in_text(self):
+        assert venue_cues_in_text("Halfway through, 90 seconds remaining") == [
+            "halfway",
+            "ninety_seconds",
+        ]
+
+    def test_venue_score_scales_with_cue_hits(self):
+        event = ExpectedEvent(
+            wall_time="09:04",
+            wall_seconds=0,
+            wav_offset_seconds=240.0,
+            event_type="play_start",
+            court_num=0,
+            court="ALL",
+            home_team="",
+            away_team="",
+            round="Round 1",
+            venue_wide=True,
+        )
+        scorer = SegmentScorer()
+        assert scorer.score(event, TranscriptSegment(0.0, 1.0, "here we go")) == 0.65
+        assert scorer.score(event, TranscriptSegment(0.0, 1.0, "Players line up, here we go")) == 0.8
+        assert scorer.score(event, TranscriptSegment(0.0, 1.0, "Halfway through")) == 0.0
+
+
+class TestBatchScoring:
+    def _court_event(self, court_num: int, home: str, away: str) -> ExpectedEvent:
+        return ExpectedEvent(
+            wall_time="09:00",
+            wall_seconds=9 * 3600,
+            wav_offset_seconds=0.0,
+            event_type="court_announcement",
+            court_num=court_num,
+            court=f"Court {court_num}",
+            home_team=home,
+            away_team=away,
+            round="Round 1",
+            venue_wide=False,
+        )
+
+    def test_matrix_matches_pairwise_scores(self):
+        events = [
+            self._court_event(2, "Alpha Squad", "Beta Brawlers"),
+            self._court_event(3, "Gamma Titans", "Delta Crusaders"),
+        ]
+        segments = [
+            TranscriptSegment(0.0, 4.0, "Court two, Alpha Squad versus Beta Brawlers"),
+            TranscriptSegment(5.0, 9.0, "Court three, home team Gamma Titans"),
+            TranscriptSegment(10.0, 11.0, "Make some noise"),
+            TranscriptSegment(12.0, 13.0, "Make some noise"),
+        ]
+        scorer = SegmentScorer()
+        matrix = scorer.score_matrix(events, segments)
+        assert matrix.shape == (2, 4)
+        for row, event in enumerate(events):
+            for col, segment in enumerate(segments):
+                assert matrix[row, col] == scorer.score(event, segment)
+
+    def test_best_in_row_keeps_first_maximum(self):
+        import numpy as np
+
+        scores = np.array([[0.2, 0.7, 0.7, 0.1], [0.0, 0.0, 0.0, 0.0]])
+        assert best_in_row(scores, 0) == (1, 0.7)
+        assert best_in_row(scores, 0, 2, 4) == (2, 0.7)
+        assert best_in_row(scores, 1) == (None, 0.0)
+        assert best_in_row(scores, 0, 2, 2) == (None, 0.0)
+
+    def test_infer_wav_start_time_from_matrix(self):
+        events = [self._court_event(2, "Alpha Squad", "Beta Brawlers")]
+        segments = [
+            TranscriptSegment(30.0, 31.0, "Make some noise"),
+            TranscriptSegment(120.0, 124.0, "Court two, Alpha Squad versus Beta Brawlers"),
+        ]
+        assert infer_wav_start_time(events, segments, 90, 0.55) == "08:58"
+        assert infer_wav_start_time(events, segments[:1], 90, 0.55) is None
+
+
+class TestBatchedRefinement:
+    def test_sub_chunks_follow_chunk_size(self):
+        bundle = TranscriptSegment(start=101.0, end=118.0, text="Halfway through, 90 seconds")
+        assert refinement_sub_chunks(bundle, 8) == [(100.0, 108.0), (108.0, 116.0), (116.0, 118.0)]
+
+    def test_all_bundles_refined_in_one_batch(self, monkeypatch):
+        import numpy as np
+
+        import verify_overhead_schedule
+
+        monkeypatch.setattr(
+            verify_overhead_schedule, "vad_speech_spans", lambda audio, offset: [(0.0, len(audio) / 16000)]
+        )
+        bundles = [
+            TranscriptSegment(start=11.0, end=20.0, text="Two minutes, one minute"),
+            TranscriptSegment(start=41.0, end=44.0, text="Halfway through, 90 seconds"),
+        ]
+        pipeline = FakeRefinementPipeline()
+        stats = RefinementStats()
+        refined = refine_bundled_segments(
+            np.zeros(16000 * 40, dtype=np.float32), 10.0, bundles, pipeline, 8, stats=stats
+        )
+        assert len(pipeline.calls) == 1
+        assert stats.sub_chunks == 3 and stats.batches == 1
+        assert [(item.start, item.text) for item in refined[0]] == [(10.5, "clip 0"), (18.5, "clip 1")]
+        assert [(item.start, item.text) for item in refined[1]] == [(40.5, "clip 2")]
+
+    def test_augment_decodes_round_once(self, monkeypatch):
+        import numpy as np
+
+        import verify_overhead_schedule
+
+        decodes: list[tuple[float, float]] = []
+
+        def fake_decode(wav, start, duration):
+            decodes.append((start, duration))
+            return np.zeros(int(duration * 16000), dtype=np.float32)
+
+        monkeypatch.setattr(verify_overhead_schedule, "decode_pcm_range", fake_decode)
+        monkeypatch.setattr(
+            verify_overhead_schedule, "vad_speech_spans", lambda audio, offset: [(0.0, len(audio) / 16000)]
+        )
+        monkeypatch.setattr(verify_overhead_schedule, "get_refinement_pipeline", lambda name: FakeRefinementPipeline())
+        segments = [
+            TranscriptSegment(start=30.0, end=34.0, text="Halfway through, 90 seconds remaining"),
+            TranscriptSegment(start=60.0, end=62.0, text="Make some noise"),
+            TranscriptSegment(start=300.0, end=303.0, text="Halfway through. 90 seconds remaining"),
+        ]
+        cache: dict = {}
+        stats = RefinementStats()
+        merged, refinements = augment_slot_segments(
+            segments, 25.0, Path("day.wav"), "base", 8, cache, stats=stats
+        )
+        assert decodes == [(29.0, 274.0)]
+        assert len(refinements) == 2
+        assert "Make some noise" in [segment.text for segment in merged]
+        assert stats.segments == 2 and stats.cached_segments == 0
+
+        augment_slot_segments(segments, 25.0, Path("day.wav"), "base", 8, cache, stats=stats)
+        assert len(decodes) == 1
+        assert stats.cached_segments == 2
+
+    @staticmethod
+    def timed_words(text: str, start: float, step: float = 0.4) -> TranscriptSegment:
+        words = [(start + n * step, start + (n + 1) * step, f" {word}") for n, word in enumerate(text.split())]
+        return TranscriptSegment(start=start, end=words[-1][1], text=text, words=words)
+
+    def test_word_timings_split_bundles_at_cue_phrases(self):
+        bundle = self.timed_words(
+            "Two minutes to get to your next court. Court four, Alpha versus Beta. 30 seconds to get to your court",
+            100.0,
+        )
+        pieces = split_on_cue_phrases(bundle)
+        assert [piece.text for piece in pieces] == [
+            "Two minutes to get to your next court.",
+            "Court four, Alpha versus Beta.",
+            "30 seconds to get to your court",
+        ]
+        assert [piece.start for piece in pieces] == [100.0, pytest.approx(103.2), pytest.approx(105.2)]
+        assert pieces[0].end == pieces[0].words[-1][1]
+        plain = TranscriptSegment(1.0, 2.0, "Halfway through, 90 seconds")
+        assert split_on_cue_phrases(plain) == [plain]
+
+    def test_augment_splits_worded_bundles_without_a_model(self, monkeypatch):
+        import verify_overhead_schedule
+
+        def no_model(*args, **kwargs):
+            raise AssertionError("bundles with word timings must not be re-transcribed")
+
+        monkeypatch.setattr(verify_overhead_schedule, "decode_pcm_range", no_model)
+        monkeypatch.setattr(verify_overhead_schedule, "get_refinement_pipeline", no_model)
+        segments = [
+            self.timed_words("Halfway through, 90 seconds remaining", 30.0),
+            TranscriptSegment(start=60.0, end=62.0, text="Make some noise"),
+        ]
+        cache: dict = {}
+        stats = RefinementStats()
+        merged, refinements = augment_slot_segments(segments, 25.0, Path("day.wav"), "base", 8, cache, stats=stats)
+        assert [segment.text for segment in merged] == ["Halfway through,", "90 seconds remaining", "Make some noise"]
+        assert len(refinements) == 1
+        assert stats.split_segments == 1 and stats.segments_per_second == 0.0
+        assert cache["entries"] == {}
+
+
+class TestStreamingByRound:
+    def run(self, games, transcript, **kwargs):
+        return verify_by_round_streaming(
+            games,
+            transcript,
+            Path("synthetic.wav"),
+            "09:00",
+            tolerance=90,
+            min_confidence=0.55,
+            skip_ranges=[],
+            skip_before=None,
+            refine_bundled=False,
+            **kwargs,
+        )
+
+    def test_rounds_match_batch_and_arrive_before_transcript_ends(self, capsys):
+        from bench_overhead import synthetic_day
+
+        games, segments = synthetic_day(2.0, [2, 3], chatter_every=20.0)
+        batch = verify_by_round(
+            games, segments, Path("synthetic.wav"), "09:00", 90, 0.55, [], None, refine_bundled=False
+        )
+        capsys.readouterr()
+
+        def transcript():
+            for settled in range(0, 8000, 300):
+                print(f"settled {settled}")
+                # Unsettled segments past the frontier must not affect any emitted round.
+                partial = [s for s in segments if s.start < settled]
+                partial.append(TranscriptSegment(start=settled + 5.0, end=settled + 6.0, text="Court two"))
+                yield TranscriptProgress(segments=partial, settled_until=float(settled))
+            yield TranscriptProgress(segments=segments, settled_until=float("inf"), done=True)
+
+        streamed = self.run(games, transcript())
+        lines = capsys.readouterr().out.splitlines()
+
+        def strip(reports):
+            return [{k: v for k, v in r.items() if k != "results"} for r in reports]
+
+        assert strip(streamed) == strip(batch)
+        first_round = next(i for i, line in enumerate(lines) if line.startswith("Round  1"))
+        assert first_round < lines.index("settled 3900")
+
+    def test_round_filter_waits_only_for_that_round(self, capsys):
+        from bench_overhead import synthetic_day
+
+        games, segments = synthetic_day(2.0, [2], chatter_every=20.0)
+
+        def transcript():
+            yield TranscriptProgress(segments=segments, settled_until=1900.0)
+            print("rest of the day")
+            yield TranscriptProgress(segments=segments, settled_until=float("inf"), done=True)
+
+        reports = self.run(games, transcript(), round_filter=1)
+        lines = capsys.readouterr().out.splitlines()
+        assert [r["round"] for r in reports] == [1]
+        assert lines[0].startswith("Round  1")
+        assert lines.index("rest of the day") > 0
+
+    def test_unanchored_round_falls_back_to_the_hint_after_one_search(self, monkeypatch):
+        import verify_overhead_schedule
+        from bench_overhead import synthetic_day
+
+        games, _segments = synthetic_day(1.0, [2])
+        searches = []
+
+        def no_anchor(slot_games, index, hint_wav, tolerance, min_confidence):
+            searches.append(hint_wav)
+
+        monkeypatch.setattr(verify_overhead_schedule, "infer_slot_anchor_wav", no_anchor)
+        done = TranscriptProgress(segments=[], settled_until=float("inf"), done=True)
+
+        reports = self.run(games, iter([done]))
+
+        assert len(searches) == len(reports)
+        assert all(r["anchor_source"] == "schedule_hint" for r in reports)
+
+
+class TestVerifyOverhead:
+    def test_only_windows_around_edits_are_retranscribed(self, tmp_path: Path, monkeypatch):
+        import verify_overhead_schedule
+        from bench_overhead import synthetic_day
+
+        games, segments = synthetic_day(2.0, [2, 3], chatter_every=20.0)
+        # The edited wav gained a cue that the transcript of the original lacks.
+        added = next(s for s in segments if 1500 <= s.start and s.text.startswith("Two minutes"))
+        before = [s for s in segments if s is not added]
+        windows_seen = []
+
+        def fake_transcribe(wav_path, model_name, windows, word_timestamps=False):
+            windows_seen.extend(windows)
+            return [
+                s for s in segments if any(w.start <= (s.start + s.end) / 2 < w.end for w in windows)
+            ]
+
+        monkeypatch.setattr(verify_overhead_schedule, "transcribe_windows", fake_transcribe)
+        monkeypatch.setattr(verify_overhead_schedule, "get_wav_duration", lambda wav: 7200.0)
+        monkeypatch.setattr(verify_overhead_schedule, "decode_pcm_range", lambda *args: None)
+        monkeypatch.setattr(verify_overhead_schedule, "vad_speech_spans", lambda audio, offset: [])
+        refine_cache = {"entries": {f"{added.start:.1f}": {}, "12.0": {}}}
+        cache_path = tmp_path / "out.wav.transcript.json"
+
+        report = verify_overhead(
+            tmp_path / "out.wav",
+            games,
+            "09:00",
+            transcript=before,
+            changed_ranges=[(added.start, added.end)],
+            refine_bundled=False,
+            refine_cache=refine_cache,
+            cache_path=cache_path,
+            output_report=tmp_path / "out_overhead_by_round_report.json",
+        )
+
+        full = verify_by_round(
+            games, segments, tmp_path / "out.wav", "09:00", 90, 0.55, [], None, refine_bundled=False
+        )
+        assert [r["summary"] for r in report["rounds"]] == [r["summary"] for r in full]
+        assert len(windows_seen) == 1
+        assert windows_seen[0].end - windows_seen[0].start < 30
+        assert report["transcript_patch"]["segments_added"] == report["transcript_patch"]["segments_replaced"] + 1
+        assert list(refine_cache["entries"]) == ["12.0"]
+        assert len(json.loads(cache_path.read_text(encoding="utf-8"))["segments"]) == len(segments)
+        assert (tmp_path / "out_overhead_by_round_phrases.txt").exists()